@@ -1,3 +1,4 @@
+from pybotx.async_buffer import AsyncBytesBuffer, AsyncMmapBuffer
 from pybotx.bot.api.exceptions import (
     UnknownSystemEventError,
     UnsupportedBotAPIVersionError,
@@ -15,11 +16,24 @@ from pybotx.bot.api.responses.unverified_request import (
 )
 from pybotx.auth import BotXAuthVersion
 from pybotx.bot.bot import Bot
+from pybotx.bot.callbacks.callback_broker_proto import CallbackBrokerProto
+from pybotx.bot.callbacks.callback_manager import BotXMethodCallbackResult
+from pybotx.bot.callbacks.callback_memory_broker import CallbackMemoryBroker
 from pybotx.bot.callbacks.callback_repo_proto import CallbackRepoProto
+from pybotx.bot.callbacks.callback_shared_repo import CallbackSharedRepo
+from pybotx.bot.callbacks.callback_sqlite_broker import CallbackSQLiteBroker
+from pybotx.bot.concurrency_limiter import (
+    ConcurrencyLimiter,
+    ConcurrencyLimitMetrics,
+)
+from pybotx.bot.cpu_offloader import CPUOffloader, CPUOffloadMetrics
+from pybotx.bot.deadline import deadline
 from pybotx.bot.exceptions import (
     AnswerDestinationLookupError,
     BotShuttingDownError,
     BotXMethodCallbackNotFoundError,
+    DeadlineExceededError,
+    HandlerTimeoutError,
     RequestHeadersNotProvidedError,
     UnknownBotAccountError,
     UnverifiedRequestError,
@@ -30,6 +44,22 @@ from pybotx.bot.handler import (
     SyncSmartAppEventHandlerFunc,
 )
 from pybotx.bot.handler_collector import HandlerCollector
+from pybotx.bot.file_cache import FileCache
+from pybotx.bot.outbox.outbox import Outbox
+from pybotx.bot.outbox.outbox_memory_store import OutboxMemoryStore
+from pybotx.bot.outbox.outbox_sqlite_store import OutboxSQLiteStore
+from pybotx.bot.outbox.outbox_store_proto import OutboxStoreProto
+from pybotx.bot.request_compressor import RequestCompressor
+from pybotx.bot.request_scheduler import (
+    RequestQueueMetrics,
+    RequestScheduler,
+    request_priority,
+)
+from pybotx.bot.transfer_manager import TransferManager, TransferMetrics
+from pybotx.bot.upload_dedup.upload_dedup_memory_store import UploadDedupMemoryStore
+from pybotx.bot.upload_dedup.upload_dedup_sqlite_store import UploadDedupSQLiteStore
+from pybotx.bot.upload_dedup.upload_dedup_store_proto import UploadDedupStoreProto
+from pybotx.bot.upload_dedup.upload_deduplicator import UploadDeduplicator
 from pybotx.bot.testing import lifespan_wrapper
 from pybotx.client.exceptions.callbacks import (
     BotXMethodFailedCallbackReceivedError,
@@ -90,6 +120,7 @@ from pybotx.models.attachments import (
     AttachmentVideo,
     AttachmentVoice,
     OutgoingAttachment,
+    OutgoingAttachmentStream,
 )
 from pybotx.models.bot_account import BotAccount, BotAccountWithSecret
 from pybotx.models.bot_catalog import BotsListItem
@@ -108,7 +139,12 @@ from pybotx.models.enums import (
     ClientNetworkContours,
     ClientPlatforms,
     ConferenceLinkTypes,
+    DeliveryModes,
     MentionTypes,
+    OutboxEntryStatuses,
+    OutboxRequestKinds,
+    RequestCompressionEncodings,
+    RequestPriorities,
     SmartappManifestWebLayoutChoices,
     SyncSourceTypes,
     UserKinds,
@@ -136,9 +172,13 @@ from pybotx.models.message.mentions import (
     MentionContact,
     MentionList,
     MentionUser,
+    MessageBody,
 )
 from pybotx.models.message.message_status import MessageStatus
+from pybotx.models.message.broadcast import BroadcastResult
 from pybotx.models.message.outgoing_message import OutgoingMessage
+from pybotx.models.message.ordered_send import OrderedSendResult
+from pybotx.models.message.prepared_message import PreparedMessage
 from pybotx.models.message.reply import Reply
 from pybotx.models.message.reply_message import ReplyMessage
 from pybotx.models.method_callbacks import (
@@ -146,6 +186,7 @@ from pybotx.models.method_callbacks import (
     BotAPIMethodSuccessfulCallback,
     BotXMethodCallback,
 )
+from pybotx.models.outbox import OutboxEntry
 from pybotx.models.smartapps import SmartApp
 from pybotx.models.status import BotMenu, StatusRecipient
 from pybotx.models.stickers import Sticker, StickerPack, StickerPackFromList
@@ -175,6 +216,8 @@ from pybotx.models.users import UserFromCSV, UserFromSearch
 __all__ = (
     "AddedToChatEvent",
     "AnswerDestinationLookupError",
+    "AsyncBytesBuffer",
+    "AsyncMmapBuffer",
     "AttachmentDocument",
     "AttachmentImage",
     "AttachmentTypes",
@@ -200,15 +243,23 @@ __all__ = (
     "BotXMethodCallbackNotFoundError",
     "BotXMethodFailedCallbackReceivedError",
     "BotXMethodCallback",
+    "BotXMethodCallbackResult",
+    "BroadcastResult",
     "BotsListItem",
     "BubbleMarkup",
     "Button",
     "ButtonRow",
     "ButtonTextAlign",
+    "CPUOffloadMetrics",
+    "CPUOffloader",
     "CTSLoginEvent",
     "CTSLogoutEvent",
+    "CallbackBrokerProto",
+    "CallbackMemoryBroker",
     "CallbackNotReceivedError",
     "CallbackRepoProto",
+    "CallbackSQLiteBroker",
+    "CallbackSharedRepo",
     "CantUpdatePersonalChatError",
     "Chat",
     "ChatCreatedEvent",
@@ -227,22 +278,28 @@ __all__ = (
     "ChatTypes",
     "ClientNetworkContours",
     "ClientPlatforms",
+    "ConcurrencyLimitMetrics",
+    "ConcurrencyLimiter",
     "ConferenceChangedEvent",
     "ConferenceCreatedEvent",
     "ConferenceDeletedEvent",
     "ConferenceLinkTypes",
+    "DeadlineExceededError",
     "DeletedFromChatEvent",
+    "DeliveryModes",
     "Document",
     "EditMessage",
     "EventDeleted",
     "EventEdit",
     "EventNotFoundError",
     "File",
+    "FileCache",
     "FileDeletedError",
     "FileMetadataNotFound",
     "FinalRecipientsListEmptyError",
     "Forward",
     "HandlerCollector",
+    "HandlerTimeoutError",
     "Image",
     "IncomingMessage",
     "IncomingMessageHandlerFunc",
@@ -262,18 +319,34 @@ __all__ = (
     "MentionChat",
     "MentionContact",
     "MentionList",
+    "MessageBody",
     "MentionTypes",
     "MentionUser",
     "MessageNotFoundError",
     "MessageStatus",
     "Middleware",
+    "OrderedSendResult",
+    "Outbox",
+    "OutboxEntry",
+    "OutboxEntryStatuses",
+    "OutboxMemoryStore",
+    "OutboxRequestKinds",
+    "OutboxSQLiteStore",
+    "OutboxStoreProto",
     "OutgoingAttachment",
+    "OutgoingAttachmentStream",
     "OutgoingMessage",
+    "PreparedMessage",
     "PermissionDeniedError",
     "RateLimitReachedError",
     "Reply",
     "ReplyMessage",
+    "RequestCompressionEncodings",
+    "RequestCompressor",
     "RequestHeadersNotProvidedError",
+    "RequestPriorities",
+    "RequestQueueMetrics",
+    "RequestScheduler",
     "SmartApp",
     "SmartAppEvent",
     "SmartappManifest",
@@ -295,10 +368,16 @@ __all__ = (
     "ThreadAlreadyExistsError",
     "ThreadCreationError",
     "ThreadCreationProhibitedError",
+    "TransferManager",
+    "TransferMetrics",
     "UnknownBotAccountError",
     "UnknownSystemEventError",
     "UnsupportedBotAPIVersionError",
     "UnverifiedRequestError",
+    "UploadDedupMemoryStore",
+    "UploadDedupSQLiteStore",
+    "UploadDedupStoreProto",
+    "UploadDeduplicator",
     "UserDevice",
     "UserFromCSV",
     "UserFromSearch",
@@ -311,7 +390,9 @@ __all__ = (
     "build_bot_disabled_response",
     "build_command_accepted_response",
     "build_unverified_request_response",
+    "deadline",
     "lifespan_wrapper",
+    "request_priority",
 )
 
 logger.disable("pybotx")
@@ -1,8 +1,11 @@
 import abc
+import mmap
 import os
-
+from collections.abc import AsyncIterator
 from typing import Protocol
 
+from pybotx.constants import CHUNK_SIZE
+
 
 class AsyncBufferBase(Protocol):
     async def seek(
@@ -14,12 +17,12 @@ class AsyncBufferBase(Protocol):
     async def tell(self) -> int: ...  # pragma: no cover
 
 
-class AsyncBufferWritable(AsyncBufferBase):
+class AsyncBufferWritable(AsyncBufferBase, Protocol):
     @abc.abstractmethod
     async def write(self, content: bytes) -> int: ...  # pragma: no cover
 
 
-class AsyncBufferReadable(AsyncBufferBase):
+class AsyncBufferReadable(AsyncBufferBase, Protocol):
     @abc.abstractmethod
     async def read(
         self,
@@ -27,8 +30,130 @@ class AsyncBufferReadable(AsyncBufferBase):
     ) -> bytes: ...  # pragma: no cover
 
 
+class AsyncBufferReadableInto(AsyncBufferReadable, Protocol):
+    """Readable buffer, which can fill preallocated memory."""
+
+    @abc.abstractmethod
+    async def readinto(
+        self,
+        buffer: bytearray | memoryview,
+    ) -> int: ...  # pragma: no cover
+
+
 async def get_file_size(async_buffer: AsyncBufferReadable) -> int:
     await async_buffer.seek(0, os.SEEK_END)
     file_size = await async_buffer.tell()
     await async_buffer.seek(0)
     return file_size
+
+
+async def iter_buffer_chunks(
+    async_buffer: AsyncBufferReadable,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes | memoryview]:
+    if not hasattr(async_buffer, "readinto"):
+        chunk = await async_buffer.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = await async_buffer.read(chunk_size)
+
+        return
+
+    # One buffer is reused, so chunk is valid only until next one is read.
+    buffer = bytearray(chunk_size)
+    buffer_view = memoryview(buffer)
+    read_size = await async_buffer.readinto(buffer)
+    while read_size:
+        yield buffer_view[:read_size]
+        read_size = await async_buffer.readinto(buffer)
+
+
+class _AsyncMemoryBuffer:
+    _memory: bytearray | mmap.mmap
+
+    def __init__(self) -> None:
+        self._cursor = 0
+
+    async def seek(self, cursor: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            cursor += self._cursor
+        elif whence == os.SEEK_END:
+            cursor += len(self._memory)
+
+        if cursor < 0:
+            raise ValueError("`cursor` should be non-negative")
+
+        self._cursor = cursor
+        return cursor
+
+    async def tell(self) -> int:
+        return self._cursor
+
+    async def read(self, bytes_to_read: int | None = None) -> bytes:
+        start, end = self._get_read_range(bytes_to_read)
+        with memoryview(self._memory) as memory:
+            content = memory[start:end].tobytes()
+
+        self._cursor = max(self._cursor, end)
+        return content
+
+    async def readinto(self, buffer: bytearray | memoryview) -> int:
+        start, end = self._get_read_range(len(buffer))
+        with memoryview(self._memory) as memory:
+            buffer[: end - start] = memory[start:end]
+
+        self._cursor = max(self._cursor, end)
+        return end - start
+
+    def _get_read_range(self, bytes_to_read: int | None) -> tuple[int, int]:
+        start = min(self._cursor, len(self._memory))
+        if bytes_to_read is None or bytes_to_read < 0:
+            return start, len(self._memory)
+
+        return start, min(start + bytes_to_read, len(self._memory))
+
+
+class AsyncBytesBuffer(_AsyncMemoryBuffer):
+    """In-memory buffer on top of `bytearray`.
+
+    Writes accept any bytes-like object and `getbuffer()` gives access to
+    content without copying.
+    """
+
+    _memory: bytearray
+
+    def __init__(self, initial_content: bytes = b"") -> None:
+        super().__init__()
+        self._memory = bytearray(initial_content)
+
+    async def write(self, content: bytes | bytearray | memoryview) -> int:
+        if self._cursor > len(self._memory):
+            self._memory.extend(bytes(self._cursor - len(self._memory)))
+
+        size = len(content)
+        self._memory[self._cursor : self._cursor + size] = content
+        self._cursor += size
+        return size
+
+    def getbuffer(self) -> memoryview:
+        return memoryview(self._memory)
+
+
+class AsyncMmapBuffer(_AsyncMemoryBuffer):
+    """Buffer on top of memory-mapped file.
+
+    Map size is fixed, so writes past its end raise `ValueError`.
+    """
+
+    def __init__(self, memory_map: mmap.mmap) -> None:
+        super().__init__()
+        self._memory = memory_map
+
+    async def write(self, content: bytes | bytearray | memoryview) -> int:
+        size = len(content)
+        if self._cursor + size > len(self._memory):
+            raise ValueError("Content doesn't fit into memory map")
+
+        self._memory[self._cursor : self._cursor + size] = content
+        self._cursor += size
+        return size
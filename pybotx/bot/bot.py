@@ -1,9 +1,21 @@
+import asyncio
+import json
 from asyncio import Task
-from collections.abc import AsyncIterable, AsyncIterator, Iterator, Mapping, Sequence
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, TypeAlias
+from typing import Any, TypeAlias, TypeVar
 from uuid import UUID
 
 import aiofiles
@@ -15,11 +27,18 @@ from aiofiles.tempfile import NamedTemporaryFile, TemporaryDirectory
 from pybotx.async_buffer import AsyncBufferReadable, AsyncBufferWritable
 from pybotx.bot.bot_accounts_storage import BotAccountsStorage
 from pybotx.auth import BotXAuthVersion
-from pybotx.bot.callbacks.callback_manager import CallbackManager
+from pybotx.bot.callbacks.callback_manager import (
+    EXPIRED_CALLBACKS_TTL_SECONDS,
+    BotXMethodCallbackResult,
+    CallbackManager,
+)
 from pydantic import TypeAdapter
 from pybotx.bot.callbacks.callback_memory_repo import CallbackMemoryRepo
 from pybotx.bot.callbacks.callback_repo_proto import CallbackRepoProto
+from pybotx.bot.broadcast import BROADCAST_DEFAULT_CONCURRENCY, broadcast_to_chats
 from pybotx.bot.contextvars import bot_id_var, chat_id_var
+from pybotx.bot.edit_coalescer import EDIT_COALESCING_MAX_RATE, EditCoalescer
+from pybotx.bot.file_cache import FileCache
 from pybotx.bot.exceptions import (
     AnswerDestinationLookupError,
     RequestHeadersNotProvidedError,
@@ -29,6 +48,25 @@ from pybotx.bot.exceptions import (
 from pybotx.bot.handler import Middleware
 from pybotx.bot.handler_collector import HandlerCollector
 from pybotx.bot.middlewares.exception_middleware import ExceptionHandlersDict
+from pybotx.bot.ordered_sender import send_in_order
+from pybotx.bot.outbox.outbox import Outbox
+from pybotx.bot.concurrency_limiter import (
+    ConcurrencyLimiter,
+    ConcurrencyLimitMetrics,
+)
+from pybotx.bot.cpu_offloader import CPUOffloader, CPUOffloadMetrics
+from pybotx.bot.request_compressor import RequestCompressor
+from pybotx.bot.request_scheduler import RequestQueueMetrics, RequestScheduler
+from pybotx.bot.transfer_manager import (
+    BATCH_TRANSFER_DEFAULT_MAX_CONCURRENCY,
+    TransferManager,
+    TransferMetrics,
+    TransferProgressCallback,
+    run_transfers,
+)
+from pybotx.bot.upload_dedup.upload_deduplicator import UploadDeduplicator
+from pybotx.client.authorized_botx_method import AuthorizedBotXMethod
+from pybotx.client.botx_method import BotXMethod
 from pybotx.client.bots_api.bot_catalog import (
     BotsListMethod,
     BotXAPIBotsListRequestPayload,
@@ -104,12 +142,14 @@ from pybotx.client.events_api.typing_event import (
     TypingEventMethod,
 )
 from pybotx.client.exceptions.common import ChatNotFoundError, InvalidBotAccountError
+from pybotx.client.exceptions.http import SyncEndpointNotSupportedError
 from pybotx.client.files_api.download_file import (
     BotXAPIDownloadFileRequestPayload,
     DownloadFileMethod,
 )
 from pybotx.client.files_api.upload_file import (
     BotXAPIUploadFileRequestPayload,
+    BotXAPIUploadFileResponsePayload,
     UploadFileMethod,
 )
 from pybotx.client.get_token import get_token
@@ -119,7 +159,10 @@ from pybotx.client.mertics_api.collect_bot_function import (
 )
 from pybotx.client.notifications_api.direct_notification import (
     BotXAPIDirectNotificationRequestPayload,
+    BotXAPIPreparedDirectNotification,
+    BotXAPIStreamedDirectNotification,
     DirectNotificationMethod,
+    DirectNotificationPayload,
     DirectNotificationSyncMethod,
 )
 from pybotx.client.notifications_api.internal_bot_notification import (
@@ -240,8 +283,15 @@ from pybotx.image_validators import (
 )
 from pybotx.logger import log_incoming_request, logger, pformat_jsonable_obj
 from pybotx.missing import Missing, MissingOptional, Undefined
+from pybotx.models.api_base import UnverifiedPayloadBaseModel
 from pybotx.models.async_files import File
-from pybotx.models.attachments import IncomingFileAttachment, OutgoingAttachment
+from pybotx.models.attachments import (
+    IncomingFileAttachment,
+    OutgoingAttachment,
+    OutgoingAttachmentStream,
+    get_api_attachments_content_size,
+    get_attachment_content_size,
+)
 from pybotx.models.bot_account import BotAccountWithSecret
 from pybotx.models.bot_catalog import BotsListItem
 from pybotx.models.call import Call
@@ -252,13 +302,28 @@ from pybotx.models.commands import (
     BotCommand,
 )
 from pybotx.models.conference import Conference
-from pybotx.models.enums import BotAPICommandTypes, ChatLinkTypes, ChatTypes
+from pybotx.models.enums import (
+    BotAPICommandTypes,
+    ChatLinkTypes,
+    ChatTypes,
+    DeliveryModes,
+    OutboxRequestKinds,
+    RequestPriorities,
+)
 from pybotx.models.message.edit_message import EditMessage
 from pybotx.models.message.markup import BubbleMarkup, KeyboardMarkup
 from pybotx.models.message.message_status import MessageStatus
+from pybotx.models.message.broadcast import BroadcastResult
+from pybotx.models.message.mentions import MessageBody
+from pybotx.models.message.ordered_send import OrderedSendResult
 from pybotx.models.message.outgoing_message import OutgoingMessage
+from pybotx.models.message.prepared_message import (
+    PreparedMessage,
+    split_outgoing_message,
+)
 from pybotx.models.message.reply_message import ReplyMessage
 from pybotx.models.method_callbacks import BotXMethodCallback
+from pybotx.models.outbox import OutboxEntry
 from pybotx.models.smartapps import SmartApp
 from pybotx.models.status import (
     BotAPIStatusRecipient,
@@ -271,6 +336,7 @@ from pybotx.models.sync_smartapp_event import (
     BotAPISyncSmartAppEvent,
     BotAPISyncSmartAppEventResponse,
 )
+from pybotx.models.system_events.event_edit import BotAPIEventEdit
 from pybotx.models.system_events.smartapp_event import SmartAppEvent
 from pybotx.models.users import UserFromCSV, UserFromSearch
 from pydantic import ValidationError
@@ -279,6 +345,9 @@ MissingOptionalAttachment: TypeAlias = MissingOptional[
     IncomingFileAttachment | OutgoingAttachment
 ]
 
+TBotXMethod = TypeVar("TBotXMethod", bound=BotXMethod)
+TResult = TypeVar("TResult")
+
 
 class Bot:
     def __init__(
@@ -290,8 +359,22 @@ class Bot:
         httpx_client: httpx.AsyncClient | None = None,
         exception_handlers: ExceptionHandlersDict | None = None,
         default_callback_timeout: float = BOTX_DEFAULT_TIMEOUT,
+        default_handler_timeout: float | None = None,
+        shutdown_timeout: float | None = None,
         callback_repo: CallbackRepoProto | None = None,
         auth_version: BotXAuthVersion = BotXAuthVersion.V2,
+        delivery_mode: DeliveryModes = DeliveryModes.CALLBACK,
+        expired_callbacks_ttl: float = EXPIRED_CALLBACKS_TTL_SECONDS,
+        edit_max_rate: float = EDIT_COALESCING_MAX_RATE,
+        outbox: Outbox | None = None,
+        request_scheduler: RequestScheduler | None = None,
+        request_compressor: RequestCompressor | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        cpu_offloader: CPUOffloader | None = None,
+        inline_attachment_spool_size: int | None = None,
+        file_cache: FileCache | None = None,
+        transfer_manager: TransferManager | None = None,
+        upload_deduplicator: UploadDeduplicator | None = None,
     ) -> None:
         if not collectors:
             logger.warning("Bot has no connected collectors")
@@ -305,7 +388,15 @@ class Bot:
             exception_handlers,
         )
 
+        if default_handler_timeout is not None and default_handler_timeout <= 0:
+            raise ValueError("`default_handler_timeout` should be positive")
+
+        if shutdown_timeout is not None and shutdown_timeout <= 0:
+            raise ValueError("`shutdown_timeout` should be positive")
+
         self._default_callback_timeout = default_callback_timeout
+        self._default_handler_timeout = default_handler_timeout
+        self._shutdown_timeout = shutdown_timeout
         self._bot_accounts_storage = BotAccountsStorage(
             list(bot_accounts),
             auth_version=auth_version,
@@ -315,7 +406,24 @@ class Bot:
         if not callback_repo:
             callback_repo = CallbackMemoryRepo()
 
-        self._callbacks_manager = CallbackManager(callback_repo)
+        self._callbacks_manager = CallbackManager(
+            callback_repo,
+            expired_callbacks_ttl=expired_callbacks_ttl,
+        )
+
+        self._delivery_mode = delivery_mode
+        self._sync_endpoints_unsupported_hosts: set[str] = set()
+        self._edit_coalescer = EditCoalescer(self._edit, edit_max_rate)
+        self._outbox = outbox
+        self._request_scheduler = request_scheduler
+        self._request_compressor = request_compressor
+        self._concurrency_limiter = concurrency_limiter
+        self._cpu_offloader = cpu_offloader
+        self._offloaded_commands_tasks: set[Task[None]] = set()
+        self._inline_attachment_spool_size = inline_attachment_spool_size
+        self._file_cache = file_cache
+        self._transfer_manager = transfer_manager or TransferManager()
+        self._upload_deduplicator = upload_deduplicator
 
         self.state: SimpleNamespace = SimpleNamespace()
 
@@ -344,9 +452,66 @@ class Bot:
         except ValidationError as validation_exc:
             raise ValueError("Bot command validation error") from validation_exc
 
-        bot_command = bot_api_command.to_domain(raw_bot_command)
+        bot_command: BotCommand
+        if isinstance(bot_api_command, BotAPIIncomingMessage | BotAPIEventEdit):
+            content_size = get_api_attachments_content_size(
+                bot_api_command.attachments,
+            )
+            if self._cpu_offloader and self._cpu_offloader.should_offload(
+                content_size,
+            ):
+                # Attachments are decoded in thread pool, but unknown bot
+                # is still reported to the caller. Command is handled after
+                # decoding, so it can be handled after commands, which were
+                # received later.
+                self._bot_accounts_storage.ensure_bot_id_exists(
+                    bot_api_command.bot_id,
+                )
+                task = asyncio.create_task(
+                    self._decode_and_execute_bot_command(
+                        bot_api_command,
+                        raw_bot_command,
+                        content_size,
+                    ),
+                )
+                self._offloaded_commands_tasks.add(task)
+                task.add_done_callback(self._offloaded_command_done)
+                return
+
+            # Large inline attachments are decoded to temporary files
+            bot_command = bot_api_command.to_domain(
+                raw_bot_command,
+                attachment_spool_size=self._inline_attachment_spool_size,
+            )
+        else:
+            bot_command = bot_api_command.to_domain(raw_bot_command)
+
         self.async_execute_bot_command(bot_command)
 
+    async def _decode_and_execute_bot_command(
+        self,
+        bot_api_command: BotAPIIncomingMessage | BotAPIEventEdit,
+        raw_bot_command: dict[str, Any],
+        content_size: int,
+    ) -> None:
+        def decode_bot_command() -> BotCommand:
+            return bot_api_command.to_domain(
+                raw_bot_command,
+                attachment_spool_size=self._inline_attachment_spool_size,
+            )
+
+        bot_command = await self._run_cpu_bound(content_size, decode_bot_command)
+        self.async_execute_bot_command(bot_command)
+
+    def _offloaded_command_done(self, task: "Task[None]") -> None:
+        self._offloaded_commands_tasks.discard(task)
+
+        # Command can't be rejected to the caller, so error is logged
+        if not task.cancelled() and task.exception():
+            logger.opt(exception=task.exception()).error(
+                "Offloaded bot command processing error",
+            )
+
     def async_execute_bot_command(
         self,
         bot_command: BotCommand,
@@ -457,10 +622,38 @@ class Bot:
 
         return await self._callbacks_manager.wait_botx_method_callback(sync_id, timeout)
 
+    async def wait_botx_method_callbacks(
+        self,
+        sync_ids: Iterable[UUID],
+        timeout: float | None = None,
+    ) -> dict[UUID, BotXMethodCallbackResult]:
+        return await self._callbacks_manager.wait_botx_method_callbacks(
+            sync_ids,
+            timeout,
+        )
+
+    def as_completed_botx_method_callbacks(
+        self,
+        sync_ids: Iterable[UUID],
+        timeout: float | None = None,
+    ) -> AsyncIterator[tuple[UUID, BotXMethodCallbackResult]]:
+        return self._callbacks_manager.as_completed_botx_method_callbacks(
+            sync_ids,
+            timeout,
+        )
+
     @property
     def bot_accounts(self) -> Iterator[BotAccountWithSecret]:
         yield from self._bot_accounts_storage.iter_bot_accounts()
 
+    @property
+    def file_cache(self) -> FileCache | None:
+        return self._file_cache
+
+    @property
+    def default_handler_timeout(self) -> float | None:
+        return self._default_handler_timeout
+
     async def fetch_tokens(self) -> None:
         if self._bot_accounts_storage.get_auth_version() != BotXAuthVersion.V1:
             return
@@ -480,10 +673,25 @@ class Bot:
         if fetch_tokens:
             await self.fetch_tokens()
 
+        if self._outbox:
+            self._outbox.start(self._send_outbox_entry)
+        self._edit_coalescer.start()
+
     async def shutdown(self) -> None:
+        # Outbox entries being sent may wait for callbacks, so they are
+        # finished before callbacks waiting is stopped. Entries added later
+        # are kept pending in store.
+        if self._outbox:
+            await self._outbox.stop()
         await self._callbacks_manager.stop_callbacks_waiting()
-        await self._handler_collector.wait_active_tasks()
+        if self._offloaded_commands_tasks:
+            await asyncio.wait(self._offloaded_commands_tasks)
+        # Handlers not finished in `shutdown_timeout` are cancelled
+        await self._handler_collector.wait_active_tasks(self._shutdown_timeout)
+        await self._edit_coalescer.close()
         await self._httpx_client.aclose()
+        if self._cpu_offloader:
+            self._cpu_offloader.close()
 
     # - Bots API -
     async def get_token(
@@ -514,11 +722,7 @@ class Bot:
         :return: List of Bots, generated timestamp.
         """
 
-        method = BotsListMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(BotsListMethod, bot_id)
         payload = BotXAPIBotsListRequestPayload.from_domain(since=since)
 
         botx_api_bots_list = await method.execute(payload)
@@ -528,12 +732,14 @@ class Bot:
     # - Notifications API -
     async def answer_message(
         self,
-        body: str,
+        body: str | MessageBody | PreparedMessage,
         *,
         metadata: Missing[dict[str, Any]] = Undefined,
         bubbles: Missing[BubbleMarkup] = Undefined,
         keyboard: Missing[KeyboardMarkup] = Undefined,
-        file: Missing[IncomingFileAttachment | OutgoingAttachment] = Undefined,
+        file: Missing[
+            IncomingFileAttachment | OutgoingAttachment | OutgoingAttachmentStream
+        ] = Undefined,
         recipients: Missing[list[UUID]] = Undefined,
         silent_response: Missing[bool] = Undefined,
         markup_auto_adjust: Missing[bool] = Undefined,
@@ -548,7 +754,8 @@ class Bot:
         Works just like `Bot.send`, but `bot_id` and `chat_id` are
         taken from the incoming message.
 
-        :param body: Message body.
+        :param body: Message body or prepared message. Other message
+            params are taken from prepared message and can't be passed.
         :param metadata: Notification options.
         :param bubbles: Bubbles (buttons attached to message) markup.
         :param keyboard: Keyboard (buttons below message input) markup.
@@ -563,9 +770,13 @@ class Bot:
             devices.
         :param ignore_mute: (BotX default: False) Ignore mute or dnd (do not
             disturb).
-        :param wait_callback: Block method call until callback received.
+        :param wait_callback: Block method call until callback received. With
+            `DeliveryModes.SYNC` synchronous endpoint is used instead of
+            waiting for callback.
         :param callback_timeout: Callback timeout in seconds (or `None` for
-            endless waiting).
+            endless waiting). Isn't used when message is sent through
+            synchronous endpoint, its request is limited by httpx client
+            timeout.
 
         :raises AnswerDestinationLookupError: If you try to answer without
             receiving incoming message.
@@ -579,6 +790,34 @@ class Bot:
         except LookupError as exc:
             raise AnswerDestinationLookupError from exc
 
+        if isinstance(body, PreparedMessage):
+            passed_params = (
+                metadata,
+                bubbles,
+                keyboard,
+                file,
+                recipients,
+                silent_response,
+                markup_auto_adjust,
+                stealth_mode,
+                send_push,
+                ignore_mute,
+            )
+            if any(param is not Undefined for param in passed_params):
+                raise ValueError(
+                    "Message params can't be passed with prepared message body",
+                )
+
+            return await self._send_direct_notification(
+                bot_id,
+                BotXAPIDirectNotificationRequestPayload.from_prepared_message(
+                    chat_id,
+                    body,
+                ),
+                wait_callback,
+                callback_timeout,
+            )
+
         return await self.send_message(
             bot_id=bot_id,
             chat_id=chat_id,
@@ -600,19 +839,30 @@ class Bot:
     async def send(
         self,
         *,
-        message: OutgoingMessage,
+        message: OutgoingMessage | PreparedMessage,
         wait_callback: bool = True,
         callback_timeout: float | None = None,
     ) -> UUID:
         """Send internal notification.
 
-        :param message: Built outgoing message.
+        :param message: Built outgoing message or prepared message.
         :param wait_callback: Wait for callback.
         :param callback_timeout: Timeout for waiting for callback.
 
         :return: Notification sync_id.
         """
 
+        if isinstance(message, PreparedMessage):
+            return await self._send_direct_notification(
+                message.bot_id,
+                BotXAPIDirectNotificationRequestPayload.from_prepared_message(
+                    message.chat_id,
+                    message,
+                ),
+                wait_callback,
+                callback_timeout,
+            )
+
         return await self.send_message(
             bot_id=message.bot_id,
             chat_id=message.chat_id,
@@ -631,16 +881,142 @@ class Bot:
             callback_timeout=callback_timeout,
         )
 
+    async def broadcast(
+        self,
+        *,
+        message_template: OutgoingMessage | PreparedMessage,
+        chat_ids: Iterable[UUID],
+        concurrency: int = BROADCAST_DEFAULT_CONCURRENCY,
+        rate_limit: float | None = None,
+        wait_callback: bool = True,
+        callback_timeout: float | None = None,
+    ) -> AsyncIterator[BroadcastResult]:
+        """Send one message to many chats.
+
+        Message payload is built and serialized once, only target chat
+        is changed for each request.
+
+        :param message_template: Built outgoing message or prepared message,
+            its `chat_id` is ignored.
+        :param chat_ids: Target chats ids.
+        :param concurrency: Number of requests performed simultaneously.
+        :param rate_limit: Max requests per second (or `None` for unlimited).
+        :param wait_callback: Wait for callback of each request.
+        :param callback_timeout: Timeout for waiting for callback.
+
+        :return: Sync_id or error for each chat, in order of completion.
+        """
+
+        if isinstance(message_template, OutgoingMessage):
+            message_template = PreparedMessage.from_outgoing_message(
+                message_template,
+            )
+
+        payload = BotXAPIDirectNotificationRequestPayload.from_prepared_message(
+            message_template.chat_id,
+            message_template,
+        )
+        prepared_payload = BotXAPIPreparedDirectNotification(payload)
+
+        async def send_to_chat(chat_id: UUID) -> UUID:
+            return await self._send_direct_notification(
+                message_template.bot_id,
+                prepared_payload.for_chat(chat_id),
+                wait_callback,
+                callback_timeout,
+            )
+
+        async for result in broadcast_to_chats(
+            chat_ids,
+            send_to_chat,
+            concurrency,
+            rate_limit,
+        ):
+            yield result
+
+    async def send_ordered(
+        self,
+        *,
+        messages: Sequence[OutgoingMessage | PreparedMessage],
+        wait_callback: bool = True,
+        callback_timeout: float | None = None,
+    ) -> list[OrderedSendResult]:
+        """Send several messages keeping their order.
+
+        Each message is sent right after previous one is accepted by BotX
+        (or processed, if sync endpoint is used), callbacks are awaited
+        concurrently. Bodies longer than `MAX_NOTIFICATION_BODY_LENGTH`
+        are split into several messages. Sending is stopped on first error,
+        so messages after failed one aren't sent.
+
+        :param messages: Built outgoing messages or prepared messages.
+        :param wait_callback: Wait for callbacks of sent messages.
+        :param callback_timeout: Timeout for waiting for callback.
+
+        :return: Result for each sent message part, in order of sending.
+        """
+
+        message_parts = [
+            (message_index, message_part)
+            for message_index, message in enumerate(messages)
+            for message_part in (
+                split_outgoing_message(message)
+                if isinstance(message, OutgoingMessage)
+                else [message]
+            )
+        ]
+        processed_sync_ids: set[UUID] = set()
+
+        async def send_message_part(message: PreparedMessage) -> UUID:
+            payload = BotXAPIDirectNotificationRequestPayload.from_prepared_message(
+                message.chat_id,
+                message,
+            )
+
+            if not (wait_callback and self._can_use_sync_endpoint(message.bot_id)):
+                return await self._send_direct_notification(
+                    message.bot_id,
+                    payload,
+                    False,
+                    callback_timeout,
+                )
+
+            # Sync endpoint responds after message is processed.
+            sync_id = await self._send_direct_notification(
+                message.bot_id,
+                payload,
+                True,
+                callback_timeout,
+            )
+            processed_sync_ids.add(sync_id)
+
+            return sync_id
+
+        async def wait_message_part_processed(sync_id: UUID) -> None:
+            if sync_id in processed_sync_ids:
+                return
+
+            callback = await self.wait_botx_method_callback(sync_id)
+            DirectNotificationMethod.raise_for_callback_error(callback)
+
+        return await send_in_order(
+            message_parts,
+            send_message_part,
+            wait_message_part_processed if wait_callback else None,
+        )
+
     async def send_message(
         self,
         *,
         bot_id: UUID,
         chat_id: UUID,
-        body: str,
+        body: str | MessageBody,
         metadata: Missing[dict[str, Any]] = Undefined,
         bubbles: Missing[BubbleMarkup] = Undefined,
         keyboard: Missing[KeyboardMarkup] = Undefined,
-        file: Missing[IncomingFileAttachment | OutgoingAttachment] = Undefined,
+        file: Missing[
+            IncomingFileAttachment | OutgoingAttachment | OutgoingAttachmentStream
+        ] = Undefined,
         silent_response: Missing[bool] = Undefined,
         markup_auto_adjust: Missing[bool] = Undefined,
         recipients: Missing[list[UUID]] = Undefined,
@@ -669,53 +1045,56 @@ class Bot:
             devices.
         :param ignore_mute: (BotX default: False) Ignore mute or dnd (do not
             disturb).
-        :param wait_callback: Block method call until callback received.
+        :param wait_callback: Block method call until callback received. With
+            `DeliveryModes.SYNC` synchronous endpoint is used instead of
+            waiting for callback.
         :param callback_timeout: Callback timeout in seconds (or `None` for
-            endless waiting).
+            endless waiting). Isn't used when message is sent through
+            synchronous endpoint, its request is limited by httpx client
+            timeout.
 
         :return: Notification sync_id.
         """
 
-        method = DirectNotificationMethod(
+        # Inline file is encoded to base64 while payload is built
+        payload = await self._run_cpu_bound(
+            get_attachment_content_size(file),
+            partial(
+                self._build_direct_notification_payload,
+                chat_id=chat_id,
+                body=body,
+                metadata=metadata,
+                bubbles=bubbles,
+                keyboard=keyboard,
+                file=file,
+                recipients=recipients,
+                silent_response=silent_response,
+                markup_auto_adjust=markup_auto_adjust,
+                stealth_mode=stealth_mode,
+                send_push=send_push,
+                ignore_mute=ignore_mute,
+            ),
+        )
+
+        return await self._send_direct_notification(
             bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-            self._callbacks_manager,
-        )
-
-        payload = BotXAPIDirectNotificationRequestPayload.from_domain(
-            chat_id=chat_id,
-            body=body,
-            metadata=metadata,
-            bubbles=bubbles,
-            keyboard=keyboard,
-            file=file,
-            recipients=recipients,
-            silent_response=silent_response,
-            markup_auto_adjust=markup_auto_adjust,
-            stealth_mode=stealth_mode,
-            send_push=send_push,
-            ignore_mute=ignore_mute,
-        )
-        botx_api_sync_id = await method.execute(
             payload,
             wait_callback,
             callback_timeout,
-            self._default_callback_timeout,
         )
 
-        return botx_api_sync_id.to_domain()
-
     async def send_message_sync(
         self,
         *,
         bot_id: UUID,
         chat_id: UUID,
-        body: str,
+        body: str | MessageBody,
         metadata: Missing[dict[str, Any]] = Undefined,
         bubbles: Missing[BubbleMarkup] = Undefined,
         keyboard: Missing[KeyboardMarkup] = Undefined,
-        file: Missing[IncomingFileAttachment | OutgoingAttachment] = Undefined,
+        file: Missing[
+            IncomingFileAttachment | OutgoingAttachment | OutgoingAttachmentStream
+        ] = Undefined,
         silent_response: Missing[bool] = Undefined,
         markup_auto_adjust: Missing[bool] = Undefined,
         recipients: Missing[list[UUID]] = Undefined,
@@ -746,25 +1125,26 @@ class Bot:
         :return: Notification sync_id.
         """
 
-        method = DirectNotificationSyncMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
-
-        payload = BotXAPIDirectNotificationRequestPayload.from_domain(
-            chat_id=chat_id,
-            body=body,
-            metadata=metadata,
-            bubbles=bubbles,
-            keyboard=keyboard,
-            file=file,
-            recipients=recipients,
-            silent_response=silent_response,
-            markup_auto_adjust=markup_auto_adjust,
-            stealth_mode=stealth_mode,
-            send_push=send_push,
-            ignore_mute=ignore_mute,
+        method = self._build_method(DirectNotificationSyncMethod, bot_id)
+
+        # Inline file is encoded to base64 while payload is built
+        payload = await self._run_cpu_bound(
+            get_attachment_content_size(file),
+            partial(
+                self._build_direct_notification_payload,
+                chat_id=chat_id,
+                body=body,
+                metadata=metadata,
+                bubbles=bubbles,
+                keyboard=keyboard,
+                file=file,
+                recipients=recipients,
+                silent_response=silent_response,
+                markup_auto_adjust=markup_auto_adjust,
+                stealth_mode=stealth_mode,
+                send_push=send_push,
+                ignore_mute=ignore_mute,
+            ),
         )
         botx_api_sync_id = await method.execute(payload)
 
@@ -794,12 +1174,7 @@ class Bot:
         :return: Notification sync_id.
         """
 
-        method = InternalBotNotificationMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-            self._callbacks_manager,
-        )
+        method = self._build_method(InternalBotNotificationMethod, bot_id)
 
         payload = BotXAPIInternalBotNotificationRequestPayload.from_domain(
             chat_id=chat_id,
@@ -821,12 +1196,23 @@ class Bot:
         self,
         *,
         message: EditMessage,
+        coalesce: bool = False,
     ) -> None:
         """Edit message.
 
         :param message: Built outgoing edit message.
+        :param coalesce: Don't wait for edit, merge it with other pending
+            edits of the same message and send at most `edit_max_rate`
+            edits per second. Latest state is sent on bot shutdown.
         """
 
+        if coalesce:
+            self._edit_coalescer.edit(message)
+            return
+
+        await self._edit(message)
+
+    async def _edit(self, message: EditMessage) -> None:
         await self.edit_message(
             bot_id=message.bot_id,
             sync_id=message.sync_id,
@@ -843,7 +1229,7 @@ class Bot:
         *,
         bot_id: UUID,
         sync_id: UUID,
-        body: Missing[str] = Undefined,
+        body: Missing[str | MessageBody] | PreparedMessage = Undefined,
         metadata: Missing[dict[str, Any]] = Undefined,
         bubbles: Missing[BubbleMarkup] = Undefined,
         keyboard: Missing[KeyboardMarkup] = Undefined,
@@ -855,7 +1241,8 @@ class Bot:
         :param bot_id: Bot which should perform the request.
         :param sync_id: `sync_id` of message to update.
         :param body: New message body. Skip to leave previous body or pass
-            empty string to clean it.
+            empty string to clean it. If prepared message is passed, other
+            message params are taken from it and can't be passed.
         :param metadata: Notification options. Skip to leave previous metadata.
         :param bubbles: Bubbles (buttons attached to message) markup. Skip to
             leave previous bubbles.
@@ -867,20 +1254,32 @@ class Bot:
             row, if its text doesn't fit.
         """
 
-        method = EditEventMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
-        payload = BotXAPIEditEventRequestPayload.from_domain(
-            sync_id=sync_id,
-            body=body,
-            metadata=metadata,
-            bubbles=bubbles,
-            keyboard=keyboard,
-            file=file,
-            markup_auto_adjust=markup_auto_adjust,
-        )
+        method = self._build_method(EditEventMethod, bot_id)
+        if isinstance(body, PreparedMessage):
+            passed_params = (metadata, bubbles, keyboard, file, markup_auto_adjust)
+            if any(param is not Undefined for param in passed_params):
+                raise ValueError(
+                    "Message params can't be passed with prepared message body",
+                )
+
+            payload = BotXAPIEditEventRequestPayload.from_prepared_message(
+                sync_id,
+                body,
+            )
+        else:
+            payload = await self._run_cpu_bound(
+                get_attachment_content_size(file),
+                partial(
+                    BotXAPIEditEventRequestPayload.from_domain,
+                    sync_id=sync_id,
+                    body=body,
+                    metadata=metadata,
+                    bubbles=bubbles,
+                    keyboard=keyboard,
+                    file=file,
+                    markup_auto_adjust=markup_auto_adjust,
+                ),
+            )
 
         await method.execute(payload)
 
@@ -914,7 +1313,7 @@ class Bot:
         *,
         bot_id: UUID,
         sync_id: UUID,
-        body: str,
+        body: str | MessageBody,
         metadata: Missing[dict[str, Any]] = Undefined,
         bubbles: Missing[BubbleMarkup] = Undefined,
         keyboard: Missing[KeyboardMarkup] = Undefined,
@@ -945,24 +1344,24 @@ class Bot:
             disturb).
         """
 
-        payload = BotXAPIReplyEventRequestPayload.from_domain(
-            sync_id=sync_id,
-            body=body,
-            metadata=metadata,
-            bubbles=bubbles,
-            keyboard=keyboard,
-            file=file,
-            silent_response=silent_response,
-            markup_auto_adjust=markup_auto_adjust,
-            stealth_mode=stealth_mode,
-            send_push=send_push,
-            ignore_mute=ignore_mute,
-        )
-        method = ReplyEventMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        payload = await self._run_cpu_bound(
+            get_attachment_content_size(file),
+            partial(
+                BotXAPIReplyEventRequestPayload.from_domain,
+                sync_id=sync_id,
+                body=body,
+                metadata=metadata,
+                bubbles=bubbles,
+                keyboard=keyboard,
+                file=file,
+                silent_response=silent_response,
+                markup_auto_adjust=markup_auto_adjust,
+                stealth_mode=stealth_mode,
+                send_push=send_push,
+                ignore_mute=ignore_mute,
+            ),
+        )
+        method = self._build_method(ReplyEventMethod, bot_id)
         await method.execute(payload)
 
     async def get_message_status(self, *, bot_id: UUID, sync_id: UUID) -> MessageStatus:
@@ -975,11 +1374,7 @@ class Bot:
         :returns: Message status object.
         """
         payload = BotXAPIMessageStatusRequestPayload.from_domain(sync_id=sync_id)
-        method = MessageStatusMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(MessageStatusMethod, bot_id)
 
         botx_api_message_status = await method.execute(payload)
         return botx_api_message_status.to_domain()
@@ -999,11 +1394,7 @@ class Bot:
         payload = BotXAPITypingEventRequestPayload.from_domain(
             chat_id=chat_id,
         )
-        method = TypingEventMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(TypingEventMethod, bot_id)
         await method.execute(payload)
 
     async def stop_typing(
@@ -1021,11 +1412,7 @@ class Bot:
         payload = BotXAPIStopTypingEventRequestPayload.from_domain(
             chat_id=chat_id,
         )
-        method = StopTypingEventMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(StopTypingEventMethod, bot_id)
         await method.execute(payload)
 
     async def delete_message(
@@ -1044,11 +1431,7 @@ class Bot:
             sync_id=sync_id,
         )
 
-        method = DeleteEventMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(DeleteEventMethod, bot_id)
 
         await method.execute(payload)
 
@@ -1065,11 +1448,7 @@ class Bot:
         :returns: List of chats info.
         """
 
-        method = ListChatsMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(ListChatsMethod, bot_id)
 
         botx_api_list_chat = await method.execute()
 
@@ -1089,7 +1468,7 @@ class Bot:
         :return: Chat information.
         """
 
-        method = ChatInfoMethod(bot_id, self._httpx_client, self._bot_accounts_storage)
+        method = self._build_method(ChatInfoMethod, bot_id)
 
         payload = BotXAPIChatInfoRequestPayload.from_domain(chat_id=chat_id)
         botx_api_chat_info = await method.execute(payload)
@@ -1110,9 +1489,7 @@ class Bot:
         :return: Chat information.
         """
 
-        method = PersonalChatMethod(
-            bot_id, self._httpx_client, self._bot_accounts_storage
-        )
+        method = self._build_method(PersonalChatMethod, bot_id)
 
         payload = BotXAPIPersonalChatRequestPayload.from_domain(user_huid=user_huid)
         botx_api_personal_chat = await method.execute(payload)
@@ -1164,7 +1541,7 @@ class Bot:
         :param huids: List of eXpress account ids.
         """
 
-        method = AddUserMethod(bot_id, self._httpx_client, self._bot_accounts_storage)
+        method = self._build_method(AddUserMethod, bot_id)
 
         payload = BotXAPIAddUserRequestPayload.from_domain(chat_id=chat_id, huids=huids)
         await method.execute(payload)
@@ -1183,11 +1560,7 @@ class Bot:
         :param huids: List of eXpress account ids.
         """
 
-        method = RemoveUserMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(RemoveUserMethod, bot_id)
 
         payload = BotXAPIRemoveUserRequestPayload.from_domain(
             chat_id=chat_id,
@@ -1209,11 +1582,7 @@ class Bot:
         :param huids: List of eXpress account ids.
         """
 
-        method = AddAdminMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(AddAdminMethod, bot_id)
 
         payload = BotXAPIAddAdminRequestPayload.from_domain(
             chat_id=chat_id,
@@ -1244,11 +1613,7 @@ class Bot:
             send.
         """
 
-        method = SetStealthMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SetStealthMethod, bot_id)
         payload = BotXAPISetStealthRequestPayload.from_domain(
             chat_id=chat_id,
             disable_web_client=disable_web_client,
@@ -1270,11 +1635,7 @@ class Bot:
         :param chat_id: Target chat id.
         """
 
-        method = DisableStealthMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(DisableStealthMethod, bot_id)
         payload = BotXAPIDisableStealthRequestPayload.from_domain(chat_id=chat_id)
 
         await method.execute(payload)
@@ -1304,11 +1665,7 @@ class Bot:
         :return: Created chat uuid.
         """
 
-        method = CreateChatMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(CreateChatMethod, bot_id)
 
         payload = BotXAPICreateChatRequestPayload(
             name=name,
@@ -1342,11 +1699,7 @@ class Bot:
         :return: Created chat link.
         """
 
-        method = CreateChatLinkMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(CreateChatLinkMethod, bot_id)
 
         payload = BotXAPICreateChatLinkRequestPayload.from_domain(
             chat_id=chat_id,
@@ -1368,11 +1721,7 @@ class Bot:
         :return: Created thread uuid.
         """
 
-        method = CreateThreadMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(CreateThreadMethod, bot_id)
 
         payload = BotXAPICreateThreadRequestPayload.from_domain(sync_id=sync_id)
         botx_api_thread_id = await method.execute(payload)
@@ -1393,11 +1742,7 @@ class Bot:
         :param sync_id: Target sync id.
         """
 
-        method = PinMessageMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(PinMessageMethod, bot_id)
         payload = BotXAPIPinMessageRequestPayload.from_domain(
             chat_id=chat_id,
             sync_id=sync_id,
@@ -1418,11 +1763,7 @@ class Bot:
 
         :return: Call.
         """
-        method = GetCallMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(GetCallMethod, bot_id)
         payload = BotXAPIGetCallRequestPayload.from_domain(
             call_id=call_id,
         )
@@ -1443,11 +1784,7 @@ class Bot:
 
         :return: Conference.
         """
-        method = GetConferenceMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(GetConferenceMethod, bot_id)
         payload = BotXAPIGetConferenceRequestPayload.from_domain(
             call_id=call_id,
         )
@@ -1467,11 +1804,7 @@ class Bot:
         :param chat_id: Target chat id.
         """
 
-        method = UnpinMessageMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(UnpinMessageMethod, bot_id)
         payload = BotXAPIUnpinMessageRequestPayload.from_domain(chat_id=chat_id)
 
         await method.execute(payload)
@@ -1494,11 +1827,7 @@ class Bot:
         :return: Search result with user information.
         """
 
-        method = SearchUserByEmailsMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SearchUserByEmailsMethod, bot_id)
         payload = BotXAPISearchUserByEmailsRequestPayload.from_domain(
             emails=emails,
             trusts_search=trusts_search,
@@ -1531,11 +1860,7 @@ class Bot:
         :return: User information.
         """
 
-        method = SearchUserByEmailPostMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SearchUserByEmailPostMethod, bot_id)
         payload = BotXAPISearchUserByEmailRequestPayload.from_domain(
             email=email,
             trusts_search=trusts_search,
@@ -1562,11 +1887,7 @@ class Bot:
         :return: User information.
         """
 
-        method = SearchUserByEmailMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SearchUserByEmailMethod, bot_id)
         payload = BotXAPISearchUserByEmailRequestPayload.from_domain(email=email)
 
         botx_api_user_from_search = await method.execute(payload)
@@ -1587,11 +1908,7 @@ class Bot:
         :return: User information.
         """
 
-        method = SearchUserByHUIDMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SearchUserByHUIDMethod, bot_id)
         payload = BotXAPISearchUserByHUIDRequestPayload.from_domain(huid=huid)
 
         botx_api_user_from_search = await method.execute(payload)
@@ -1614,11 +1931,7 @@ class Bot:
         :return: User information.
         """
 
-        method = SearchUserByLoginMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SearchUserByLoginMethod, bot_id)
         payload = BotXAPISearchUserByLoginRequestPayload.from_domain(
             ad_login=ad_login,
             ad_domain=ad_domain,
@@ -1642,11 +1955,7 @@ class Bot:
         :return: User information.
         """
 
-        method = SearchUserByOtherIdMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SearchUserByOtherIdMethod, bot_id)
         payload = BotXAPISearchUserByOtherIdRequestPayload.from_domain(
             other_id=other_id,
         )
@@ -1684,11 +1993,7 @@ class Bot:
         :param office: New user office.
         :param manager: New user manager.
         """
-        method = UpdateUsersProfileMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(UpdateUsersProfileMethod, bot_id)
 
         payload = BotXAPIUpdateUserProfileRequestPayload.from_domain(
             user_huid=user_huid,
@@ -1723,11 +2028,7 @@ class Bot:
 
         :yield: The list of users.
         """
-        method = UsersAsCSVMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(UsersAsCSVMethod, bot_id)
         payload = BotXAPIUsersAsCSVRequestPayload.from_domain(
             cts_user=cts_user,
             unregistered=unregistered,
@@ -1775,11 +2076,7 @@ class Bot:
         :param encrypted: Encrypt payload.
         """
 
-        method = SmartAppEventMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SmartAppEventMethod, bot_id)
         payload = BotXAPISmartAppEventRequestPayload.from_domain(
             ref=ref,
             smartapp_id=bot_id,
@@ -1811,11 +2108,7 @@ class Bot:
         :param meta: Meta information.
         """
 
-        method = SmartAppNotificationMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SmartAppNotificationMethod, bot_id)
         payload = BotXAPISmartAppNotificationRequestPayload.from_domain(
             chat_id=chat_id,
             smartapp_counter=smartapp_counter,
@@ -1840,11 +2133,7 @@ class Bot:
         :return: List of SmartApps, list version.
         """
 
-        method = SmartAppsListMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SmartAppsListMethod, bot_id)
         payload = BotXAPISmartAppsListRequestPayload.from_domain(version=version)
 
         botx_api_smartapps_list = await method.execute(payload)
@@ -1877,11 +2166,7 @@ class Bot:
         :return: Smartapp manifest with the set parameters received from BotX.
         """
 
-        method = SmartAppManifestMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SmartAppManifestMethod, bot_id)
         payload = BotXAPISmartAppManifestRequestPayload.from_domain(
             ios=ios,
             android=android,
@@ -1900,25 +2185,36 @@ class Bot:
         bot_id: UUID,
         async_buffer: AsyncBufferReadable,
         filename: str,
+        progress_callback: TransferProgressCallback | None = None,
     ) -> str:
         """Upload static file to file service.
 
         :param bot_id: Bot which should perform the request.
         :param async_buffer: Buffer to read uploaded file.
         :param filename: File name.
+        :param progress_callback: Called with sent and total bytes count.
 
         :return: file link.
         """
 
-        method = SmartappsUploadFileMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(SmartappsUploadFileMethod, bot_id)
+
+        async def upload(upload_buffer: AsyncBufferReadable) -> str:
+            botx_api_static_file = await method.execute(
+                upload_buffer,
+                filename,
+                progress_callback,
+            )
+            return botx_api_static_file.to_domain()
 
-        botx_api_static_file = await method.execute(async_buffer, filename)
+        if self._upload_deduplicator is None:
+            return await upload(async_buffer)
 
-        return botx_api_static_file.to_domain()
+        return await self._upload_deduplicator.upload(
+            f"upload_static_file:{bot_id}:{json.dumps(filename)}",
+            async_buffer,
+            upload,
+        )
 
     async def send_smartapp_custom_notification(
         self,
@@ -1945,12 +2241,7 @@ class Bot:
         :return: Notification sync_id.
         """
 
-        method = SmartAppCustomNotificationMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-            self._callbacks_manager,
-        )
+        method = self._build_method(SmartAppCustomNotificationMethod, bot_id)
         payload = BotXAPISmartAppCustomNotificationRequestPayload.from_domain(
             group_chat_id=group_chat_id,
             title=title,
@@ -1988,12 +2279,7 @@ class Bot:
         :return: Sent message's sync_id.
         """
 
-        method = SmartAppUnreadCounterMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-            self._callbacks_manager,
-        )
+        method = self._build_method(SmartAppUnreadCounterMethod, bot_id)
         payload = BotXAPISmartAppUnreadCounterRequestPayload.from_domain(
             group_chat_id=group_chat_id,
             counter=counter,
@@ -2025,11 +2311,7 @@ class Bot:
         :return: Created sticker pack.
         """
 
-        method = CreateStickerPackMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(CreateStickerPackMethod, bot_id)
         payload = BotXAPICreateStickerPackRequestPayload.from_domain(
             name=name,
             huid=huid,
@@ -2060,11 +2342,7 @@ class Bot:
         await ensure_file_content_is_png(async_buffer)
         await ensure_sticker_image_size_valid(async_buffer)
 
-        method = AddStickerMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(AddStickerMethod, bot_id)
         payload = await BotXAPIAddStickerRequestPayload.from_domain(
             sticker_pack_id=sticker_pack_id,
             emoji=emoji,
@@ -2089,11 +2367,7 @@ class Bot:
         :param sticker_id: Sticker id which should be deleted.
         """
 
-        method = DeleteStickerMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(DeleteStickerMethod, bot_id)
         payload = await BotXAPIDeleteStickerRequestPayload.from_domain(
             sticker_id=sticker_id,
             sticker_pack_id=sticker_pack_id,
@@ -2117,11 +2391,7 @@ class Bot:
 
         after = None
 
-        method = GetStickerPacksMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(GetStickerPacksMethod, bot_id)
 
         while True:
             payload = BotXAPIGetStickerPacksRequestPayload.from_domain(
@@ -2154,11 +2424,7 @@ class Bot:
         :return: Sticker pack.
         """
 
-        method = GetStickerPackMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(GetStickerPackMethod, bot_id)
         payload = BotXAPIGetStickerPackRequestPayload.from_domain(
             sticker_pack_id=sticker_pack_id,
         )
@@ -2174,11 +2440,7 @@ class Bot:
         :param sticker_pack_id: Target sticker pack.
         """
 
-        method = DeleteStickerPackMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(DeleteStickerPackMethod, bot_id)
 
         payload = BotXAPIDeleteStickerPackRequestPayload.from_domain(
             sticker_pack_id=sticker_pack_id,
@@ -2202,11 +2464,7 @@ class Bot:
         :return: Sticker.
         """
 
-        method = GetStickerMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(GetStickerMethod, bot_id)
         payload = BotXAPIGetStickerRequestPayload.from_domain(
             sticker_pack_id=sticker_pack_id,
             sticker_id=sticker_id,
@@ -2236,11 +2494,7 @@ class Bot:
         :return: Edited sticker pack.
         """
 
-        method = EditStickerPackMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(EditStickerPackMethod, bot_id)
         payload = BotXAPIEditStickerPackRequestPayload.from_domain(
             sticker_pack_id=sticker_pack_id,
             name=name,
@@ -2261,6 +2515,7 @@ class Bot:
         file_id: UUID,
         async_buffer: AsyncBufferWritable,
         is_preview: bool = False,
+        progress_callback: TransferProgressCallback | None = None,
     ) -> None:
         """Download file form file service.
 
@@ -2269,20 +2524,89 @@ class Bot:
         :param file_id: Async file id.
         :param async_buffer: Buffer to write downloaded file.
         :param is_preview: If true and file has preview, return it instead of original.
+        :param progress_callback: Called with received and total (if known)
+            bytes count.
         """
 
-        method = DownloadFileMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(DownloadFileMethod, bot_id)
         payload = BotXAPIDownloadFileRequestPayload.from_domain(
             chat_id=chat_id,
             file_id=file_id,
             is_preview=is_preview,
         )
 
-        await method.execute(payload, async_buffer)
+        await method.execute(payload, async_buffer, progress_callback)
+
+    async def download_files(
+        self,
+        *,
+        bot_id: UUID,
+        chat_id: UUID,
+        files: Sequence[tuple[File, AsyncBufferWritable]],
+        max_concurrency: int = BATCH_TRANSFER_DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Download several files from file service in parallel.
+
+        If one of downloads fails, others are cancelled.
+
+        :param bot_id: Bot which should perform the request.
+        :param chat_id: Target chat id.
+        :param files: Async files with buffers to write them.
+        :param max_concurrency: Max number of simultaneous downloads.
+        """
+
+        await run_transfers(
+            (
+                partial(
+                    self.download_file,
+                    bot_id=bot_id,
+                    chat_id=chat_id,
+                    file_id=file.file_id,
+                    async_buffer=async_buffer,
+                )
+                for file, async_buffer in files
+            ),
+            max_concurrency,
+        )
+
+    @asynccontextmanager
+    async def download_file_to_cache(
+        self,
+        *,
+        bot_id: UUID,
+        chat_id: UUID,
+        file_id: UUID,
+        file_hash: str,
+        is_preview: bool = False,
+    ) -> AsyncIterator[Path]:
+        """Download file to file cache, if it isn't there yet.
+
+        Cached file isn't removed from cache until context is exited.
+
+        :param bot_id: Bot which should perform the request.
+        :param chat_id: Target chat id.
+        :param file_id: Async file id.
+        :param file_hash: Async file hash, used as cache key.
+        :param is_preview: If true and file has preview, return it instead of original.
+
+        :return: Path to cached file.
+        """
+
+        if self._file_cache is None:
+            raise ValueError("`file_cache` isn't configured")
+
+        async def download(async_buffer: AsyncBufferWritable) -> None:
+            await self.download_file(
+                bot_id=bot_id,
+                chat_id=chat_id,
+                file_id=file_id,
+                async_buffer=async_buffer,
+                is_preview=is_preview,
+            )
+
+        cache_key = f"{file_hash}:preview" if is_preview else file_hash
+        async with self._file_cache.pin_path(cache_key, download) as path:
+            yield path
 
     async def upload_file(
         self,
@@ -2293,6 +2617,7 @@ class Bot:
         filename: str,
         duration: Missing[int] = Undefined,
         caption: Missing[str] = Undefined,
+        progress_callback: TransferProgressCallback | None = None,
     ) -> File:
         """Upload file to file service.
 
@@ -2302,24 +2627,46 @@ class Bot:
         :param filename: File name.
         :param duration: Video duration.
         :param caption: Text under file.
+        :param progress_callback: Called with sent and total bytes count.
 
         :return: Meta info of uploaded file.
         """
 
-        method = UploadFileMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(UploadFileMethod, bot_id)
         payload = BotXAPIUploadFileRequestPayload.from_domain(
             chat_id=chat_id,
             duration=duration,
             caption=caption,
         )
 
-        botx_api_async_file = await method.execute(payload, async_buffer, filename)
+        if self._upload_deduplicator is None:
+            botx_api_async_file = await method.execute(
+                payload,
+                async_buffer,
+                filename,
+                progress_callback,
+            )
+            return botx_api_async_file.to_domain()
+
+        async def upload(upload_buffer: AsyncBufferReadable) -> str:
+            botx_api_async_file = await method.execute(
+                payload,
+                upload_buffer,
+                filename,
+                progress_callback,
+            )
+            return botx_api_async_file.json()
+
+        # Same content in other chat or with other meta is uploaded again
+        raw_botx_api_async_file = await self._upload_deduplicator.upload(
+            f"upload_file:{bot_id}:{json.dumps([filename, payload.json()])}",
+            async_buffer,
+            upload,
+        )
 
-        return botx_api_async_file.to_domain()
+        return BotXAPIUploadFileResponsePayload.model_validate_json(
+            raw_botx_api_async_file,
+        ).to_domain()
 
     # - OpenID API -
     async def refresh_access_token(
@@ -2336,12 +2683,7 @@ class Bot:
         :param ref: sync_id of the failed event to resend.
         """
 
-        method = RefreshAccessTokenMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-            self._callbacks_manager,
-        )
+        method = self._build_method(RefreshAccessTokenMethod, bot_id)
 
         payload = BotXAPIRefreshAccessTokenRequestPayload.from_domain(
             huid=huid,
@@ -2365,11 +2707,7 @@ class Bot:
         :param chat_id: Chat in which the function was used.
         """
 
-        method = CollectBotFunctionMethod(
-            bot_id,
-            self._httpx_client,
-            self._bot_accounts_storage,
-        )
+        method = self._build_method(CollectBotFunctionMethod, bot_id)
 
         payload = BotXAPICollectBotFunctionRequestPayload.from_domain(
             bot_function=bot_function,
@@ -2378,6 +2716,260 @@ class Bot:
         )
         await method.execute(payload)
 
+    # - Requests scheduling -
+    def get_request_queue_metrics(
+        self,
+    ) -> dict[RequestPriorities, RequestQueueMetrics]:
+        """Get BotX requests queue metrics.
+
+        :return: Metrics for each priority class.
+        """
+
+        if self._request_scheduler is None:
+            return {}
+
+        return self._request_scheduler.get_metrics()
+
+    def get_concurrency_limit_metrics(self) -> dict[str, ConcurrencyLimitMetrics]:
+        """Get adaptive concurrency limits of BotX requests.
+
+        :return: Current limit and congestion stats for each CTS url.
+        """
+
+        if self._concurrency_limiter is None:
+            return {}
+
+        return self._concurrency_limiter.get_metrics()
+
+    def get_cpu_offload_metrics(self) -> CPUOffloadMetrics:
+        """Get metrics of work offloaded to thread pool.
+
+        :return: Offloaded calls count, their payloads size and duration.
+        """
+
+        if self._cpu_offloader is None:
+            return CPUOffloadMetrics()
+
+        return self._cpu_offloader.get_metrics()
+
+    def get_transfer_metrics(self) -> dict[str, TransferMetrics]:
+        """Get file transfers metrics.
+
+        :return: Metrics for each CTS url.
+        """
+
+        return self._transfer_manager.get_metrics()
+
+    # - Outbox -
+    async def enqueue(
+        self,
+        *,
+        message: OutgoingMessage | PreparedMessage | EditMessage | ReplyMessage,
+        send_at: datetime | None = None,
+        key: str | None = None,
+    ) -> UUID:
+        """Save message to outbox, it will be sent by outbox workers.
+
+        Bot should be created with `outbox`. Outgoing messages are marked
+        as sent after their callbacks are received. Scheduled entries are
+        checked every outbox `poll_interval` (1 second by default), so they
+        may be sent up to this interval later than `send_at`.
+
+        :param message: Built outgoing, prepared, edit or reply message.
+        :param send_at: Send not earlier than this time (or `None` for now).
+        :param key: Key to cancel scheduled message.
+
+        :return: Outbox entry id.
+        """
+
+        if isinstance(message, EditMessage):
+            kind = OutboxRequestKinds.EDIT_MESSAGE
+            payload: UnverifiedPayloadBaseModel = (
+                BotXAPIEditEventRequestPayload.from_domain(
+                    sync_id=message.sync_id,
+                    body=message.body,
+                    metadata=message.metadata,
+                    bubbles=message.bubbles,
+                    keyboard=message.keyboard,
+                    file=message.file,
+                    markup_auto_adjust=message.markup_auto_adjust,
+                )
+            )
+        elif isinstance(message, ReplyMessage):
+            kind = OutboxRequestKinds.REPLY_MESSAGE
+            payload = BotXAPIReplyEventRequestPayload.from_domain(
+                sync_id=message.sync_id,
+                body=message.body,
+                metadata=message.metadata,
+                bubbles=message.bubbles,
+                keyboard=message.keyboard,
+                file=message.file,
+                silent_response=message.silent_response,
+                markup_auto_adjust=message.markup_auto_adjust,
+                stealth_mode=message.stealth_mode,
+                send_push=message.send_push,
+                ignore_mute=message.ignore_mute,
+            )
+        else:
+            if isinstance(message, OutgoingMessage):
+                message = PreparedMessage.from_outgoing_message(message)
+
+            kind = OutboxRequestKinds.SEND_MESSAGE
+            payload = BotXAPIDirectNotificationRequestPayload.from_prepared_message(
+                message.chat_id,
+                message,
+            )
+
+        return await self._add_outbox_entry(
+            message.bot_id,
+            kind,
+            payload,
+            send_at,
+            key,
+        )
+
+    async def enqueue_delete_message(
+        self,
+        *,
+        bot_id: UUID,
+        sync_id: UUID,
+        send_at: datetime | None = None,
+        key: str | None = None,
+    ) -> UUID:
+        """Save message deletion to outbox.
+
+        `send_at` precision is limited by outbox `poll_interval`.
+
+        :param bot_id: Bot which should perform the request.
+        :param sync_id: Target sync_id.
+        :param send_at: Delete not earlier than this time (or `None` for now).
+        :param key: Key to cancel scheduled deletion.
+
+        :return: Outbox entry id.
+        """
+
+        payload = BotXAPIDeleteEventRequestPayload.from_domain(sync_id=sync_id)
+
+        return await self._add_outbox_entry(
+            bot_id,
+            OutboxRequestKinds.DELETE_MESSAGE,
+            payload,
+            send_at,
+            key,
+        )
+
+    async def enqueue_smartapp_notification(
+        self,
+        *,
+        bot_id: UUID,
+        chat_id: UUID,
+        smartapp_counter: int,
+        body: Missing[str] = Undefined,
+        opts: Missing[dict[str, Any]] = Undefined,
+        meta: Missing[dict[str, Any]] = Undefined,
+        send_at: datetime | None = None,
+        key: str | None = None,
+    ) -> UUID:
+        """Save SmartApp notification to outbox.
+
+        `send_at` precision is limited by outbox `poll_interval`.
+
+        :param bot_id: Bot which should perform the request.
+        :param chat_id: Target chat id.
+        :param smartapp_counter: Value app's counter.
+        :param body: Event body.
+        :param opts: Event options.
+        :param meta: Meta information.
+        :param send_at: Send not earlier than this time (or `None` for now).
+        :param key: Key to cancel scheduled notification.
+
+        :return: Outbox entry id.
+        """
+
+        payload = BotXAPISmartAppNotificationRequestPayload.from_domain(
+            chat_id=chat_id,
+            smartapp_counter=smartapp_counter,
+            body=body,
+            opts=opts,
+            meta=meta,
+        )
+
+        return await self._add_outbox_entry(
+            bot_id,
+            OutboxRequestKinds.SMARTAPP_NOTIFICATION,
+            payload,
+            send_at,
+            key,
+        )
+
+    async def get_outbox_entry(self, entry_id: UUID) -> OutboxEntry | None:
+        """Get outbox entry with its delivery status.
+
+        :param entry_id: Outbox entry id.
+
+        :return: Outbox entry or `None`, if it isn't found.
+        """
+
+        return await self._get_outbox().get_entry(entry_id)
+
+    async def cancel_outbox_entries(self, *, key: str) -> int:
+        """Cancel outbox entries, which aren't sent yet.
+
+        Entries, which are being sent at the moment, aren't cancelled and
+        aren't counted in the result.
+
+        :param key: Key of scheduled entries.
+
+        :return: Number of cancelled entries.
+        """
+
+        return await self._get_outbox().cancel_entries(key)
+
+    async def _add_outbox_entry(
+        self,
+        bot_id: UUID,
+        kind: OutboxRequestKinds,
+        payload: UnverifiedPayloadBaseModel,
+        send_at: datetime | None,
+        key: str | None,
+    ) -> UUID:
+        return await self._get_outbox().add_entry(
+            bot_id,
+            kind,
+            payload.jsonable_dict(),
+            send_at=send_at.timestamp() if send_at else 0,
+            key=key,
+        )
+
+    def _build_method(
+        self,
+        method_cls: type[TBotXMethod],
+        bot_id: UUID,
+    ) -> TBotXMethod:
+        return method_cls(
+            bot_id,
+            self._httpx_client,
+            self._bot_accounts_storage,
+            self._callbacks_manager,
+            request_scheduler=self._request_scheduler,
+            transfer_manager=self._transfer_manager,
+            request_compressor=self._request_compressor,
+            cpu_offloader=self._cpu_offloader,
+            concurrency_limiter=self._concurrency_limiter,
+        )
+
+    async def _run_cpu_bound(self, size: int, func: Callable[[], TResult]) -> TResult:
+        if self._cpu_offloader is None:
+            return func()
+
+        return await self._cpu_offloader.run(size, func)
+
+    def _get_outbox(self) -> Outbox:
+        if self._outbox is None:
+            raise ValueError("`outbox` isn't configured")
+
+        return self._outbox
+
     def _verify_request(
         self,
         headers: Mapping[str, str] | None,
@@ -2515,6 +3107,118 @@ class Bot:
             if not trusted_issuers or issuer not in trusted_issuers:
                 raise UnverifiedRequestError("Invalid issuer")
 
+    def _build_direct_notification_payload(
+        self,
+        *,
+        chat_id: UUID,
+        body: str | MessageBody,
+        metadata: Missing[dict[str, Any]],
+        bubbles: Missing[BubbleMarkup],
+        keyboard: Missing[KeyboardMarkup],
+        file: Missing[
+            IncomingFileAttachment | OutgoingAttachment | OutgoingAttachmentStream
+        ],
+        recipients: Missing[list[UUID]],
+        silent_response: Missing[bool],
+        markup_auto_adjust: Missing[bool],
+        stealth_mode: Missing[bool],
+        send_push: Missing[bool],
+        ignore_mute: Missing[bool],
+    ) -> DirectNotificationPayload:
+        payload = BotXAPIDirectNotificationRequestPayload.from_domain(
+            chat_id=chat_id,
+            body=body,
+            metadata=metadata,
+            bubbles=bubbles,
+            keyboard=keyboard,
+            file=Undefined if isinstance(file, OutgoingAttachmentStream) else file,
+            recipients=recipients,
+            silent_response=silent_response,
+            markup_auto_adjust=markup_auto_adjust,
+            stealth_mode=stealth_mode,
+            send_push=send_push,
+            ignore_mute=ignore_mute,
+        )
+
+        if isinstance(file, OutgoingAttachmentStream):
+            return BotXAPIStreamedDirectNotification(payload, file)
+
+        return payload
+
+    async def _send_direct_notification(
+        self,
+        bot_id: UUID,
+        payload: DirectNotificationPayload,
+        wait_callback: bool,
+        callback_timeout: float | None,
+    ) -> UUID:
+        if wait_callback and self._can_use_sync_endpoint(bot_id):
+            sync_method = self._build_method(DirectNotificationSyncMethod, bot_id)
+            try:
+                botx_api_sync_id = await sync_method.execute(payload)
+            except SyncEndpointNotSupportedError:
+                self._mark_sync_endpoint_unsupported(bot_id)
+            else:
+                return botx_api_sync_id.to_domain()
+
+        method = self._build_method(DirectNotificationMethod, bot_id)
+        botx_api_sync_id = await method.execute(
+            payload,
+            wait_callback,
+            callback_timeout,
+            self._default_callback_timeout,
+        )
+
+        return botx_api_sync_id.to_domain()
+
+    async def _send_outbox_entry(self, entry: OutboxEntry) -> UUID | None:
+        # Payloads are stored in BotX API format, so they are sent as is.
+        if entry.kind == OutboxRequestKinds.SEND_MESSAGE:
+            return await self._send_direct_notification(
+                entry.bot_id,
+                BotXAPIDirectNotificationRequestPayload(**entry.payload),
+                wait_callback=True,
+                callback_timeout=None,
+            )
+
+        method_cls: type[AuthorizedBotXMethod]
+        payload_cls: type[UnverifiedPayloadBaseModel]
+
+        if entry.kind == OutboxRequestKinds.EDIT_MESSAGE:
+            method_cls = EditEventMethod
+            payload_cls = BotXAPIEditEventRequestPayload
+        elif entry.kind == OutboxRequestKinds.REPLY_MESSAGE:
+            method_cls = ReplyEventMethod
+            payload_cls = BotXAPIReplyEventRequestPayload
+        elif entry.kind == OutboxRequestKinds.DELETE_MESSAGE:
+            method_cls = DeleteEventMethod
+            payload_cls = BotXAPIDeleteEventRequestPayload
+        else:
+            method_cls = SmartAppNotificationMethod
+            payload_cls = BotXAPISmartAppNotificationRequestPayload
+
+        method: AuthorizedBotXMethod = self._build_method(method_cls, entry.bot_id)
+        await method.execute(payload_cls(**entry.payload))
+
+        return None
+
+    def _can_use_sync_endpoint(self, bot_id: UUID) -> bool:
+        if self._delivery_mode != DeliveryModes.SYNC:
+            return False
+
+        host = self._bot_accounts_storage.get_bot_account(bot_id).host
+        return host not in self._sync_endpoints_unsupported_hosts
+
+    def _mark_sync_endpoint_unsupported(self, bot_id: UUID) -> None:
+        host = self._bot_accounts_storage.get_bot_account(bot_id).host
+        self._sync_endpoints_unsupported_hosts.add(host)
+
+        logger.warning(
+            "CTS `{host}` doesn't support synchronous endpoints, "
+            "falling back to callbacks",
+            host=host,
+        )
+
     @staticmethod
     def _build_main_collector(
         collectors: Sequence[HandlerCollector],
@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from uuid import UUID
+
+from pybotx.bot.rate_limiter import RateLimiter
+from pybotx.bot.request_scheduler import request_priority
+from pybotx.models.enums import RequestPriorities
+from pybotx.models.message.broadcast import BroadcastResult
+
+BROADCAST_DEFAULT_CONCURRENCY = 10
+
+
+async def broadcast_to_chats(
+    chat_ids: Iterable[UUID],
+    send: Callable[[UUID], Awaitable[UUID]],
+    concurrency: int = BROADCAST_DEFAULT_CONCURRENCY,
+    rate_limit: float | None = None,
+) -> AsyncIterator[BroadcastResult]:
+    """Call `send` for every chat and yield results as they are ready.
+
+    Chats are sent by `concurrency` workers, at most `rate_limit` requests
+    per second. Error of one chat doesn't stop broadcast, it's returned
+    in chat result. Workers are stopped if iteration is stopped early.
+    """
+
+    if concurrency <= 0:
+        raise ValueError("`concurrency` should be positive")
+
+    if rate_limit is not None and rate_limit <= 0:
+        raise ValueError("`rate_limit` should be positive")
+
+    rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+    results: asyncio.Queue[BroadcastResult | None] = asyncio.Queue(concurrency)
+    chat_ids_iterator = iter(chat_ids)
+    is_stopped = False
+
+    async def worker() -> None:
+        try:
+            for chat_id in chat_ids_iterator:
+                if rate_limiter:
+                    await rate_limiter.acquire()
+
+                try:
+                    with request_priority(RequestPriorities.BULK):
+                        sync_id = await send(chat_id)
+                except Exception as exc:  # noqa: BLE001
+                    result = BroadcastResult(chat_id=chat_id, error=exc)
+                else:
+                    result = BroadcastResult(chat_id=chat_id, sync_id=sync_id)
+
+                await results.put(result)
+        finally:
+            # Nobody reads results after iteration is stopped
+            if not is_stopped:
+                await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+
+    try:
+        running_workers = len(workers)
+        while running_workers:
+            result = await results.get()
+            if result is None:
+                running_workers -= 1
+            else:
+                yield result
+    finally:
+        is_stopped = True
+        for worker_task in workers:
+            worker_task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,105 @@
+import asyncio
+import heapq
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+from pybotx.logger import logger
+
+AlarmHandler = Callable[[UUID], Awaitable[None]]
+
+# Cancelled alarms are removed from heap lazily, so it's rebuilt
+# when stale entries start to dominate.
+HEAP_COMPACTION_MIN_SIZE = 1024
+
+
+class AlarmScheduler:
+    """Heap of alarms served by a single driver task."""
+
+    def __init__(self, handler: AlarmHandler) -> None:
+        self._handler = handler
+        self._heap: list[tuple[float, UUID]] = []
+        self._alarm_times: dict[UUID, float] = {}
+        self._wakeup = asyncio.Event()
+        self._driver: asyncio.Task[None] | None = None
+
+    def __contains__(self, sync_id: UUID) -> bool:
+        return sync_id in self._alarm_times
+
+    def __len__(self) -> int:
+        return len(self._alarm_times)
+
+    def schedule(self, sync_id: UUID, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        alarm_time = loop.time() + timeout
+
+        self._alarm_times[sync_id] = alarm_time
+        heapq.heappush(self._heap, (alarm_time, sync_id))
+
+        if self._driver is None:
+            self._driver = asyncio.create_task(self._drive())
+        elif self._heap[0] == (alarm_time, sync_id):
+            self._wakeup.set()
+
+    def cancel(self, sync_id: UUID) -> float | None:
+        alarm_time = self._alarm_times.pop(sync_id, None)
+        if alarm_time is None:
+            return None
+
+        if len(self._heap) > max(
+            HEAP_COMPACTION_MIN_SIZE,
+            len(self._alarm_times) * 2,
+        ):
+            self._compact()
+
+        return alarm_time - asyncio.get_running_loop().time()
+
+    async def stop(self) -> None:
+        self._alarm_times.clear()
+        self._heap.clear()
+
+        if self._driver is not None:
+            self._driver.cancel()
+            try:
+                await self._driver
+            except asyncio.CancelledError:
+                pass
+            self._driver = None
+
+    def _compact(self) -> None:
+        self._heap = [
+            (alarm_time, sync_id) for sync_id, alarm_time in self._alarm_times.items()
+        ]
+        heapq.heapify(self._heap)
+
+    async def _drive(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self._alarm_times:
+            alarm_time, sync_id = self._heap[0]
+            if self._alarm_times.get(sync_id) != alarm_time:
+                heapq.heappop(self._heap)
+                continue
+
+            if alarm_time > loop.time():
+                self._wakeup.clear()
+                wakeup_handle = loop.call_at(alarm_time, self._wakeup.set)
+                try:
+                    await self._wakeup.wait()
+                finally:
+                    wakeup_handle.cancel()
+                continue
+
+            heapq.heappop(self._heap)
+            del self._alarm_times[sync_id]
+
+            # Failed handler shouldn't stop other alarms
+            try:
+                await self._handler(sync_id)
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "Alarm handler for `{sync_id}` failed",
+                    sync_id=sync_id,
+                )
+
+        self._heap.clear()
+        self._driver = None
@@ -0,0 +1,35 @@
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+from uuid import UUID
+
+CallbackListener = Callable[[UUID], Awaitable[None]]
+
+
+class CallbackBrokerProto(Protocol):
+    """Key-value storage with pub/sub shared between bot workers."""
+
+    async def publish_callback(
+        self,
+        sync_id: UUID,
+        raw_callback: str,
+    ) -> None: ...  # pragma: no cover
+
+    async def get_callback(
+        self,
+        sync_id: UUID,
+    ) -> str | None: ...  # pragma: no cover
+
+    async def delete_callback(
+        self,
+        sync_id: UUID,
+    ) -> None: ...  # pragma: no cover
+
+    async def subscribe(
+        self,
+        listener: CallbackListener,
+    ) -> None: ...  # pragma: no cover
+
+    async def unsubscribe(
+        self,
+        listener: CallbackListener,
+    ) -> None: ...  # pragma: no cover
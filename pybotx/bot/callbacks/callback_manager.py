@@ -1,8 +1,13 @@
 import asyncio
-from typing import Literal, NamedTuple, overload
+from collections.abc import AsyncIterator, Iterable
+from contextlib import suppress
+from functools import partial
+from typing import Literal, TypeAlias, overload
 from uuid import UUID
 
+from pybotx.bot.callbacks.alarm_scheduler import AlarmScheduler
 from pybotx.bot.callbacks.callback_repo_proto import CallbackRepoProto
+from pybotx.bot.callbacks.expiring_set import ExpiringSyncIdSet
 from pybotx.bot.exceptions import BotXMethodCallbackNotFoundError
 from pybotx.client.exceptions.callbacks import CallbackNotReceivedError
 from pybotx.logger import logger
@@ -10,21 +15,17 @@ from pybotx.models.method_callbacks import BotXMethodCallback
 
 ORPHAN_CALLBACK_TTL_SECONDS = 5.0
 ORPHAN_PENDING_CALLBACKS_LIMIT = 1000
+EXPIRED_CALLBACKS_TTL_SECONDS = 600.0
 
-
-class CallbackAlarm(NamedTuple):
-    alarm_time: float
-    task: asyncio.Task[None]
+BotXMethodCallbackResult: TypeAlias = (
+    BotXMethodCallback | CallbackNotReceivedError | BotXMethodCallbackNotFoundError
+)
 
 
 async def _callback_timeout_alarm(
     callbacks_manager: "CallbackManager",
     sync_id: UUID,
-    timeout: float,
 ) -> None:
-    await asyncio.sleep(timeout)
-
-    callbacks_manager.cancel_callback_timeout_alarm(sync_id)
     await callbacks_manager.pop_botx_method_callback(sync_id)
 
     logger.error("Callback `{sync_id}` wasn't waited", sync_id=sync_id)
@@ -33,11 +34,7 @@ async def _callback_timeout_alarm(
 async def _orphan_callback_alarm(
     callbacks_manager: "CallbackManager",
     sync_id: UUID,
-    timeout: float,
 ) -> None:
-    await asyncio.sleep(timeout)
-
-    callbacks_manager.cancel_orphan_callback_alarm(sync_id)
     callbacks_manager.drop_orphan_callback(sync_id)
 
     logger.warning(
@@ -47,13 +44,19 @@ async def _orphan_callback_alarm(
 
 
 class CallbackManager:
-    def __init__(self, callback_repo: CallbackRepoProto) -> None:
+    def __init__(
+        self,
+        callback_repo: CallbackRepoProto,
+        expired_callbacks_ttl: float = EXPIRED_CALLBACKS_TTL_SECONDS,
+    ) -> None:
         self._callback_repo = callback_repo
-        self._callback_alarms: dict[UUID, CallbackAlarm] = {}
-        self._orphan_callback_alarms: dict[UUID, CallbackAlarm] = {}
+        self._callback_alarms = AlarmScheduler(partial(_callback_timeout_alarm, self))
+        self._orphan_callback_alarms = AlarmScheduler(
+            partial(_orphan_callback_alarm, self),
+        )
         self._expected_sync_ids: set[UUID] = set()
         self._pending_callbacks: dict[UUID, BotXMethodCallback] = {}
-        self._expired_sync_ids: set[UUID] = set()
+        self._expired_sync_ids = ExpiringSyncIdSet(expired_callbacks_ttl)
 
     def register_expected_callback(self, sync_id: UUID) -> None:
         self._expected_sync_ids.add(sync_id)
@@ -93,8 +96,7 @@ class CallbackManager:
             self._pending_callbacks[sync_id] = callback
             self._setup_orphan_callback_alarm(sync_id, ORPHAN_CALLBACK_TTL_SECONDS)
             logger.warning(
-                "Callback `{sync_id}` received without a registered handler; "
-                "buffering",
+                "Callback `{sync_id}` received without a registered handler; buffering",
                 sync_id=sync_id,
             )
             return
@@ -105,13 +107,105 @@ class CallbackManager:
         timeout: float,
     ) -> BotXMethodCallback:
         try:
-            return await self._callback_repo.wait_botx_method_callback(
-                sync_id, timeout
-            )
+            return await self._callback_repo.wait_botx_method_callback(sync_id, timeout)
         except CallbackNotReceivedError:
             self._mark_callback_expired(sync_id)
             raise
 
+    async def as_completed_botx_method_callbacks(
+        self,
+        sync_ids: Iterable[UUID],
+        timeout: float | None = None,
+    ) -> AsyncIterator[tuple[UUID, BotXMethodCallbackResult]]:
+        """Yield callbacks of not waited methods in order of their arrival.
+
+        All callbacks share one deadline: `timeout` seconds from now or,
+        if it's `None`, the latest of their timeout alarms. Unknown sync_ids
+        and callbacks not received before deadline are yielded with
+        exceptions instead of callbacks.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        remaining_times: dict[UUID, float] = {}
+        not_found_errors: list[BotXMethodCallbackNotFoundError] = []
+        for sync_id in dict.fromkeys(sync_ids):
+            try:
+                remaining_times[sync_id] = self.cancel_callback_timeout_alarm(
+                    sync_id,
+                    return_remaining_time=True,
+                )
+            except BotXMethodCallbackNotFoundError as exc:
+                not_found_errors.append(exc)
+
+        if timeout is None:
+            timeout = max(remaining_times.values(), default=0)
+
+        # Done futures and `None` on deadline, so one timer serves all callbacks.
+        done_futures: asyncio.Queue[asyncio.Future[BotXMethodCallback] | None] = (
+            asyncio.Queue()
+        )
+        pending: dict[asyncio.Future[BotXMethodCallback], UUID] = {}
+        waiting_tasks: set[asyncio.Future[BotXMethodCallback]] = set()
+        for sync_id in remaining_times:
+            try:
+                future = self._get_callback_future(sync_id, timeout, waiting_tasks)
+            except BotXMethodCallbackNotFoundError as exc:
+                not_found_errors.append(exc)
+                continue
+
+            future.add_done_callback(done_futures.put_nowait)
+            pending[future] = sync_id
+
+        deadline_timer = loop.call_later(timeout, done_futures.put_nowait, None)
+
+        try:
+            for not_found_error in not_found_errors:
+                yield not_found_error.sync_id, not_found_error
+
+            while pending:
+                done_future = await done_futures.get()
+                if done_future is None:
+                    break
+
+                sync_id = pending.pop(done_future)
+                if isinstance(done_future.exception(), CallbackNotReceivedError):
+                    await self._expire_callback(sync_id)
+                    yield sync_id, CallbackNotReceivedError(sync_id)
+                    continue
+
+                callback = done_future.result()
+                await self._callback_repo.pop_botx_method_callback(sync_id)
+                yield sync_id, callback
+
+            while pending:
+                future, sync_id = pending.popitem()
+                future.remove_done_callback(done_futures.put_nowait)
+                await self._expire_callback(sync_id)
+                yield sync_id, CallbackNotReceivedError(sync_id)
+        finally:
+            deadline_timer.cancel()
+            for waiting_task in waiting_tasks:
+                waiting_task.cancel()
+
+            # Iteration was stopped early, so nobody will wait rest callbacks.
+            for future, sync_id in pending.items():
+                future.remove_done_callback(done_futures.put_nowait)
+                await self._expire_callback(sync_id)
+
+    async def wait_botx_method_callbacks(
+        self,
+        sync_ids: Iterable[UUID],
+        timeout: float | None = None,
+    ) -> dict[UUID, BotXMethodCallbackResult]:
+        return {
+            sync_id: result
+            async for sync_id, result in self.as_completed_botx_method_callbacks(
+                sync_ids,
+                timeout,
+            )
+        }
+
     async def pop_botx_method_callback(
         self,
         sync_id: UUID,
@@ -119,15 +213,12 @@ class CallbackManager:
         return await self._callback_repo.pop_botx_method_callback(sync_id)
 
     async def stop_callbacks_waiting(self) -> None:
+        await self._callback_alarms.stop()
+        await self._orphan_callback_alarms.stop()
         await self._callback_repo.stop_callbacks_waiting()
 
     def setup_callback_timeout_alarm(self, sync_id: UUID, timeout: float) -> None:
-        loop = asyncio.get_running_loop()
-
-        self._callback_alarms[sync_id] = CallbackAlarm(
-            alarm_time=loop.time() + timeout,
-            task=asyncio.create_task(_callback_timeout_alarm(self, sync_id, timeout)),
-        )
+        self._callback_alarms.schedule(sync_id, timeout)
 
     @overload
     def cancel_callback_timeout_alarm(
@@ -147,35 +238,42 @@ class CallbackManager:
         sync_id: UUID,
         return_remaining_time: bool = False,
     ) -> float | None:
-        try:
-            alarm_time, alarm = self._callback_alarms.pop(sync_id)
-        except KeyError:
-            raise BotXMethodCallbackNotFoundError(sync_id) from None
+        time_before_alarm = self._callback_alarms.cancel(sync_id)
+        if time_before_alarm is None:
+            raise BotXMethodCallbackNotFoundError(sync_id)
 
-        time_before_alarm: float | None = None
+        return time_before_alarm if return_remaining_time else None
 
-        if return_remaining_time:
-            loop = asyncio.get_running_loop()
-            time_before_alarm = alarm_time - loop.time()
+    def _get_callback_future(
+        self,
+        sync_id: UUID,
+        timeout: float,
+        waiting_tasks: set[asyncio.Future[BotXMethodCallback]],
+    ) -> asyncio.Future[BotXMethodCallback]:
+        get_callback = getattr(self._callback_repo, "get_botx_method_callback", None)
+        if get_callback is not None:
+            return get_callback(sync_id)  # type: ignore[no-any-return]
+
+        # Repo doesn't implement optional `get_botx_method_callback`
+        waiting_task = asyncio.ensure_future(
+            self._callback_repo.wait_botx_method_callback(sync_id, timeout),
+        )
+        waiting_tasks.add(waiting_task)
 
-        alarm.cancel()
+        return waiting_task
 
-        return time_before_alarm
+    async def _expire_callback(self, sync_id: UUID) -> None:
+        with suppress(KeyError):
+            await self._callback_repo.pop_botx_method_callback(sync_id)
+        self._mark_callback_expired(sync_id)
 
     def _setup_orphan_callback_alarm(self, sync_id: UUID, timeout: float) -> None:
         if sync_id in self._orphan_callback_alarms:
             return
-        loop = asyncio.get_running_loop()
-        self._orphan_callback_alarms[sync_id] = CallbackAlarm(
-            alarm_time=loop.time() + timeout,
-            task=asyncio.create_task(_orphan_callback_alarm(self, sync_id, timeout)),
-        )
+        self._orphan_callback_alarms.schedule(sync_id, timeout)
 
     def cancel_orphan_callback_alarm(self, sync_id: UUID) -> None:
-        alarm = self._orphan_callback_alarms.pop(sync_id, None)
-        if alarm is None:
-            return
-        alarm.task.cancel()
+        self._orphan_callback_alarms.cancel(sync_id)
 
     def mark_callback_expired(self, sync_id: UUID) -> None:
         self._mark_callback_expired(sync_id)
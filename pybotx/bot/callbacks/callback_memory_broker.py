@@ -0,0 +1,55 @@
+import time
+from uuid import UUID
+
+from pybotx.bot.callbacks.callback_broker_proto import (
+    CallbackBrokerProto,
+    CallbackListener,
+)
+
+CALLBACK_BROKER_TTL_SECONDS = 600.0
+
+
+class CallbackMemoryBroker(CallbackBrokerProto):
+    """In-process broker, for tests and several bots in one process."""
+
+    def __init__(self, ttl: float = CALLBACK_BROKER_TTL_SECONDS) -> None:
+        self._ttl = ttl
+        # All items have the same ttl, so insertion order is expiration order.
+        self._callbacks: dict[UUID, tuple[float, str]] = {}
+        self._listeners: list[CallbackListener] = []
+
+    async def publish_callback(self, sync_id: UUID, raw_callback: str) -> None:
+        now = time.monotonic()
+        self._drop_expired_callbacks(now)
+
+        self._callbacks.pop(sync_id, None)
+        self._callbacks[sync_id] = (now + self._ttl, raw_callback)
+
+        for listener in list(self._listeners):
+            await listener(sync_id)
+
+    async def get_callback(self, sync_id: UUID) -> str | None:
+        self._drop_expired_callbacks(time.monotonic())
+
+        stored_callback = self._callbacks.get(sync_id)
+        if stored_callback is None:
+            return None
+
+        return stored_callback[1]
+
+    async def delete_callback(self, sync_id: UUID) -> None:
+        self._callbacks.pop(sync_id, None)
+
+    async def subscribe(self, listener: CallbackListener) -> None:
+        self._listeners.append(listener)
+
+    async def unsubscribe(self, listener: CallbackListener) -> None:
+        self._listeners.remove(listener)
+
+    def _drop_expired_callbacks(self, now: float) -> None:
+        while self._callbacks:
+            sync_id = next(iter(self._callbacks))
+            if self._callbacks[sync_id][0] > now:
+                break
+
+            del self._callbacks[sync_id]
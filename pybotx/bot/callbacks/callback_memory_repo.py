@@ -25,7 +25,7 @@ class CallbackMemoryRepo(CallbackRepoProto):
     ) -> None:
         sync_id = callback.sync_id
 
-        future = self._get_botx_method_callback(sync_id)
+        future = self.get_botx_method_callback(sync_id)
         future.set_result(callback)
 
     async def wait_botx_method_callback(
@@ -33,7 +33,7 @@ class CallbackMemoryRepo(CallbackRepoProto):
         sync_id: UUID,
         timeout: float,
     ) -> BotXMethodCallback:
-        future = self._get_botx_method_callback(sync_id)
+        future = self.get_botx_method_callback(sync_id)
 
         try:
             return await asyncio.wait_for(future, timeout=timeout)
@@ -41,6 +41,12 @@ class CallbackMemoryRepo(CallbackRepoProto):
             del self._callback_futures[sync_id]
             raise CallbackNotReceivedError(sync_id) from exc
 
+    def get_botx_method_callback(self, sync_id: UUID) -> "Future[BotXMethodCallback]":
+        try:
+            return self._callback_futures[sync_id]
+        except KeyError:
+            raise BotXMethodCallbackNotFoundError(sync_id) from None
+
     async def pop_botx_method_callback(
         self,
         sync_id: UUID,
@@ -58,9 +64,3 @@ class CallbackMemoryRepo(CallbackRepoProto):
                 # Mark exception as retrieved to avoid "Future exception was never retrieved"
                 future.exception()
         self._callback_futures.clear()
-
-    def _get_botx_method_callback(self, sync_id: UUID) -> "Future[BotXMethodCallback]":
-        try:
-            return self._callback_futures[sync_id]
-        except KeyError:
-            raise BotXMethodCallbackNotFoundError(sync_id) from None
@@ -10,6 +10,13 @@ from typing import Protocol
 
 
 class CallbackRepoProto(Protocol):
+    """Storage of BotX method callbacks.
+
+    Repo may also implement optional `get_botx_method_callback(sync_id)`,
+    which returns callback future, so callbacks waited in bulk don't need
+    a task each.
+    """
+
     async def create_botx_method_callback(
         self,
         sync_id: UUID,
@@ -0,0 +1,124 @@
+import asyncio
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from pybotx.bot.callbacks.callback_broker_proto import CallbackBrokerProto
+from pybotx.bot.callbacks.callback_repo_proto import CallbackRepoProto
+from pybotx.bot.exceptions import BotShuttingDownError, BotXMethodCallbackNotFoundError
+from pybotx.client.exceptions.callbacks import CallbackNotReceivedError
+from pybotx.models.method_callbacks import BotXMethodCallback
+
+if TYPE_CHECKING:
+    from asyncio import Future
+
+_callback_adapter: TypeAdapter[BotXMethodCallback] = TypeAdapter(BotXMethodCallback)
+
+
+class CallbackSharedRepo(CallbackRepoProto):
+    """Callback repo for several workers behind one callback endpoint.
+
+    Callback received by any worker is stored in the broker and published,
+    so the worker which waits for it can pick it up.
+    """
+
+    def __init__(self, broker: CallbackBrokerProto) -> None:
+        self._broker = broker
+        self._callback_futures: dict[UUID, Future[BotXMethodCallback]] = {}
+        self._subscribed = False
+        # Concurrent first callbacks shouldn't subscribe several times
+        self._subscription_lock = asyncio.Lock()
+
+    async def create_botx_method_callback(self, sync_id: UUID) -> None:
+        if not self._subscribed:
+            await self._subscribe()
+
+        loop = asyncio.get_running_loop()
+        self._callback_futures[sync_id] = loop.create_future()
+
+        # Callback can be received by another worker before registration
+        await self._resolve_callback(sync_id)
+
+    async def set_botx_method_callback_result(
+        self,
+        callback: BotXMethodCallback,
+    ) -> None:
+        await self._broker.publish_callback(
+            callback.sync_id,
+            callback.model_dump_json(),
+        )
+
+    async def wait_botx_method_callback(
+        self,
+        sync_id: UUID,
+        timeout: float,
+    ) -> BotXMethodCallback:
+        future = self.get_botx_method_callback(sync_id)
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError as exc:
+            raise CallbackNotReceivedError(sync_id) from exc
+        finally:
+            self._callback_futures.pop(sync_id, None)
+
+    def get_botx_method_callback(self, sync_id: UUID) -> "Future[BotXMethodCallback]":
+        try:
+            return self._callback_futures[sync_id]
+        except KeyError:
+            raise BotXMethodCallbackNotFoundError(sync_id) from None
+
+    async def pop_botx_method_callback(
+        self,
+        sync_id: UUID,
+    ) -> "Future[BotXMethodCallback]":
+        future = self._callback_futures.pop(sync_id)
+        if not future.done():
+            # Received callback is already deleted from broker
+            await self._broker.delete_callback(sync_id)
+        return future
+
+    async def stop_callbacks_waiting(self) -> None:
+        await self._unsubscribe()
+
+        for sync_id, future in self._callback_futures.items():
+            if not future.done():
+                future.set_exception(
+                    BotShuttingDownError(
+                        f"Callback with sync_id `{sync_id!s}` can't be received",
+                    ),
+                )
+                # Mark exception as retrieved to avoid "Future exception was never retrieved"
+                future.exception()
+        self._callback_futures.clear()
+
+    async def _subscribe(self) -> None:
+        async with self._subscription_lock:
+            if self._subscribed:
+                return
+
+            await self._broker.subscribe(self._on_callback_published)
+            self._subscribed = True
+
+    async def _unsubscribe(self) -> None:
+        async with self._subscription_lock:
+            if not self._subscribed:
+                return
+
+            await self._broker.unsubscribe(self._on_callback_published)
+            self._subscribed = False
+
+    async def _on_callback_published(self, sync_id: UUID) -> None:
+        if sync_id in self._callback_futures:
+            await self._resolve_callback(sync_id)
+
+    async def _resolve_callback(self, sync_id: UUID) -> None:
+        raw_callback = await self._broker.get_callback(sync_id)
+
+        future = self._callback_futures.get(sync_id)
+        if raw_callback is None or future is None or future.done():
+            return
+
+        await self._broker.delete_callback(sync_id)
+        future.set_result(_callback_adapter.validate_json(raw_callback))
@@ -0,0 +1,165 @@
+import asyncio
+import sqlite3
+import time
+from uuid import UUID
+
+from pybotx.bot.callbacks.callback_broker_proto import (
+    CallbackBrokerProto,
+    CallbackListener,
+)
+from pybotx.bot.callbacks.callback_memory_broker import CALLBACK_BROKER_TTL_SECONDS
+from pybotx.bot.sqlite_connection import SQLiteConnection
+from pybotx.logger import logger
+
+CALLBACK_BROKER_POLL_INTERVAL_SECONDS = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS botx_callbacks (
+    sync_id TEXT PRIMARY KEY,
+    raw_callback TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS botx_callbacks_expires_at
+    ON botx_callbacks (expires_at);
+CREATE TABLE IF NOT EXISTS botx_callback_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sync_id TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS botx_callback_events_created_at
+    ON botx_callback_events (created_at);
+"""
+
+
+class CallbackSQLiteBroker(CallbackBrokerProto):
+    """Broker on top of SQLite database for workers on the same host.
+
+    Subscribers are notified by polling an append-only events table.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = CALLBACK_BROKER_TTL_SECONDS,
+        poll_interval: float = CALLBACK_BROKER_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        self._ttl = ttl
+        self._poll_interval = poll_interval
+
+        self._connection = SQLiteConnection(path, _SCHEMA)
+
+        # Guards poller start and stop, which await between check and set
+        self._poller_lock = asyncio.Lock()
+        self._listeners: list[CallbackListener] = []
+        self._poller: asyncio.Task[None] | None = None
+        self._last_event_id = 0
+
+    async def publish_callback(self, sync_id: UUID, raw_callback: str) -> None:
+        await self._connection.transaction(
+            lambda connection: self._publish_callback(
+                connection,
+                str(sync_id),
+                raw_callback,
+            ),
+        )
+
+    async def get_callback(self, sync_id: UUID) -> str | None:
+        rows = await self._connection.fetchall(
+            "SELECT raw_callback FROM botx_callbacks "
+            "WHERE sync_id = ? AND expires_at > ?",
+            (str(sync_id), time.time()),
+        )
+        if not rows:
+            return None
+
+        return str(rows[0][0])
+
+    async def delete_callback(self, sync_id: UUID) -> None:
+        await self._connection.execute(
+            "DELETE FROM botx_callbacks WHERE sync_id = ?",
+            (str(sync_id),),
+        )
+
+    async def subscribe(self, listener: CallbackListener) -> None:
+        self._listeners.append(listener)
+
+        async with self._poller_lock:
+            if self._poller is not None:
+                return
+
+            rows = await self._connection.fetchall(
+                "SELECT COALESCE(MAX(id), 0) FROM botx_callback_events",
+            )
+            self._last_event_id = rows[0][0]
+            self._poller = asyncio.create_task(self._poll_events())
+
+    async def unsubscribe(self, listener: CallbackListener) -> None:
+        self._listeners.remove(listener)
+
+        async with self._poller_lock:
+            if self._listeners or self._poller is None:
+                return
+
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+
+    async def close(self) -> None:
+        for listener in list(self._listeners):
+            await self.unsubscribe(listener)
+
+        await self._connection.close()
+
+    async def _poll_events(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+
+            # Poller is kept running, otherwise no callback would be delivered
+            try:
+                rows = await self._connection.fetchall(
+                    "SELECT id, sync_id FROM botx_callback_events "
+                    "WHERE id > ? ORDER BY id",
+                    (self._last_event_id,),
+                )
+            except Exception:  # noqa: BLE001
+                logger.exception("Can't fetch callback events")
+                continue
+
+            for event_id, sync_id in rows:
+                self._last_event_id = event_id
+                for listener in list(self._listeners):
+                    try:
+                        await listener(UUID(sync_id))
+                    except Exception:  # noqa: BLE001
+                        logger.exception(
+                            "Callback listener for `{sync_id}` failed",
+                            sync_id=sync_id,
+                        )
+
+    def _publish_callback(
+        self,
+        connection: sqlite3.Connection,
+        sync_id: str,
+        raw_callback: str,
+    ) -> None:
+        now = time.time()
+
+        connection.execute(
+            "DELETE FROM botx_callbacks WHERE expires_at <= ?",
+            (now,),
+        )
+        connection.execute(
+            "DELETE FROM botx_callback_events WHERE created_at <= ?",
+            (now - self._ttl,),
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO botx_callbacks VALUES (?, ?, ?)",
+            (sync_id, raw_callback, now + self._ttl),
+        )
+        connection.execute(
+            "INSERT INTO botx_callback_events (sync_id, created_at) VALUES (?, ?)",
+            (sync_id, now),
+        )
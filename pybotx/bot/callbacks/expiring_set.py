@@ -0,0 +1,51 @@
+import time
+from collections import deque
+from collections.abc import Callable
+from uuid import UUID
+
+
+class ExpiringSyncIdSet:
+    """Set of sync_ids which forgets them after `ttl` seconds.
+
+    Items are stored in a ring of time buckets, so an item lives at least
+    `ttl` and at most `ttl + ttl / buckets_count` seconds and expired items
+    are dropped a whole bucket at a time.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        buckets_count: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0 or buckets_count <= 0:
+            raise ValueError("`ttl` and `buckets_count` should be positive")
+
+        self._ttl = ttl
+        self._clock = clock
+        self._bucket_ttl = ttl / buckets_count
+        self._buckets: deque[tuple[float, set[UUID]]] = deque()
+
+    def __contains__(self, sync_id: UUID) -> bool:
+        self._drop_expired_buckets(self._clock())
+        return any(sync_id in bucket for _, bucket in self._buckets)
+
+    def __len__(self) -> int:
+        self._drop_expired_buckets(self._clock())
+        return sum(len(bucket) for _, bucket in self._buckets)
+
+    def add(self, sync_id: UUID) -> None:
+        now = self._clock()
+        self._drop_expired_buckets(now)
+
+        if not self._buckets or self._buckets[-1][0] + self._bucket_ttl <= now:
+            self._buckets.append((now, set()))
+
+        self._buckets[-1][1].add(sync_id)
+
+    def _drop_expired_buckets(self, now: float) -> None:
+        # Bucket expires when its newest possible item becomes older than ttl.
+        while (
+            self._buckets and self._buckets[0][0] + self._bucket_ttl + self._ttl <= now
+        ):
+            self._buckets.popleft()
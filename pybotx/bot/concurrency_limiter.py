@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from http import HTTPStatus
+from itertools import count
+
+import httpx
+
+from pybotx.bot.contextvars import request_priority_var
+from pybotx.bot.request_scheduler import REQUEST_SCHEDULER_DEFAULT_MAX_CONCURRENCY
+from pybotx.models.enums import RequestPriorities
+
+CONCURRENCY_LIMITER_DEFAULT_INITIAL_LIMIT = 10
+CONCURRENCY_LIMITER_DEFAULT_MIN_LIMIT = 1
+CONCURRENCY_LIMITER_DEFAULT_LATENCY_THRESHOLD = 2.0
+CONCURRENCY_LIMITER_DEFAULT_BACKOFF_RATIO = 0.5
+# Weight of the last response in average latency.
+LATENCY_SMOOTHING_FACTOR = 0.1
+
+PRIORITIES_ORDER = {priority: order for order, priority in enumerate(RequestPriorities)}
+
+
+@dataclass(slots=True)
+class ConcurrencyLimitMetrics:
+    limit: int
+    in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    congested: int = 0
+    average_latency: float = 0.0
+
+
+@dataclass(slots=True)
+class ConcurrencySlot:
+    started_at: float
+    status_code: int | None = None
+    latency: float | None = None
+    is_timeout_shrunk: bool = False
+
+    def record_response(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.latency = asyncio.get_running_loop().time() - self.started_at
+
+
+class _CTSConcurrencyLimit:
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.completed = 0
+        self.congested = 0
+        self.average_latency = 0.0
+        self.decreased_at = float("-inf")
+        # Cancelled waiters are left in heap and skipped on pop.
+        self.waiters_heap: list[tuple[int, int, asyncio.Future[None]]] = []
+        self.waiters: set[asyncio.Future[None]] = set()
+
+
+class ConcurrencyLimiter:
+    """Adapts concurrency of BotX requests to capacity of each CTS.
+
+    Limit grows by one request per window of healthy responses (above
+    `initial_limit` only while at least half of it is used) and is cut
+    by `backoff_ratio` on `429`, `5xx`, transport errors or responses
+    slower than `latency_threshold`. Requests, which were sent before the
+    last cut, don't cut the limit again. Timeouts of requests, whose
+    timeouts were shrunk to handler deadline, are ignored.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = CONCURRENCY_LIMITER_DEFAULT_INITIAL_LIMIT,
+        min_limit: int = CONCURRENCY_LIMITER_DEFAULT_MIN_LIMIT,
+        max_limit: int = REQUEST_SCHEDULER_DEFAULT_MAX_CONCURRENCY,
+        latency_threshold: float = CONCURRENCY_LIMITER_DEFAULT_LATENCY_THRESHOLD,
+        backoff_ratio: float = CONCURRENCY_LIMITER_DEFAULT_BACKOFF_RATIO,
+    ) -> None:
+        if min_limit <= 0:
+            raise ValueError("`min_limit` should be positive")
+
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "`initial_limit` should be between `min_limit` and `max_limit`",
+            )
+
+        if latency_threshold <= 0:
+            raise ValueError("`latency_threshold` should be positive")
+
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("`backoff_ratio` should be between 0 and 1")
+
+        self._initial_limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_threshold = latency_threshold
+        self._backoff_ratio = backoff_ratio
+        self._limits: dict[str, _CTSConcurrencyLimit] = {}
+        self._counter = count()
+
+    @asynccontextmanager
+    async def request_slot(self, cts_url: str) -> AsyncIterator[ConcurrencySlot]:
+        cts_limit = self._limits.setdefault(
+            cts_url,
+            _CTSConcurrencyLimit(self._initial_limit),
+        )
+        await self._acquire(cts_limit)
+
+        slot = ConcurrencySlot(asyncio.get_running_loop().time())
+        congested = None
+        try:
+            yield slot
+        except httpx.TransportError as exc:
+            # Timeout shrunk to handler deadline doesn't mean that CTS is slow
+            if not (isinstance(exc, httpx.TimeoutException) and slot.is_timeout_shrunk):
+                congested = True
+            raise
+        finally:
+            if congested is None and slot.status_code is not None:
+                congested = self._is_congested(slot)
+
+            cts_limit.in_flight -= 1
+            if congested is not None:
+                self._adjust_limit(cts_limit, slot, congested)
+
+            self._wake_up_waiters(cts_limit)
+
+    def get_metrics(self) -> dict[str, ConcurrencyLimitMetrics]:
+        return {
+            cts_url: ConcurrencyLimitMetrics(
+                limit=int(cts_limit.limit),
+                in_flight=cts_limit.in_flight,
+                queued=len(cts_limit.waiters),
+                completed=cts_limit.completed,
+                congested=cts_limit.congested,
+                average_latency=cts_limit.average_latency,
+            )
+            for cts_url, cts_limit in self._limits.items()
+        }
+
+    async def _acquire(self, cts_limit: _CTSConcurrencyLimit) -> None:
+        if cts_limit.in_flight < int(cts_limit.limit) and not cts_limit.waiters:
+            cts_limit.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        priority_order = PRIORITIES_ORDER[request_priority_var.get()]
+        heapq.heappush(
+            cts_limit.waiters_heap,
+            (priority_order, next(self._counter), waiter),
+        )
+        cts_limit.waiters.add(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                cts_limit.waiters.discard(waiter)
+            else:
+                # Slot was given right before cancellation, pass it on.
+                cts_limit.in_flight -= 1
+                self._wake_up_waiters(cts_limit)
+            raise
+
+    def _is_congested(self, slot: ConcurrencySlot) -> bool:
+        assert slot.status_code is not None
+        assert slot.latency is not None
+
+        return (
+            slot.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            or slot.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+            or slot.latency > self._latency_threshold
+        )
+
+    def _adjust_limit(
+        self,
+        cts_limit: _CTSConcurrencyLimit,
+        slot: ConcurrencySlot,
+        congested: bool,
+    ) -> None:
+        now = asyncio.get_running_loop().time()
+        latency = now - slot.started_at if slot.latency is None else slot.latency
+
+        cts_limit.completed += 1
+        if cts_limit.completed == 1:
+            cts_limit.average_latency = latency
+        else:
+            cts_limit.average_latency += LATENCY_SMOOTHING_FACTOR * (
+                latency - cts_limit.average_latency
+            )
+
+        is_limit_used = (cts_limit.in_flight + 1) * 2 >= int(cts_limit.limit)
+        if congested:
+            cts_limit.congested += 1
+            if slot.started_at >= cts_limit.decreased_at:
+                cts_limit.limit = max(
+                    self._min_limit,
+                    cts_limit.limit * self._backoff_ratio,
+                )
+                cts_limit.decreased_at = now
+        # Limit above `initial_limit` isn't grown while less than half of it
+        # is used, otherwise it would become meaningless after quiet periods.
+        # Cut limit is recovered to `initial_limit` even under light load.
+        elif is_limit_used or cts_limit.limit < self._initial_limit:
+            cts_limit.limit = min(
+                self._max_limit,
+                cts_limit.limit + 1 / cts_limit.limit,
+            )
+
+    def _wake_up_waiters(self, cts_limit: _CTSConcurrencyLimit) -> None:
+        while cts_limit.waiters and cts_limit.in_flight < int(cts_limit.limit):
+            _, _, waiter = heapq.heappop(cts_limit.waiters_heap)
+            if waiter not in cts_limit.waiters:
+                continue
+
+            cts_limit.waiters.remove(waiter)
+            if waiter.cancelled():
+                continue
+
+            cts_limit.in_flight += 1
+            waiter.set_result(None)
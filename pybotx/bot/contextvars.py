@@ -2,9 +2,17 @@ from contextvars import ContextVar
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from pybotx.models.enums import RequestPriorities
+
 if TYPE_CHECKING:  # To avoid circular import
     from pybotx.bot.bot import Bot
 
 bot_var: ContextVar["Bot"] = ContextVar("bot_var")
 bot_id_var: ContextVar[UUID] = ContextVar("bot_id")
 chat_id_var: ContextVar[UUID] = ContextVar("chat_id")
+request_priority_var: ContextVar[RequestPriorities] = ContextVar(
+    "request_priority",
+    default=RequestPriorities.NORMAL,
+)
+# Event loop time, after which BotX requests are useless
+deadline_var: ContextVar[float | None] = ContextVar("deadline", default=None)
@@ -0,0 +1,79 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TypeVar
+
+CPU_OFFLOADER_DEFAULT_MIN_SIZE = 1024 * 1024
+CPU_OFFLOADER_DEFAULT_MAX_WORKERS = 4
+
+TResult = TypeVar("TResult")
+
+
+@dataclass(slots=True)
+class CPUOffloadMetrics:
+    offloaded: int = 0
+    offloaded_bytes: int = 0
+    offloaded_time: float = 0.0
+
+
+class CPUOffloader:
+    """Runs heavy codec work on big payloads in thread pool.
+
+    Decoding of inline attachments, base64 encoding of outgoing files and
+    compression of request bodies don't block event loop, so small
+    messages are handled without delays during file-heavy traffic. Work on
+    payloads smaller than `min_size` is done in place, because passing it
+    to thread costs more.
+
+    Incoming commands with offloaded attachments are handled after they
+    are decoded, so they can be handled after commands received later.
+    Offloading is opt-in: bot without offloader does all codec work in
+    place.
+    """
+
+    def __init__(
+        self,
+        min_size: int = CPU_OFFLOADER_DEFAULT_MIN_SIZE,
+        max_workers: int = CPU_OFFLOADER_DEFAULT_MAX_WORKERS,
+    ) -> None:
+        if min_size <= 0:
+            raise ValueError("`min_size` should be positive")
+
+        if max_workers <= 0:
+            raise ValueError("`max_workers` should be positive")
+
+        self._min_size = min_size
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._metrics = CPUOffloadMetrics()
+
+    def should_offload(self, size: int) -> bool:
+        return size >= self._min_size
+
+    async def run(self, size: int, func: Callable[[], TResult]) -> TResult:
+        if not self.should_offload(size):
+            return func()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self._max_workers,
+                thread_name_prefix="pybotx-cpu-offloader",
+            )
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        try:
+            return await loop.run_in_executor(self._executor, func)
+        finally:
+            self._metrics.offloaded += 1
+            self._metrics.offloaded_bytes += size
+            self._metrics.offloaded_time += loop.time() - start_time
+
+    def get_metrics(self) -> CPUOffloadMetrics:
+        return replace(self._metrics)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
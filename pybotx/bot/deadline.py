@@ -0,0 +1,35 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from pybotx.bot.contextvars import deadline_var
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """Limit time of BotX requests and callbacks waiting inside the block.
+
+    Nested blocks can only shrink outer deadline.
+    """
+
+    if timeout <= 0:
+        raise ValueError("`timeout` should be positive")
+
+    new_deadline = asyncio.get_running_loop().time() + timeout
+    current_deadline = deadline_var.get()
+    if current_deadline is not None:
+        new_deadline = min(new_deadline, current_deadline)
+
+    token = deadline_var.set(new_deadline)
+    try:
+        yield
+    finally:
+        deadline_var.reset(token)
+
+
+def get_remaining_time() -> float | None:
+    current_deadline = deadline_var.get()
+    if current_deadline is None:
+        return None
+
+    return max(current_deadline - asyncio.get_running_loop().time(), 0)
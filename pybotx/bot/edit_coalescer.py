@@ -0,0 +1,105 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import fields, replace
+from uuid import UUID
+
+from pybotx.bot.outbox.outbox import is_retryable_error
+from pybotx.logger import logger
+from pybotx.missing import Undefined
+from pybotx.models.message.edit_message import EditMessage
+
+EditHandler = Callable[[EditMessage], Awaitable[None]]
+
+EDIT_COALESCING_MAX_RATE = 2.0
+EDIT_COALESCING_MAX_RETRIES = 3
+
+
+def merge_edit_messages(pending: EditMessage, message: EditMessage) -> EditMessage:
+    changes = {
+        field.name: getattr(message, field.name)
+        for field in fields(message)
+        if getattr(message, field.name) is not Undefined
+    }
+    return replace(pending, **changes)
+
+
+class EditCoalescer:
+    """Keeps only the latest edit of each message and sends it at limited rate.
+
+    First edit of a message is sent at once. Edits received while previous
+    one is sent or during `1 / max_rate` seconds after it are merged and
+    sent together. Edit failed with network error, 5xx or 429 response is
+    merged under newer pending edits and retried at the same rate, other
+    errors are logged and edit is dropped.
+    """
+
+    def __init__(
+        self,
+        handler: EditHandler,
+        max_rate: float = EDIT_COALESCING_MAX_RATE,
+    ) -> None:
+        if max_rate <= 0:
+            raise ValueError("`max_rate` should be positive")
+
+        self._handler = handler
+        self._interval = 1 / max_rate
+        self._pending_edits: dict[UUID, EditMessage] = {}
+        self._flushers: dict[UUID, asyncio.Task[None]] = {}
+        self._closing = asyncio.Event()
+
+    def start(self) -> None:
+        self._closing = asyncio.Event()
+
+    def edit(self, message: EditMessage) -> None:
+        sync_id = message.sync_id
+
+        pending = self._pending_edits.get(sync_id)
+        self._pending_edits[sync_id] = (
+            message if pending is None else merge_edit_messages(pending, message)
+        )
+
+        if sync_id not in self._flushers:
+            # Edits outlive handler, so its deadline and priority aren't used
+            self._flushers[sync_id] = contextvars.Context().run(
+                asyncio.create_task,
+                self._flush(sync_id),
+            )
+
+    async def close(self) -> None:
+        """Send pending edits without waiting and stop."""
+
+        self._closing.set()
+        await asyncio.gather(*self._flushers.values())
+
+    async def _flush(self, sync_id: UUID) -> None:
+        retries = 0
+        while (message := self._pending_edits.pop(sync_id, None)) is not None:
+            # Failed edit shouldn't stop sending of next edits
+            try:
+                await self._handler(message)
+            except Exception as exc:  # noqa: BLE001
+                if is_retryable_error(exc) and retries < EDIT_COALESCING_MAX_RETRIES:
+                    retries += 1
+                    self._requeue(message)
+                    logger.opt(exception=True).warning(
+                        "Can't edit message `{sync_id}`, retrying",
+                        sync_id=sync_id,
+                    )
+                else:
+                    retries = 0
+                    logger.exception("Can't edit message `{sync_id}`", sync_id=sync_id)
+            else:
+                retries = 0
+
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), self._interval)
+
+        del self._flushers[sync_id]
+
+    def _requeue(self, message: EditMessage) -> None:
+        newer = self._pending_edits.get(message.sync_id)
+        self._pending_edits[message.sync_id] = (
+            message if newer is None else merge_edit_messages(message, newer)
+        )
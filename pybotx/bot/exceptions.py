@@ -25,6 +25,20 @@ class BotShuttingDownError(Exception):
         super().__init__(self.message)
 
 
+class HandlerTimeoutError(Exception):
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.message = f"Handler didn't finish in {timeout} seconds"
+        super().__init__(self.message)
+
+
+class DeadlineExceededError(Exception):
+    def __init__(self, context: Any) -> None:
+        self.context = context
+        self.message = f"Deadline exceeded before request to BotX: {context}"
+        super().__init__(self.message)
+
+
 class AnswerDestinationLookupError(Exception):
     def __init__(self) -> None:
         self.message = "No IncomingMessage received. Use `Bot.send` instead"
@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from uuid import uuid4
+
+import aiofiles
+
+from pybotx.async_buffer import AsyncBufferWritable
+
+FileDownloader = Callable[[AsyncBufferWritable], Awaitable[None]]
+
+_TMP_FILE_SUFFIX = ".tmp"
+
+
+class FileCache:
+    """On-disk content-addressed cache of downloaded files.
+
+    Files are stored by `file_hash`, so the same content isn't downloaded
+    twice, even if it was sent in different messages. Concurrent requests
+    of the same file share one download. Least recently used files are
+    removed, when total size exceeds `max_size`.
+
+    Files are pinned while their paths are used, pinned files aren't removed
+    even if cache is full.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int) -> None:
+        if max_size <= 0:
+            raise ValueError("`max_size` should be positive")
+
+        self._directory = Path(directory)
+        self._max_size = max_size
+        self._size = 0
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._pins: dict[str, int] = {}
+        self._downloads: dict[str, asyncio.Task[Path]] = {}
+        # Files are replaced and removed one by one, so removal of evicted
+        # file can't remove file, which was downloaded again.
+        self._files_lock = asyncio.Lock()
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._load_entries()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @asynccontextmanager
+    async def pin_path(
+        self,
+        file_hash: str,
+        download: FileDownloader,
+    ) -> AsyncIterator[Path]:
+        """Get path of cached file, file is downloaded if needed.
+
+        File isn't removed from cache until context is exited.
+        """
+
+        key = hashlib.sha256(file_hash.encode()).hexdigest()
+
+        self._pins[key] = self._pins.get(key, 0) + 1
+        try:
+            yield await self._get_path(key, download)
+        finally:
+            self._pins[key] -= 1
+            if not self._pins[key]:
+                del self._pins[key]
+                async with self._files_lock:
+                    await self._remove_evicted_files()
+
+    async def _get_path(self, key: str, download: FileDownloader) -> Path:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            path = self._directory / key
+            try:
+                # Keeps order of used files after restart
+                await asyncio.to_thread(os.utime, path)
+            except FileNotFoundError:
+                self._size -= self._entries.pop(key, 0)
+            else:
+                return path
+
+        task = self._downloads.get(key)
+        if task is None:
+            task = asyncio.create_task(self._download(key, download))
+            self._downloads[key] = task
+            task.add_done_callback(lambda _: self._downloads.pop(key, None))
+
+        # Download isn't cancelled, if one of waiters is cancelled
+        return await asyncio.shield(task)
+
+    async def _download(self, key: str, download: FileDownloader) -> Path:
+        path = self._directory / key
+        tmp_path = path.with_name(f"{key}.{uuid4().hex}{_TMP_FILE_SUFFIX}")
+
+        try:
+            async with aiofiles.open(tmp_path, "wb+") as tmp_file:
+                await download(tmp_file)
+
+            async with self._files_lock:
+                size = await asyncio.to_thread(_replace_file, tmp_path, path)
+                self._add_entry(key, size)
+                await self._remove_evicted_files()
+        except BaseException:
+            await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+            raise
+
+        return path
+
+    def _add_entry(self, key: str, size: int) -> None:
+        self._entries[key] = size
+        self._size += size
+
+    async def _remove_evicted_files(self) -> None:
+        evicted_paths = self._pop_evicted_paths()
+        if evicted_paths:
+            await asyncio.to_thread(_unlink_files, evicted_paths)
+
+    def _pop_evicted_paths(self) -> list[Path]:
+        evicted_paths = []
+
+        # Just added file is kept even if it is bigger than cache
+        for key in list(self._entries)[:-1]:
+            if self._size <= self._max_size:
+                break
+
+            if key not in self._pins:
+                self._size -= self._entries.pop(key)
+                evicted_paths.append(self._directory / key)
+
+        return evicted_paths
+
+    def _load_entries(self) -> None:
+        paths = []
+        for path in self._directory.iterdir():
+            if path.name.endswith(_TMP_FILE_SUFFIX):
+                path.unlink(missing_ok=True)
+            else:
+                paths.append(path)
+
+        for path in sorted(paths, key=lambda path: path.stat().st_mtime):
+            self._add_entry(path.name, path.stat().st_size)
+
+        _unlink_files(self._pop_evicted_paths())
+
+
+def _replace_file(tmp_path: Path, path: Path) -> int:
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+
+def _unlink_files(paths: Iterable[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from functools import partial
 from typing import TYPE_CHECKING, Literal, TypeVar
 from collections.abc import Awaitable, Callable
 
+from pybotx.bot.deadline import deadline
+from pybotx.bot.exceptions import HandlerTimeoutError
 from pybotx.models.commands import BotCommand
 from pybotx.models.message.incoming_message import IncomingMessage
 from pybotx.models.status import StatusRecipient
@@ -63,13 +66,36 @@ Middleware = Callable[
 ]
 
 
+async def run_with_timeout(awaitable: Awaitable[None], timeout: float | None) -> None:
+    if timeout is None:
+        await awaitable
+        return
+
+    try:
+        # BotX requests of handler shouldn't outlive it
+        with deadline(timeout):
+            await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError as exc:
+        raise HandlerTimeoutError(timeout) from exc
+
+
 @dataclass(slots=True)
 class BaseIncomingMessageHandler:
     handler_func: IncomingMessageHandlerFunc
     middlewares: list[Middleware]
+    timeout: float | None = field(default=None, kw_only=True)
 
     async def __call__(self, message: IncomingMessage, bot: "Bot") -> None:
-        handler_func = self.handler_func
+        timeout = self.timeout
+        if timeout is None:
+            timeout = bot.default_handler_timeout
+
+        # Timeout is raised inside middlewares, so it can be handled
+        # by exception handlers
+        async def call_handler(message: IncomingMessage, bot: "Bot") -> None:
+            await run_with_timeout(self.handler_func(message, bot), timeout)
+
+        handler_func: IncomingMessageHandlerFunc = call_handler
 
         for middleware in self.middlewares[::-1]:
             handler_func = partial(
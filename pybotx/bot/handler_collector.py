@@ -8,7 +8,13 @@ from typing import (
 from collections.abc import Callable, Sequence
 from weakref import WeakSet
 
-from pybotx.bot.contextvars import bot_id_var, bot_var, chat_id_var
+from pybotx.bot.contextvars import (
+    bot_id_var,
+    bot_var,
+    chat_id_var,
+    request_priority_var,
+)
+from pybotx.bot.exceptions import HandlerTimeoutError
 from pybotx.bot.handler import (
     CommandHandler,
     DefaultMessageHandler,
@@ -20,6 +26,7 @@ from pybotx.bot.handler import (
     SystemEventHandlerFunc,
     VisibleCommandHandler,
     VisibleFunc,
+    run_with_timeout,
 )
 from pybotx.bot.middlewares.exception_middleware import (
     ExceptionHandlersDict,
@@ -28,6 +35,7 @@ from pybotx.bot.middlewares.exception_middleware import (
 from pybotx.client.smartapps_api.exceptions import SyncSmartAppEventHandlerNotFoundError
 from pybotx.converters import optional_sequence_to_list
 from pybotx.logger import logger
+from pybotx.models.enums import RequestPriorities
 from pybotx.models.commands import BotCommand, SystemEvent
 from pybotx.models.message.incoming_message import IncomingMessage
 from pybotx.models.status import BotMenu, StatusRecipient
@@ -118,7 +126,17 @@ class HandlerCollector:
             event_handler = self._get_system_event_handler_or_none(bot_command)
             if event_handler:
                 self._fill_contextvars(bot_command, bot)
-                await event_handler(bot_command, bot)
+                try:
+                    await run_with_timeout(
+                        event_handler(bot_command, bot),
+                        bot.default_handler_timeout,
+                    )
+                except HandlerTimeoutError:
+                    # System events aren't passed to exception handlers
+                    logger.exception(
+                        "Handler for `{event_cls_name}` timed out:",
+                        event_cls_name=type(bot_command).__name__,
+                    )
 
         else:
             raise NotImplementedError(f"Unsupported event type: `{bot_command}`")
@@ -165,11 +183,19 @@ class HandlerCollector:
         visible: bool | VisibleFunc = True,
         description: str | None = None,
         middlewares: Sequence[Middleware] | None = None,
+        timeout: float | None = None,
     ) -> Callable[[IncomingMessageHandlerFunc], IncomingMessageHandlerFunc]:
-        """Decorate command handler."""
+        """Decorate command handler.
+
+        Handler is cancelled after `timeout` seconds (`Bot` default is used
+        if not set), `HandlerTimeoutError` is passed to exception handlers.
+        """
         if not self.VALID_COMMAND_NAME_RE.match(command_name):
             raise ValueError("Command should start with '/' and doesn't include spaces")
 
+        if timeout is not None and timeout <= 0:
+            raise ValueError("`timeout` should be positive")
+
         def decorator(
             handler_func: IncomingMessageHandlerFunc,
         ) -> IncomingMessageHandlerFunc:
@@ -183,6 +209,7 @@ class HandlerCollector:
                 visible,
                 description,
                 self._middlewares + optional_sequence_to_list(middlewares),
+                timeout,
             )
 
             return handler_func
@@ -200,6 +227,7 @@ class HandlerCollector:
         self,
         *,
         middlewares: Sequence[Middleware] | None = None,
+        timeout: float | None = None,
     ) -> MessageHandlerDecorator: ...  # pragma: no cover
 
     def default_message_handler(
@@ -207,17 +235,22 @@ class HandlerCollector:
         handler_func: IncomingMessageHandlerFunc | None = None,
         *,
         middlewares: Sequence[Middleware] | None = None,
+        timeout: float | None = None,
     ) -> IncomingMessageHandlerFunc | Callable[[IncomingMessageHandlerFunc], IncomingMessageHandlerFunc]:
         """Decorate fallback messages handler."""
         if self._default_message_handler:
             raise ValueError("Default command handler already registered")
 
+        if timeout is not None and timeout <= 0:
+            raise ValueError("`timeout` should be positive")
+
         def decorator(
             handler_func: IncomingMessageHandlerFunc,
         ) -> IncomingMessageHandlerFunc:
             self._default_message_handler = DefaultMessageHandler(
                 handler_func=handler_func,
                 middlewares=self._middlewares + optional_sequence_to_list(middlewares),
+                timeout=timeout,
             )
 
             return handler_func
@@ -362,13 +395,26 @@ class HandlerCollector:
         exception_middleware = ExceptionMiddleware(exception_handlers or {})
         self._middlewares.insert(0, exception_middleware.dispatch)
 
-    async def wait_active_tasks(self) -> None:
-        if self._tasks:
-            await asyncio.wait(
-                self._tasks,
-                return_when=asyncio.ALL_COMPLETED,
+    async def wait_active_tasks(self, timeout: float | None = None) -> None:
+        """Wait for handlers, cancel ones not finished in `timeout` seconds."""
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(
+            self._tasks,
+            timeout=timeout,
+            return_when=asyncio.ALL_COMPLETED,
+        )
+        if pending:
+            logger.warning(
+                "Cancelling {pending_count} not finished handlers",
+                pending_count=len(pending),
             )
 
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
     def _include_collector(self, other: "HandlerCollector") -> None:
         # - Message handlers -
         command_duplicates = set(self._user_commands_handlers) & set(
@@ -481,6 +527,7 @@ class HandlerCollector:
         visible: bool | VisibleFunc,
         description: str | None,
         middlewares: list[Middleware],
+        timeout: float | None,
     ) -> CommandHandler:
         if visible is True or callable(visible):
             if not description:
@@ -491,11 +538,13 @@ class HandlerCollector:
                 visible=visible,
                 description=description,
                 middlewares=middlewares,
+                timeout=timeout,
             )
 
         return HiddenCommandHandler(
             handler_func=handler_func,
             middlewares=middlewares,
+            timeout=timeout,
         )
 
     def _system_event(
@@ -525,6 +574,7 @@ class HandlerCollector:
     def _fill_contextvars(self, bot_command: BotCommand, bot: "Bot") -> None:
         bot_var.set(bot)
         bot_id_var.set(bot_command.bot.id)
+        request_priority_var.set(RequestPriorities.INTERACTIVE)
 
         chat = getattr(bot_command, "chat", None)
         if chat:
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from functools import partial
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pybotx.models.message.ordered_send import OrderedSendResult
+
+TMessage = TypeVar("TMessage")
+
+
+async def send_in_order(
+    messages: Iterable[tuple[int, TMessage]],
+    send: Callable[[TMessage], Awaitable[UUID]],
+    wait_processed: Callable[[UUID], Coroutine[Any, Any, None]] | None = None,
+) -> list[OrderedSendResult]:
+    """Send messages one by one without waiting previous ones to be processed.
+
+    Next message is sent right after previous one is accepted, so order
+    is kept, and `wait_processed` is awaited for sent messages concurrently.
+    Sending is stopped on first error, including errors of processing.
+    """
+
+    results: list[OrderedSendResult] = []
+    processing_tasks: list[asyncio.Task[None]] = []
+
+    def set_processing_error(
+        result: OrderedSendResult,
+        task: "asyncio.Task[None]",
+    ) -> None:
+        exc = None if task.cancelled() else task.exception()
+        if isinstance(exc, Exception):
+            result.error = exc
+
+    try:
+        for message_index, message in messages:
+            if any(result.error for result in results):
+                break
+
+            result = OrderedSendResult(message_index=message_index)
+            results.append(result)
+
+            # Error is returned in result of message, which wasn't sent
+            try:
+                result.sync_id = await send(message)
+            except Exception as exc:  # noqa: BLE001
+                result.error = exc
+                break
+
+            if wait_processed:
+                task = asyncio.create_task(wait_processed(result.sync_id))
+                task.add_done_callback(partial(set_processing_error, result))
+                processing_tasks.append(task)
+
+        await asyncio.gather(*processing_tasks, return_exceptions=True)
+    finally:
+        for task in processing_tasks:
+            task.cancel()
+
+    return results
@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+
+from pybotx.bot.outbox.outbox_memory_store import OutboxMemoryStore
+from pybotx.bot.outbox.outbox_store_proto import OutboxStoreProto
+from pybotx.bot.rate_limiter import RateLimiter
+from pybotx.bot.request_scheduler import request_priority
+from pybotx.client.exceptions.common import RateLimitReachedError
+from pybotx.client.exceptions.http import InvalidBotXStatusCodeError
+from pybotx.logger import logger
+from pybotx.models.enums import (
+    OutboxEntryStatuses,
+    OutboxRequestKinds,
+    RequestPriorities,
+)
+from pybotx.models.outbox import OutboxEntry
+
+OutboxHandler = Callable[[OutboxEntry], Awaitable[UUID | None]]
+
+OUTBOX_DEFAULT_WORKERS = 4
+OUTBOX_DEFAULT_MAX_ATTEMPTS = 5
+OUTBOX_DEFAULT_RETRY_DELAY = 1.0
+OUTBOX_POLL_INTERVAL_SECONDS = 1.0
+# Should be longer than sending of one entry, including callback waiting.
+OUTBOX_DEFAULT_CLAIM_TIMEOUT = 300.0
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    if isinstance(exc, (httpx.TransportError, RateLimitReachedError)):
+        return True
+
+    if isinstance(exc, InvalidBotXStatusCodeError):
+        status_code = exc.response.status_code
+        return (
+            status_code == HTTPStatus.TOO_MANY_REQUESTS
+            or status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+
+    return False
+
+
+class Outbox:
+    """Persists outgoing requests and sends them with a pool of workers.
+
+    Network errors, 5xx and 429 responses are retried with exponential
+    delay, other errors fail entry at once. Scheduled entries are sent
+    not earlier than `send_at` by the same dispatcher, so they don't need
+    a task per entry. Store is polled every `poll_interval` seconds, so
+    scheduled entries may be sent up to this interval late. Pending entries
+    from the store, including overdue scheduled ones, are sent after restart.
+
+    Entries are claimed in the store before sending, so several processes
+    can share one store. Claims of entries, which weren't finished in
+    `claim_timeout` seconds (e.g. process was killed), expire and they
+    are sent again.
+    """
+
+    def __init__(
+        self,
+        store: OutboxStoreProto | None = None,
+        *,
+        workers: int = OUTBOX_DEFAULT_WORKERS,
+        max_attempts: int = OUTBOX_DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = OUTBOX_DEFAULT_RETRY_DELAY,
+        rate_limit: float | None = None,
+        poll_interval: float = OUTBOX_POLL_INTERVAL_SECONDS,
+        claim_timeout: float = OUTBOX_DEFAULT_CLAIM_TIMEOUT,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("`workers` should be positive")
+        if max_attempts <= 0:
+            raise ValueError("`max_attempts` should be positive")
+        if claim_timeout <= 0:
+            raise ValueError("`claim_timeout` should be positive")
+
+        self._store = store or OutboxMemoryStore()
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._poll_interval = poll_interval
+        self._claim_timeout = claim_timeout
+
+        self._handler: OutboxHandler | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._entry_tasks: dict[UUID, asyncio.Task[None]] = {}
+        self._wakeup = asyncio.Event()
+
+    async def add_entry(
+        self,
+        bot_id: UUID,
+        kind: OutboxRequestKinds,
+        payload: dict[str, Any],
+        *,
+        send_at: float = 0,
+        key: str | None = None,
+    ) -> UUID:
+        entry = OutboxEntry(
+            id=uuid4(),
+            bot_id=bot_id,
+            kind=kind,
+            payload=payload,
+            next_attempt_at=send_at,
+            key=key,
+        )
+        await self._store.add_entry(entry)
+        self._wakeup.set()
+
+        return entry.id
+
+    async def get_entry(self, entry_id: UUID) -> OutboxEntry | None:
+        return await self._store.get_entry(entry_id)
+
+    async def cancel_entries(self, key: str) -> int:
+        return await self._store.cancel_entries(key)
+
+    def start(self, handler: OutboxHandler) -> None:
+        self._handler = handler
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self) -> None:
+        """Stop taking new entries and wait for entries being sent."""
+
+        if self._dispatcher is None:
+            return
+
+        self._dispatcher.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._dispatcher
+        self._dispatcher = None
+
+        await asyncio.gather(*self._entry_tasks.values())
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+
+            free_workers = self._workers - len(self._entry_tasks)
+            if free_workers:
+                now = time.time()
+                entries = await self._store.claim_ready_entries(
+                    now,
+                    free_workers,
+                    now + self._claim_timeout,
+                )
+                for entry in entries:
+                    self._start_entry_task(entry)
+
+            # Not `wait_for`: before Python 3.12 it may lose dispatcher cancellation.
+            timer = asyncio.get_running_loop().call_later(
+                self._poll_interval,
+                self._wakeup.set,
+            )
+            try:
+                await self._wakeup.wait()
+            finally:
+                timer.cancel()
+
+    def _start_entry_task(self, entry: OutboxEntry) -> None:
+        task = asyncio.create_task(self._send_entry(entry))
+        self._entry_tasks[entry.id] = task
+
+        def on_done(_: "asyncio.Task[None]") -> None:
+            del self._entry_tasks[entry.id]
+            self._wakeup.set()
+
+        task.add_done_callback(on_done)
+
+    async def _send_entry(self, entry: OutboxEntry) -> None:
+        assert self._handler is not None
+
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
+
+        # Any error is saved in entry, so it isn't lost with entry task
+        try:
+            with request_priority(RequestPriorities.BULK):
+                entry.sync_id = await self._handler(entry)
+        except Exception as exc:  # noqa: BLE001
+            entry.error = repr(exc)
+
+            if is_retryable_error(exc) and entry.attempts < self._max_attempts:
+                entry.status = OutboxEntryStatuses.PENDING
+                entry.next_attempt_at = time.time() + self._retry_delay * 2 ** (
+                    entry.attempts - 1
+                )
+                logger.warning(
+                    "Outbox entry `{entry_id}` failed, retrying: {error}",
+                    entry_id=entry.id,
+                    error=entry.error,
+                )
+            else:
+                entry.status = OutboxEntryStatuses.FAILED
+                logger.error(
+                    "Outbox entry `{entry_id}` failed: {error}",
+                    entry_id=entry.id,
+                    error=entry.error,
+                )
+        else:
+            entry.status = OutboxEntryStatuses.SENT
+            entry.error = None
+
+        await self._store.update_entry(entry)
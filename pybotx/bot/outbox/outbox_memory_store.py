@@ -0,0 +1,123 @@
+import heapq
+from dataclasses import replace
+from itertools import count, islice
+from uuid import UUID
+
+from pybotx.bot.outbox.outbox_store_proto import OutboxStoreProto
+from pybotx.models.enums import OutboxEntryStatuses
+from pybotx.models.outbox import OutboxEntry
+
+OUTBOX_MEMORY_STORE_FINISHED_ENTRIES_LIMIT = 1000
+UNFINISHED_STATUSES = (OutboxEntryStatuses.PENDING, OutboxEntryStatuses.SENDING)
+
+
+class OutboxMemoryStore(OutboxStoreProto):
+    """In-process store, entries are lost on restart.
+
+    Pending and sending entries are kept in a heap by `next_attempt_at`, so scheduled
+    entries don't slow down fetching of ready ones. Only last
+    `finished_entries_limit` sent, failed or cancelled entries are kept.
+    """
+
+    def __init__(
+        self,
+        finished_entries_limit: int = OUTBOX_MEMORY_STORE_FINISHED_ENTRIES_LIMIT,
+    ) -> None:
+        self._finished_entries_limit = finished_entries_limit
+        self._pending_entries: dict[UUID, OutboxEntry] = {}
+        self._finished_entries: dict[UUID, OutboxEntry] = {}
+
+        # Heap items are outdated, if entry was updated after they were pushed.
+        self._schedule: list[tuple[float, int, OutboxEntry]] = []
+        self._counter = count()
+        self._ready_entry_ids: dict[UUID, None] = {}
+        self._key_entry_ids: dict[str, set[UUID]] = {}
+
+    async def add_entry(self, entry: OutboxEntry) -> None:
+        await self.update_entry(entry)
+
+    async def update_entry(self, entry: OutboxEntry) -> None:
+        finished_entry = self._finished_entries.get(entry.id)
+        if finished_entry and finished_entry.status == OutboxEntryStatuses.CANCELLED:
+            return
+
+        self._forget_pending_entry(entry.id)
+
+        if entry.status in UNFINISHED_STATUSES:
+            self._add_pending_entry(replace(entry))
+            return
+
+        self._finished_entries[entry.id] = replace(entry)
+        if len(self._finished_entries) > self._finished_entries_limit:
+            del self._finished_entries[next(iter(self._finished_entries))]
+
+    async def get_entry(self, entry_id: UUID) -> OutboxEntry | None:
+        entry = self._pending_entries.get(entry_id) or self._finished_entries.get(
+            entry_id,
+        )
+        if entry is None:
+            return None
+
+        return replace(entry)
+
+    async def claim_ready_entries(
+        self,
+        now: float,
+        limit: int,
+        claimed_until: float,
+    ) -> list[OutboxEntry]:
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, entry = heapq.heappop(self._schedule)
+            if self._pending_entries.get(entry.id) is entry:
+                self._ready_entry_ids[entry.id] = None
+
+        claimed_entries = []
+        for entry_id in list(islice(self._ready_entry_ids, limit)):
+            entry = self._pending_entries[entry_id]
+            claimed_entry = replace(
+                entry,
+                status=OutboxEntryStatuses.SENDING,
+                attempts=entry.attempts + 1,
+                next_attempt_at=claimed_until,
+            )
+            await self.update_entry(claimed_entry)
+            claimed_entries.append(claimed_entry)
+
+        return claimed_entries
+
+    async def cancel_entries(self, key: str) -> int:
+        entries = [
+            self._pending_entries[entry_id]
+            for entry_id in self._key_entry_ids.get(key, ())
+            if self._pending_entries[entry_id].status == OutboxEntryStatuses.PENDING
+        ]
+
+        for entry in entries:
+            await self.update_entry(
+                replace(entry, status=OutboxEntryStatuses.CANCELLED),
+            )
+
+        return len(entries)
+
+    def _add_pending_entry(self, entry: OutboxEntry) -> None:
+        self._pending_entries[entry.id] = entry
+        heapq.heappush(
+            self._schedule,
+            (entry.next_attempt_at, next(self._counter), entry),
+        )
+
+        if entry.key is not None:
+            self._key_entry_ids.setdefault(entry.key, set()).add(entry.id)
+
+    def _forget_pending_entry(self, entry_id: UUID) -> None:
+        entry = self._pending_entries.pop(entry_id, None)
+        if entry is None:
+            return
+
+        self._ready_entry_ids.pop(entry_id, None)
+
+        if entry.key is not None:
+            key_entry_ids = self._key_entry_ids[entry.key]
+            key_entry_ids.discard(entry_id)
+            if not key_entry_ids:
+                del self._key_entry_ids[entry.key]
@@ -0,0 +1,170 @@
+import json
+import sqlite3
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+from pybotx.bot.outbox.outbox_store_proto import OutboxStoreProto
+from pybotx.bot.sqlite_connection import SQLiteConnection
+from pybotx.models.enums import OutboxEntryStatuses, OutboxRequestKinds
+from pybotx.models.outbox import OutboxEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS botx_outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    bot_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    sync_id TEXT,
+    error TEXT,
+    key TEXT
+);
+CREATE INDEX IF NOT EXISTS botx_outbox_ready
+    ON botx_outbox (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS botx_outbox_key
+    ON botx_outbox (key);
+"""
+
+_COLUMNS = (
+    "id, bot_id, kind, payload, status, attempts, next_attempt_at, sync_id, error, key"
+)
+
+
+class OutboxSQLiteStore(OutboxStoreProto):
+    """Store on top of SQLite database, survives bot restarts."""
+
+    def __init__(self, path: str) -> None:
+        self._connection = SQLiteConnection(path, _SCHEMA)
+
+    async def add_entry(self, entry: OutboxEntry) -> None:
+        await self._connection.execute(
+            f"INSERT INTO botx_outbox ({_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _dump_entry(entry),
+        )
+
+    async def update_entry(self, entry: OutboxEntry) -> None:
+        await self._connection.execute(
+            "UPDATE botx_outbox SET status = ?, attempts = ?, "
+            "next_attempt_at = ?, sync_id = ?, error = ? "
+            "WHERE id = ? AND status != ?",
+            (
+                *_dump_entry(entry)[4:9],
+                str(entry.id),
+                OutboxEntryStatuses.CANCELLED.value,
+            ),
+        )
+
+    async def get_entry(self, entry_id: UUID) -> OutboxEntry | None:
+        rows = await self._connection.fetchall(
+            f"SELECT {_COLUMNS} FROM botx_outbox WHERE id = ?",
+            (str(entry_id),),
+        )
+        if not rows:
+            return None
+
+        return _load_entry(rows[0])
+
+    async def claim_ready_entries(
+        self,
+        now: float,
+        limit: int,
+        claimed_until: float,
+    ) -> list[OutboxEntry]:
+        return await self._connection.transaction(
+            partial(
+                _claim_ready_entries,
+                now=now,
+                limit=limit,
+                claimed_until=claimed_until,
+            ),
+        )
+
+    async def cancel_entries(self, key: str) -> int:
+        return await self._connection.execute(
+            "UPDATE botx_outbox SET status = ? WHERE key = ? AND status = ?",
+            (
+                OutboxEntryStatuses.CANCELLED.value,
+                key,
+                OutboxEntryStatuses.PENDING.value,
+            ),
+        )
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+
+def _claim_ready_entries(
+    connection: sqlite3.Connection,
+    now: float,
+    limit: int,
+    claimed_until: float,
+) -> list[OutboxEntry]:
+    # Take write lock before reading, so other processes can't claim same entries.
+    connection.execute("BEGIN IMMEDIATE")
+
+    rows = connection.execute(
+        f"SELECT {_COLUMNS} FROM botx_outbox "
+        "WHERE status IN (?, ?) AND next_attempt_at <= ? "
+        "ORDER BY next_attempt_at, seq LIMIT ?",
+        (
+            OutboxEntryStatuses.PENDING.value,
+            OutboxEntryStatuses.SENDING.value,
+            now,
+            limit,
+        ),
+    ).fetchall()
+
+    entries = [_load_entry(row) for row in rows]
+    for entry in entries:
+        entry.status = OutboxEntryStatuses.SENDING
+        entry.attempts += 1
+        entry.next_attempt_at = claimed_until
+
+    connection.executemany(
+        "UPDATE botx_outbox SET status = ?, attempts = ?, next_attempt_at = ? "
+        "WHERE id = ?",
+        [
+            (entry.status.value, entry.attempts, entry.next_attempt_at, str(entry.id))
+            for entry in entries
+        ],
+    )
+
+    return entries
+
+
+def _dump_entry(entry: OutboxEntry) -> tuple[Any, ...]:
+    return (
+        str(entry.id),
+        str(entry.bot_id),
+        entry.kind.value,
+        json.dumps(entry.payload, ensure_ascii=False),
+        entry.status.value,
+        entry.attempts,
+        entry.next_attempt_at,
+        str(entry.sync_id) if entry.sync_id else None,
+        entry.error,
+        entry.key,
+    )
+
+
+def _load_entry(row: tuple[Any, ...]) -> OutboxEntry:
+    entry_id, bot_id, kind, payload, status, attempts, next_attempt_at = row[:7]
+    sync_id, error, key = row[7:]
+
+    return OutboxEntry(
+        id=UUID(entry_id),
+        bot_id=UUID(bot_id),
+        kind=OutboxRequestKinds(kind),
+        payload=json.loads(payload),
+        status=OutboxEntryStatuses(status),
+        attempts=attempts,
+        next_attempt_at=next_attempt_at,
+        sync_id=UUID(sync_id) if sync_id else None,
+        error=error,
+        key=key,
+    )
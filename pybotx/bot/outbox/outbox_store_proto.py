@@ -0,0 +1,47 @@
+from typing import Protocol
+from uuid import UUID
+
+from pybotx.models.outbox import OutboxEntry
+
+
+class OutboxStoreProto(Protocol):
+    """Durable storage of outgoing requests."""
+
+    async def add_entry(
+        self,
+        entry: OutboxEntry,
+    ) -> None: ...  # pragma: no cover
+
+    async def update_entry(
+        self,
+        entry: OutboxEntry,
+    ) -> None:
+        """Save entry changes, cancelled entries shouldn't be changed."""
+
+    async def get_entry(
+        self,
+        entry_id: UUID,
+    ) -> OutboxEntry | None: ...  # pragma: no cover
+
+    async def claim_ready_entries(
+        self,
+        now: float,
+        limit: int,
+        claimed_until: float,
+    ) -> list[OutboxEntry]:
+        """Atomically mark ready entries as sending and return them.
+
+        Ready entries are pending or sending ones with `next_attempt_at <= now`,
+        earliest first. Claimed entries get incremented `attempts` and
+        `next_attempt_at = claimed_until`, so they are claimed again only if
+        sender has died.
+        """
+
+    async def cancel_entries(
+        self,
+        key: str,
+    ) -> int:
+        """Cancel pending entries with given key and return their count.
+
+        Sending entries aren't cancelled.
+        """
@@ -0,0 +1,21 @@
+import asyncio
+
+
+class RateLimiter:
+    """Spaces acquisitions out to keep them under `rate` per second."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("`rate` should be positive")
+
+        self._interval = 1 / rate
+        self._next_time = 0.0
+
+    async def acquire(self, amount: float = 1) -> None:
+        now = asyncio.get_running_loop().time()
+
+        delay = self._next_time - now
+        self._next_time = max(self._next_time, now) + amount * self._interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,64 @@
+import gzip
+import zlib
+from collections.abc import Iterable
+
+from pybotx.models.enums import RequestCompressionEncodings
+
+REQUEST_COMPRESSION_DEFAULT_MIN_SIZE = 32 * 1024
+REQUEST_COMPRESSION_DEFAULT_LEVEL = 6
+
+
+class RequestCompressor:
+    """Compresses big bodies of BotX requests.
+
+    Only methods with potentially big bodies (messages with inline files
+    and metadata, smartapp events) are compressed. CTS, which responds
+    with `415 Unsupported Media Type`, is switched off automatically and
+    the request is sent again without compression.
+    """
+
+    def __init__(
+        self,
+        encoding: RequestCompressionEncodings = RequestCompressionEncodings.GZIP,
+        min_size: int = REQUEST_COMPRESSION_DEFAULT_MIN_SIZE,
+        level: int = REQUEST_COMPRESSION_DEFAULT_LEVEL,
+        disabled_cts_urls: Iterable[str] = (),
+    ) -> None:
+        if min_size <= 0:
+            raise ValueError("`min_size` should be positive")
+
+        if not 0 <= level <= 9:
+            raise ValueError("`level` should be between 0 and 9")
+
+        self.encoding = encoding
+        self._min_size = min_size
+        self._level = level
+        self._disabled_cts_urls = {
+            _normalize_cts_url(cts_url) for cts_url in disabled_cts_urls
+        }
+
+    @property
+    def content_encoding(self) -> str:
+        return self.encoding.name.lower()
+
+    def is_enabled(self, cts_url: str) -> bool:
+        return _normalize_cts_url(cts_url) not in self._disabled_cts_urls
+
+    def enable(self, cts_url: str) -> None:
+        self._disabled_cts_urls.discard(_normalize_cts_url(cts_url))
+
+    def disable(self, cts_url: str) -> None:
+        self._disabled_cts_urls.add(_normalize_cts_url(cts_url))
+
+    def should_compress(self, cts_url: str, content: bytes) -> bool:
+        return len(content) >= self._min_size and self.is_enabled(cts_url)
+
+    def compress(self, content: bytes) -> bytes:
+        if self.encoding == RequestCompressionEncodings.GZIP:
+            return gzip.compress(content, self._level)
+
+        return zlib.compress(content, self._level)
+
+
+def _normalize_cts_url(cts_url: str) -> str:
+    return cts_url.rstrip("/")
@@ -0,0 +1,163 @@
+import asyncio
+import heapq
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from itertools import count
+from uuid import UUID
+
+from pybotx.bot.contextvars import request_priority_var
+from pybotx.models.enums import RequestPriorities
+
+# Same as `httpx` connection pool default size.
+REQUEST_SCHEDULER_DEFAULT_MAX_CONCURRENCY = 100
+
+
+@dataclass(slots=True)
+class RequestQueueMetrics:
+    queued: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    total_wait_time: float = 0.0
+
+
+@contextmanager
+def request_priority(priority: RequestPriorities) -> Iterator[None]:
+    """Set priority of BotX requests performed inside the block."""
+
+    token = request_priority_var.set(priority)
+    try:
+        yield
+    finally:
+        request_priority_var.reset(token)
+
+
+class _PriorityQueue:
+    """Weighted fair queue of waiters from different bot accounts.
+
+    Each waiter gets virtual finish time, which grows by `1 / weight` for
+    every queued request of the same bot, so busy bots don't delay others.
+    """
+
+    def __init__(self, bot_weights: Mapping[UUID, float]) -> None:
+        self._bot_weights = bot_weights
+        self._virtual_time = 0.0
+        self._last_finish_times: dict[UUID, float] = {}
+        # Removed waiters are left in heap and skipped on pop.
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._waiters: set[asyncio.Future[None]] = set()
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def push(self, bot_id: UUID, waiter: "asyncio.Future[None]") -> None:
+        start_time = max(
+            self._virtual_time,
+            self._last_finish_times.get(bot_id, 0.0),
+        )
+        finish_time = start_time + 1 / self._bot_weights.get(bot_id, 1.0)
+        self._last_finish_times[bot_id] = finish_time
+
+        heapq.heappush(self._heap, (finish_time, next(self._counter), waiter))
+        self._waiters.add(waiter)
+
+    def pop(self) -> "asyncio.Future[None]":
+        while True:
+            finish_time, _, waiter = heapq.heappop(self._heap)
+            if waiter in self._waiters:
+                break
+
+        self._waiters.remove(waiter)
+        self._virtual_time = finish_time
+
+        return waiter
+
+    def remove(self, waiter: "asyncio.Future[None]") -> None:
+        self._waiters.discard(waiter)
+
+
+class RequestScheduler:
+    """Limits concurrent BotX requests and orders waiting ones.
+
+    Waiting requests are served in strict order of priority classes and
+    fairly across bot accounts inside one class.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = REQUEST_SCHEDULER_DEFAULT_MAX_CONCURRENCY,
+        bot_weights: Mapping[UUID, float] | None = None,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("`max_concurrency` should be positive")
+
+        bot_weights = bot_weights or {}
+        if any(weight <= 0 for weight in bot_weights.values()):
+            raise ValueError("Bot weights should be positive")
+
+        self._max_concurrency = max_concurrency
+        self._in_flight = 0
+        # Enum members order is priorities order.
+        self._queues = {
+            priority: _PriorityQueue(bot_weights) for priority in RequestPriorities
+        }
+        self._metrics = {
+            priority: RequestQueueMetrics() for priority in RequestPriorities
+        }
+
+    @asynccontextmanager
+    async def request_slot(self, bot_id: UUID) -> AsyncIterator[None]:
+        priority = request_priority_var.get()
+        metrics = self._metrics[priority]
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        await self._acquire(bot_id, priority)
+        metrics.total_wait_time += loop.time() - queued_at
+
+        metrics.in_flight += 1
+        try:
+            yield
+        finally:
+            metrics.in_flight -= 1
+            metrics.completed += 1
+
+            self._in_flight -= 1
+            self._wake_up_waiters()
+
+    def get_metrics(self) -> dict[RequestPriorities, RequestQueueMetrics]:
+        return {
+            priority: replace(metrics, queued=len(self._queues[priority]))
+            for priority, metrics in self._metrics.items()
+        }
+
+    async def _acquire(self, bot_id: UUID, priority: RequestPriorities) -> None:
+        if self._in_flight < self._max_concurrency and not any(self._queues.values()):
+            self._in_flight += 1
+            return
+
+        queue = self._queues[priority]
+        waiter = asyncio.get_running_loop().create_future()
+        queue.push(bot_id, waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                queue.remove(waiter)
+            else:
+                # Slot was given right before cancellation, pass it on.
+                self._in_flight -= 1
+                self._wake_up_waiters()
+            raise
+
+    def _wake_up_waiters(self) -> None:
+        for queue in self._queues.values():
+            while queue and self._in_flight < self._max_concurrency:
+                waiter = queue.pop()
+                if waiter.cancelled():
+                    continue
+
+                self._in_flight += 1
+                waiter.set_result(None)
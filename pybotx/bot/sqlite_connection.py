@@ -0,0 +1,59 @@
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+TResult = TypeVar("TResult")
+
+
+class SQLiteConnection:
+    """SQLite connection, which runs queries one by one in worker threads.
+
+    Thread lock is held by worker thread, so it is kept even if awaiting
+    task is cancelled.
+    """
+
+    def __init__(self, path: str, schema: str) -> None:
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(schema)
+
+        self._lock = threading.Lock()
+
+    async def fetchall(
+        self,
+        query: str,
+        params: tuple[Any, ...] = (),
+    ) -> list[Any]:
+        return await self.transaction(
+            lambda connection: connection.execute(query, params).fetchall(),
+        )
+
+    async def execute(self, query: str, params: tuple[Any, ...] = ()) -> int:
+        """Execute query and return count of modified rows."""
+
+        return await self.transaction(
+            lambda connection: connection.execute(query, params).rowcount,
+        )
+
+    async def transaction(
+        self,
+        func: Callable[[sqlite3.Connection], TResult],
+    ) -> TResult:
+        """Run `func` in worker thread inside one transaction."""
+
+        return await asyncio.to_thread(self._run_transaction, func)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def _run_transaction(
+        self, func: Callable[[sqlite3.Connection], TResult]
+    ) -> TResult:
+        with self._lock, self._connection:
+            return func(self._connection)
+
+    def _close(self) -> None:
+        with self._lock:
+            self._connection.close()
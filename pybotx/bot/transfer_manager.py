@@ -0,0 +1,147 @@
+import asyncio
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sized,
+)
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass, replace
+from typing import TypeVar
+
+from pybotx.bot.rate_limiter import RateLimiter
+
+BATCH_TRANSFER_DEFAULT_MAX_CONCURRENCY = 4
+
+TransferProgressCallback = Callable[[int, int | None], None]
+
+TChunk = TypeVar("TChunk", bound=Sized)
+
+
+@dataclass(slots=True)
+class TransferMetrics:
+    active: int = 0
+    completed: int = 0
+    transferred_bytes: int = 0
+
+
+class Transfer:
+    """Accounts and throttles bytes of one file transfer."""
+
+    def __init__(
+        self,
+        metrics: TransferMetrics,
+        rate_limiter: RateLimiter | None,
+        total: int | None,
+        progress_callback: TransferProgressCallback | None,
+    ) -> None:
+        self._metrics = metrics
+        self._rate_limiter = rate_limiter
+        self._progress_callback = progress_callback
+        self.total = total
+        self.transferred = 0
+
+    async def advance(self, size: int) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(size)
+
+        self.transferred += size
+        self._metrics.transferred_bytes += size
+
+        if self._progress_callback is not None:
+            self._progress_callback(self.transferred, self.total)
+
+    async def iter_chunks(
+        self,
+        chunks: AsyncIterable[TChunk],
+    ) -> AsyncIterator[TChunk]:
+        async for chunk in chunks:
+            await self.advance(len(chunk))
+            yield chunk
+
+
+class TransferManager:
+    """Limits concurrency and bandwidth of file transfers per CTS.
+
+    File downloads and uploads don't take slots of `RequestScheduler`,
+    so big transfers don't starve other BotX requests. Transfers aren't
+    limited by default.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        max_bytes_per_second: float | None = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("`max_concurrency` should be positive")
+
+        if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+            raise ValueError("`max_bytes_per_second` should be positive")
+
+        self._max_concurrency = max_concurrency
+        self._max_bytes_per_second = max_bytes_per_second
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._rate_limiters: dict[str, RateLimiter] = {}
+        self._metrics: dict[str, TransferMetrics] = {}
+
+    @asynccontextmanager
+    async def transfer(
+        self,
+        cts_url: str,
+        total: int | None = None,
+        progress_callback: TransferProgressCallback | None = None,
+    ) -> AsyncIterator[Transfer]:
+        metrics = self._metrics.setdefault(cts_url, TransferMetrics())
+
+        rate_limiter = None
+        if self._max_bytes_per_second is not None:
+            rate_limiter = self._rate_limiters.setdefault(
+                cts_url,
+                RateLimiter(self._max_bytes_per_second),
+            )
+
+        async with self._get_semaphore(cts_url):
+            metrics.active += 1
+            try:
+                yield Transfer(metrics, rate_limiter, total, progress_callback)
+            finally:
+                metrics.active -= 1
+                metrics.completed += 1
+
+    def get_metrics(self) -> dict[str, TransferMetrics]:
+        return {cts_url: replace(metrics) for cts_url, metrics in self._metrics.items()}
+
+    def _get_semaphore(self, cts_url: str) -> AbstractAsyncContextManager[object]:
+        if self._max_concurrency is None:
+            return nullcontext()
+
+        return self._semaphores.setdefault(
+            cts_url,
+            asyncio.Semaphore(self._max_concurrency),
+        )
+
+
+async def run_transfers(
+    transfers: Iterable[Callable[[], Awaitable[None]]],
+    max_concurrency: int = BATCH_TRANSFER_DEFAULT_MAX_CONCURRENCY,
+) -> None:
+    """Run transfers in parallel, others are cancelled if one fails."""
+
+    if max_concurrency <= 0:
+        raise ValueError("`max_concurrency` should be positive")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(transfer: Callable[[], Awaitable[None]]) -> None:
+        async with semaphore:
+            await transfer()
+
+    tasks = [asyncio.create_task(run(transfer)) for transfer in transfers]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,27 @@
+from pybotx.bot.upload_dedup.upload_dedup_store_proto import UploadDedupStoreProto
+
+
+class UploadDedupMemoryStore(UploadDedupStoreProto):
+    """In-process store, results are lost on restart."""
+
+    def __init__(self) -> None:
+        self._results: dict[str, tuple[str, float | None]] = {}
+
+    async def get_result(self, key: str, now: float) -> str | None:
+        result, expires_at = self._results.get(key, (None, None))
+        if expires_at is not None and expires_at <= now:
+            del self._results[key]
+            return None
+
+        return result
+
+    async def set_result(
+        self,
+        key: str,
+        result: str,
+        expires_at: float | None,
+    ) -> None:
+        self._results[key] = (result, expires_at)
+
+    async def clear(self) -> None:
+        self._results.clear()
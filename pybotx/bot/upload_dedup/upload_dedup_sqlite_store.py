@@ -0,0 +1,46 @@
+from pybotx.bot.sqlite_connection import SQLiteConnection
+from pybotx.bot.upload_dedup.upload_dedup_store_proto import UploadDedupStoreProto
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS botx_upload_dedup (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    expires_at REAL
+);
+"""
+
+
+class UploadDedupSQLiteStore(UploadDedupStoreProto):
+    """Store on top of SQLite database, survives bot restarts."""
+
+    def __init__(self, path: str) -> None:
+        self._connection = SQLiteConnection(path, _SCHEMA)
+
+    async def get_result(self, key: str, now: float) -> str | None:
+        rows = await self._connection.fetchall(
+            "SELECT result FROM botx_upload_dedup "
+            "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, now),
+        )
+        if not rows:
+            return None
+
+        return str(rows[0][0])
+
+    async def set_result(
+        self,
+        key: str,
+        result: str,
+        expires_at: float | None,
+    ) -> None:
+        await self._connection.execute(
+            "INSERT OR REPLACE INTO botx_upload_dedup (key, result, expires_at) "
+            "VALUES (?, ?, ?)",
+            (key, result, expires_at),
+        )
+
+    async def clear(self) -> None:
+        await self._connection.execute("DELETE FROM botx_upload_dedup")
+
+    async def close(self) -> None:
+        await self._connection.close()
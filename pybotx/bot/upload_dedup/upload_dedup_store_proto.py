@@ -0,0 +1,21 @@
+from typing import Protocol
+
+
+class UploadDedupStoreProto(Protocol):
+    """Storage of upload results by content key."""
+
+    async def get_result(
+        self,
+        key: str,
+        now: float,
+    ) -> str | None:
+        """Get result, which isn't expired by `now`."""
+
+    async def set_result(
+        self,
+        key: str,
+        result: str,
+        expires_at: float | None,
+    ) -> None: ...  # pragma: no cover
+
+    async def clear(self) -> None: ...  # pragma: no cover
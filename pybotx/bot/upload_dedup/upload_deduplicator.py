@@ -0,0 +1,168 @@
+import asyncio
+import hashlib
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from pybotx.async_buffer import (
+    AsyncBufferReadable,
+    get_file_size,
+    iter_buffer_chunks,
+)
+from pybotx.bot.upload_dedup.upload_dedup_memory_store import UploadDedupMemoryStore
+from pybotx.bot.upload_dedup.upload_dedup_store_proto import UploadDedupStoreProto
+
+UPLOAD_DEDUP_DEFAULT_TTL = 24 * 60 * 60.0
+
+Upload = Callable[[AsyncBufferReadable], Awaitable[str]]
+
+
+class UploadDeduplicator:
+    """Skips uploads of content, which was already uploaded in the same scope.
+
+    Content hash is calculated while content is uploaded. Content, which
+    has the same size as one of uploaded files, is hashed before upload,
+    so upload can be skipped. Concurrent uploads of the same content in
+    the same scope are done once.
+
+    Results are kept in `store` for `ttl` seconds (or forever, if it is
+    `None`), use persistent store to skip uploads after restart.
+    """
+
+    def __init__(
+        self,
+        store: UploadDedupStoreProto | None = None,
+        *,
+        ttl: float | None = UPLOAD_DEDUP_DEFAULT_TTL,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("`ttl` should be positive")
+
+        self._store = store or UploadDedupMemoryStore()
+        self._ttl = ttl
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    async def upload(
+        self,
+        scope: str,
+        async_buffer: AsyncBufferReadable,
+        upload: Upload,
+    ) -> str:
+        """Upload content or get result of its previous upload.
+
+        `upload` gets buffer, which should be read to upload content.
+        """
+
+        content_size = await get_file_size(async_buffer)
+        size_key = f"{scope}:{content_size}"
+
+        # Same content has the same size, so its uploads are done one by one
+        async with self._lock(size_key):
+            if await self._store.get_result(size_key, time.time()) is None:
+                return await self._upload_new_content(
+                    size_key,
+                    content_size,
+                    async_buffer,
+                    upload,
+                )
+
+            key = f"{size_key}:{await _get_content_hash(async_buffer)}"
+            result = await self._store.get_result(key, time.time())
+            if result is None:
+                result = await upload(async_buffer)
+                await self._set_result(size_key, key, result)
+
+            return result
+
+    async def clear(self) -> None:
+        """Forget all upload results, so content will be uploaded again."""
+
+        await self._store.clear()
+
+    async def _upload_new_content(
+        self,
+        size_key: str,
+        content_size: int,
+        async_buffer: AsyncBufferReadable,
+        upload: Upload,
+    ) -> str:
+        hashing_buffer = _HashingBuffer(async_buffer)
+        result = await upload(hashing_buffer)
+
+        # Content may be read only partially or out of order by `upload`
+        content_hash = hashing_buffer.get_hash(content_size)
+        if content_hash is None:
+            content_hash = await _get_content_hash(async_buffer)
+
+        await self._set_result(size_key, f"{size_key}:{content_hash}", result)
+
+        return result
+
+    async def _set_result(self, size_key: str, key: str, result: str) -> None:
+        expires_at = None if self._ttl is None else time.time() + self._ttl
+
+        await self._store.set_result(key, result, expires_at)
+        await self._store.set_result(size_key, "", expires_at)
+
+    @asynccontextmanager
+    async def _lock(self, key: str) -> AsyncIterator[None]:
+        lock, users_count = self._locks.get(key, (asyncio.Lock(), 0))
+        self._locks[key] = (lock, users_count + 1)
+
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users_count = self._locks.pop(key)
+            if users_count > 1:
+                self._locks[key] = (lock, users_count - 1)
+
+
+class _HashingBuffer:
+    """Calculates hash of content, while it is read from start to end."""
+
+    def __init__(self, async_buffer: AsyncBufferReadable) -> None:
+        self._async_buffer = async_buffer
+        self._content_hash = hashlib.sha256()
+        self._hashed_size = 0
+        self._is_read_in_order = True
+
+    async def seek(self, cursor: int, whence: int = os.SEEK_SET) -> int:
+        position = await self._async_buffer.seek(cursor, whence)
+        if position == 0:
+            self._content_hash = hashlib.sha256()
+            self._hashed_size = 0
+            self._is_read_in_order = True
+        elif position != self._hashed_size:
+            self._is_read_in_order = False
+
+        return position
+
+    async def tell(self) -> int:
+        return await self._async_buffer.tell()
+
+    async def read(self, bytes_to_read: int | None = None) -> bytes:
+        content = await self._async_buffer.read(bytes_to_read)
+
+        self._content_hash.update(content)
+        self._hashed_size += len(content)
+
+        return content
+
+    def get_hash(self, content_size: int) -> str | None:
+        if not self._is_read_in_order or self._hashed_size != content_size:
+            return None
+
+        return self._content_hash.hexdigest()
+
+
+async def _get_content_hash(async_buffer: AsyncBufferReadable) -> str:
+    content_hash = hashlib.sha256()
+
+    await async_buffer.seek(0)
+    async for chunk in iter_buffer_chunks(async_buffer):
+        content_hash.update(chunk)
+    await async_buffer.seek(0)
+
+    return content_hash.hexdigest()
@@ -1,8 +1,15 @@
 import json
-from contextlib import asynccontextmanager
+from contextlib import (
+    AbstractAsyncContextManager,
+    asynccontextmanager,
+    nullcontext,
+)
+from functools import partial
+from http import HTTPStatus
 from json.decoder import JSONDecodeError
 from typing import (
     Any,
+    ClassVar,
     NoReturn,
     TypeVar,
 )
@@ -14,13 +21,29 @@ from mypy_extensions import Arg
 
 from pybotx.bot.bot_accounts_storage import BotAccountsStorage
 from pybotx.bot.callbacks.callback_manager import CallbackManager
+from pybotx.bot.concurrency_limiter import ConcurrencyLimiter, ConcurrencySlot
+from pybotx.bot.cpu_offloader import CPUOffloader
+from pybotx.bot.deadline import get_remaining_time
+from pybotx.bot.exceptions import DeadlineExceededError
+from pybotx.bot.request_compressor import RequestCompressor
+from pybotx.bot.request_scheduler import RequestScheduler
+from pybotx.bot.transfer_manager import (
+    Transfer,
+    TransferManager,
+    TransferProgressCallback,
+)
 from pybotx.client.exceptions.base import BaseClientError
 from pybotx.client.exceptions.callbacks import BotXMethodFailedCallbackReceivedError
 from pybotx.client.exceptions.http import (
     InvalidBotXResponsePayloadError,
     InvalidBotXStatusCodeError,
 )
-from pybotx.logger import logger, pformat_jsonable_obj, trim_file_data_in_outgoing_json
+from pybotx.logger import (
+    logger,
+    pformat_jsonable_obj,
+    pformat_outgoing_content,
+    trim_file_data_in_outgoing_json,
+)
 from pybotx.models.api_base import VerifiedPayloadBaseModel
 from pybotx.models.method_callbacks import (
     BotAPIMethodFailedCallback,
@@ -37,6 +60,7 @@ CallbackExceptionHandler = Callable[
 ]
 ErrorCallbackHandlers = Mapping[str, CallbackExceptionHandler]
 TBotXAPIModel = TypeVar("TBotXAPIModel", bound=VerifiedPayloadBaseModel)
+TResult = TypeVar("TResult")
 
 
 def response_exception_thrower(
@@ -59,9 +83,21 @@ def callback_exception_thrower(
     return factory
 
 
+def _shrink_timeout(timeout: float | None, remaining_time: float) -> float:
+    if timeout is None:
+        return remaining_time
+
+    return min(timeout, remaining_time)
+
+
 class BotXMethod:
-    status_handlers: StatusHandlers = {}
+    status_handlers: ClassVar[StatusHandlers] = {}
     error_callback_handlers: ErrorCallbackHandlers = {}
+    # Set for methods, which may have big bodies
+    compress_request_body: bool = False
+    # Set for file transfers, they are limited by transfer manager instead of
+    # request scheduler and concurrency limiter
+    is_file_transfer: bool = False
 
     def __init__(
         self,
@@ -69,11 +105,21 @@ class BotXMethod:
         httpx_client: httpx.AsyncClient,
         bot_accounts_storage: BotAccountsStorage,
         callbacks_manager: CallbackManager | None = None,
+        request_scheduler: RequestScheduler | None = None,
+        transfer_manager: TransferManager | None = None,
+        request_compressor: RequestCompressor | None = None,
+        cpu_offloader: CPUOffloader | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
     ) -> None:
         self._bot_id = sender_bot_id
         self._httpx_client = httpx_client
         self._bot_accounts_storage = bot_accounts_storage
         self._callbacks_manager = callbacks_manager
+        self._request_scheduler = request_scheduler
+        self._transfer_manager = transfer_manager
+        self._request_compressor = request_compressor
+        self._cpu_offloader = cpu_offloader
+        self._concurrency_limiter = concurrency_limiter
 
     # For MyPy checks
     execute: Callable[..., Awaitable[Any]]
@@ -110,7 +156,16 @@ class BotXMethod:
     async def _botx_method_call(self, *args: Any, **kwargs: Any) -> httpx.Response:
         self._log_outgoing_request(*args, **kwargs)
 
-        response = await self._httpx_client.request(*args, **kwargs)
+        async with (
+            self._concurrency_slot() as concurrency_slot,
+            self._request_slot(),
+        ):
+            response = await self._request(
+                *args,
+                **self._apply_deadline(kwargs, concurrency_slot),
+            )
+            concurrency_slot.record_response(response.status_code)
+
         await self._raise_for_status(response)
 
         return response
@@ -123,10 +178,136 @@ class BotXMethod:
     ) -> AsyncGenerator[httpx.Response, None]:
         self._log_outgoing_request(*args, **kwargs)
 
-        async with self._httpx_client.stream(*args, **kwargs) as response:
+        async with (
+            self._concurrency_slot() as concurrency_slot,
+            self._request_slot(),
+            self._httpx_client.stream(
+                *args,
+                **self._apply_deadline(kwargs, concurrency_slot),
+            ) as response,
+        ):
+            concurrency_slot.record_response(response.status_code)
             await self._raise_for_status(response)
             yield response
 
+    def _transfer(
+        self,
+        total: int | None = None,
+        progress_callback: TransferProgressCallback | None = None,
+    ) -> AbstractAsyncContextManager[Transfer]:
+        transfer_manager = self._transfer_manager or TransferManager()
+        return transfer_manager.transfer(
+            self._bot_accounts_storage.get_cts_url(self._bot_id),
+            total,
+            progress_callback,
+        )
+
+    def _apply_deadline(
+        self,
+        kwargs: dict[str, Any],
+        concurrency_slot: ConcurrencySlot,
+    ) -> dict[str, Any]:
+        remaining_time = get_remaining_time()
+        if remaining_time is None:
+            return kwargs
+
+        if remaining_time <= 0:
+            raise DeadlineExceededError(self.__class__.__name__)
+
+        client_timeout = self._httpx_client.timeout
+        timeout = httpx.Timeout(
+            connect=_shrink_timeout(client_timeout.connect, remaining_time),
+            read=_shrink_timeout(client_timeout.read, remaining_time),
+            write=_shrink_timeout(client_timeout.write, remaining_time),
+            pool=_shrink_timeout(client_timeout.pool, remaining_time),
+        )
+        concurrency_slot.is_timeout_shrunk = timeout != client_timeout
+
+        return {**kwargs, "timeout": timeout}
+
+    async def _request(self, *args: Any, **kwargs: Any) -> httpx.Response:
+        compressed_kwargs = await self._compress_request_body(kwargs)
+        response = await self._httpx_client.request(*args, **compressed_kwargs)
+
+        if (
+            compressed_kwargs is kwargs
+            or response.status_code != HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+        ):
+            return response
+
+        self._disable_request_compression()
+        return await self._httpx_client.request(*args, **kwargs)
+
+    async def _compress_request_body(
+        self,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        if self._request_compressor is None or not self.compress_request_body:
+            return kwargs
+
+        headers = dict(kwargs.get("headers") or {})
+        if "json" in kwargs:
+            # Same encoding as `httpx` uses for `json` argument
+            content = json.dumps(
+                kwargs["json"],
+                ensure_ascii=False,
+                separators=(",", ":"),
+                allow_nan=False,
+            ).encode()
+            headers["Content-Type"] = "application/json"
+        elif isinstance(kwargs.get("content"), bytes):
+            content = kwargs["content"]
+        else:
+            # Streamed bodies are sent as is
+            return kwargs
+
+        cts_url = self._bot_accounts_storage.get_cts_url(self._bot_id)
+        if not self._request_compressor.should_compress(cts_url, content):
+            return kwargs
+
+        headers["Content-Encoding"] = self._request_compressor.content_encoding
+        compressed_kwargs = {
+            key: value for key, value in kwargs.items() if key != "json"
+        }
+        compressed_kwargs["content"] = await self._run_cpu_bound(
+            len(content),
+            partial(self._request_compressor.compress, content),
+        )
+        compressed_kwargs["headers"] = headers
+
+        return compressed_kwargs
+
+    async def _run_cpu_bound(self, size: int, func: Callable[[], TResult]) -> TResult:
+        if self._cpu_offloader is None:
+            return func()
+
+        return await self._cpu_offloader.run(size, func)
+
+    def _disable_request_compression(self) -> None:
+        assert self._request_compressor is not None
+
+        cts_url = self._bot_accounts_storage.get_cts_url(self._bot_id)
+        self._request_compressor.disable(cts_url)
+
+        logger.warning(
+            "CTS `{cts_url}` doesn't support compressed requests, "
+            "sending them without compression",
+            cts_url=cts_url,
+        )
+
+    def _concurrency_slot(self) -> AbstractAsyncContextManager[ConcurrencySlot]:
+        if self._concurrency_limiter is None or self.is_file_transfer:
+            return nullcontext(ConcurrencySlot(0.0))
+
+        cts_url = self._bot_accounts_storage.get_cts_url(self._bot_id)
+        return self._concurrency_limiter.request_slot(cts_url)
+
+    def _request_slot(self) -> AbstractAsyncContextManager[None]:
+        if self._request_scheduler is None or self.is_file_transfer:
+            return nullcontext()
+
+        return self._request_scheduler.request_slot(self._bot_id)
+
     async def _raise_for_status(self, response: httpx.Response) -> None:
         handler = self.status_handlers.get(response.status_code)
         if handler:
@@ -167,20 +348,28 @@ class BotXMethod:
             )
             return None
 
+        remaining_time = get_remaining_time()
+        if remaining_time is not None:
+            callback_timeout = min(callback_timeout, remaining_time)
+
         callback = await self._callbacks_manager.wait_botx_method_callback(
             sync_id,
             callback_timeout,
         )
 
+        self.raise_for_callback_error(callback)
+
+        return callback
+
+    @classmethod
+    def raise_for_callback_error(cls, callback: BotXMethodCallback) -> None:
         if callback.status == "error":
-            error_handler = self.error_callback_handlers.get(callback.reason)
+            error_handler = cls.error_callback_handlers.get(callback.reason)
             if not error_handler:
                 raise BotXMethodFailedCallbackReceivedError(callback)
 
             error_handler(callback)  # Handler should raise an exception
 
-        return callback
-
     def _log_outgoing_request(
         self,
         *args: Any,
@@ -189,12 +378,15 @@ class BotXMethod:
         method, url = args
         query_params = kwargs.get("params")
         json_body = kwargs.get("json")
+        content = kwargs.get("content")
 
         log_template = "Performing request to BotX:\n{method} {url}"
         if query_params:
             log_template += "\nquery: {params}"
         if json_body is not None:
             log_template += "\njson: {json}"
+        if content is not None:
+            log_template += "\ncontent: {content}"
 
         logger.opt(lazy=True).debug(
             log_template,
@@ -204,4 +396,5 @@ class BotXMethod:
             json=lambda: pformat_jsonable_obj(
                 trim_file_data_in_outgoing_json(json_body),
             ),
+            content=lambda: pformat_outgoing_content(content),
         )
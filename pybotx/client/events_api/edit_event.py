@@ -17,8 +17,10 @@ from pybotx.models.message.markup import (
 )
 from pybotx.models.message.mentions import (
     BotXAPIMention,
-    find_and_replace_embed_mentions,
+    MessageBody,
+    build_botx_api_body,
 )
+from pybotx.models.message.prepared_message import PreparedMessage
 
 
 class BotXAPIEditEventPayloadOpts(UnverifiedPayloadBaseModel):
@@ -48,7 +50,7 @@ class BotXAPIEditEventRequestPayload(UnverifiedPayloadBaseModel):
     def from_domain(
         cls,
         sync_id: UUID,
-        body: Missing[str],
+        body: Missing[str | MessageBody],
         metadata: Missing[dict[str, Any]],
         bubbles: Missing[BubbleMarkup],
         keyboard: Missing[KeyboardMarkup],
@@ -61,14 +63,15 @@ class BotXAPIEditEventRequestPayload(UnverifiedPayloadBaseModel):
         elif file is None:
             api_file = None
 
+        api_body: Missing[str] = Undefined
         mentions: Missing[list[BotXAPIMention]] = Undefined
-        if isinstance(body, str):
-            body, mentions = find_and_replace_embed_mentions(body)
+        if isinstance(body, str | MessageBody):
+            api_body, mentions = build_botx_api_body(body)
 
         return cls(
             sync_id=sync_id,
             payload=BotXAPIEditEvent(
-                body=body,
+                body=api_body,
                 # TODO: Metadata can be cleaned with `{}`
                 metadata=metadata,
                 opts=BotXAPIEditEventPayloadOpts(
@@ -84,12 +87,38 @@ class BotXAPIEditEventRequestPayload(UnverifiedPayloadBaseModel):
             ),
         )
 
+    @classmethod
+    def from_prepared_message(
+        cls,
+        sync_id: UUID,
+        message: PreparedMessage,
+    ) -> "BotXAPIEditEventRequestPayload":
+        return cls(
+            sync_id=sync_id,
+            payload=BotXAPIEditEvent(
+                body=message.body,
+                metadata=message.metadata,
+                opts=BotXAPIEditEventPayloadOpts(
+                    buttons_auto_adjust=message.markup_auto_adjust,
+                ),
+                bubble=message.bubbles,
+                keyboard=message.keyboard,
+                mentions=message.mentions,
+            ),
+            file=message.file,
+            opts=BotXAPIEditEventOpts(
+                raw_mentions=bool(message.mentions) or Undefined,
+            ),
+        )
+
 
 class BotXAPIEditEventResponsePayload(VerifiedPayloadBaseModel):
     status: Literal["ok"]
 
 
 class EditEventMethod(AuthorizedBotXMethod):
+    compress_request_body = True
+
     async def execute(
         self,
         payload: BotXAPIEditEventRequestPayload,
@@ -17,7 +17,8 @@ from pybotx.models.message.markup import (
 )
 from pybotx.models.message.mentions import (
     BotXAPIMention,
-    find_and_replace_embed_mentions,
+    MessageBody,
+    build_botx_api_body,
 )
 
 
@@ -57,7 +58,7 @@ class BotXAPIReplyEventRequestPayload(UnverifiedPayloadBaseModel):
     def from_domain(
         cls,
         sync_id: UUID,
-        body: str,
+        body: str | MessageBody,
         metadata: Missing[dict[str, Any]],
         bubbles: Missing[BubbleMarkup],
         keyboard: Missing[KeyboardMarkup],
@@ -72,13 +73,13 @@ class BotXAPIReplyEventRequestPayload(UnverifiedPayloadBaseModel):
         if file:
             api_file = BotXAPIAttachment.from_file_attachment(file)
 
-        body, mentions = find_and_replace_embed_mentions(body)
+        api_body, mentions = build_botx_api_body(body)
 
         return cls(
             source_sync_id=sync_id,
             reply=BotXAPIReplyEvent(
                 status="ok",
-                body=body,
+                body=api_body,
                 metadata=metadata,
                 opts=BotXAPIReplyEventMessageOpts(
                     buttons_auto_adjust=markup_auto_adjust,
@@ -105,6 +106,8 @@ class BotXAPIReplyEventResponsePayload(VerifiedPayloadBaseModel):
 
 
 class ReplyEventMethod(AuthorizedBotXMethod):
+    compress_request_body = True
+
     async def execute(self, payload: BotXAPIReplyEventRequestPayload) -> None:
         path = "/api/v3/botx/events/reply_event"
 
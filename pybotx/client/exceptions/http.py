@@ -25,3 +25,7 @@ class InvalidBotXStatusCodeError(InvalidBotXResponseError):
 
 class InvalidBotXResponsePayloadError(InvalidBotXResponseError):
     """Received invalid status code."""
+
+
+class SyncEndpointNotSupportedError(InvalidBotXStatusCodeError):
+    """CTS doesn't provide requested synchronous endpoint."""
@@ -4,6 +4,7 @@ from uuid import UUID
 import httpx
 
 from pybotx.async_buffer import AsyncBufferWritable
+from pybotx.bot.transfer_manager import TransferProgressCallback
 from pybotx.client.authorized_botx_method import AuthorizedBotXMethod
 from pybotx.client.botx_method import response_exception_thrower
 from pybotx.client.exceptions.common import ChatNotFoundError
@@ -43,6 +44,7 @@ def not_found_error_handler(response: httpx.Response) -> NoReturn:
 
 
 class DownloadFileMethod(AuthorizedBotXMethod):
+    is_file_transfer = True
     status_handlers = {
         **AuthorizedBotXMethod.status_handlers,
         204: response_exception_thrower(FileDeletedError),
@@ -53,16 +55,25 @@ class DownloadFileMethod(AuthorizedBotXMethod):
         self,
         payload: BotXAPIDownloadFileRequestPayload,
         async_buffer: AsyncBufferWritable,
+        progress_callback: TransferProgressCallback | None = None,
     ) -> None:
         path = "/api/v3/botx/files/download"
 
-        async with self._botx_method_stream(
-            "GET",
-            self._build_url(path),
-            params=payload.jsonable_dict(),
-        ) as response:
+        async with (
+            self._transfer(progress_callback=progress_callback) as transfer,
+            self._botx_method_stream(
+                "GET",
+                self._build_url(path),
+                params=payload.jsonable_dict(),
+            ) as response,
+        ):
+            content_length = response.headers.get("Content-Length")
+            if content_length is not None:
+                transfer.total = int(content_length)
+
+            chunks = transfer.iter_chunks(response.aiter_bytes())
             # https://github.com/nedbat/coveragepy/issues/1223
-            async for chunk in response.aiter_bytes():  # pragma: no branch
+            async for chunk in chunks:  # pragma: no branch
                 await async_buffer.write(chunk)
 
         await async_buffer.seek(0)
@@ -1,12 +1,12 @@
-import tempfile
 from typing import Literal
 from uuid import UUID
 
 from pybotx.async_buffer import AsyncBufferReadable
+from pybotx.bot.transfer_manager import TransferProgressCallback
 from pybotx.client.authorized_botx_method import AuthorizedBotXMethod
 from pybotx.client.botx_method import response_exception_thrower
 from pybotx.client.exceptions.common import ChatNotFoundError
-from pybotx.constants import CHUNK_SIZE
+from pybotx.client.multipart import build_multipart_file_request
 from pybotx.missing import Missing
 from pybotx.models.api_base import UnverifiedPayloadBaseModel, VerifiedPayloadBaseModel
 from pybotx.models.async_files import APIAsyncFile, File, convert_async_file_to_domain
@@ -46,6 +46,7 @@ class BotXAPIUploadFileResponsePayload(VerifiedPayloadBaseModel):
 
 
 class UploadFileMethod(AuthorizedBotXMethod):
+    is_file_transfer = True
     status_handlers = {
         **AuthorizedBotXMethod.status_handlers,
         404: response_exception_thrower(ChatNotFoundError),
@@ -56,22 +57,24 @@ class UploadFileMethod(AuthorizedBotXMethod):
         payload: BotXAPIUploadFileRequestPayload,
         async_buffer: AsyncBufferReadable,
         filename: str,
+        progress_callback: TransferProgressCallback | None = None,
     ) -> BotXAPIUploadFileResponsePayload:
         path = "/api/v3/botx/files/upload"
 
-        with tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE) as tmp_file:
-            chunk = await async_buffer.read(CHUNK_SIZE)
-            while chunk:
-                tmp_file.write(chunk)
-                chunk = await async_buffer.read(CHUNK_SIZE)
-
-            tmp_file.seek(0)
+        request = await build_multipart_file_request(
+            payload.jsonable_dict(),
+            "content",
+            filename,
+            async_buffer,
+        )
+        total = int(request["headers"]["Content-Length"])
 
+        async with self._transfer(total, progress_callback) as transfer:
             response = await self._botx_method_call(
                 "POST",
                 self._build_url(path),
-                data=payload.jsonable_dict(),
-                files={"content": (filename, tmp_file)},
+                content=transfer.iter_chunks(request["content"]),
+                headers=request["headers"],
             )
 
         return self._verify_and_extract_api_model(
@@ -0,0 +1,87 @@
+import mimetypes
+import os
+from collections.abc import AsyncIterator, Mapping
+from typing import Any
+
+from pybotx.async_buffer import AsyncBufferReadable, get_file_size
+from pybotx.constants import CHUNK_SIZE
+
+# Same escaping as in `httpx` multipart encoder (HTML5 form encoding).
+_FORM_PARAM_ESCAPING = str.maketrans(
+    {
+        '"': "%22",
+        "\\": "\\\\",
+        **{chr(code): f"%{code:02X}" for code in range(0x20) if code != 0x1B},
+    },
+)
+
+
+async def build_multipart_file_request(
+    data: Mapping[str, str],
+    field_name: str,
+    filename: str,
+    async_buffer: AsyncBufferReadable,
+) -> dict[str, Any]:
+    """Build `multipart/form-data` body, which reads file while it is sent.
+
+    File isn't copied to memory or temporary file, body length is
+    calculated in advance for `Content-Length` header.
+
+    :return: `content` and `headers` arguments for `httpx` request.
+    """
+
+    boundary = os.urandom(16).hex().encode()
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    head_parts: list[bytes] = []
+    for name, value in data.items():
+        head_parts.extend(
+            (
+                b"--%b\r\n" % boundary,
+                b"Content-Disposition: form-data; %b\r\n\r\n"
+                % _format_param("name", name),
+                value.encode(),
+                b"\r\n",
+            ),
+        )
+    head_parts.extend(
+        (
+            b"--%b\r\n" % boundary,
+            b"Content-Disposition: form-data; %b; %b\r\n"
+            % (_format_param("name", field_name), _format_param("filename", filename)),
+            b"Content-Type: %b\r\n\r\n" % content_type.encode(),
+        ),
+    )
+    head = b"".join(head_parts)
+    tail = b"\r\n--%b--\r\n" % boundary
+
+    file_size = await get_file_size(async_buffer)
+
+    return {
+        "content": _iter_multipart_body(head, async_buffer, tail),
+        "headers": {
+            "Content-Type": f"multipart/form-data; boundary={boundary.decode()}",
+            "Content-Length": str(len(head) + file_size + len(tail)),
+        },
+    }
+
+
+def _format_param(name: str, value: str) -> bytes:
+    return f'{name}="{value.translate(_FORM_PARAM_ESCAPING)}"'.encode()
+
+
+async def _iter_multipart_body(
+    head: bytes,
+    async_buffer: AsyncBufferReadable,
+    tail: bytes,
+) -> AsyncIterator[bytes]:
+    yield head
+
+    # httpx may keep body chunks (e.g. on `request.read()`), so chunks
+    # aren't read into reused buffer.
+    chunk = await async_buffer.read(CHUNK_SIZE)
+    while chunk:
+        yield chunk
+        chunk = await async_buffer.read(CHUNK_SIZE)
+
+    yield tail
@@ -1,17 +1,25 @@
-from typing import Any, Literal
-from uuid import UUID
+import json
+from collections.abc import AsyncIterator
+from json.decoder import JSONDecodeError
+from typing import Any, ClassVar, Literal, NoReturn
+from uuid import UUID, uuid4
 
 import httpx
 
+from pybotx.async_buffer import AsyncBufferReadable, get_file_size
 from pybotx.client.authorized_botx_method import AuthorizedBotXMethod
-from pybotx.client.botx_method import callback_exception_thrower
+from pybotx.client.botx_method import StatusHandler, callback_exception_thrower
 from pybotx.client.exceptions.common import ChatNotFoundError
 from pybotx.client.exceptions.notifications import (
     BotIsNotChatMemberError,
     FinalRecipientsListEmptyError,
     StealthModeDisabledError,
 )
-from pybotx.client.exceptions.http import InvalidBotXResponsePayloadError
+from pybotx.client.exceptions.http import (
+    InvalidBotXResponsePayloadError,
+    InvalidBotXStatusCodeError,
+    SyncEndpointNotSupportedError,
+)
 from pybotx.constants import MAX_NOTIFICATION_BODY_LENGTH
 from pybotx.missing import Missing, Undefined
 from pybotx.models.api_base import UnverifiedPayloadBaseModel, VerifiedPayloadBaseModel
@@ -19,6 +27,10 @@ from pybotx.models.attachments import (
     BotXAPIAttachment,
     IncomingFileAttachment,
     OutgoingAttachment,
+    OutgoingAttachmentStream,
+    get_base64_encoded_size,
+    get_mimetype_by_filename,
+    iter_base64_encoded_chunks,
 )
 from pybotx.models.message.markup import (
     BotXAPIMarkup,
@@ -28,8 +40,10 @@ from pybotx.models.message.markup import (
 )
 from pybotx.models.message.mentions import (
     BotXAPIMention,
-    find_and_replace_embed_mentions,
+    MessageBody,
+    build_botx_api_body,
 )
+from pybotx.models.message.prepared_message import PreparedMessage
 
 
 class BotXAPIDirectNotificationMessageOpts(UnverifiedPayloadBaseModel):
@@ -68,7 +82,7 @@ class BotXAPIDirectNotificationRequestPayload(UnverifiedPayloadBaseModel):
     def from_domain(
         cls,
         chat_id: UUID,
-        body: str,
+        body: str | MessageBody,
         metadata: Missing[dict[str, Any]],
         bubbles: Missing[BubbleMarkup],
         keyboard: Missing[KeyboardMarkup],
@@ -84,18 +98,18 @@ class BotXAPIDirectNotificationRequestPayload(UnverifiedPayloadBaseModel):
         if file:
             api_file = BotXAPIAttachment.from_file_attachment(file)
 
-        if len(body) > MAX_NOTIFICATION_BODY_LENGTH:
+        api_body, mentions = build_botx_api_body(body)
+
+        if len(api_body) > MAX_NOTIFICATION_BODY_LENGTH:
             raise ValueError(
                 f"Message body length exceeds {MAX_NOTIFICATION_BODY_LENGTH} symbols",
             )
 
-        body, mentions = find_and_replace_embed_mentions(body)
-
         return cls(
             group_chat_id=chat_id,
             notification=BotXAPIDirectNotification(
                 status="ok",
-                body=body,
+                body=api_body,
                 metadata=metadata,
                 opts=BotXAPIDirectNotificationMessageOpts(
                     silent_response=silent_response,
@@ -116,6 +130,131 @@ class BotXAPIDirectNotificationRequestPayload(UnverifiedPayloadBaseModel):
             ),
         )
 
+    @classmethod
+    def from_prepared_message(
+        cls,
+        chat_id: UUID,
+        message: PreparedMessage,
+    ) -> "BotXAPIDirectNotificationRequestPayload":
+        return cls(
+            group_chat_id=chat_id,
+            notification=BotXAPIDirectNotification(
+                status="ok",
+                body=message.body,
+                metadata=message.metadata,
+                opts=BotXAPIDirectNotificationMessageOpts(
+                    silent_response=message.silent_response,
+                    buttons_auto_adjust=message.markup_auto_adjust,
+                ),
+                bubble=message.bubbles,
+                keyboard=message.keyboard,
+                mentions=message.mentions,
+            ),
+            file=message.file,
+            recipients=message.recipients,
+            opts=BotXAPIDirectNotificationOpts(
+                stealth_mode=message.stealth_mode,
+                notification_opts=BotXAPIDirectNotificationNestedOpts(
+                    send=message.send_push,
+                    force_dnd=message.ignore_mute,
+                ),
+            ),
+        )
+
+
+class BotXAPIPreparedDirectNotification:
+    """Direct notification serialized once to be sent to many chats.
+
+    `group_chat_id` is the only field that differs between chats, so
+    request body is split around it and glued back for each chat.
+    """
+
+    def __init__(self, payload: BotXAPIDirectNotificationRequestPayload) -> None:
+        placeholder = uuid4().hex
+        raw_payload = payload.jsonable_dict()
+        raw_payload["group_chat_id"] = placeholder
+
+        prefix, suffix = json.dumps(raw_payload, ensure_ascii=False).split(
+            placeholder,
+        )
+        self._prefix = prefix.encode()
+        self._suffix = suffix.encode()
+
+    def for_chat(self, chat_id: UUID) -> bytes:
+        return b"".join((self._prefix, str(chat_id).encode(), self._suffix))
+
+
+class BotXAPIStreamedDirectNotification:
+    """Direct notification with attachment encoded while request is sent.
+
+    Request body is split around attachment data, file is read and
+    base64-encoded chunk by chunk, so it isn't kept in memory as whole.
+    """
+
+    def __init__(
+        self,
+        payload: BotXAPIDirectNotificationRequestPayload,
+        attachment: OutgoingAttachmentStream,
+    ) -> None:
+        placeholder = uuid4().hex
+        raw_payload = payload.jsonable_dict()
+        raw_payload["file"] = {"file_name": attachment.filename, "data": placeholder}
+
+        prefix, suffix = json.dumps(raw_payload, ensure_ascii=False).split(
+            placeholder,
+        )
+        mimetype = get_mimetype_by_filename(attachment.filename)
+        self._prefix = f"{prefix}data:{mimetype};base64,".encode()
+        self._suffix = suffix.encode()
+        self._async_buffer = attachment.async_buffer
+
+    async def build_request_body(self) -> dict[str, Any]:
+        file_size = await get_file_size(self._async_buffer)
+        content_length = (
+            len(self._prefix) + get_base64_encoded_size(file_size) + len(self._suffix)
+        )
+
+        return {
+            "content": _iter_streamed_body(
+                self._prefix,
+                self._async_buffer,
+                self._suffix,
+            ),
+            "headers": {
+                "Content-Type": "application/json",
+                "Content-Length": str(content_length),
+            },
+        }
+
+
+async def _iter_streamed_body(
+    prefix: bytes,
+    async_buffer: AsyncBufferReadable,
+    suffix: bytes,
+) -> AsyncIterator[bytes]:
+    yield prefix
+    async for chunk in iter_base64_encoded_chunks(async_buffer):
+        yield chunk
+    yield suffix
+
+
+DirectNotificationPayload = (
+    BotXAPIDirectNotificationRequestPayload | BotXAPIStreamedDirectNotification | bytes
+)
+
+
+async def _build_request_body(payload: DirectNotificationPayload) -> dict[str, Any]:
+    if isinstance(payload, bytes):
+        return {
+            "content": payload,
+            "headers": {"Content-Type": "application/json"},
+        }
+
+    if isinstance(payload, BotXAPIStreamedDirectNotification):
+        return await payload.build_request_body()
+
+    return {"json": payload.jsonable_dict()}
+
 
 class BotXAPISyncIdResult(VerifiedPayloadBaseModel):
     sync_id: UUID
@@ -156,7 +295,61 @@ def _raise_direct_notification_sync_error(
     raise exc_type.from_response(response)
 
 
+# 404 with known reason used to be raised as `InvalidBotXStatusCodeError`,
+# so these errors are subclasses of both for backward compatibility.
+class _ChatNotFoundStatusCodeError(ChatNotFoundError, InvalidBotXStatusCodeError):
+    """Chat with specified group_chat_id not found."""
+
+
+class _BotIsNotChatMemberStatusCodeError(
+    BotIsNotChatMemberError,
+    InvalidBotXStatusCodeError,
+):
+    """Bot is not in the list of chat members."""
+
+
+class _FinalRecipientsListEmptyStatusCodeError(
+    FinalRecipientsListEmptyError,
+    InvalidBotXStatusCodeError,
+):
+    """Resulting event recipients list is empty."""
+
+
+class _StealthModeDisabledStatusCodeError(
+    StealthModeDisabledError,
+    InvalidBotXStatusCodeError,
+):
+    """Requested stealth mode disabled in specified chat."""
+
+
+_DIRECT_NOTIFICATION_SYNC_STATUS_CODE_ERROR_MAP: dict[
+    str,
+    type[InvalidBotXStatusCodeError],
+] = {
+    "chat_not_found": _ChatNotFoundStatusCodeError,
+    "bot_is_not_a_chat_member": _BotIsNotChatMemberStatusCodeError,
+    "event_recipients_list_is_empty": _FinalRecipientsListEmptyStatusCodeError,
+    "stealth_mode_disabled": _StealthModeDisabledStatusCodeError,
+}
+
+
+def sync_endpoint_not_found_handler(response: httpx.Response) -> NoReturn:
+    # Old CTS versions don't have `/sync` endpoint at all, so 404 without
+    # known error reason means that we should fall back to callbacks.
+    try:
+        reason = response.json().get("reason")
+    except (JSONDecodeError, AttributeError):
+        reason = None
+
+    exc_type = _DIRECT_NOTIFICATION_SYNC_STATUS_CODE_ERROR_MAP.get(reason)
+    if exc_type is not None:
+        raise exc_type(response)
+
+    raise SyncEndpointNotSupportedError(response)
+
+
 class DirectNotificationMethod(AuthorizedBotXMethod):
+    compress_request_body = True
     error_callback_handlers = {
         **AuthorizedBotXMethod.error_callback_handlers,
         "chat_not_found": callback_exception_thrower(ChatNotFoundError),
@@ -171,7 +364,7 @@ class DirectNotificationMethod(AuthorizedBotXMethod):
 
     async def execute(
         self,
-        payload: BotXAPIDirectNotificationRequestPayload,
+        payload: DirectNotificationPayload,
         wait_callback: bool,
         callback_timeout: float | None,
         default_callback_timeout: float,
@@ -181,7 +374,7 @@ class DirectNotificationMethod(AuthorizedBotXMethod):
         response = await self._botx_method_call(
             "POST",
             self._build_url(path),
-            json=payload.jsonable_dict(),
+            **await _build_request_body(payload),
         )
 
         api_model = self._verify_and_extract_api_model(
@@ -199,16 +392,22 @@ class DirectNotificationMethod(AuthorizedBotXMethod):
 
 
 class DirectNotificationSyncMethod(AuthorizedBotXMethod):
+    compress_request_body = True
+    status_handlers: ClassVar[dict[int, StatusHandler]] = {
+        **AuthorizedBotXMethod.status_handlers,
+        404: sync_endpoint_not_found_handler,
+    }
+
     async def execute(
         self,
-        payload: BotXAPIDirectNotificationRequestPayload,
+        payload: DirectNotificationPayload,
     ) -> BotXAPIDirectNotificationResponsePayload:
         path = "/api/v4/botx/notifications/direct/sync"
 
         response = await self._botx_method_call(
             "POST",
             self._build_url(path),
-            json=payload.jsonable_dict(),
+            **await _build_request_body(payload),
         )
 
         api_model = self._verify_and_extract_api_model(
@@ -50,6 +50,7 @@ class BotXAPIInternalBotNotificationResponsePayload(VerifiedPayloadBaseModel):
 
 
 class InternalBotNotificationMethod(AuthorizedBotXMethod):
+    compress_request_body = True
     status_handlers = {
         **AuthorizedBotXMethod.status_handlers,
         429: response_exception_thrower(RateLimitReachedError),
@@ -47,6 +47,7 @@ class BotXAPISmartAppCustomNotificationResponsePayload(VerifiedPayloadBaseModel)
 
 
 class SmartAppCustomNotificationMethod(AuthorizedBotXMethod):
+    compress_request_body = True
     error_callback_handlers = {
         **AuthorizedBotXMethod.error_callback_handlers,
     }
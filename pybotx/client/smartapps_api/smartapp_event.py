@@ -50,6 +50,8 @@ class BotXAPISmartAppEventResponsePayload(VerifiedPayloadBaseModel):
 
 
 class SmartAppEventMethod(AuthorizedBotXMethod):
+    compress_request_body = True
+
     async def execute(
         self,
         payload: BotXAPISmartAppEventRequestPayload,
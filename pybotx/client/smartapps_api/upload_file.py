@@ -1,11 +1,11 @@
-import tempfile
 from typing import Literal
 
 from pybotx.async_buffer import AsyncBufferReadable
+from pybotx.bot.transfer_manager import TransferProgressCallback
 from pybotx.client.authorized_botx_method import AuthorizedBotXMethod
 from pybotx.client.botx_method import response_exception_thrower
 from pybotx.client.exceptions.files import FileTypeNotAllowed
-from pybotx.constants import CHUNK_SIZE
+from pybotx.client.multipart import build_multipart_file_request
 from pybotx.models.api_base import VerifiedPayloadBaseModel
 
 
@@ -22,6 +22,7 @@ class BotXAPIUploadFileResponsePayload(VerifiedPayloadBaseModel):
 
 
 class UploadFileMethod(AuthorizedBotXMethod):
+    is_file_transfer = True
     status_handlers = {
         **AuthorizedBotXMethod.status_handlers,
         400: response_exception_thrower(FileTypeNotAllowed),
@@ -31,21 +32,24 @@ class UploadFileMethod(AuthorizedBotXMethod):
         self,
         async_buffer: AsyncBufferReadable,
         filename: str,
+        progress_callback: TransferProgressCallback | None = None,
     ) -> BotXAPIUploadFileResponsePayload:
         path = "/api/v3/botx/smartapps/upload_file"
 
-        with tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE) as tmp_file:
-            chunk = await async_buffer.read(CHUNK_SIZE)
-            while chunk:
-                tmp_file.write(chunk)
-                chunk = await async_buffer.read(CHUNK_SIZE)
-
-            tmp_file.seek(0)
+        request = await build_multipart_file_request(
+            {},
+            "content",
+            filename,
+            async_buffer,
+        )
+        total = int(request["headers"]["Content-Length"])
 
+        async with self._transfer(total, progress_callback) as transfer:
             response = await self._botx_method_call(
                 "POST",
                 self._build_url(path),
-                files={"content": (filename, tmp_file)},
+                content=transfer.iter_chunks(request["content"]),
+                headers=request["headers"],
             )
 
         return self._verify_and_extract_api_model(
@@ -27,6 +27,18 @@ def trim_file_data_in_outgoing_json(json_body: Any) -> Any:
     return json_body
 
 
+def pformat_outgoing_content(content: Any) -> str:
+    if not isinstance(content, bytes):
+        return "<streamed>"
+
+    try:
+        json_body = json.loads(content)
+    except ValueError:
+        return f"<{len(content)} bytes>"
+
+    return pformat_jsonable_obj(trim_file_data_in_outgoing_json(json_body))
+
+
 def trim_file_data_in_incoming_json(json_body: dict[str, Any]) -> dict[str, Any]:
     if json_body.get("attachments"):
         # Max one attach per-message
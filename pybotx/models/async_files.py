@@ -1,9 +1,11 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Literal, cast
 from collections.abc import AsyncGenerator
 from uuid import UUID
 
+import aiofiles
 from aiofiles.tempfile import SpooledTemporaryFile
 
 from pybotx.bot.contextvars import bot_id_var, bot_var, chat_id_var
@@ -38,6 +40,10 @@ class AsyncFileBase:
     chunk_size: int | None = None
     caption: str | None = None
 
+    @property
+    def file_id(self) -> UUID:
+        return self._file_id
+
     @property
     def file_url(self) -> str:
         return self._file_url
@@ -54,6 +60,16 @@ class AsyncFileBase:
     async def open(self, *, is_preview: bool = False) -> AsyncGenerator[SpooledTemporaryFile, None]:
         bot = bot_var.get()
 
+        if bot.file_cache is not None:
+            # Cached file is shared, so it is opened read-only
+            async with (
+                self.cached_path(is_preview=is_preview) as path,
+                aiofiles.open(path, "rb") as cached_file,
+            ):
+                yield cached_file
+
+            return
+
         async with SpooledTemporaryFile(max_size=CHUNK_SIZE) as tmp_file:
             await bot.download_file(
                 bot_id=bot_id_var.get(),
@@ -65,6 +81,26 @@ class AsyncFileBase:
 
             yield tmp_file
 
+    @asynccontextmanager
+    async def cached_path(
+        self,
+        *,
+        is_preview: bool = False,
+    ) -> AsyncGenerator[Path, None]:
+        """Get path of file in bot file cache, file is downloaded if needed.
+
+        File isn't removed from cache until context is exited.
+        """
+
+        async with bot_var.get().download_file_to_cache(
+            bot_id=bot_id_var.get(),
+            chat_id=chat_id_var.get(),
+            file_id=self._file_id,
+            file_hash=self._file_hash,
+            is_preview=is_preview,
+        ) as path:
+            yield path
+
 
 @dataclass(slots=True)
 class Image(AsyncFileBase):
@@ -1,14 +1,17 @@
 import base64
+import os
+import tempfile
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Literal, TypeGuard
-from collections.abc import AsyncGenerator
+from typing import IO, Any, Literal, TypeGuard
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable
 from uuid import UUID
 
+import aiofiles
 from aiofiles.tempfile import SpooledTemporaryFile
 
-from pybotx.async_buffer import AsyncBufferReadable
+from pybotx.async_buffer import AsyncBufferReadable, iter_buffer_chunks
 from pybotx.constants import CHUNK_SIZE
 from pybotx.models.api_base import UnverifiedPayloadBaseModel, VerifiedPayloadBaseModel
 from pybotx.models.enums import APIAttachmentTypes, AttachmentTypes
@@ -17,6 +20,13 @@ from pybotx.models.stickers import Sticker
 
 @dataclass(slots=True)
 class FileAttachmentBase:
+    """Inline file attachment.
+
+    Large attachments can be decoded to temporary `spooled_file` instead of
+    memory. In this case `content` is empty, `read_content()` reads whole
+    file and `open()` should be used to read it by chunks.
+    """
+
     type: AttachmentTypes
     filename: str
     size: int
@@ -25,14 +35,33 @@ class FileAttachmentBase:
 
     content: bytes
 
+    spooled_file: IO[bytes] | None = field(
+        default=None,
+        kw_only=True,
+        repr=False,
+        compare=False,
+    )
+
     @asynccontextmanager
     async def open(self) -> AsyncGenerator[SpooledTemporaryFile, None]:
+        if self.spooled_file is not None:
+            async with aiofiles.open(self.spooled_file.name, "rb") as spooled_file:
+                yield spooled_file
+            return
+
         async with SpooledTemporaryFile(max_size=CHUNK_SIZE) as tmp_file:
             await tmp_file.write(self.content)
             await tmp_file.seek(0)
 
             yield tmp_file
 
+    def read_content(self) -> bytes:
+        if self.spooled_file is None:
+            return self.content
+
+        with open(self.spooled_file.name, "rb") as spooled_file:
+            return spooled_file.read()
+
 
 @dataclass(slots=True)
 class AttachmentImage(FileAttachmentBase):
@@ -105,6 +134,19 @@ class OutgoingAttachment:
         )
 
 
+@dataclass(slots=True)
+class OutgoingAttachmentStream:
+    """Attachment, which is read and encoded while request is sent.
+
+    Unlike `OutgoingAttachment`, file content isn't kept in memory.
+    Buffer is read from the beginning.
+    """
+
+    async_buffer: AsyncBufferReadable
+    filename: str
+    is_async_file: Literal[False] = False
+
+
 class BotAPIAttachmentImageData(VerifiedPayloadBaseModel):
     content: str
     file_name: str
@@ -261,6 +303,7 @@ def _is_api_sticker_attachment(
 def convert_api_attachment_to_domain(
     api_attachment: BotAPIAttachment,
     message_body: str,
+    spool_size: int | None = None,
 ) -> IncomingAttachment:
     match api_attachment.type:
         case APIAttachmentTypes.IMAGE:
@@ -268,28 +311,36 @@ def convert_api_attachment_to_domain(
                 raise NotImplementedError(
                     f"Unsupported attachment type: {api_attachment.type}",
                 )
-            content = decode_rfc2397(api_attachment.data.content)
+            content, spooled_file, size = _decode_file_attachment_content(
+                api_attachment.data.content,
+                spool_size,
+            )
 
             return AttachmentImage(
                 type=AttachmentTypes.IMAGE,
                 filename=api_attachment.data.file_name,
-                size=len(content),
+                size=size,
                 is_async_file=False,
                 content=content,
+                spooled_file=spooled_file,
             )
         case APIAttachmentTypes.VIDEO:
             if not _is_api_video_attachment(api_attachment):
                 raise NotImplementedError(
                     f"Unsupported attachment type: {api_attachment.type}",
                 )
-            content = decode_rfc2397(api_attachment.data.content)
+            content, spooled_file, size = _decode_file_attachment_content(
+                api_attachment.data.content,
+                spool_size,
+            )
 
             return AttachmentVideo(
                 type=AttachmentTypes.VIDEO,
                 filename=api_attachment.data.file_name,
-                size=len(content),
+                size=size,
                 is_async_file=False,
                 content=content,
+                spooled_file=spooled_file,
                 duration=api_attachment.data.duration,
             )
         case APIAttachmentTypes.DOCUMENT:
@@ -297,21 +348,28 @@ def convert_api_attachment_to_domain(
                 raise NotImplementedError(
                     f"Unsupported attachment type: {api_attachment.type}",
                 )
-            content = decode_rfc2397(api_attachment.data.content)
+            content, spooled_file, size = _decode_file_attachment_content(
+                api_attachment.data.content,
+                spool_size,
+            )
 
             return AttachmentDocument(
                 type=AttachmentTypes.DOCUMENT,
                 filename=api_attachment.data.file_name,
-                size=len(content),
+                size=size,
                 is_async_file=False,
                 content=content,
+                spooled_file=spooled_file,
             )
         case APIAttachmentTypes.VOICE:
             if not _is_api_voice_attachment(api_attachment):
                 raise NotImplementedError(
                     f"Unsupported attachment type: {api_attachment.type}",
                 )
-            content = decode_rfc2397(api_attachment.data.content)
+            content, spooled_file, size = _decode_file_attachment_content(
+                api_attachment.data.content,
+                spool_size,
+            )
             attachment_extension = get_attachment_extension_from_encoded_content(
                 api_attachment.data.content,
             )
@@ -319,9 +377,10 @@ def convert_api_attachment_to_domain(
             return AttachmentVoice(
                 type=AttachmentTypes.VOICE,
                 filename=f"record.{attachment_extension}",
-                size=len(content),
+                size=size,
                 is_async_file=False,
                 content=content,
+                spooled_file=spooled_file,
                 duration=api_attachment.data.duration,
             )
         case APIAttachmentTypes.LOCATION:
@@ -378,7 +437,24 @@ def convert_api_attachment_to_domain(
 def get_attachment_extension_from_encoded_content(
     encoded_content: str,
 ) -> str:
-    return encoded_content.split(";")[0].split("/")[1]
+    # Header is sliced, so large content isn't copied
+    header_end = encoded_content.find(";")
+    if header_end != -1:
+        encoded_content = encoded_content[:header_end]
+
+    return encoded_content.split("/")[1]
+
+
+def _decode_file_attachment_content(
+    encoded_content: str,
+    spool_size: int | None,
+) -> tuple[bytes, IO[bytes] | None, int]:
+    if spool_size is None or len(encoded_content) <= spool_size:
+        content = decode_rfc2397(encoded_content)
+        return content, None, len(content)
+
+    spooled_file = decode_rfc2397_to_file(encoded_content)
+    return b"", spooled_file, spooled_file.seek(0, os.SEEK_END)
 
 
 def decode_rfc2397(encoded_content: str) -> bytes:
@@ -501,6 +577,80 @@ def encode_rfc2397(content: bytes, mimetype: str) -> str:
     return f"data:{mimetype};base64,{b64_content}"
 
 
+def decode_rfc2397_to_file(encoded_content: str) -> IO[bytes]:
+    # Content is decoded chunk by chunk, so decoded bytes aren't held in memory.
+    # Whitespace is skipped, so only whole 4-char groups are decoded at once.
+    tmp_file = tempfile.NamedTemporaryFile()  # noqa: SIM115
+
+    data_start = encoded_content.find(",") + 1
+    encoded_chunk_size = CHUNK_SIZE // 3 * 4
+    remainder = ""
+    for chunk_start in range(data_start, len(encoded_content), encoded_chunk_size):
+        encoded_chunk = remainder + "".join(
+            encoded_content[chunk_start : chunk_start + encoded_chunk_size].split(),
+        )
+        decoded_size = len(encoded_chunk) - len(encoded_chunk) % 4
+        tmp_file.write(base64.b64decode(encoded_chunk[:decoded_size]))
+        remainder = encoded_chunk[decoded_size:]
+
+    tmp_file.write(base64.b64decode(remainder))
+    tmp_file.flush()
+    return tmp_file
+
+
+def get_base64_encoded_size(size: int) -> int:
+    return (size + 2) // 3 * 4
+
+
+async def iter_base64_encoded_chunks(
+    async_buffer: AsyncBufferReadable,
+) -> AsyncIterator[bytes]:
+    # Only whole 3-byte groups are encoded, so chunks can be concatenated.
+    remainder = b""
+
+    async for chunk in iter_buffer_chunks(async_buffer):
+        # Group split between chunks is completed, rest of chunk isn't copied
+        group_end = min(-len(remainder) % 3, len(chunk))
+        remainder += chunk[:group_end]
+        if len(remainder) == 3:
+            yield base64.b64encode(remainder)
+            remainder = b""
+
+        encoded_end = len(chunk) - (len(chunk) - group_end) % 3
+        if encoded_end > group_end:
+            yield base64.b64encode(chunk[group_end:encoded_end])
+
+        remainder += chunk[encoded_end:]
+
+    yield base64.b64encode(remainder)
+
+
+def get_api_attachments_content_size(
+    attachments: Iterable[BotAPIAttachment | dict[str, Any]],
+) -> int:
+    return sum(
+        len(attachment.data.content)
+        for attachment in attachments
+        if isinstance(
+            attachment,
+            BotAPIAttachmentVideo
+            | BotAPIAttachmentImage
+            | BotAPIAttachmentDocument
+            | BotAPIAttachmentVoice,
+        )
+    )
+
+
+def get_attachment_content_size(attachment: object) -> int:
+    if isinstance(attachment, OutgoingAttachment):
+        return len(attachment.content)
+
+    if isinstance(attachment, FileAttachmentBase):
+        return attachment.size
+
+    return 0
+
+
 def get_mimetype_by_filename(filename: str) -> str:
     extension = filename.rsplit(".", 1)[-1].lower()
 
@@ -516,11 +666,14 @@ class BotXAPIAttachment(UnverifiedPayloadBaseModel):
         cls,
         attachment: IncomingFileAttachment | OutgoingAttachment,
     ) -> "BotXAPIAttachment":
-        assert attachment.content is not None
+        if isinstance(attachment, FileAttachmentBase):
+            content = attachment.read_content()
+        else:
+            content = attachment.content
 
         mimetype = get_mimetype_by_filename(attachment.filename)
 
         return cls(
             file_name=attachment.filename,
-            data=encode_rfc2397(attachment.content, mimetype),
+            data=encode_rfc2397(content, mimetype),
         )
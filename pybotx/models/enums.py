@@ -83,6 +83,54 @@ class ConferenceLinkTypes(AutoName):
     SERVER = auto()
 
 
+class DeliveryModes(AutoName):
+    """Outgoing notifications delivery modes.
+
+    Attributes:
+        CALLBACK: Send request and wait for BotX callback.
+        SYNC: Use synchronous BotX endpoints where they exist and fall back
+            to callbacks otherwise.
+    """
+
+    CALLBACK = auto()
+    SYNC = auto()
+
+
+class RequestPriorities(AutoName):
+    """Priority classes of BotX requests, from highest to lowest.
+
+    Attributes:
+        INTERACTIVE: Requests from handlers, user is waiting for them.
+        NORMAL: Requests without specified priority.
+        BULK: Broadcasts and outbox requests.
+    """
+
+    INTERACTIVE = auto()
+    NORMAL = auto()
+    BULK = auto()
+
+
+class RequestCompressionEncodings(AutoName):
+    GZIP = auto()
+    DEFLATE = auto()
+
+
+class OutboxRequestKinds(AutoName):
+    SEND_MESSAGE = auto()
+    EDIT_MESSAGE = auto()
+    REPLY_MESSAGE = auto()
+    DELETE_MESSAGE = auto()
+    SMARTAPP_NOTIFICATION = auto()
+
+
+class OutboxEntryStatuses(AutoName):
+    PENDING = auto()
+    SENDING = auto()
+    SENT = auto()
+    FAILED = auto()
+    CANCELLED = auto()
+
+
 UNSUPPORTED = Literal["UNSUPPORTED"]
 IncomingChatTypes = ChatTypes | UNSUPPORTED
 IncomingSyncSourceTypes = SyncSourceTypes | UNSUPPORTED
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class BroadcastResult:
+    chat_id: UUID
+    sync_id: UUID | None = None
+    error: Exception | None = None
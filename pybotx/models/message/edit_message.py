@@ -5,13 +5,14 @@ from uuid import UUID
 from pybotx.missing import Missing, Undefined
 from pybotx.models.attachments import IncomingFileAttachment, OutgoingAttachment
 from pybotx.models.message.markup import BubbleMarkup, KeyboardMarkup
+from pybotx.models.message.mentions import MessageBody
 
 
 @dataclass(slots=True)
 class EditMessage:
     bot_id: UUID
     sync_id: UUID
-    body: Missing[str] = Undefined
+    body: Missing[str | MessageBody] = Undefined
     metadata: Missing[dict[str, Any]] = Undefined
     bubbles: Missing[BubbleMarkup] = Undefined
     keyboard: Missing[KeyboardMarkup] = Undefined
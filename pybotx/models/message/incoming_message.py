@@ -240,7 +240,11 @@ class BotAPIIncomingMessage(BotAPIBaseCommand):
         # Pydantic-валидатор: просто делегируем статическому методу
         return cls.validate_items(value, info)
 
-    def to_domain(self, raw_command: dict[str, Any]) -> IncomingMessage:
+    def to_domain(
+        self,
+        raw_command: dict[str, Any],
+        attachment_spool_size: int | None = None,
+    ) -> IncomingMessage:
         if self.sender.device_meta:
             pushes = self.sender.device_meta.pushes
             timezone = self.sender.device_meta.timezone
@@ -295,6 +299,7 @@ class BotAPIIncomingMessage(BotAPIBaseCommand):
                 attachment_domain = convert_api_attachment_to_domain(
                     self.attachments[0],
                     self.payload.body,
+                    attachment_spool_size,
                 )
                 if isinstance(attachment_domain, FileAttachmentBase):
                     file = attachment_domain
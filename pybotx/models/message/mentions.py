@@ -1,4 +1,5 @@
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Literal
 from uuid import UUID, uuid4
@@ -259,11 +260,30 @@ BotXAPIMention = (
 def build_botx_api_embed_mention(
     mention_dict: dict[str, str],
 ) -> BotXAPIMention:
-    mention_type = MentionTypes(mention_dict["mention_type"])
-    mentioned_entity_id = mention_dict["mentioned_entity_id"]
     # re match will have "" if mention_name not passed
-    mention_name = mention_dict["mention_name"] or Undefined
+    return _build_botx_api_mention(
+        MentionTypes(mention_dict["mention_type"]),
+        mention_dict["mentioned_entity_id"],
+        mention_dict["mention_name"] or Undefined,
+    )
 
+
+def build_botx_api_mention(mention: Mention) -> BotXAPIMention:
+    if isinstance(mention, MentionAll):
+        return _build_botx_api_mention(mention.type, "", Undefined)
+
+    return _build_botx_api_mention(
+        mention.type,
+        str(mention.entity_id),
+        mention.name or Undefined,
+    )
+
+
+def _build_botx_api_mention(
+    mention_type: MentionTypes,
+    mentioned_entity_id: str,
+    mention_name: Missing[str],
+) -> BotXAPIMention:
     if mention_type == MentionTypes.USER:
         return BotXAPIUserMention(
             mention_type=convert_mention_type_from_domain(mention_type),
@@ -327,13 +347,58 @@ EMBED_MENTION_RE = re.compile(
 def find_and_replace_embed_mentions(body: str) -> tuple[str, list[BotXAPIMention]]:
     mentions = []
 
-    for match in EMBED_MENTION_RE.finditer(body):
-        mention_dict = match.groupdict()
-        embed_mention = match.group(0)
-
-        mention = build_botx_api_embed_mention(mention_dict)
-        body = body.replace(embed_mention, mention.to_botx_embed_mention_format(), 1)
-
+    def replace_embed_mention(match: re.Match[str]) -> str:
+        mention = build_botx_api_embed_mention(match.groupdict())
         mentions.append(mention)
+        return mention.to_botx_embed_mention_format()
+
+    body = EMBED_MENTION_RE.sub(replace_embed_mention, body)
 
     return body, mentions
+
+
+class MessageBody:
+    """Message body built from text parts and mentions.
+
+    Mentions are converted to BotX format in one pass over parts, without
+    embedding them into string and parsing it back. Text parts are sent
+    as is. `str()` gives body with embed mentions.
+    """
+
+    def __init__(self, *parts: str | Mention) -> None:
+        self._parts: list[str | Mention] = list(parts)
+
+    def __str__(self) -> str:
+        return "".join(str(part) for part in self._parts)
+
+    def append(self, part: str | Mention) -> "MessageBody":
+        self._parts.append(part)
+        return self
+
+    def extend(self, parts: Iterable[str | Mention]) -> "MessageBody":
+        self._parts.extend(parts)
+        return self
+
+    def to_botx_api(self) -> tuple[str, list[BotXAPIMention]]:
+        body_parts = []
+        mentions = []
+
+        for part in self._parts:
+            if isinstance(part, str):
+                body_parts.append(part)
+                continue
+
+            mention = build_botx_api_mention(part)
+            body_parts.append(mention.to_botx_embed_mention_format())
+            mentions.append(mention)
+
+        return "".join(body_parts), mentions
+
+
+def build_botx_api_body(
+    body: str | MessageBody,
+) -> tuple[str, list[BotXAPIMention]]:
+    if isinstance(body, MessageBody):
+        return body.to_botx_api()
+
+    return find_and_replace_embed_mentions(body)
@@ -5,13 +5,14 @@ from uuid import UUID
 from pybotx.missing import Missing, Undefined
 from pybotx.models.attachments import IncomingFileAttachment, OutgoingAttachment
 from pybotx.models.message.markup import BubbleMarkup, KeyboardMarkup
+from pybotx.models.message.mentions import MessageBody
 
 
 @dataclass(slots=True)
 class OutgoingMessage:
     bot_id: UUID
     chat_id: UUID
-    body: str
+    body: str | MessageBody
     metadata: Missing[dict[str, Any]] = Undefined
     bubbles: Missing[BubbleMarkup] = Undefined
     keyboard: Missing[KeyboardMarkup] = Undefined
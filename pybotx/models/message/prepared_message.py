@@ -0,0 +1,158 @@
+import re
+from dataclasses import dataclass, replace
+from typing import Any
+from uuid import UUID
+
+from pybotx.constants import MAX_NOTIFICATION_BODY_LENGTH
+from pybotx.missing import Missing, Undefined
+from pybotx.models.attachments import BotXAPIAttachment
+from pybotx.models.message.markup import (
+    BaseMarkup,
+    BotXAPIMarkup,
+    Markup,
+    api_markup_from_domain,
+)
+from pybotx.models.message.mentions import (
+    BotXAPIMention,
+    build_botx_api_body,
+)
+from pybotx.models.message.outgoing_message import OutgoingMessage
+
+
+def _api_markup_from_domain(markup: Missing[Markup]) -> Missing[BotXAPIMarkup]:
+    # Empty markup is kept, because it cleans markup on edit.
+    if isinstance(markup, BaseMarkup):
+        return api_markup_from_domain(markup)
+
+    return Undefined
+
+
+@dataclass(slots=True)
+class PreparedMessage:
+    """Outgoing message converted to BotX API format once for repeated sends."""
+
+    bot_id: UUID
+    chat_id: UUID
+    body: str
+    mentions: Missing[list[BotXAPIMention]] = Undefined
+    metadata: Missing[dict[str, Any]] = Undefined
+    bubbles: Missing[BotXAPIMarkup] = Undefined
+    keyboard: Missing[BotXAPIMarkup] = Undefined
+    file: Missing[BotXAPIAttachment] = Undefined
+    silent_response: Missing[bool] = Undefined
+    markup_auto_adjust: Missing[bool] = Undefined
+    recipients: Missing[list[UUID]] = Undefined
+    stealth_mode: Missing[bool] = Undefined
+    send_push: Missing[bool] = Undefined
+    ignore_mute: Missing[bool] = Undefined
+
+    @classmethod
+    def from_outgoing_message(cls, message: OutgoingMessage) -> "PreparedMessage":
+        body, mentions = build_botx_api_body(message.body)
+
+        if len(body) > MAX_NOTIFICATION_BODY_LENGTH:
+            raise ValueError(
+                f"Message body length exceeds {MAX_NOTIFICATION_BODY_LENGTH} symbols",
+            )
+
+        return cls._from_api_body(message, body, mentions)
+
+    @classmethod
+    def _from_api_body(
+        cls,
+        message: OutgoingMessage,
+        body: str,
+        mentions: list[BotXAPIMention],
+    ) -> "PreparedMessage":
+        return cls(
+            bot_id=message.bot_id,
+            chat_id=message.chat_id,
+            body=body,
+            mentions=mentions or Undefined,
+            metadata=message.metadata,
+            bubbles=_api_markup_from_domain(message.bubbles),
+            keyboard=_api_markup_from_domain(message.keyboard),
+            file=(
+                BotXAPIAttachment.from_file_attachment(message.file)
+                if message.file
+                else Undefined
+            ),
+            silent_response=message.silent_response,
+            markup_auto_adjust=message.markup_auto_adjust,
+            recipients=message.recipients,
+            stealth_mode=message.stealth_mode,
+            send_push=message.send_push,
+            ignore_mute=message.ignore_mute,
+        )
+
+
+def split_outgoing_message(
+    message: OutgoingMessage,
+    max_body_length: int = MAX_NOTIFICATION_BODY_LENGTH,
+) -> list[PreparedMessage]:
+    """Convert message to ordered parts with bodies of allowed length.
+
+    Body is split by lines or words where possible, mentions are never
+    split. Metadata, markup and file are sent with the last part.
+    """
+
+    body, mentions = build_botx_api_body(message.body)
+    body_parts = _split_body(body, max_body_length)
+
+    last_part = PreparedMessage._from_api_body(message, body_parts[-1], mentions)
+    if len(body_parts) == 1:
+        return [last_part]
+
+    parts = [
+        replace(
+            last_part,
+            body=body_part,
+            metadata=Undefined,
+            bubbles=Undefined,
+            keyboard=Undefined,
+            file=Undefined,
+        )
+        for body_part in body_parts[:-1]
+    ]
+    parts.append(last_part)
+
+    for part in parts:
+        part_mentions = [
+            mention
+            for mention in mentions
+            if mention.to_botx_embed_mention_format() in part.body
+        ]
+        part.mentions = part_mentions or Undefined
+
+    return parts
+
+
+_EMBED_MENTION_FORMAT_RE = re.compile(r"@{1,2}\{mention:[0-9a-f\-]+\}")
+
+
+def _split_body(body: str, max_length: int) -> list[str]:
+    parts = []
+    while len(body) > max_length:
+        split_position = _find_split_position(body, max_length)
+        parts.append(body[:split_position])
+        body = body[split_position:]
+
+    parts.append(body)
+    return parts
+
+
+def _find_split_position(body: str, max_length: int) -> int:
+    for separator in ("\n", " "):
+        separator_position = body.rfind(separator, 0, max_length)
+        if separator_position != -1:
+            return separator_position + 1
+
+    # Hard cut shouldn't break mention in BotX format.
+    for match in _EMBED_MENTION_FORMAT_RE.finditer(body):
+        if match.start() >= max_length:
+            break
+
+        if match.end() > max_length:
+            return match.start() or match.end()
+
+    return max_length
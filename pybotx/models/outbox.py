@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from pybotx.models.enums import OutboxEntryStatuses, OutboxRequestKinds
+
+
+@dataclass(slots=True)
+class OutboxEntry:
+    """Persisted outgoing BotX request.
+
+    `payload` is request body in BotX API format, `next_attempt_at` is
+    unix timestamp, for sending entries it's the end of their claim.
+    `key` is set by user to cancel scheduled entries.
+    """
+
+    id: UUID
+    bot_id: UUID
+    kind: OutboxRequestKinds
+    payload: dict[str, Any]
+    status: OutboxEntryStatuses = OutboxEntryStatuses.PENDING
+    attempts: int = 0
+    next_attempt_at: float = 0
+    sync_id: UUID | None = None
+    error: str | None = None
+    key: str | None = None
@@ -66,7 +66,11 @@ class BotAPIEventEdit(BotAPIBaseCommand):
     attachments: list[BotAPIAttachment]
     entities: list[BotAPIEntity]
 
-    def to_domain(self, raw_command: dict[str, Any]) -> EventEdit:
+    def to_domain(
+        self,
+        raw_command: dict[str, Any],
+        attachment_spool_size: int | None = None,
+    ) -> EventEdit:
         return EventEdit(
             bot=BotAccount(
                 id=self.bot_id,
@@ -78,6 +82,7 @@ class BotAPIEventEdit(BotAPIBaseCommand):
                 convert_api_attachment_to_domain(
                     api_attachment=attachment,
                     message_body=self.payload.body,
+                    spool_size=attachment_spool_size,
                 )
                 for attachment in self.attachments
             ],
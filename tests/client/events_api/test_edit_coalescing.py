@@ -0,0 +1,321 @@
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import BubbleMarkup, EditMessage, deadline
+from pybotx.bot.edit_coalescer import EDIT_COALESCING_MAX_RETRIES, EditCoalescer
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+SYNC_ID = UUID("8ba66c5b-40bf-5c77-911d-519cb4e382e9")
+OTHER_SYNC_ID = UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+
+
+def mock_edit_event(
+    respx_mock: MockRouter,
+    host: str,
+    failed_requests_count: int = 0,
+    failed_status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR,
+) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        if len(requests) <= failed_requests_count:
+            return httpx.Response(failed_status_code)
+
+        return httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": "edit_event_pushed"},
+        )
+
+    respx_mock.post(f"https://{host}/api/v3/botx/events/edit_event").mock(
+        side_effect=handler,
+    )
+    return requests
+
+
+async def test__edit__coalesced_edits_merged(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(respx_mock, host)
+
+    bubbles = BubbleMarkup()
+    bubbles.add_button(command="/stop", label="Stop")
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="0%"),
+            coalesce=True,
+        )
+        await asyncio.sleep(0.05)  # Wait for first edit
+
+        for progress in (25, 50, 75):
+            await bot.edit(
+                message=EditMessage(
+                    bot_id=bot_id,
+                    sync_id=SYNC_ID,
+                    body=f"{progress}%",
+                ),
+                coalesce=True,
+            )
+        await bot.edit(
+            message=EditMessage(
+                bot_id=bot_id,
+                sync_id=SYNC_ID,
+                bubbles=bubbles,
+                metadata={"done": False},
+            ),
+            coalesce=True,
+        )
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=OTHER_SYNC_ID, body="Hi!"),
+            coalesce=True,
+        )
+
+    # - Assert -
+    assert requests[0] == {
+        "sync_id": str(SYNC_ID),
+        "payload": {"body": "0%", "mentions": []},
+    }
+    assert sorted(requests[1:], key=lambda request: request["sync_id"]) == [
+        {
+            "sync_id": str(OTHER_SYNC_ID),
+            "payload": {"body": "Hi!", "mentions": []},
+        },
+        {
+            "sync_id": str(SYNC_ID),
+            "payload": {
+                "body": "75%",
+                "mentions": [],
+                "metadata": {"done": False},
+                "bubble": [
+                    [
+                        {
+                            "command": "/stop",
+                            "data": {},
+                            "label": "Stop",
+                            "opts": {"silent": True, "align": "center"},
+                        },
+                    ],
+                ],
+            },
+        },
+    ]
+
+
+async def test__edit__coalesced_edits_rate_limited(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(respx_mock, host)
+
+    # - Act -
+    async with bot_factory(edit_max_rate=10) as bot:
+        for body in ("first", "second"):
+            await bot.edit(
+                message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body=body),
+                coalesce=True,
+            )
+            await asyncio.sleep(0.05)
+
+        sent_before_interval = len(requests)
+        await asyncio.sleep(0.1)
+
+    # - Assert -
+    assert sent_before_interval == 1
+    assert [request["payload"]["body"] for request in requests] == [
+        "first",
+        "second",
+    ]
+
+
+async def test__edit__failed_coalesced_edit_logged(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(respx_mock, host, failed_requests_count=1)
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="first"),
+            coalesce=True,
+        )
+        await asyncio.sleep(0.05)
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="second"),
+            coalesce=True,
+        )
+
+    # - Assert -
+    assert f"Can't edit message `{SYNC_ID}`" in loguru_caplog.text
+    assert len(requests) == 2
+
+
+async def test__edit__failed_coalesced_edit_retried(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(respx_mock, host, failed_requests_count=2)
+
+    # - Act -
+    async with bot_factory(edit_max_rate=100) as bot:
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="first"),
+            coalesce=True,
+        )
+        await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert [request["payload"]["body"] for request in requests] == [
+        "first",
+        "first",
+        "first",
+    ]
+
+
+async def test__edit__failed_coalesced_edit_dropped_after_retries(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(respx_mock, host, failed_requests_count=10)
+
+    # - Act -
+    async with bot_factory(edit_max_rate=100) as bot:
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="first"),
+            coalesce=True,
+        )
+        await asyncio.sleep(0.1)
+
+    # - Assert -
+    assert len(requests) == EDIT_COALESCING_MAX_RETRIES + 1
+    assert [
+        record.levelname
+        for record in loguru_caplog.records
+        if record.message.startswith("Can't edit message")
+    ] == ["WARNING"] * EDIT_COALESCING_MAX_RETRIES + ["ERROR"]
+
+
+async def test__edit__permanently_failed_coalesced_edit_not_retried(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(
+        respx_mock,
+        host,
+        failed_requests_count=10,
+        failed_status_code=HTTPStatus.BAD_REQUEST,
+    )
+
+    # - Act -
+    async with bot_factory(edit_max_rate=100) as bot:
+        await bot.edit(
+            message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="first"),
+            coalesce=True,
+        )
+        await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert len(requests) == 1
+    assert [
+        record.levelname
+        for record in loguru_caplog.records
+        if record.message.startswith("Can't edit message")
+    ] == ["ERROR"]
+
+
+async def test__edit__coalesced_edit_sent_after_handler_deadline(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_edit_event(respx_mock, host)
+
+    # - Act -
+    async with bot_factory(edit_max_rate=10) as bot:
+        with deadline(0.01):
+            for body in ("first", "second"):
+                await bot.edit(
+                    message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body=body),
+                    coalesce=True,
+                )
+                await asyncio.sleep(0.02)
+        await asyncio.sleep(0.1)
+
+    # - Assert -
+    assert [request["payload"]["body"] for request in requests] == [
+        "first",
+        "second",
+    ]
+
+
+async def test__edit_coalescer__restarted_after_close(bot_id: UUID) -> None:
+    # - Arrange -
+    sent_bodies: list[Any] = []
+
+    async def handler(message: EditMessage) -> None:
+        sent_bodies.append(message.body)
+
+    coalescer = EditCoalescer(handler, max_rate=10)
+    coalescer.edit(EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="first"))
+    await coalescer.close()
+
+    # - Act -
+    coalescer.start()
+    for body in ("second", "third"):
+        coalescer.edit(EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body=body))
+        await asyncio.sleep(0.01)
+
+    sent_before_interval = list(sent_bodies)
+    await coalescer.close()
+
+    # - Assert -
+    assert sent_before_interval == ["first", "second"]
+    assert sent_bodies == ["first", "second", "third"]
+
+
+async def test__edit__invalid_edit_max_rate(bot_factory: Any) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        async with bot_factory(edit_max_rate=0):
+            pass  # pragma: no cover
+
+    # - Assert -
+    assert "max_rate" in str(exc.value)
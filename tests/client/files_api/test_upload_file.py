@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from typing import Any
 from uuid import UUID
 
 import httpx
@@ -13,6 +14,7 @@ from pybotx import (
     HandlerCollector,
     lifespan_wrapper,
 )
+from pybotx.constants import CHUNK_SIZE
 
 pytestmark = [
     pytest.mark.asyncio,
@@ -20,6 +22,26 @@ pytestmark = [
     pytest.mark.usefixtures("respx_mock"),
 ]
 
+UPLOAD_FILE_RESPONSE = {
+    "status": "ok",
+    "result": {
+        "type": "image",
+        "file": "https://link.to/file",
+        "file_mime_type": "image/png",
+        "file_name": "pass.png",
+        "file_preview": "https://link.to/preview",
+        "file_preview_height": 300,
+        "file_preview_width": 300,
+        "file_size": 1502345,
+        "file_hash": "Jd9r+OKpw5y+FSCg1xNTSUkwEo4nCW1Sn1AkotkOpH0=",
+        "file_encryption_algo": "stream",
+        "chunk_size": 2097152,
+        "file_id": "8dada2c8-67a6-4434-9dec-570d244e78ee",
+        "caption": "текст",
+        "duration": None,
+    },
+}
+
 
 async def test__download_file__chat_not_found_error_raised(
     respx_mock: MockRouter,
@@ -88,25 +110,7 @@ async def test__download_file__succeed(
     ).mock(
         return_value=httpx.Response(
             HTTPStatus.OK,
-            json={
-                "status": "ok",
-                "result": {
-                    "type": "image",
-                    "file": "https://link.to/file",
-                    "file_mime_type": "image/png",
-                    "file_name": "pass.png",
-                    "file_preview": "https://link.to/preview",
-                    "file_preview_height": 300,
-                    "file_preview_width": 300,
-                    "file_size": 1502345,
-                    "file_hash": "Jd9r+OKpw5y+FSCg1xNTSUkwEo4nCW1Sn1AkotkOpH0=",
-                    "file_encryption_algo": "stream",
-                    "chunk_size": 2097152,
-                    "file_id": "8dada2c8-67a6-4434-9dec-570d244e78ee",
-                    "caption": "текст",
-                    "duration": None,
-                },
-            },
+            json=UPLOAD_FILE_RESPONSE,
         ),
     )
 
@@ -129,3 +133,52 @@ async def test__download_file__succeed(
     assert uploaded_file.chunk_size == 2097152
     assert uploaded_file.caption == "текст"
     assert endpoint.called
+
+
+async def test__upload_file__file_streamed_as_multipart(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    async_buffer: NamedTemporaryFile,
+) -> None:
+    # - Arrange -
+    file_content = b"Hello, world!\n" * (CHUNK_SIZE // 10)
+    await async_buffer.write(file_content)
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(HTTPStatus.OK, json=UPLOAD_FILE_RESPONSE)
+
+    respx_mock.post(f"https://{host}/api/v3/botx/files/upload").mock(
+        side_effect=handler,
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.upload_file(
+            bot_id=bot_id,
+            chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+            async_buffer=async_buffer,
+            filename='"report".txt',
+            caption="текст",
+        )
+
+    # - Assert -
+    request = requests[0]
+    expected_request = httpx.Request(
+        "POST",
+        request.url,
+        headers={"Content-Type": request.headers["Content-Type"]},
+        data={
+            "group_chat_id": "054af49e-5e18-4dca-ad73-4f96b6de63fa",
+            "meta": '{"caption": "текст"}',
+        },
+        files={"content": ('"report".txt', file_content)},
+    )
+
+    assert request.content == expected_request.read()
+    assert request.headers["Content-Length"] == str(len(request.content))
+    assert "Transfer-Encoding" not in request.headers
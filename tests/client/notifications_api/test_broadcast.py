@@ -0,0 +1,284 @@
+import json
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    BroadcastResult,
+    BubbleMarkup,
+    DeliveryModes,
+    MentionBuilder,
+    OutgoingMessage,
+    PreparedMessage,
+    UnknownBotAccountError,
+)
+from pybotx.client.exceptions.http import InvalidBotXStatusCodeError
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+ENDPOINT = "/api/v4/botx/notifications/direct"
+
+
+def sync_id_for_chat(chat_id: UUID) -> UUID:
+    return UUID(int=chat_id.int ^ 1)
+
+
+def mock_direct_notification(
+    respx_mock: MockRouter,
+    host: str,
+    path: str = ENDPOINT,
+    failed_chat_id: UUID | None = None,
+) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raw_request = json.loads(request.content)
+        requests.append(raw_request)
+
+        chat_id = UUID(raw_request["group_chat_id"])
+        if chat_id == failed_chat_id:
+            return httpx.Response(HTTPStatus.INTERNAL_SERVER_ERROR)
+
+        return httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={
+                "status": "ok",
+                "result": {"sync_id": str(sync_id_for_chat(chat_id))},
+            },
+        )
+
+    respx_mock.post(f"https://{host}{path}").mock(side_effect=handler)
+    return requests
+
+
+async def test__broadcast__payload_built_once_for_all_chats(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+    chat_ids = [uuid4() for _ in range(5)]
+
+    bubbles = BubbleMarkup()
+    bubbles.add_button(command="/bye", label="Bye")
+    mention = MentionBuilder.user(UUID("8f3abcc8-ba00-4c89-88e0-b786beb8ec24"))
+
+    message_template = OutgoingMessage(
+        bot_id=bot_id,
+        chat_id=chat_ids[0],
+        body=f"Hi, {mention}! Привет!",
+        bubbles=bubbles,
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        results = [
+            result
+            async for result in bot.broadcast(
+                message_template=message_template,
+                chat_ids=chat_ids,
+                concurrency=2,
+                wait_callback=False,
+            )
+        ]
+
+    # - Assert -
+    assert sorted(results, key=lambda result: chat_ids.index(result.chat_id)) == [
+        BroadcastResult(chat_id=chat_id, sync_id=sync_id_for_chat(chat_id))
+        for chat_id in chat_ids
+    ]
+
+    assert [UUID(request.pop("group_chat_id")) for request in requests] == chat_ids
+    assert all(request == requests[0] for request in requests)
+
+    notification = requests[0]["notification"]
+    assert notification["body"].endswith("! Привет!")
+    assert notification["bubble"][0][0]["command"] == "/bye"
+    assert notification["mentions"][0]["mention_type"] == "user"
+
+
+async def test__broadcast__error_returned_for_failed_chat(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    chat_ids = [uuid4() for _ in range(3)]
+    mock_direct_notification(respx_mock, host, failed_chat_id=chat_ids[1])
+
+    # - Act -
+    async with bot_factory() as bot:
+        results = {
+            result.chat_id: result
+            async for result in bot.broadcast(
+                message_template=OutgoingMessage(
+                    bot_id=bot_id,
+                    chat_id=chat_ids[0],
+                    body="Hi!",
+                ),
+                chat_ids=chat_ids,
+                rate_limit=1000,
+                wait_callback=False,
+            )
+        }
+
+    # - Assert -
+    assert results[chat_ids[0]].sync_id == sync_id_for_chat(chat_ids[0])
+    assert results[chat_ids[1]].sync_id is None
+    assert isinstance(results[chat_ids[1]].error, InvalidBotXStatusCodeError)
+    assert results[chat_ids[2]].error is None
+
+
+async def test__broadcast__unexpected_errors_returned_for_chats(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    chat_ids = [uuid4() for _ in range(3)]
+    respx_mock.post(f"https://{host}{ENDPOINT}").mock(
+        side_effect=RuntimeError("Unexpected error"),
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        results = [
+            result
+            async for result in bot.broadcast(
+                message_template=OutgoingMessage(
+                    bot_id=bot_id,
+                    chat_id=chat_ids[0],
+                    body="Hi!",
+                ),
+                chat_ids=chat_ids,
+                concurrency=2,
+                wait_callback=False,
+            )
+        ]
+        unknown_bot_results = [
+            result
+            async for result in bot.broadcast(
+                message_template=OutgoingMessage(
+                    bot_id=uuid4(),
+                    chat_id=chat_ids[0],
+                    body="Hi!",
+                ),
+                chat_ids=chat_ids,
+                wait_callback=False,
+            )
+        ]
+
+    # - Assert -
+    assert {result.chat_id for result in results} == set(chat_ids)
+    assert all(isinstance(result.error, RuntimeError) for result in results)
+    assert len(unknown_bot_results) == len(chat_ids)
+    assert all(
+        isinstance(result.error, UnknownBotAccountError)
+        for result in unknown_bot_results
+    )
+
+
+async def test__broadcast__sync_delivery_mode(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host, path=f"{ENDPOINT}/sync")
+    chat_ids = [uuid4() for _ in range(2)]
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC) as bot:
+        results = [
+            result
+            async for result in bot.broadcast(
+                message_template=PreparedMessage.from_outgoing_message(
+                    OutgoingMessage(
+                        bot_id=bot_id,
+                        chat_id=chat_ids[0],
+                        body="Hi!",
+                    ),
+                ),
+                chat_ids=chat_ids,
+            )
+        ]
+
+    # - Assert -
+    assert {result.sync_id for result in results} == {
+        sync_id_for_chat(chat_id) for chat_id in chat_ids
+    }
+    assert len(requests) == 2
+
+
+async def test__broadcast__stopped_early(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+    chat_ids = [uuid4() for _ in range(100)]
+
+    # - Act -
+    async with bot_factory() as bot:
+        results = bot.broadcast(
+            message_template=OutgoingMessage(
+                bot_id=bot_id,
+                chat_id=chat_ids[0],
+                body="Hi!",
+            ),
+            chat_ids=chat_ids,
+            concurrency=1,
+            wait_callback=False,
+        )
+        async for _ in results:
+            break
+        await results.aclose()
+
+    # - Assert -
+    assert len(requests) < len(chat_ids)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_message"),
+    [
+        ({"concurrency": 0}, "`concurrency` should be positive"),
+        ({"rate_limit": 0}, "`rate_limit` should be positive"),
+    ],
+)
+async def test__broadcast__invalid_params(
+    bot_id: UUID,
+    bot_factory: Any,
+    kwargs: dict[str, Any],
+    error_message: str,
+) -> None:
+    # - Act -
+    async with bot_factory() as bot:
+        with pytest.raises(ValueError) as exc:
+            async for _ in bot.broadcast(  # pragma: no cover
+                message_template=OutgoingMessage(
+                    bot_id=bot_id,
+                    chat_id=uuid4(),
+                    body="Hi!",
+                ),
+                chat_ids=[uuid4()],
+                **kwargs,
+            ):
+                pass
+
+    # - Assert -
+    assert error_message in str(exc.value)
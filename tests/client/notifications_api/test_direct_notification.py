@@ -19,11 +19,15 @@ from pybotx import (
     IncomingMessage,
     KeyboardMarkup,
     MentionBuilder,
+    MessageBody,
     OutgoingAttachment,
+    OutgoingAttachmentStream,
     OutgoingMessage,
     StealthModeDisabledError,
     UnknownBotAccountError,
 )
+from pybotx.constants import CHUNK_SIZE
+from pybotx.models.attachments import encode_rfc2397
 from tests.testkit import BotXRequest, mock_botx, ok_payload
 
 pytestmark = [
@@ -828,3 +832,117 @@ async def test__send_message__message_body_max_length_succeed(
     # - Assert -
     assert (await task) == UUID(SYNC_ID)
     assert endpoint.called
+
+
+async def test__send_message__message_body_succeed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    monkeypatch: pytest.MonkeyPatch,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    monkeypatch.setattr(
+        "pybotx.models.message.mentions.uuid4",
+        lambda: UUID("f3e176d5-ff46-4b18-b260-25008338c06e"),
+    )
+
+    request = BotXRequest(
+        method="POST",
+        path=ENDPOINT,
+        json={
+            "group_chat_id": CHAT_ID,
+            "notification": {
+                "status": "ok",
+                "body": "Hi, @{mention:f3e176d5-ff46-4b18-b260-25008338c06e}!",
+                "mentions": [
+                    {
+                        "mention_type": "user",
+                        "mention_id": "f3e176d5-ff46-4b18-b260-25008338c06e",
+                        "mention_data": {
+                            "user_huid": "8f3abcc8-ba00-4c89-88e0-b786beb8ec24",
+                            "name": "Ivan",
+                        },
+                    },
+                ],
+            },
+        },
+    )
+    endpoint = mock_botx(
+        respx_mock,
+        host,
+        request,
+        ok_payload({"sync_id": SYNC_ID}),
+        HTTPStatus.ACCEPTED,
+    )
+
+    body = MessageBody(
+        "Hi, ",
+        MentionBuilder.user(UUID("8f3abcc8-ba00-4c89-88e0-b786beb8ec24"), "Ivan"),
+        "!",
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        sync_id = await bot.send_message(
+            body=body,
+            bot_id=bot_id,
+            chat_id=UUID(CHAT_ID),
+            wait_callback=False,
+        )
+
+    # - Assert -
+    assert sync_id == UUID(SYNC_ID)
+    assert endpoint.called
+
+
+async def test__send_message__streamed_attachment_succeed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    file_content = b"Hello, world!\n" * (CHUNK_SIZE // 10)
+    request = BotXRequest(
+        method="POST",
+        path=ENDPOINT,
+        json={
+            "group_chat_id": CHAT_ID,
+            "notification": {"status": "ok", "body": "Hi!"},
+            "file": {
+                "file_name": "test.txt",
+                "data": encode_rfc2397(file_content, "text/plain"),
+            },
+        },
+    )
+    endpoint = mock_botx(
+        respx_mock,
+        host,
+        request,
+        ok_payload({"sync_id": SYNC_ID}),
+        HTTPStatus.ACCEPTED,
+    )
+
+    # - Act -
+    async with (
+        bot_factory() as bot,
+        NamedTemporaryFile("wb+") as async_buffer,
+    ):
+        await async_buffer.write(file_content)
+
+        sync_id = await bot.send_message(
+            body="Hi!",
+            bot_id=bot_id,
+            chat_id=UUID(CHAT_ID),
+            file=OutgoingAttachmentStream(async_buffer, "test.txt"),
+            wait_callback=False,
+        )
+
+    # - Assert -
+    assert sync_id == UUID(SYNC_ID)
+    assert endpoint.called
+
+    sent_request = endpoint.calls.last.request
+    assert int(sent_request.headers["Content-Length"]) == len(sent_request.content)
+    assert "Transfer-Encoding" not in sent_request.headers
@@ -1,17 +1,26 @@
+import asyncio
 from http import HTTPStatus
 from typing import Any
 from uuid import UUID
 
 import pytest
+from aiofiles.tempfile import NamedTemporaryFile
 from respx.router import MockRouter
 
 from pybotx import (
     BotIsNotChatMemberError,
     ChatNotFoundError,
+    DeliveryModes,
     FinalRecipientsListEmptyError,
+    OutgoingAttachmentStream,
     StealthModeDisabledError,
 )
-from pybotx.client.exceptions.http import InvalidBotXResponsePayloadError
+from pybotx.client.exceptions.http import (
+    InvalidBotXResponsePayloadError,
+    InvalidBotXStatusCodeError,
+    SyncEndpointNotSupportedError,
+)
+from pybotx.models.attachments import encode_rfc2397
 from tests.testkit import BotXRequest, error_payload, mock_botx, ok_payload
 
 pytestmark = [
@@ -130,3 +139,239 @@ async def test__send_message_sync__unknown_error_reason_raised(
 
     # - Assert -
     assert endpoint.called
+
+
+CALLBACK_REQUEST = BotXRequest(
+    method="POST",
+    path="/api/v4/botx/notifications/direct",
+    json=REQUEST.json,
+)
+
+
+async def test__send_message__sync_delivery_mode_uses_sync_endpoint(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    sync_endpoint = mock_botx(
+        respx_mock,
+        host,
+        REQUEST,
+        ok_payload({"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"}),
+        HTTPStatus.OK,
+    )
+    callback_endpoint = mock_botx(
+        respx_mock,
+        host,
+        CALLBACK_REQUEST,
+        ok_payload({"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"}),
+        HTTPStatus.ACCEPTED,
+    )
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC) as bot:
+        sync_id = await bot.send_message(
+            body="Hi!",
+            bot_id=bot_id,
+            chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+        )
+
+    # - Assert -
+    assert sync_id == UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+    assert sync_endpoint.call_count == 1
+    assert not callback_endpoint.called
+
+
+async def test__send_message__sync_delivery_mode_without_waiting_uses_callbacks(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    sync_endpoint = mock_botx(
+        respx_mock,
+        host,
+        REQUEST,
+        ok_payload({"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"}),
+        HTTPStatus.OK,
+    )
+    callback_endpoint = mock_botx(
+        respx_mock,
+        host,
+        CALLBACK_REQUEST,
+        ok_payload({"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"}),
+        HTTPStatus.ACCEPTED,
+    )
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC) as bot:
+        sync_id = await bot.send_message(
+            body="Hi!",
+            bot_id=bot_id,
+            chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+            wait_callback=False,
+        )
+
+    # - Assert -
+    assert sync_id == UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+    assert not sync_endpoint.called
+    assert callback_endpoint.called
+
+
+async def test__send_message__sync_endpoint_not_supported_fallback_to_callbacks(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    sync_endpoint = mock_botx(
+        respx_mock,
+        host,
+        REQUEST,
+        None,
+        HTTPStatus.NOT_FOUND,
+        response_content="Not found",
+    )
+    callback_endpoint = mock_botx(
+        respx_mock,
+        host,
+        CALLBACK_REQUEST,
+        ok_payload({"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"}),
+        HTTPStatus.ACCEPTED,
+    )
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC) as bot:
+        for _ in range(2):  # Second call should skip sync endpoint
+            task = asyncio.create_task(
+                bot.send_message(
+                    body="Hi!",
+                    bot_id=bot_id,
+                    chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+                ),
+            )
+            await asyncio.sleep(0.05)  # Wait for callback registration
+
+            await bot.set_raw_botx_method_result(
+                {
+                    "status": "ok",
+                    "sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3",
+                    "result": {},
+                },
+                verify_request=False,
+            )
+            sync_id = await task
+
+    # - Assert -
+    assert sync_id == UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+    assert sync_endpoint.call_count == 1
+    assert callback_endpoint.call_count == 2
+    assert "falling back to callbacks" in loguru_caplog.text
+
+
+async def test__send_message__sync_endpoint_not_found_with_known_reason_raised(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    sync_endpoint = mock_botx(
+        respx_mock,
+        host,
+        REQUEST,
+        error_payload("chat_not_found"),
+        HTTPStatus.NOT_FOUND,
+    )
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC) as bot:
+        with pytest.raises(ChatNotFoundError) as exc:
+            await bot.send_message(
+                body="Hi!",
+                bot_id=bot_id,
+                chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+            )
+
+    # - Assert -
+    assert sync_endpoint.called
+    assert isinstance(exc.value, InvalidBotXStatusCodeError)
+
+
+async def test__send_message_sync__endpoint_not_supported_raised(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    sync_endpoint = mock_botx(
+        respx_mock,
+        host,
+        REQUEST,
+        ["unexpected"],
+        HTTPStatus.NOT_FOUND,
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        with pytest.raises(SyncEndpointNotSupportedError):
+            await bot.send_message_sync(
+                body="Hi!",
+                bot_id=bot_id,
+                chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+            )
+
+    # - Assert -
+    assert sync_endpoint.called
+
+
+async def test__send_message_sync__streamed_attachment_succeed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    file_content = b"Hello, world!"
+    endpoint = mock_botx(
+        respx_mock,
+        host,
+        BotXRequest(
+            method="POST",
+            path=ENDPOINT,
+            json={
+                "group_chat_id": "054af49e-5e18-4dca-ad73-4f96b6de63fa",
+                "notification": {"status": "ok", "body": "Hi!"},
+                "file": {
+                    "file_name": "test.txt",
+                    "data": encode_rfc2397(file_content, "text/plain"),
+                },
+            },
+        ),
+        ok_payload({"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"}),
+        HTTPStatus.OK,
+    )
+
+    # - Act -
+    async with (
+        bot_factory() as bot,
+        NamedTemporaryFile("wb+") as async_buffer,
+    ):
+        await async_buffer.write(file_content)
+
+        sync_id = await bot.send_message_sync(
+            body="Hi!",
+            bot_id=bot_id,
+            chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+            file=OutgoingAttachmentStream(async_buffer, "test.txt"),
+        )
+
+    # - Assert -
+    assert sync_id == UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+    assert endpoint.called
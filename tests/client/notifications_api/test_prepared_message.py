@@ -0,0 +1,392 @@
+import asyncio
+import json
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from aiofiles.tempfile import NamedTemporaryFile
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BubbleMarkup,
+    HandlerCollector,
+    IncomingMessage,
+    KeyboardMarkup,
+    MentionBuilder,
+    OutgoingAttachment,
+    OutgoingMessage,
+    PreparedMessage,
+)
+from pybotx.missing import Undefined
+from pybotx.models.message.prepared_message import split_outgoing_message
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+SYNC_ID = "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"
+USER_HUID = UUID("8f3abcc8-ba00-4c89-88e0-b786beb8ec24")
+
+
+def mock_endpoint(
+    respx_mock: MockRouter,
+    host: str,
+    path: str,
+    response_json: dict[str, Any],
+) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(HTTPStatus.ACCEPTED, json=response_json)
+
+    respx_mock.post(f"https://{host}{path}").mock(side_effect=handler)
+    return requests
+
+
+def mock_direct_notification(
+    respx_mock: MockRouter,
+    host: str,
+) -> list[dict[str, Any]]:
+    return mock_endpoint(
+        respx_mock,
+        host,
+        "/api/v4/botx/notifications/direct",
+        {"status": "ok", "result": {"sync_id": SYNC_ID}},
+    )
+
+
+async def test__send__prepared_message_converted_once(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+
+    bubbles = BubbleMarkup()
+    bubbles.add_button(command="/bubble-button", label="Bubble button")
+    keyboard = KeyboardMarkup()
+    keyboard.add_button(command="/keyboard-button", label="Keyboard button")
+
+    async with NamedTemporaryFile("wb+") as async_buffer:
+        await async_buffer.write(b"Hello, world!\n")
+        await async_buffer.seek(0)
+
+        file = await OutgoingAttachment.from_async_buffer(async_buffer, "test.txt")
+
+    mention = MentionBuilder.user(USER_HUID, "Ivan")
+    message = PreparedMessage.from_outgoing_message(
+        OutgoingMessage(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            body=f"Hi, {mention}!",
+            metadata={"foo": "bar"},
+            bubbles=bubbles,
+            keyboard=keyboard,
+            file=file,
+            recipients=[USER_HUID],
+            silent_response=True,
+        ),
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        for _ in range(2):
+            await bot.send(message=message, wait_callback=False)
+
+    # - Assert -
+    assert requests[0] == requests[1]
+
+    mention_id = requests[0]["notification"]["mentions"][0]["mention_id"]
+    assert requests[0] == {
+        "group_chat_id": str(CHAT_ID),
+        "notification": {
+            "status": "ok",
+            "body": f"Hi, @{{mention:{mention_id}}}!",
+            "metadata": {"foo": "bar"},
+            "opts": {"silent_response": True},
+            "bubble": [
+                [
+                    {
+                        "command": "/bubble-button",
+                        "data": {},
+                        "label": "Bubble button",
+                        "opts": {"silent": True, "align": "center"},
+                    },
+                ],
+            ],
+            "keyboard": [
+                [
+                    {
+                        "command": "/keyboard-button",
+                        "data": {},
+                        "label": "Keyboard button",
+                        "opts": {"silent": True, "align": "center"},
+                    },
+                ],
+            ],
+            "mentions": [
+                {
+                    "mention_type": "user",
+                    "mention_id": mention_id,
+                    "mention_data": {"user_huid": str(USER_HUID), "name": "Ivan"},
+                },
+            ],
+        },
+        "file": {
+            "file_name": "test.txt",
+            "data": "data:text/plain;base64,SGVsbG8sIHdvcmxkIQo=",
+        },
+        "recipients": [str(USER_HUID)],
+    }
+
+
+async def test__answer_message__prepared_message(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+    message = PreparedMessage.from_outgoing_message(
+        OutgoingMessage(
+            bot_id=bot_id,
+            chat_id=USER_HUID,  # Should be replaced with incoming message chat
+            body="Hi!",
+        ),
+    )
+
+    collector = HandlerCollector()
+
+    @collector.command("/hello", description="Hello command")
+    async def hello_handler(_: IncomingMessage, bot: Bot) -> None:
+        await bot.answer_message(message, wait_callback=False)
+
+    # - Act -
+    async with bot_factory(collectors=[collector]) as bot:
+        bot.async_execute_raw_bot_command(
+            api_incoming_message_factory(
+                bot_id=bot_id,
+                host=host,
+                group_chat_id=str(CHAT_ID),
+            ),
+            verify_request=False,
+        )
+        await asyncio.sleep(0.05)  # Wait for handler
+
+    # - Assert -
+    assert requests == [
+        {
+            "group_chat_id": str(CHAT_ID),
+            "notification": {"status": "ok", "body": "Hi!"},
+        },
+    ]
+
+
+async def test__edit_message__prepared_message(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_endpoint(
+        respx_mock,
+        host,
+        "/api/v3/botx/events/edit_event",
+        {"status": "ok", "result": "edit_event_pushed"},
+    )
+    message = PreparedMessage.from_outgoing_message(
+        OutgoingMessage(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            body=f"Bye, {MentionBuilder.all()}!",
+            bubbles=BubbleMarkup(),
+            markup_auto_adjust=True,
+        ),
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.edit_message(bot_id=bot_id, sync_id=UUID(SYNC_ID), body=message)
+
+    # - Assert -
+    mention_id = requests[0]["payload"]["mentions"][0]["mention_id"]
+    assert requests == [
+        {
+            "sync_id": SYNC_ID,
+            "payload": {
+                "body": f"Bye, @{{mention:{mention_id}}}!",
+                "opts": {"buttons_auto_adjust": True},
+                "bubble": [],
+                "mentions": [{"mention_type": "all", "mention_id": mention_id}],
+            },
+            "opts": {"raw_mentions": True},
+        },
+    ]
+
+
+async def test__answer_message__prepared_message_with_params(
+    host: str,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    message = PreparedMessage.from_outgoing_message(
+        OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+    )
+    errors: list[ValueError] = []
+
+    collector = HandlerCollector()
+
+    @collector.command("/hello", description="Hello command")
+    async def hello_handler(_: IncomingMessage, bot: Bot) -> None:
+        try:
+            await bot.answer_message(message, bubbles=BubbleMarkup())
+        except ValueError as exc:
+            errors.append(exc)
+
+    # - Act -
+    async with bot_factory(collectors=[collector]) as bot:
+        bot.async_execute_raw_bot_command(
+            api_incoming_message_factory(
+                bot_id=bot_id,
+                host=host,
+                group_chat_id=str(CHAT_ID),
+            ),
+            verify_request=False,
+        )
+        await asyncio.sleep(0.05)  # Wait for handler
+
+    # - Assert -
+    assert len(errors) == 1
+    assert "Message params can't be passed" in str(errors[0])
+
+
+async def test__edit_message__prepared_message_with_params(
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    message = PreparedMessage.from_outgoing_message(
+        OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Bye!"),
+    )
+
+    # - Act -
+    async with bot_factory() as bot:
+        with pytest.raises(ValueError) as exc:
+            await bot.edit_message(
+                bot_id=bot_id,
+                sync_id=UUID(SYNC_ID),
+                body=message,
+                file=None,
+            )
+
+    # - Assert -
+    assert "Message params can't be passed" in str(exc.value)
+
+
+async def test__prepared_message__too_long_body(bot_id: UUID) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        PreparedMessage.from_outgoing_message(
+            OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="a" * 4097),
+        )
+
+    # - Assert -
+    assert "4096" in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    ("body", "expected_parts"),
+    [
+        ("short", ["short"]),
+        ("first line\nsecond", ["first line\n", "second"]),
+        ("one two three", ["one two ", "three"]),
+        ("abcdefghijklmnopqrst", ["abcdefghijkl", "mnopqrst"]),
+    ],
+)
+async def test__split_outgoing_message__body_split(
+    bot_id: UUID,
+    body: str,
+    expected_parts: list[str],
+) -> None:
+    # - Act -
+    parts = split_outgoing_message(
+        OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body=body),
+        max_body_length=12,
+    )
+
+    # - Assert -
+    assert [part.body for part in parts] == expected_parts
+
+
+async def test__split_outgoing_message__mentions_and_markup(bot_id: UUID) -> None:
+    # - Arrange -
+    bubbles = BubbleMarkup()
+    bubbles.add_button(command="/bye", label="Bye")
+    mention = MentionBuilder.user(USER_HUID)
+
+    # - Act -
+    parts = split_outgoing_message(
+        OutgoingMessage(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            body=f"{'a' * 40}{mention}",
+            bubbles=bubbles,
+            metadata={"key": "value"},
+        ),
+        max_body_length=50,
+    )
+
+    # - Assert -
+    assert parts[0].body == "a" * 40
+    assert parts[0].mentions is Undefined
+    assert parts[0].bubbles is Undefined
+    assert parts[0].metadata is Undefined
+
+    assert parts[1].mentions
+    assert parts[1].body == f"@{{mention:{parts[1].mentions[0].mention_id}}}"
+    assert parts[1].bubbles
+    assert parts[1].metadata == {"key": "value"}
+
+
+@pytest.mark.parametrize("max_body_length", [10, 50])
+async def test__split_outgoing_message__mentions_not_split(
+    bot_id: UUID,
+    max_body_length: int,
+) -> None:
+    # - Arrange -
+    mention = MentionBuilder.user(USER_HUID)
+
+    # - Act -
+    parts = split_outgoing_message(
+        OutgoingMessage(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            body=f"{mention}{'b' * 60}{mention}",
+        ),
+        max_body_length=max_body_length,
+    )
+
+    # - Assert -
+    mentions = [mention for part in parts if part.mentions for mention in part.mentions]
+    mention_formats = [mention.to_botx_embed_mention_format() for mention in mentions]
+
+    body = "".join(part.body for part in parts)
+    assert body == f"{mention_formats[0]}{'b' * 60}{mention_formats[1]}"
+    # Mention longer than max body length is sent as separate message.
+    max_part_length = max(max_body_length, len(mention_formats[0]))
+    assert all(len(part.body) <= max_part_length for part in parts)
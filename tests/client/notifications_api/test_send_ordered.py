@@ -0,0 +1,228 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BubbleMarkup,
+    ChatNotFoundError,
+    DeliveryModes,
+    OrderedSendResult,
+    OutgoingMessage,
+    PreparedMessage,
+)
+from pybotx.client.exceptions.http import InvalidBotXStatusCodeError
+from pybotx.constants import MAX_NOTIFICATION_BODY_LENGTH
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+ENDPOINT = "/api/v4/botx/notifications/direct"
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+
+
+def mock_direct_notification(
+    respx_mock: MockRouter,
+    host: str,
+    path: str = ENDPOINT,
+    on_request: Callable[[int], Awaitable[HTTPStatus]] | None = None,
+) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+
+        status = HTTPStatus.ACCEPTED
+        if on_request:
+            status = await on_request(len(requests))
+
+        return httpx.Response(
+            status,
+            json={"status": "ok", "result": {"sync_id": str(UUID(int=len(requests)))}},
+        )
+
+    respx_mock.post(f"https://{host}{path}").mock(side_effect=handler)
+    return requests
+
+
+async def set_callback(bot: Bot, sync_id: UUID, reason: str | None = None) -> None:
+    callback: dict[str, Any] = {"status": "ok", "sync_id": str(sync_id), "result": {}}
+    if reason:
+        callback = {
+            "status": "error",
+            "sync_id": str(sync_id),
+            "reason": reason,
+            "errors": [],
+            "error_data": {"group_chat_id": str(CHAT_ID)},
+        }
+
+    await bot.set_raw_botx_method_result(callback, verify_request=False)
+
+
+async def wait_requests(requests: list[dict[str, Any]], count: int) -> None:
+    while len(requests) < count:
+        await asyncio.sleep(0.01)
+
+
+async def test__send_ordered__messages_sent_without_waiting_callbacks(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+
+    bubbles = BubbleMarkup()
+    bubbles.add_button(command="/next", label="Next")
+
+    long_line = "a" * (MAX_NOTIFICATION_BODY_LENGTH - 10)
+    messages = [
+        OutgoingMessage(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            body=f"{long_line}\n{long_line}",
+            bubbles=bubbles,
+        ),
+        PreparedMessage.from_outgoing_message(
+            OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="second"),
+        ),
+        OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="third"),
+    ]
+
+    # - Act -
+    async with bot_factory() as bot:
+        task = asyncio.create_task(bot.send_ordered(messages=messages))
+
+        await wait_requests(requests, 4)
+        for sync_id_int in range(1, 5):
+            await set_callback(bot, UUID(int=sync_id_int))
+
+        results = await task
+
+    # - Assert -
+    assert results == [
+        OrderedSendResult(message_index=0, sync_id=UUID(int=1)),
+        OrderedSendResult(message_index=0, sync_id=UUID(int=2)),
+        OrderedSendResult(message_index=1, sync_id=UUID(int=3)),
+        OrderedSendResult(message_index=2, sync_id=UUID(int=4)),
+    ]
+    assert [request["notification"]["body"] for request in requests] == [
+        f"{long_line}\n",
+        long_line,
+        "second",
+        "third",
+    ]
+    assert "bubble" not in requests[0]["notification"]
+    assert requests[1]["notification"]["bubble"][0][0]["command"] == "/next"
+
+
+async def test__send_ordered__stopped_on_failed_request(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    async def on_request(request_number: int) -> HTTPStatus:
+        if request_number == 2:
+            return HTTPStatus.INTERNAL_SERVER_ERROR
+
+        return HTTPStatus.ACCEPTED
+
+    requests = mock_direct_notification(respx_mock, host, on_request=on_request)
+
+    # - Act -
+    async with bot_factory() as bot:
+        results = await bot.send_ordered(
+            messages=[
+                OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body=body)
+                for body in ("first", "second", "third")
+            ],
+            wait_callback=False,
+        )
+
+    # - Assert -
+    assert len(requests) == 2
+    assert results[0] == OrderedSendResult(message_index=0, sync_id=UUID(int=1))
+    assert results[1].sync_id is None
+    assert isinstance(results[1].error, InvalidBotXStatusCodeError)
+
+
+async def test__send_ordered__stopped_on_failed_callback(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    bot: Bot
+
+    async def on_request(request_number: int) -> HTTPStatus:
+        if request_number == 2:
+            await set_callback(bot, UUID(int=1), reason="chat_not_found")
+            await asyncio.sleep(0.01)
+
+        return HTTPStatus.ACCEPTED
+
+    requests = mock_direct_notification(respx_mock, host, on_request=on_request)
+
+    # - Act -
+    async with bot_factory() as bot:
+        task = asyncio.create_task(
+            bot.send_ordered(
+                messages=[
+                    OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body=body)
+                    for body in ("first", "second", "third")
+                ],
+            ),
+        )
+
+        await wait_requests(requests, 2)
+        await set_callback(bot, UUID(int=2))
+
+        results = await task
+
+    # - Assert -
+    assert len(requests) == 2
+    assert isinstance(results[0].error, ChatNotFoundError)
+    assert results[1] == OrderedSendResult(message_index=1, sync_id=UUID(int=2))
+
+
+async def test__send_ordered__sync_delivery_mode(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host, path=f"{ENDPOINT}/sync")
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC) as bot:
+        results = await bot.send_ordered(
+            messages=[
+                OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body=body)
+                for body in ("first", "second")
+            ],
+        )
+
+    # - Assert -
+    assert results == [
+        OrderedSendResult(message_index=0, sync_id=UUID(int=1)),
+        OrderedSendResult(message_index=1, sync_id=UUID(int=2)),
+    ]
+    assert [request["notification"]["body"] for request in requests] == [
+        "first",
+        "second",
+    ]
@@ -438,6 +438,56 @@ async def test__botx_method_callback__callback_received_after_timeout(
     assert endpoint.called
 
 
+async def test__botx_method_callback__callback_received_after_expiry_window(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    endpoint = respx_mock.post(
+        f"https://{host}/foo/bar",
+        json={"baz": 1},
+        headers={"Content-Type": "application/json"},
+    ).mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={
+                "status": "ok",
+                "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+            },
+        ),
+    )
+    built_bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        expired_callbacks_ttl=0.01,
+    )
+
+    built_bot.call_foo_bar = types.MethodType(call_foo_bar, built_bot)
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        with pytest.raises(CallbackNotReceivedError):
+            await bot.call_foo_bar(bot_id, baz=1, callback_timeout=0)
+
+        await asyncio.sleep(0.05)
+
+        await bot.set_raw_botx_method_result(
+            {
+                "status": "ok",
+                "sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3",
+                "result": {},
+            },
+            verify_request=False,
+        )
+
+    # - Assert -
+    assert "received without a registered handler" in loguru_caplog.text
+    assert endpoint.called
+
+
 async def test__botx_method_callback__dont_wait_for_callback(
     respx_mock: MockRouter,
     host: str,
@@ -0,0 +1,401 @@
+# mypy: disable-error-code=attr-defined
+
+import asyncio
+import sqlite3
+import types
+from collections.abc import AsyncGenerator
+from http import HTTPStatus
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BotAccountWithSecret,
+    BotShuttingDownError,
+    BotXMethodCallbackNotFoundError,
+    CallbackBrokerProto,
+    CallbackMemoryBroker,
+    CallbackNotReceivedError,
+    CallbackSharedRepo,
+    CallbackSQLiteBroker,
+    HandlerCollector,
+    lifespan_wrapper,
+)
+from pybotx.models.method_callbacks import BotAPIMethodSuccessfulCallback
+from tests.client.test_botx_method_callback import call_foo_bar
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+SYNC_ID = UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+SUCCESSFUL_CALLBACK = {
+    "status": "ok",
+    "sync_id": str(SYNC_ID),
+    "result": {},
+}
+
+
+@pytest.fixture
+def foo_bar_endpoint(respx_mock: MockRouter, host: str) -> None:
+    respx_mock.post(f"https://{host}/foo/bar").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": {"sync_id": str(SYNC_ID)}},
+        ),
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def broker(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> AsyncGenerator[CallbackBrokerProto, None]:
+    if request.param == "memory":
+        yield CallbackMemoryBroker()
+        return
+
+    sqlite_broker = CallbackSQLiteBroker(
+        str(tmp_path / "callbacks.sqlite3"),
+        poll_interval=0.01,
+    )
+    yield sqlite_broker
+    await sqlite_broker.close()
+
+
+def build_worker(
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> Bot:
+    bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        callback_repo=CallbackSharedRepo(broker),
+    )
+    bot.call_foo_bar = types.MethodType(call_foo_bar, bot)
+    return bot
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__callback_received_by_another_worker(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+    receiver = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender), lifespan_wrapper(receiver):
+        task = asyncio.create_task(sender.call_foo_bar(bot_id, baz=1))
+        await asyncio.sleep(0.05)  # Wait for callback registration
+
+        await receiver.set_raw_botx_method_result(
+            SUCCESSFUL_CALLBACK,
+            verify_request=False,
+        )
+        sync_id = await asyncio.wait_for(task, timeout=1)
+
+    # - Assert -
+    assert sync_id == SYNC_ID
+    assert await broker.get_callback(SYNC_ID) is None
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__callback_received_before_registration(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+    receiver = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender), lifespan_wrapper(receiver):
+        await receiver.set_raw_botx_method_result(
+            SUCCESSFUL_CALLBACK,
+            verify_request=False,
+        )
+        sync_id = await sender.call_foo_bar(bot_id, baz=1, callback_timeout=1)
+
+    # - Assert -
+    assert sync_id == SYNC_ID
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__wait_later_callback(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+    receiver = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender), lifespan_wrapper(receiver):
+        sync_id = await sender.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        for _ in range(2):  # Duplicated callback should be ignored
+            await receiver.set_raw_botx_method_result(
+                SUCCESSFUL_CALLBACK,
+                verify_request=False,
+            )
+            await asyncio.sleep(0.05)
+
+        callback = await sender.wait_botx_method_callback(sync_id)
+
+        with pytest.raises(BotXMethodCallbackNotFoundError):
+            await sender._callbacks_manager.wait_botx_method_callback(sync_id, 1)
+
+    # - Assert -
+    assert callback == BotAPIMethodSuccessfulCallback(
+        sync_id=SYNC_ID,
+        status="ok",
+        result={},
+    )
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__wait_callbacks_in_bulk(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+    receiver = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender), lifespan_wrapper(receiver):
+        sync_id = await sender.call_foo_bar(bot_id, baz=1, wait_callback=False)
+        await receiver.set_raw_botx_method_result(
+            SUCCESSFUL_CALLBACK,
+            verify_request=False,
+        )
+
+        results = await sender.wait_botx_method_callbacks([sync_id], timeout=1)
+
+    # - Assert -
+    assert results == {
+        SYNC_ID: BotAPIMethodSuccessfulCallback(
+            sync_id=SYNC_ID,
+            status="ok",
+            result={},
+        ),
+    }
+    assert await broker.get_callback(SYNC_ID) is None
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__callback_not_received(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender):
+        with pytest.raises(CallbackNotReceivedError) as exc:
+            await sender.call_foo_bar(bot_id, baz=1, callback_timeout=0)
+
+    # - Assert -
+    assert str(SYNC_ID) in str(exc.value)
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__not_waited_callback_dropped(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender):
+        await sender.call_foo_bar(
+            bot_id,
+            baz=1,
+            wait_callback=False,
+            callback_timeout=0,
+        )
+        await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert "wasn't waited" in loguru_caplog.text
+
+
+@pytest.mark.usefixtures("foo_bar_endpoint")
+async def test__callback_shared_repo__pending_callback_during_shutdown(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sender = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(sender):
+        task = asyncio.create_task(sender.call_foo_bar(bot_id, baz=1))
+        await asyncio.sleep(0.05)  # Wait for callback registration
+
+    # - Assert -
+    with pytest.raises(BotShuttingDownError):
+        await task
+
+
+async def test__callback_shared_repo__several_waiting_workers(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    sync_ids = [uuid4() for _ in range(3)]
+    respx_mock.post(f"https://{host}/foo/bar").mock(
+        side_effect=[
+            httpx.Response(
+                HTTPStatus.ACCEPTED,
+                json={"status": "ok", "result": {"sync_id": str(sync_id)}},
+            )
+            for sync_id in sync_ids
+        ],
+    )
+
+    first_worker = build_worker(bot_account, broker)
+    second_worker = build_worker(bot_account, broker)
+
+    # - Act -
+    async with lifespan_wrapper(first_worker), lifespan_wrapper(second_worker):
+        await first_worker.call_foo_bar(bot_id, baz=1, wait_callback=False)
+        await second_worker.call_foo_bar(bot_id, baz=1, wait_callback=False)
+        await first_worker.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        await second_worker.set_raw_botx_method_result(
+            {"status": "ok", "sync_id": str(sync_ids[0]), "result": {}},
+            verify_request=False,
+        )
+        await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert await broker.get_callback(sync_ids[0]) is None
+
+
+async def test__callback_memory_broker__callback_expired() -> None:
+    # - Arrange -
+    broker = CallbackMemoryBroker(ttl=0.01)
+    await broker.publish_callback(SYNC_ID, "{}")
+
+    # - Act -
+    await asyncio.sleep(0.02)
+
+    # - Assert -
+    assert await broker.get_callback(SYNC_ID) is None
+
+
+async def test__callback_sqlite_broker__callback_expired(tmp_path: Path) -> None:
+    # - Arrange -
+    broker = CallbackSQLiteBroker(str(tmp_path / "callbacks.sqlite3"), ttl=0.01)
+    await broker.subscribe(AsyncMock())
+    await broker.publish_callback(SYNC_ID, "{}")
+
+    # - Act -
+    await asyncio.sleep(0.02)
+
+    # - Assert -
+    assert await broker.get_callback(SYNC_ID) is None
+    await broker.close()
+
+
+def get_poller_tasks() -> list[asyncio.Task[None]]:
+    return [
+        task
+        for task in asyncio.all_tasks()
+        if getattr(task.get_coro(), "__name__", None) == "_poll_events"
+    ]
+
+
+async def test__callback_shared_repo__concurrent_first_callbacks_subscribe_once(
+    broker: CallbackBrokerProto,
+) -> None:
+    # - Arrange -
+    repo = CallbackSharedRepo(broker)
+
+    # - Act -
+    await asyncio.gather(
+        *(repo.create_botx_method_callback(uuid4()) for _ in range(5)),
+    )
+    listeners_count = len(broker._listeners)
+
+    await repo.stop_callbacks_waiting()
+
+    # - Assert -
+    assert listeners_count == 1
+    assert not broker._listeners
+    assert not get_poller_tasks()
+
+
+async def test__callback_sqlite_broker__concurrent_subscribes_start_one_poller(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    broker = CallbackSQLiteBroker(str(tmp_path / "callbacks.sqlite3"))
+    listeners = [AsyncMock() for _ in range(5)]
+
+    # - Act -
+    await asyncio.gather(*(broker.subscribe(listener) for listener in listeners))
+    pollers_count = len(get_poller_tasks())
+
+    await asyncio.gather(*(broker.unsubscribe(listener) for listener in listeners))
+    await broker.close()
+
+    # - Assert -
+    assert pollers_count == 1
+    assert not get_poller_tasks()
+
+
+async def test__callback_sqlite_broker__poller_survives_errors(
+    tmp_path: Path,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    broker = CallbackSQLiteBroker(
+        str(tmp_path / "callbacks.sqlite3"),
+        poll_interval=0.01,
+    )
+    failing_listener = AsyncMock(side_effect=ValueError("Invalid callback"))
+    listener = AsyncMock()
+    await broker.subscribe(failing_listener)
+    await broker.subscribe(listener)
+
+    fetchall = broker._connection.fetchall
+    broker._connection.fetchall = AsyncMock(  # type: ignore[method-assign]
+        side_effect=sqlite3.OperationalError("database is locked"),
+    )
+
+    # - Act -
+    await asyncio.sleep(0.03)
+    broker._connection.fetchall = fetchall  # type: ignore[method-assign]
+
+    await broker.publish_callback(SYNC_ID, "{}")
+    await asyncio.sleep(0.05)
+    await broker.close()
+
+    # - Assert -
+    assert "Can't fetch callback events" in loguru_caplog.text
+    assert f"Callback listener for `{SYNC_ID}` failed" in loguru_caplog.text
+    listener.assert_awaited_once_with(SYNC_ID)
@@ -0,0 +1,284 @@
+# mypy: disable-error-code=attr-defined
+
+import asyncio
+import types
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BotAccountWithSecret,
+    BotShuttingDownError,
+    BotXMethodCallbackNotFoundError,
+    CallbackNotReceivedError,
+    CallbackRepoProto,
+    HandlerCollector,
+    lifespan_wrapper,
+)
+from pybotx.bot.callbacks.callback_memory_repo import CallbackMemoryRepo
+from pybotx.models.method_callbacks import (
+    BotAPIMethodFailedCallback,
+    BotAPIMethodSuccessfulCallback,
+    BotXMethodCallback,
+)
+from tests.client.test_botx_method_callback import call_foo_bar
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+
+@pytest.fixture
+def sync_ids(respx_mock: MockRouter, host: str) -> list[UUID]:
+    sync_ids = [uuid4() for _ in range(3)]
+    respx_mock.post(f"https://{host}/foo/bar").mock(
+        side_effect=[
+            httpx.Response(
+                HTTPStatus.ACCEPTED,
+                json={"status": "ok", "result": {"sync_id": str(sync_id)}},
+            )
+            for sync_id in sync_ids
+        ],
+    )
+    return sync_ids
+
+
+@pytest.fixture
+def bot(bot_account: BotAccountWithSecret) -> Bot:
+    built_bot = Bot(collectors=[HandlerCollector()], bot_accounts=[bot_account])
+    built_bot.call_foo_bar = types.MethodType(call_foo_bar, built_bot)
+    return built_bot
+
+
+class LegacyCallbackRepo(CallbackRepoProto):
+    """Repo without `get_botx_method_callback`, which waits up to 0.05s."""
+
+    def __init__(self) -> None:
+        self._repo = CallbackMemoryRepo()
+
+    async def create_botx_method_callback(self, sync_id: UUID) -> None:
+        await self._repo.create_botx_method_callback(sync_id)
+
+    async def set_botx_method_callback_result(
+        self,
+        callback: BotXMethodCallback,
+    ) -> None:
+        await self._repo.set_botx_method_callback_result(callback)
+
+    async def wait_botx_method_callback(
+        self,
+        sync_id: UUID,
+        timeout: float,
+    ) -> BotXMethodCallback:
+        return await self._repo.wait_botx_method_callback(sync_id, min(timeout, 0.05))
+
+    async def pop_botx_method_callback(
+        self,
+        sync_id: UUID,
+    ) -> "asyncio.Future[BotXMethodCallback]":
+        return await self._repo.pop_botx_method_callback(sync_id)
+
+    async def stop_callbacks_waiting(self) -> None:
+        await self._repo.stop_callbacks_waiting()
+
+
+async def send_callback(bot: Bot, sync_id: UUID, status: str = "ok") -> None:
+    raw_callback: dict[str, Any] = {"sync_id": str(sync_id), "status": status}
+    if status == "ok":
+        raw_callback["result"] = {}
+    else:
+        raw_callback.update(reason="chat_not_found", errors=[], error_data={})
+
+    await bot.set_raw_botx_method_result(raw_callback, verify_request=False)
+
+
+async def test__wait_botx_method_callbacks__received_and_failed_results(
+    bot_id: UUID,
+    bot: Bot,
+    sync_ids: list[UUID],
+) -> None:
+    # - Arrange -
+    unknown_sync_id = uuid4()
+
+    # - Act -
+    async with lifespan_wrapper(bot):
+        for _ in sync_ids:
+            await bot.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        await send_callback(bot, sync_ids[0])
+        await send_callback(bot, sync_ids[1], status="error")
+
+        results = await bot.wait_botx_method_callbacks(
+            [*sync_ids, sync_ids[0], unknown_sync_id],
+            timeout=0.05,
+        )
+
+    # - Assert -
+    assert list(results) == [unknown_sync_id, *sync_ids]
+    assert isinstance(results[unknown_sync_id], BotXMethodCallbackNotFoundError)
+    assert results[sync_ids[0]] == BotAPIMethodSuccessfulCallback(
+        sync_id=sync_ids[0],
+        status="ok",
+        result={},
+    )
+    assert isinstance(results[sync_ids[1]], BotAPIMethodFailedCallback)
+    assert isinstance(results[sync_ids[2]], CallbackNotReceivedError)
+
+
+async def test__as_completed_botx_method_callbacks__yields_in_arrival_order(
+    bot_id: UUID,
+    bot: Bot,
+    sync_ids: list[UUID],
+) -> None:
+    # - Arrange -
+    arrival_order = [sync_ids[2], sync_ids[0], sync_ids[1]]
+
+    async def consume_callbacks() -> list[UUID]:
+        return [
+            sync_id
+            async for sync_id, _ in bot.as_completed_botx_method_callbacks(
+                sync_ids,
+                timeout=1,
+            )
+        ]
+
+    # - Act -
+    async with lifespan_wrapper(bot):
+        for _ in sync_ids:
+            await bot.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        task = asyncio.create_task(consume_callbacks())
+        for sync_id in arrival_order:
+            await asyncio.sleep(0.01)
+            await send_callback(bot, sync_id)
+
+        received = await task
+
+    # - Assert -
+    assert received == arrival_order
+
+
+async def test__as_completed_botx_method_callbacks__default_timeout_from_alarms(
+    bot_id: UUID,
+    bot: Bot,
+    sync_ids: list[UUID],
+) -> None:
+    # - Arrange -
+    results = []
+
+    # - Act -
+    async with lifespan_wrapper(bot):
+        for _ in sync_ids:
+            await bot.call_foo_bar(
+                bot_id,
+                baz=1,
+                wait_callback=False,
+                callback_timeout=0.05,
+            )
+
+        async for sync_id, result in bot.as_completed_botx_method_callbacks(
+            sync_ids,
+        ):
+            results.append((sync_id, result))
+
+    # - Assert -
+    assert {sync_id for sync_id, _ in results} == set(sync_ids)
+    assert all(isinstance(result, CallbackNotReceivedError) for _, result in results)
+
+
+async def test__as_completed_botx_method_callbacks__callback_not_created(
+    bot: Bot,
+) -> None:
+    # - Arrange -
+    sync_id = uuid4()
+
+    # - Act -
+    async with lifespan_wrapper(bot):
+        bot._callbacks_manager.setup_callback_timeout_alarm(sync_id, 1)
+        results = await bot.wait_botx_method_callbacks([sync_id])
+
+    # - Assert -
+    assert isinstance(results[sync_id], BotXMethodCallbackNotFoundError)
+
+
+async def test__as_completed_botx_method_callbacks__stopped_early(
+    bot_id: UUID,
+    bot: Bot,
+    sync_ids: list[UUID],
+) -> None:
+    # - Act -
+    async with lifespan_wrapper(bot):
+        for _ in sync_ids:
+            await bot.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        await send_callback(bot, sync_ids[1])
+
+        callbacks = bot.as_completed_botx_method_callbacks(sync_ids, timeout=1)
+        async for sync_id, _ in callbacks:
+            break
+        await callbacks.aclose()
+
+        # - Assert -
+        assert sync_id == sync_ids[1]
+        with pytest.raises(BotXMethodCallbackNotFoundError):
+            await send_callback(bot, sync_ids[0])
+        with pytest.raises(BotXMethodCallbackNotFoundError):
+            await bot.wait_botx_method_callback(sync_ids[2])
+
+
+async def test__as_completed_botx_method_callbacks__bot_shutting_down(
+    bot_id: UUID,
+    bot: Bot,
+    sync_ids: list[UUID],
+) -> None:
+    # - Arrange -
+    async def consume_callbacks() -> None:
+        async for _ in bot.as_completed_botx_method_callbacks(sync_ids):
+            pass  # pragma: no cover
+
+    # - Act -
+    async with lifespan_wrapper(bot):
+        for _ in sync_ids:
+            await bot.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        task = asyncio.create_task(consume_callbacks())
+        await asyncio.sleep(0)
+
+    # - Assert -
+    with pytest.raises(BotShuttingDownError):
+        await task
+
+
+async def test__wait_botx_method_callbacks__repo_without_callback_getter(
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    sync_ids: list[UUID],
+) -> None:
+    # - Arrange -
+    built_bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        callback_repo=LegacyCallbackRepo(),
+    )
+    built_bot.call_foo_bar = types.MethodType(call_foo_bar, built_bot)
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        for _ in sync_ids:
+            await bot.call_foo_bar(bot_id, baz=1, wait_callback=False)
+
+        await send_callback(bot, sync_ids[0])
+
+        results = await bot.wait_botx_method_callbacks(sync_ids, timeout=1)
+
+    # - Assert -
+    assert isinstance(results[sync_ids[0]], BotAPIMethodSuccessfulCallback)
+    assert isinstance(results[sync_ids[1]], CallbackNotReceivedError)
+    assert isinstance(results[sync_ids[2]], CallbackNotReceivedError)
@@ -0,0 +1,58 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from pybotx import MentionBuilder, MessageBody
+from pybotx.models.message.mentions import find_and_replace_embed_mentions
+
+MENTION_ID = UUID("f3e176d5-ff46-4b18-b260-25008338c06e")
+
+
+@pytest.fixture(autouse=True)
+def fixed_mention_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("pybotx.models.message.mentions.uuid4", lambda: MENTION_ID)
+
+
+def test__message_body__same_as_embed_mentions() -> None:
+    # - Arrange -
+    body = MessageBody(
+        "Hi, ",
+        MentionBuilder.user(uuid4(), "Ivan"),
+        ", ",
+        MentionBuilder.contact(uuid4()),
+        ", ",
+        MentionBuilder.chat(uuid4(), "Our chat"),
+        ", ",
+        MentionBuilder.channel(uuid4()),
+        " and ",
+        MentionBuilder.all(),
+        "!",
+    )
+
+    # - Act -
+    api_body, mentions = body.to_botx_api()
+
+    # - Assert -
+    expected_body, expected_mentions = find_and_replace_embed_mentions(str(body))
+    assert api_body == expected_body
+    assert [mention.jsonable_dict() for mention in mentions] == [
+        mention.jsonable_dict() for mention in expected_mentions
+    ]
+    assert len(mentions) == 5
+
+
+def test__message_body__built_by_parts() -> None:
+    # - Arrange -
+    users = [MentionBuilder.user(uuid4()) for _ in range(3)]
+
+    # - Act -
+    body = MessageBody("Roll call:").extend(users).append(" <embed_mention>")
+    api_body, mentions = body.to_botx_api()
+
+    # - Assert -
+    embed_mention = f"@{{mention:{MENTION_ID}}}"
+    assert api_body == f"Roll call:{embed_mention * 3} <embed_mention>"
+    assert [
+        mention.mention_data.user_huid  # type: ignore[union-attr]
+        for mention in mentions
+    ] == [user.entity_id for user in users]
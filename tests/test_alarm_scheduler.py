@@ -0,0 +1,164 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+import pybotx.bot.callbacks.alarm_scheduler as alarm_scheduler_module
+from pybotx.bot.callbacks.alarm_scheduler import AlarmScheduler
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test__alarm_scheduler__alarms_fired_in_deadline_order() -> None:
+    # - Arrange -
+    fired: list[UUID] = []
+
+    async def handler(sync_id: UUID) -> None:
+        fired.append(sync_id)
+
+    scheduler = AlarmScheduler(handler)
+    late, early = uuid4(), uuid4()
+
+    # - Act -
+    scheduler.schedule(late, 0.05)
+    await asyncio.sleep(0)  # Let driver fall asleep until `late` alarm
+    scheduler.schedule(early, 0.01)
+
+    await asyncio.sleep(0.1)
+
+    # - Assert -
+    assert fired == [early, late]
+    assert not scheduler
+    assert scheduler._driver is None
+
+
+async def test__alarm_scheduler__cancel_returns_remaining_time() -> None:
+    # - Arrange -
+    fired: list[UUID] = []
+
+    async def handler(sync_id: UUID) -> None:
+        fired.append(sync_id)
+
+    scheduler = AlarmScheduler(handler)
+    sync_id = uuid4()
+    scheduler.schedule(sync_id, 10)
+
+    # - Act -
+    remaining_time = scheduler.cancel(sync_id)
+
+    # - Assert -
+    assert remaining_time is not None
+    assert 9 < remaining_time <= 10
+    assert scheduler.cancel(sync_id) is None
+    assert sync_id not in scheduler
+
+    await scheduler.stop()
+    assert not fired
+
+
+async def test__alarm_scheduler__cancelled_alarm_not_fired() -> None:
+    # - Arrange -
+    fired: list[UUID] = []
+
+    async def handler(sync_id: UUID) -> None:
+        fired.append(sync_id)
+
+    scheduler = AlarmScheduler(handler)
+    cancelled, kept = uuid4(), uuid4()
+
+    # - Act -
+    scheduler.schedule(cancelled, 0.01)
+    scheduler.schedule(kept, 0.02)
+    scheduler.cancel(cancelled)
+
+    await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert fired == [kept]
+
+
+async def test__alarm_scheduler__rescheduled_alarm_uses_last_deadline() -> None:
+    # - Arrange -
+    fired: list[UUID] = []
+
+    async def handler(sync_id: UUID) -> None:
+        fired.append(sync_id)
+
+    scheduler = AlarmScheduler(handler)
+    sync_id = uuid4()
+
+    # - Act -
+    scheduler.schedule(sync_id, 0.01)
+    scheduler.schedule(sync_id, 0.05)
+
+    await asyncio.sleep(0.03)
+    fired_before_deadline = list(fired)
+    await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert fired_before_deadline == []
+    assert fired == [sync_id]
+
+
+async def test__alarm_scheduler__heap_compacted_after_cancellations(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # - Arrange -
+    monkeypatch.setattr(alarm_scheduler_module, "HEAP_COMPACTION_MIN_SIZE", 4)
+
+    async def handler(sync_id: UUID) -> None:
+        """Do nothing."""
+
+    scheduler = AlarmScheduler(handler)
+    sync_ids = [uuid4() for _ in range(10)]
+    for sync_id in sync_ids:
+        scheduler.schedule(sync_id, 10)
+
+    # - Act -
+    for sync_id in sync_ids[:-1]:
+        scheduler.cancel(sync_id)
+
+    # - Assert -
+    assert len(scheduler) == 1
+    assert len(scheduler._heap) <= 4
+
+    await scheduler.stop()
+
+
+async def test__alarm_scheduler__handler_error_logged(
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    fired: list[UUID] = []
+
+    async def handler(sync_id: UUID) -> None:
+        fired.append(sync_id)
+        if len(fired) == 1:
+            raise RuntimeError("Boom")
+
+    scheduler = AlarmScheduler(handler)
+    first, second = uuid4(), uuid4()
+
+    # - Act -
+    scheduler.schedule(first, 0)
+    scheduler.schedule(second, 0.01)
+
+    await asyncio.sleep(0.05)
+
+    # - Assert -
+    assert fired == [first, second]
+    assert f"Alarm handler for `{first}` failed" in loguru_caplog.text
+
+
+async def test__alarm_scheduler__stop_without_alarms() -> None:
+    # - Arrange -
+    async def handler(sync_id: UUID) -> None:
+        """Do nothing."""
+
+    scheduler = AlarmScheduler(handler)
+
+    # - Act -
+    await scheduler.stop()
+
+    # - Assert -
+    assert not scheduler
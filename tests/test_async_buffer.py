@@ -1,10 +1,13 @@
+import mmap
 import os
 import pytest
 
+from pybotx import AsyncBytesBuffer, AsyncMmapBuffer
 from pybotx.async_buffer import (
     AsyncBufferReadable,
     AsyncBufferWritable,
     get_file_size,
+    iter_buffer_chunks,
 )
 
 
@@ -113,3 +116,80 @@ async def test_get_file_size() -> None:
     # Verify position is reset to 0
     position = await buffer.tell()
     assert position == 0
+
+
+@pytest.mark.asyncio
+async def test_iter_buffer_chunks() -> None:
+    """Test chunks are read with and without `readinto` support."""
+    buffer = ConcreteAsyncBuffer()
+    await buffer.write(b"Hello, World!")
+    await buffer.seek(0)
+
+    chunks = [chunk async for chunk in iter_buffer_chunks(buffer, 5)]
+    assert chunks == [b"Hello", b", Wor", b"ld!"]
+
+    bytes_buffer = AsyncBytesBuffer(b"Hello, World!")
+
+    # Chunks share one buffer, so they should be copied to be kept.
+    chunks = [bytes(chunk) async for chunk in iter_buffer_chunks(bytes_buffer, 5)]
+    assert chunks == [b"Hello", b", Wor", b"ld!"]
+
+
+@pytest.mark.asyncio
+async def test_async_bytes_buffer() -> None:
+    """Test bytearray-backed buffer."""
+    buffer = AsyncBytesBuffer(b"Hello")
+
+    # Test write accepts memoryview and extends content
+    await buffer.seek(0, os.SEEK_END)
+    bytes_written = await buffer.write(memoryview(b", World!"))
+    assert bytes_written == 8
+    assert await get_file_size(buffer) == 13
+
+    # Test readinto
+    target = bytearray(8)
+    assert await buffer.readinto(target) == 8
+    assert target == b"Hello, W"
+    assert await buffer.readinto(target) == 5
+    assert target[:5] == b"orld!"
+    assert await buffer.readinto(target) == 0
+
+    # Test write after end fills gap with zero bytes
+    await buffer.seek(2, os.SEEK_CUR)
+    await buffer.write(b"!")
+    assert buffer.getbuffer().tobytes() == b"Hello, World!\x00\x00!"
+
+    # Test read past end doesn't move cursor
+    await buffer.seek(20)
+    assert await buffer.read() == b""
+    assert await buffer.tell() == 20
+
+
+@pytest.mark.asyncio
+async def test_async_bytes_buffer_negative_seek() -> None:
+    """Test seek before buffer start is rejected."""
+    buffer = AsyncBytesBuffer()
+
+    with pytest.raises(ValueError):
+        await buffer.seek(-1)
+
+
+@pytest.mark.asyncio
+async def test_async_mmap_buffer() -> None:
+    """Test memory-mapped file buffer."""
+    with mmap.mmap(-1, 13) as memory_map:
+        buffer = AsyncMmapBuffer(memory_map)
+
+        # Test write
+        bytes_written = await buffer.write(b"Hello, World!")
+        assert bytes_written == 13
+        assert memory_map[:] == b"Hello, World!"
+
+        # Test read
+        await buffer.seek(-6, os.SEEK_END)
+        assert await buffer.read(5) == b"World"
+        assert await buffer.read(-1) == b"!"
+
+        # Test write past map end
+        with pytest.raises(ValueError):
+            await buffer.write(b"!")
@@ -1,4 +1,5 @@
 import asyncio
+import base64
 from types import SimpleNamespace
 from typing import Any, cast
 from collections.abc import Callable
@@ -15,6 +16,8 @@ from pybotx import (
     Sticker,
     lifespan_wrapper,
 )
+from pybotx.async_buffer import AsyncBytesBuffer
+from pybotx.constants import CHUNK_SIZE
 from pybotx.models.attachments import (
     AttachmentDocument,
     AttachmentImage,
@@ -28,6 +31,10 @@ from pybotx.models.attachments import (
     Location,
     OutgoingAttachment,
     convert_api_attachment_to_domain,
+    decode_rfc2397_to_file,
+    encode_rfc2397,
+    get_attachment_extension_from_encoded_content,
+    iter_base64_encoded_chunks,
 )
 
 pytestmark = [
@@ -83,6 +90,68 @@ async def test__attachment__open(
     assert read_content == b"Hello, world!\n"
 
 
+async def test__attachment__open_spooled_large_attachment(
+    host: str,
+    bot_account: BotAccountWithSecret,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+) -> None:
+    # - Arrange -
+    content = b"Hello, world!\n" * (CHUNK_SIZE // 10)
+    payload = api_incoming_message_factory(
+        bot_id=bot_id,
+        attachment={
+            "data": {
+                "content": encode_rfc2397(content, "text/plain"),
+                "file_name": "test_file.txt",
+            },
+            "type": "document",
+        },
+        group_chat_id="054af49e-5e18-4dca-ad73-4f96b6de63fa",
+        host=host,
+    )
+    collector = HandlerCollector()
+    incoming_message: IncomingMessage | None = None
+    message_handled = asyncio.Event()
+
+    @collector.default_message_handler
+    async def default_handler(message: IncomingMessage, bot: Bot) -> None:
+        nonlocal incoming_message
+        incoming_message = message
+        message_handled.set()
+
+    built_bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        inline_attachment_spool_size=CHUNK_SIZE,
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+        # Large attachment is decoded in thread pool
+        await message_handled.wait()
+
+        assert incoming_message and incoming_message.file
+        async with incoming_message.file.open() as fo:
+            # Each `open()` has its own file cursor.
+            async with incoming_message.file.open() as other_fo:
+                await other_fo.read()
+            read_content = await fo.read()
+
+    # - Assert -
+    assert incoming_message.file.content == b""
+    assert incoming_message.file.read_content() == content
+    assert incoming_message.file.size == len(content)
+    assert read_content == content
+    api_attachment = BotXAPIAttachment.from_file_attachment(incoming_message.file)
+    assert api_attachment.data == encode_rfc2397(content, "text/plain")
+
+    assert incoming_message.file.spooled_file
+    incoming_message.file.spooled_file.close()
+
+
 async def test__botx_api_attachment__uppercase_file_extension_mimetype() -> None:
     # - Arrange -
     attachment = OutgoingAttachment(
@@ -396,3 +465,41 @@ async def test__async_execute_raw_bot_command__empty_attachment(
         is_async_file=False,
         content=b"",
     )
+
+
+async def test__get_attachment_extension__without_parameters() -> None:
+    # - Act -
+    extension = get_attachment_extension_from_encoded_content("data:audio/mp3")
+
+    # - Assert -
+    assert extension == "mp3"
+
+
+async def test__decode_rfc2397_to_file__whitespace_skipped() -> None:
+    # - Arrange -
+    content = b"Hello, world!\n" * CHUNK_SIZE
+    encoded_content = f"data:text/plain;base64,{base64.encodebytes(content).decode()}"
+
+    # - Act -
+    with decode_rfc2397_to_file(encoded_content) as decoded_file:
+        decoded_file.seek(0)
+        decoded_content = decoded_file.read()
+
+    # - Assert -
+    assert decoded_content == content
+
+
+@pytest.mark.parametrize("extra_size", [0, 1, 2, 3])
+async def test__iter_base64_encoded_chunks__groups_split_between_chunks(
+    extra_size: int,
+) -> None:
+    # - Arrange -
+    content = bytes(range(256)) * (CHUNK_SIZE // 256) + b"x" * extra_size
+
+    # - Act -
+    encoded_chunks = [
+        chunk async for chunk in iter_base64_encoded_chunks(AsyncBytesBuffer(content))
+    ]
+
+    # - Assert -
+    assert b"".join(encoded_chunks) == base64.b64encode(content)
@@ -0,0 +1,373 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    ConcurrencyLimiter,
+    ConcurrencyLimitMetrics,
+    RequestPriorities,
+    deadline,
+    request_priority,
+)
+from pybotx.client.exceptions.http import InvalidBotXStatusCodeError
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CTS_URL = "https://cts.example.com/"
+SOURCE_SYNC_ID = UUID("8ba66c5b-40bf-5c77-911d-519cb4e382e9")
+
+
+async def send_request(
+    limiter: ConcurrencyLimiter,
+    status_code: int | None = HTTPStatus.OK,
+    release_event: asyncio.Event | None = None,
+) -> None:
+    async with limiter.request_slot(CTS_URL) as slot:
+        if release_event:
+            await release_event.wait()
+        if status_code is not None:
+            slot.record_response(status_code)
+
+
+async def send_parallel_requests(
+    limiter: ConcurrencyLimiter,
+    status_codes: list[int],
+) -> None:
+    release_event = asyncio.Event()
+    tasks = [
+        asyncio.create_task(send_request(limiter, status_code, release_event))
+        for status_code in status_codes
+    ]
+    await asyncio.sleep(0)
+
+    release_event.set()
+    await asyncio.gather(*tasks)
+
+
+def get_limit(limiter: ConcurrencyLimiter) -> int:
+    return limiter.get_metrics()[CTS_URL].limit
+
+
+async def test__concurrency_limiter__limit_grows_additively() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+    # - Act -
+    limits = []
+    for _ in range(4):
+        await send_request(limiter)
+        limits.append(get_limit(limiter))
+
+    # - Assert -
+    assert limits == [2, 2, 3, 3]
+
+
+async def test__concurrency_limiter__not_used_limit_not_grown() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=4)
+
+    # - Act -
+    for _ in range(10):
+        await send_request(limiter)
+
+    # - Assert -
+    assert get_limit(limiter) == 4
+
+
+async def test__concurrency_limiter__limit_cut_multiplicatively() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=10, min_limit=2)
+
+    # - Act -
+    # Requests were sent before the cut, so limit is cut only once.
+    await send_parallel_requests(
+        limiter,
+        [HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE],
+    )
+    limit_after_first_cut = get_limit(limiter)
+
+    await send_request(limiter, HTTPStatus.INTERNAL_SERVER_ERROR)
+    await send_request(limiter, HTTPStatus.BAD_GATEWAY)
+
+    # - Assert -
+    assert limit_after_first_cut == 5
+    metrics = limiter.get_metrics()[CTS_URL]
+    assert metrics.average_latency == pytest.approx(0, abs=0.1)
+    metrics.average_latency = 0
+    assert metrics == ConcurrencyLimitMetrics(limit=2, completed=4, congested=4)
+
+
+async def test__concurrency_limiter__cut_limit_recovered_under_light_load() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=4)
+    await send_request(limiter, HTTPStatus.SERVICE_UNAVAILABLE)
+    limit_after_cut = get_limit(limiter)
+
+    # - Act -
+    for _ in range(10):
+        await send_request(limiter)
+
+    # - Assert -
+    assert limit_after_cut == 2
+    assert get_limit(limiter) == 4
+
+
+async def test__concurrency_limiter__slow_response_cuts_limit() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=4, latency_threshold=0.01)
+
+    # - Act -
+    async with limiter.request_slot(CTS_URL) as slot:
+        await asyncio.sleep(0.02)
+        slot.record_response(HTTPStatus.OK)
+
+    # - Assert -
+    metrics = limiter.get_metrics()[CTS_URL]
+    assert metrics.limit == 2
+    assert metrics.average_latency >= 0.02
+
+
+async def test__concurrency_limiter__transport_error_cuts_limit() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=4)
+
+    # - Act -
+    with pytest.raises(httpx.ConnectError):
+        async with limiter.request_slot(CTS_URL):
+            raise httpx.ConnectError("Connection refused")
+
+    # - Assert -
+    assert get_limit(limiter) == 2
+
+
+async def test__concurrency_limiter__shrunk_timeout_ignored() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=4)
+
+    # - Act -
+    with pytest.raises(httpx.ReadTimeout):
+        async with limiter.request_slot(CTS_URL) as slot:
+            slot.is_timeout_shrunk = True
+            raise httpx.ReadTimeout("Timed out")
+
+    with pytest.raises(httpx.ConnectError):
+        async with limiter.request_slot(CTS_URL) as slot:
+            slot.is_timeout_shrunk = True
+            raise httpx.ConnectError("Connection refused")
+
+    # - Assert -
+    metrics = limiter.get_metrics()[CTS_URL]
+    assert metrics.completed == 1
+    assert metrics.congested == 1
+    assert metrics.limit == 2
+
+
+async def test__concurrency_limiter__request_without_response_ignored() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=4)
+
+    # - Act -
+    with pytest.raises(ValueError):
+        async with limiter.request_slot(CTS_URL):
+            raise ValueError("Invalid payload")
+
+    # - Assert -
+    assert limiter.get_metrics()[CTS_URL] == ConcurrencyLimitMetrics(limit=4)
+
+
+async def test__concurrency_limiter__waiters_served_by_priority() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=1)
+    sent_requests: list[str] = []
+    release_event = asyncio.Event()
+
+    async def send_labeled_request(label: str, priority: RequestPriorities) -> None:
+        with request_priority(priority):
+            async with limiter.request_slot(CTS_URL):
+                sent_requests.append(label)
+
+    holder = asyncio.create_task(send_request(limiter, None, release_event))
+    await asyncio.sleep(0)
+
+    tasks = []
+    for label, priority in (
+        ("bulk", RequestPriorities.BULK),
+        ("interactive", RequestPriorities.INTERACTIVE),
+    ):
+        tasks.append(asyncio.create_task(send_labeled_request(label, priority)))
+        await asyncio.sleep(0)
+
+    queued = limiter.get_metrics()[CTS_URL].queued
+
+    # - Act -
+    release_event.set()
+    await asyncio.gather(holder, *tasks)
+
+    # - Assert -
+    assert queued == 2
+    assert sent_requests == ["interactive", "bulk"]
+
+
+async def test__concurrency_limiter__cancelled_waiters() -> None:
+    # - Arrange -
+    limiter = ConcurrencyLimiter(initial_limit=1)
+    sent_requests: list[str] = []
+    release_event = asyncio.Event()
+
+    async def send_labeled_request(label: str) -> None:
+        async with limiter.request_slot(CTS_URL):
+            sent_requests.append(label)
+
+    async def holder() -> None:
+        async with limiter.request_slot(CTS_URL):
+            await release_event.wait()
+            # Waiter future is cancelled, but it isn't removed from queue yet.
+            waiters["cancelled_on_release"].cancel()
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+
+    waiters = {
+        label: asyncio.create_task(send_labeled_request(label))
+        for label in (
+            "cancelled",
+            "cancelled_on_release",
+            "woken_up_and_cancelled",
+            "sent",
+        )
+    }
+    await asyncio.sleep(0)
+
+    # - Act -
+    waiters["cancelled"].cancel()
+    await asyncio.sleep(0)
+    queued_after_cancel = limiter.get_metrics()[CTS_URL].queued
+
+    release_event.set()
+    await asyncio.sleep(0)
+    # Slot is already given to waiter, but it isn't resumed yet.
+    waiters["woken_up_and_cancelled"].cancel()
+
+    results = await asyncio.gather(*waiters.values(), return_exceptions=True)
+    await holder_task
+
+    # - Assert -
+    assert queued_after_cancel == 3
+    assert sent_requests == ["sent"]
+    assert [type(result) for result in results] == [
+        asyncio.CancelledError,
+        asyncio.CancelledError,
+        asyncio.CancelledError,
+        type(None),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_message"),
+    [
+        ({"min_limit": 0}, "`min_limit` should be positive"),
+        (
+            {"initial_limit": 200},
+            "`initial_limit` should be between `min_limit` and `max_limit`",
+        ),
+        ({"latency_threshold": 0}, "`latency_threshold` should be positive"),
+        ({"backoff_ratio": 1}, "`backoff_ratio` should be between 0 and 1"),
+    ],
+)
+async def test__concurrency_limiter__invalid_params(
+    kwargs: dict[str, Any],
+    error_message: str,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        ConcurrencyLimiter(**kwargs)
+
+    # - Assert -
+    assert error_message in str(exc.value)
+
+
+async def test__concurrency_limiter__botx_requests_limited(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v3/botx/events/reply_event").mock(
+        side_effect=[
+            httpx.Response(
+                HTTPStatus.ACCEPTED,
+                json={"status": "ok", "result": "bot_reply_pushed"},
+            ),
+            httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE),
+        ],
+    )
+    respx_mock.get(f"https://{host}/api/v3/botx/users/users_as_csv").mock(
+        return_value=httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE),
+    )
+    limiter = ConcurrencyLimiter(initial_limit=8)
+
+    # - Act -
+    async with bot_factory(concurrency_limiter=limiter) as bot:
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+        with pytest.raises(InvalidBotXStatusCodeError):
+            await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+        with pytest.raises(InvalidBotXStatusCodeError):
+            async with bot.users_as_csv(bot_id=bot_id):
+                pass  # pragma: no cover
+
+    # - Assert -
+    metrics = bot.get_concurrency_limit_metrics()
+    assert list(metrics) == [f"https://{host}/"]
+    assert metrics[f"https://{host}/"].completed == 3
+    assert metrics[f"https://{host}/"].congested == 2
+    assert metrics[f"https://{host}/"].limit == 2
+
+
+async def test__concurrency_limiter__timeout_within_deadline_not_congested(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v3/botx/events/reply_event").mock(
+        side_effect=httpx.ReadTimeout("Timed out"),
+    )
+    limiter = ConcurrencyLimiter(initial_limit=8)
+
+    # - Act -
+    async with bot_factory(
+        concurrency_limiter=limiter,
+        httpx_client=httpx.AsyncClient(timeout=60),
+    ) as bot:
+        with deadline(1), pytest.raises(httpx.ReadTimeout):
+            await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+        with deadline(120), pytest.raises(httpx.ReadTimeout):
+            await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+
+    # - Assert -
+    metrics = bot.get_concurrency_limit_metrics()[f"https://{host}/"]
+    assert metrics.completed == 1
+    assert metrics.congested == 1
+    assert metrics.limit == 4
+
+
+async def test__concurrency_limiter__bot_without_limiter(
+    bot_factory: Any,
+) -> None:
+    # - Act -
+    async with bot_factory() as bot:
+        pass
+
+    # - Assert -
+    assert bot.get_concurrency_limit_metrics() == {}
@@ -0,0 +1,329 @@
+import gzip
+import threading
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    AttachmentTypes,
+    Bot,
+    BotAccountWithSecret,
+    CPUOffloader,
+    CPUOffloadMetrics,
+    HandlerCollector,
+    IncomingMessage,
+    OutgoingAttachment,
+    RequestCompressor,
+    UnknownBotAccountError,
+    lifespan_wrapper,
+)
+from pybotx.models.attachments import AttachmentDocument, encode_rfc2397
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+SOURCE_SYNC_ID = UUID("8ba66c5b-40bf-5c77-911d-519cb4e382e9")
+
+
+def build_payload(
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+    bot_id: UUID,
+    host: str,
+    content: bytes,
+) -> dict[str, Any]:
+    return api_incoming_message_factory(
+        bot_id=bot_id,
+        attachment={
+            "data": {
+                "content": encode_rfc2397(content, "text/plain"),
+                "file_name": "test_file.txt",
+            },
+            "type": "document",
+        },
+        group_chat_id="054af49e-5e18-4dca-ad73-4f96b6de63fa",
+        host=host,
+    )
+
+
+async def test__cpu_offloader__big_payload_offloaded() -> None:
+    # - Arrange -
+    cpu_offloader = CPUOffloader(min_size=10)
+
+    # - Act -
+    small_thread = await cpu_offloader.run(9, threading.current_thread)
+    big_thread = await cpu_offloader.run(10, threading.current_thread)
+    cpu_offloader.close()
+    thread_after_close = await cpu_offloader.run(10, threading.current_thread)
+    cpu_offloader.close()
+
+    # - Assert -
+    assert small_thread is threading.current_thread()
+    assert big_thread is not threading.current_thread()
+    assert thread_after_close is not threading.current_thread()
+
+    metrics = cpu_offloader.get_metrics()
+    assert metrics.offloaded == 2
+    assert metrics.offloaded_bytes == 20
+    assert metrics.offloaded_time > 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_message"),
+    [
+        ({"min_size": 0}, "`min_size` should be positive"),
+        ({"max_workers": 0}, "`max_workers` should be positive"),
+    ],
+)
+async def test__cpu_offloader__invalid_params(
+    kwargs: dict[str, Any],
+    error_message: str,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        CPUOffloader(**kwargs)
+
+    # - Assert -
+    assert error_message in str(exc.value)
+
+
+async def test__cpu_offloader__big_incoming_attachment_decoded_in_thread(
+    host: str,
+    bot_account: BotAccountWithSecret,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+) -> None:
+    # - Arrange -
+    content = b"Hello, world!\n" * 100
+    payload = build_payload(api_incoming_message_factory, bot_id, host, content)
+    encoded_size = len(payload["attachments"][0]["data"]["content"])
+
+    collector = HandlerCollector()
+    incoming_message: IncomingMessage | None = None
+
+    @collector.default_message_handler
+    async def default_handler(message: IncomingMessage, bot: Bot) -> None:
+        nonlocal incoming_message
+        incoming_message = message
+
+    built_bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        cpu_offloader=CPUOffloader(min_size=1024),
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+    # - Assert -
+    assert incoming_message and incoming_message.file
+    assert incoming_message.file.content == content
+    metrics = bot.get_cpu_offload_metrics()
+    assert metrics.offloaded == 1
+    assert metrics.offloaded_bytes == encoded_size
+
+
+async def test__cpu_offloader__offloaded_decoding_error_logged(
+    host: str,
+    bot_account: BotAccountWithSecret,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    payload = build_payload(api_incoming_message_factory, bot_id, host, b"")
+    payload["attachments"][0]["data"]["content"] = (
+        "data:text/plain;base64," + "A" * 1025
+    )
+    built_bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        cpu_offloader=CPUOffloader(min_size=1024),
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+    # - Assert -
+    assert "Offloaded bot command processing error" in loguru_caplog.text
+    assert "Invalid base64-encoded string" in loguru_caplog.text
+
+
+async def test__cpu_offloader__small_incoming_attachment_decoded_in_place(
+    host: str,
+    bot_account: BotAccountWithSecret,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+) -> None:
+    # - Arrange -
+    payload = build_payload(api_incoming_message_factory, bot_id, host, b"Hello")
+    built_bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        cpu_offloader=CPUOffloader(min_size=1024),
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+    # - Assert -
+    assert bot.get_cpu_offload_metrics() == CPUOffloadMetrics()
+
+
+async def test__cpu_offloader__not_configured__big_attachment_decoded_in_place(
+    host: str,
+    bot_account: BotAccountWithSecret,
+    bot_id: UUID,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+) -> None:
+    # - Arrange -
+    content = b"Hello, world!\n" * 100_000
+    payload = build_payload(api_incoming_message_factory, bot_id, host, content)
+
+    collector = HandlerCollector()
+    incoming_message: IncomingMessage | None = None
+
+    @collector.default_message_handler
+    async def default_handler(message: IncomingMessage, bot: Bot) -> None:
+        nonlocal incoming_message
+        incoming_message = message
+
+    built_bot = Bot(collectors=[collector], bot_accounts=[bot_account])
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+    # - Assert -
+    assert incoming_message and incoming_message.file
+    assert incoming_message.file.content == content
+    assert bot.get_cpu_offload_metrics() == CPUOffloadMetrics()
+
+
+async def test__cpu_offloader__unknown_bot_raised_for_offloaded_command(
+    host: str,
+    bot_account: BotAccountWithSecret,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+) -> None:
+    # - Arrange -
+    payload = build_payload(
+        api_incoming_message_factory,
+        UUID("123e4567-e89b-12d3-a456-426655440000"),
+        host,
+        b"Hello, world!\n" * 100,
+    )
+    built_bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        cpu_offloader=CPUOffloader(min_size=1024),
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        with pytest.raises(UnknownBotAccountError):
+            bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+    # - Assert -
+    assert bot.get_cpu_offload_metrics() == CPUOffloadMetrics()
+
+
+async def test__cpu_offloader__outgoing_attachment_encoded_in_thread(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v3/botx/events/reply_event").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": "bot_reply_pushed"},
+        ),
+    )
+    respx_mock.post(f"https://{host}/api/v3/botx/events/edit_event").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": "update_pushed"},
+        ),
+    )
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={
+                "status": "ok",
+                "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+            },
+        ),
+    )
+    file = OutgoingAttachment(content=b"Hello, world!", filename="test.txt")
+    incoming_file = AttachmentDocument(
+        type=AttachmentTypes.DOCUMENT,
+        filename="test.txt",
+        size=13,
+        is_async_file=False,
+        content=b"Hello, world!",
+    )
+
+    # - Act -
+    async with bot_factory(cpu_offloader=CPUOffloader(min_size=10)) as bot:
+        await bot.reply_message(
+            bot_id=bot_id,
+            sync_id=SOURCE_SYNC_ID,
+            body="Hi!",
+            file=file,
+        )
+        await bot.edit_message(
+            bot_id=bot_id,
+            sync_id=SOURCE_SYNC_ID,
+            file=incoming_file,
+        )
+        await bot.send_message(
+            bot_id=bot_id,
+            chat_id=UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa"),
+            body="Hi!",
+            file=file,
+            wait_callback=False,
+        )
+
+    # - Assert -
+    metrics = bot.get_cpu_offload_metrics()
+    assert metrics.offloaded == 3
+    assert metrics.offloaded_bytes == 3 * len(file.content)
+
+
+async def test__cpu_offloader__request_body_compressed_in_thread(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    endpoint = respx_mock.post(f"https://{host}/api/v3/botx/events/reply_event").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": "bot_reply_pushed"},
+        ),
+    )
+
+    # - Act -
+    async with bot_factory(
+        request_compressor=RequestCompressor(min_size=1),
+        cpu_offloader=CPUOffloader(min_size=1),
+    ) as bot:
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+
+    # - Assert -
+    body = gzip.decompress(endpoint.calls.last.request.content)
+    metrics = bot.get_cpu_offload_metrics()
+    assert metrics.offloaded == 1
+    assert metrics.offloaded_bytes == len(body)
@@ -0,0 +1,169 @@
+import asyncio
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BotAccountWithSecret,
+    CallbackNotReceivedError,
+    DeadlineExceededError,
+    HandlerCollector,
+    IncomingMessage,
+    deadline,
+    lifespan_wrapper,
+)
+from pybotx.bot.deadline import get_remaining_time
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+SOURCE_SYNC_ID = UUID("8ba66c5b-40bf-5c77-911d-519cb4e382e9")
+
+
+def mock_reply_event(respx_mock: MockRouter, host: str) -> list[dict[str, Any]]:
+    timeouts: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": "bot_reply_pushed"},
+        )
+
+    respx_mock.post(f"https://{host}/api/v3/botx/events/reply_event").mock(
+        side_effect=handler,
+    )
+    return timeouts
+
+
+async def test__deadline__request_timeout_shrunk(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    timeouts = mock_reply_event(respx_mock, host)
+
+    # - Act -
+    async with bot_factory(
+        httpx_client=httpx.AsyncClient(timeout=httpx.Timeout(5, pool=None)),
+    ) as bot:
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+        with deadline(60):
+            await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+        with deadline(1):
+            await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+
+    # - Assert -
+    assert timeouts[0] == {"connect": 5, "read": 5, "write": 5, "pool": None}
+    assert timeouts[1]["connect"] == 5
+    assert 59 < timeouts[1]["pool"] <= 60
+    assert all(0 < timeout <= 1 for timeout in timeouts[2].values())
+
+
+async def test__deadline__expired_deadline_request_not_sent(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    timeouts = mock_reply_event(respx_mock, host)
+
+    # - Act -
+    async with bot_factory() as bot:
+        with deadline(0.01):
+            await asyncio.sleep(0.02)
+            with pytest.raises(DeadlineExceededError) as exc:
+                await bot.reply_message(
+                    bot_id=bot_id,
+                    sync_id=SOURCE_SYNC_ID,
+                    body="Hi!",
+                )
+
+    # - Assert -
+    assert "ReplyEventMethod" in str(exc.value)
+    assert not timeouts
+
+
+async def test__deadline__callback_timeout_shrunk(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={
+                "status": "ok",
+                "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+            },
+        ),
+    )
+
+    # - Act -
+    async with bot_factory(default_callback_timeout=60) as bot:
+        with deadline(0.05), pytest.raises(CallbackNotReceivedError) as exc:
+            await bot.send_message(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!")
+
+    # - Assert -
+    assert exc.value.sync_id == UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+
+
+async def test__deadline__handler_timeout_propagated(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    incoming_message_factory: Callable[..., IncomingMessage],
+    bot_account: BotAccountWithSecret,
+) -> None:
+    # - Arrange -
+    timeouts = mock_reply_event(respx_mock, host)
+    user_command = incoming_message_factory(body="/command")
+    collector = HandlerCollector()
+
+    @collector.command("/command", description="My command", timeout=2)
+    async def handler(message: IncomingMessage, bot: Bot) -> None:
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+
+    built_bot = Bot(collectors=[collector], bot_accounts=[bot_account])
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        await bot.async_execute_bot_command(user_command)
+
+    # - Assert -
+    assert all(0 < timeout <= 2 for timeout in timeouts[0].values())
+
+
+async def test__deadline__nested_deadline_only_shrinks() -> None:
+    # - Act -
+    with deadline(1), deadline(60):
+        remaining_time = get_remaining_time()
+
+    # - Assert -
+    assert remaining_time is not None
+    assert 0 < remaining_time <= 1
+    assert get_remaining_time() is None
+
+
+async def test__deadline__invalid_timeout() -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc, deadline(0):
+        pass  # pragma: no cover
+
+    # - Assert -
+    assert "`timeout` should be positive" in str(exc.value)
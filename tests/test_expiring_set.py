@@ -0,0 +1,76 @@
+from uuid import uuid4
+
+import pytest
+
+from pybotx.bot.callbacks.expiring_set import ExpiringSyncIdSet
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test__expiring_set__item_kept_during_ttl(clock: FakeClock) -> None:
+    # - Arrange -
+    expiring_set = ExpiringSyncIdSet(ttl=10, buckets_count=5, clock=clock)
+    sync_id = uuid4()
+
+    # - Act -
+    expiring_set.add(sync_id)
+    clock.now += 10
+
+    # - Assert -
+    assert sync_id in expiring_set
+    assert len(expiring_set) == 1
+
+
+def test__expiring_set__item_dropped_after_ttl(clock: FakeClock) -> None:
+    # - Arrange -
+    expiring_set = ExpiringSyncIdSet(ttl=10, buckets_count=5, clock=clock)
+    old_sync_id, new_sync_id = uuid4(), uuid4()
+
+    # - Act -
+    expiring_set.add(old_sync_id)
+    clock.now += 6
+    expiring_set.add(new_sync_id)
+    clock.now += 6
+
+    # - Assert -
+    assert old_sync_id not in expiring_set
+    assert new_sync_id in expiring_set
+    assert len(expiring_set._buckets) == 1
+
+
+def test__expiring_set__buckets_count_is_bounded(clock: FakeClock) -> None:
+    # - Arrange -
+    expiring_set = ExpiringSyncIdSet(ttl=10, buckets_count=5, clock=clock)
+
+    # - Act -
+    for _ in range(1000):
+        expiring_set.add(uuid4())
+        clock.now += 0.5
+
+    # - Assert -
+    assert len(expiring_set._buckets) <= 6
+    assert len(expiring_set) <= 24
+
+
+@pytest.mark.parametrize(("ttl", "buckets_count"), [(0, 10), (10, 0)])
+def test__expiring_set__invalid_params_error_raised(
+    ttl: float,
+    buckets_count: int,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        ExpiringSyncIdSet(ttl=ttl, buckets_count=buckets_count)
+
+    # - Assert -
+    assert "should be positive" in str(exc.value)
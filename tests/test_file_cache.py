@@ -0,0 +1,338 @@
+import asyncio
+import os
+from collections.abc import Callable
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BotAccountWithSecret,
+    FileCache,
+    HandlerCollector,
+    SmartAppEvent,
+    lifespan_wrapper,
+)
+from pybotx.async_buffer import AsyncBufferWritable
+from pybotx.bot.file_cache import FileDownloader
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+FILE_ID = UUID("c3b9def2-b2c8-4732-b61f-99b9b110fa80")
+
+
+def downloader(content: bytes, calls: list[bytes]) -> FileDownloader:
+    async def download(async_buffer: AsyncBufferWritable) -> None:
+        calls.append(content)
+        await asyncio.sleep(0)
+        await async_buffer.write(content)
+
+    return download
+
+
+async def get_path(
+    file_cache: FileCache,
+    file_hash: str,
+    download: FileDownloader,
+) -> Path:
+    async with file_cache.pin_path(file_hash, download) as path:
+        return path
+
+
+async def test__file_cache__concurrent_downloads_deduplicated(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    file_cache = FileCache(tmp_path, max_size=1024)
+    calls: list[bytes] = []
+
+    # - Act -
+    paths = await asyncio.gather(
+        *(
+            get_path(file_cache, "hash", downloader(b"Hello, world!", calls))
+            for _ in range(3)
+        ),
+    )
+    cached_path = await get_path(file_cache, "hash", downloader(b"Other", calls))
+
+    # - Assert -
+    assert calls == [b"Hello, world!"]
+    assert len(set(paths)) == 1
+    assert cached_path == paths[0]
+    assert cached_path.read_bytes() == b"Hello, world!"
+    assert file_cache.size == 13
+
+
+async def test__file_cache__least_recently_used_file_evicted(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    file_cache = FileCache(tmp_path, max_size=10)
+    calls: list[bytes] = []
+
+    first_path = await get_path(file_cache, "first", downloader(b"12345", calls))
+    second_path = await get_path(file_cache, "second", downloader(b"12345", calls))
+    await get_path(file_cache, "first", downloader(b"12345", calls))
+
+    # - Act -
+    third_path = await get_path(file_cache, "third", downloader(b"12345", calls))
+
+    # - Assert -
+    assert first_path.exists()
+    assert not second_path.exists()
+    assert third_path.exists()
+    assert file_cache.size == 10
+
+
+async def test__file_cache__file_bigger_than_cache_kept_until_next_file(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    file_cache = FileCache(tmp_path, max_size=1)
+    calls: list[bytes] = []
+
+    # - Act -
+    first_path = await get_path(file_cache, "first", downloader(b"12345", calls))
+    first_path_existed = first_path.exists()
+    second_path = await get_path(file_cache, "second", downloader(b"12345", calls))
+
+    # - Assert -
+    assert first_path_existed
+    assert not first_path.exists()
+    assert second_path.exists()
+
+
+async def test__file_cache__entries_loaded_from_directory(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    calls: list[bytes] = []
+    file_cache = FileCache(tmp_path, max_size=10)
+    old_path = await get_path(file_cache, "old", downloader(b"12345", calls))
+    new_path = await get_path(file_cache, "new", downloader(b"12345", calls))
+    os.utime(old_path, (0, 0))
+
+    tmp_file_path = tmp_path / "unfinished.tmp"
+    tmp_file_path.write_bytes(b"123")
+
+    # - Act -
+    file_cache = FileCache(tmp_path, max_size=10)
+    cached_path = await get_path(file_cache, "new", downloader(b"12345", calls))
+    await get_path(file_cache, "other", downloader(b"12345", calls))
+
+    # - Assert -
+    assert cached_path == new_path
+    assert calls == [b"12345", b"12345", b"12345"]
+    assert not old_path.exists()
+    assert not tmp_file_path.exists()
+
+
+async def test__file_cache__removed_file_downloaded_again(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    file_cache = FileCache(tmp_path, max_size=1024)
+    calls: list[bytes] = []
+
+    path = await get_path(file_cache, "hash", downloader(b"Hello", calls))
+    path.unlink()
+
+    # - Act -
+    path = await get_path(file_cache, "hash", downloader(b"Hello", calls))
+
+    # - Assert -
+    assert calls == [b"Hello", b"Hello"]
+    assert path.read_bytes() == b"Hello"
+    assert file_cache.size == 5
+
+
+async def test__file_cache__failed_download_not_cached(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    file_cache = FileCache(tmp_path, max_size=1024)
+
+    async def failed_download(async_buffer: AsyncBufferWritable) -> None:
+        await async_buffer.write(b"Hel")
+        raise httpx.ReadError("Connection lost")
+
+    # - Act -
+    with pytest.raises(httpx.ReadError):
+        await get_path(file_cache, "hash", failed_download)
+
+    # - Assert -
+    assert list(tmp_path.iterdir()) == []
+    assert file_cache.size == 0
+
+
+async def test__file_cache__pinned_file_not_evicted(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    file_cache = FileCache(tmp_path, max_size=5)
+    calls: list[bytes] = []
+
+    # - Act -
+    async with file_cache.pin_path("first", downloader(b"12345", calls)) as path:
+        async with file_cache.pin_path("first", downloader(b"12345", calls)):
+            await get_path(file_cache, "second", downloader(b"12345", calls))
+
+        first_path_existed = path.exists()
+        cache_size = file_cache.size
+
+    # - Assert -
+    assert first_path_existed
+    assert cache_size == 10
+    assert not path.exists()
+    assert file_cache.size == 5
+
+
+async def test__file_cache__invalid_max_size(tmp_path: Path) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        FileCache(tmp_path, max_size=0)
+
+    # - Assert -
+    assert "`max_size` should be positive" in str(exc.value)
+
+
+async def test__download_file_to_cache__succeed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    endpoint = respx_mock.get(
+        f"https://{host}/api/v3/botx/files/download",
+        params={
+            "group_chat_id": str(CHAT_ID),
+            "file_id": str(FILE_ID),
+            "is_preview": True,
+        },
+        headers={"Authorization": "Bearer token"},
+    ).mock(
+        return_value=httpx.Response(HTTPStatus.OK, content=b"Preview"),
+    )
+
+    # - Act -
+    async with bot_factory(file_cache=FileCache(tmp_path, max_size=1024)) as bot:
+        paths = []
+        for _ in range(2):
+            async with bot.download_file_to_cache(
+                bot_id=bot_id,
+                chat_id=CHAT_ID,
+                file_id=FILE_ID,
+                file_hash="hash",
+                is_preview=True,
+            ) as path:
+                paths.append(path)
+
+    # - Assert -
+    assert paths[0] == paths[1]
+    assert paths[0].read_bytes() == b"Preview"
+    assert endpoint.call_count == 1
+
+
+async def test__download_file_to_cache__cache_not_configured(
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Act -
+    async with bot_factory() as bot:
+        with pytest.raises(ValueError) as exc:
+            async with bot.download_file_to_cache(
+                bot_id=bot_id,
+                chat_id=CHAT_ID,
+                file_id=FILE_ID,
+                file_hash="hash",
+            ):
+                pass  # pragma: no cover
+
+    # - Assert -
+    assert "`file_cache` isn't configured" in str(exc.value)
+
+
+async def test__async_file__open_from_cache(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    api_incoming_message_factory: Callable[..., dict[str, Any]],
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    endpoint = respx_mock.get(
+        f"https://{host}/api/v3/botx/files/download",
+        params={
+            "group_chat_id": str(CHAT_ID),
+            "file_id": str(FILE_ID),
+            "is_preview": False,
+        },
+        headers={"Authorization": "Bearer token"},
+    ).mock(
+        return_value=httpx.Response(HTTPStatus.OK, content=b"Hello, world!\n"),
+    )
+    payload = api_incoming_message_factory(
+        body="system:smartapp_event",
+        command_type="system",
+        data={
+            "ref": "6fafda2c-6505-57a5-a088-25ea5d1d0364",
+            "smartapp_id": "8dada2c8-67a6-4434-9dec-570d244e78ee",
+            "data": {},
+            "opts": {},
+            "smartapp_api_version": 1,
+        },
+        bot_id=bot_id,
+        group_chat_id=CHAT_ID,
+        host=host,
+        async_file={
+            "type": "document",
+            "file": "https://link.to/file",
+            "file_mime_type": "plain/text",
+            "file_name": "file.txt",
+            "file_size": 14,
+            "file_hash": "Jd9r+OKpw5y+FSCg1xNTSUkwEo4nCW1Sn1AkotkOpH0=",
+            "file_id": str(FILE_ID),
+        },
+    )
+
+    collector = HandlerCollector()
+    read_contents: list[bytes] = []
+    cached_paths: list[Path] = []
+
+    @collector.smartapp_event
+    async def smartapp_event_handler(event: SmartAppEvent, bot: Bot) -> None:
+        assert event.files
+        for _ in range(2):
+            async with event.files[0].open() as fo:
+                read_contents.append(await fo.read())
+
+        async with event.files[0].cached_path() as path:
+            cached_paths.append(path)
+
+    built_bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        file_cache=FileCache(tmp_path, max_size=1024),
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_raw_bot_command(payload, verify_request=False)
+
+    # - Assert -
+    assert read_contents == [b"Hello, world!\n"] * 2
+    assert cached_paths[0].read_bytes() == b"Hello, world!\n"
+    assert endpoint.call_count == 1
@@ -358,6 +358,7 @@ async def test__async_file_properties_expose_private_fields() -> None:
         _file_hash="Jd9r+OKpw5y+FSCg1xNTSUkwEo4nCW1Sn1AkotkOpH0=",
     )
 
+    assert image.file_id == UUID("8dada2c8-67a6-4434-9dec-570d244e78ee")
     assert image.file_url == "https://link.to/file"
     assert image.file_mimetype == "image/png"
     assert image.file_hash == "Jd9r+OKpw5y+FSCg1xNTSUkwEo4nCW1Sn1AkotkOpH0="
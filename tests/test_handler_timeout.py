@@ -0,0 +1,238 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pybotx import (
+    Bot,
+    BotAccountWithSecret,
+    HandlerCollector,
+    HandlerTimeoutError,
+    IncomingMessage,
+    SmartAppEvent,
+    lifespan_wrapper,
+)
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+
+async def test__command__timed_out_handler_passed_to_exception_handler(
+    incoming_message_factory: Callable[..., IncomingMessage],
+    bot_account: BotAccountWithSecret,
+) -> None:
+    # - Arrange -
+    user_command = incoming_message_factory(body="/command")
+    collector = HandlerCollector()
+    handler_cancelled = False
+    timeout_errors: list[HandlerTimeoutError] = []
+
+    @collector.command("/command", description="My command", timeout=0.01)
+    async def handler(message: IncomingMessage, bot: Bot) -> None:
+        nonlocal handler_cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            handler_cancelled = True
+            raise
+
+    async def timeout_error_handler(
+        message: IncomingMessage,
+        bot: Bot,
+        exc: Exception,
+    ) -> None:
+        assert isinstance(exc, HandlerTimeoutError)
+        timeout_errors.append(exc)
+
+    built_bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        default_handler_timeout=10,
+        exception_handlers={HandlerTimeoutError: timeout_error_handler},
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        bot.async_execute_bot_command(user_command)
+
+    # - Assert -
+    assert handler_cancelled
+    assert [exc.timeout for exc in timeout_errors] == [0.01]
+
+
+async def test__default_message_handler__bot_default_timeout_used(
+    incoming_message_factory: Callable[..., IncomingMessage],
+    bot_account: BotAccountWithSecret,
+) -> None:
+    # - Arrange -
+    user_command = incoming_message_factory(body="Hello!")
+    collector = HandlerCollector()
+
+    @collector.default_message_handler
+    async def handler(message: IncomingMessage, bot: Bot) -> None:
+        await asyncio.sleep(1)
+
+    built_bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        default_handler_timeout=0.01,
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        with pytest.raises(HandlerTimeoutError) as exc:
+            await bot.async_execute_bot_command(user_command)
+
+    # - Assert -
+    assert exc.value.timeout == 0.01
+
+
+async def test__default_message_handler__own_timeout_used(
+    incoming_message_factory: Callable[..., IncomingMessage],
+    bot_account: BotAccountWithSecret,
+) -> None:
+    # - Arrange -
+    user_command = incoming_message_factory(body="Hello!")
+    collector = HandlerCollector()
+
+    @collector.default_message_handler(timeout=0.01)
+    async def handler(message: IncomingMessage, bot: Bot) -> None:
+        await asyncio.sleep(1)
+
+    built_bot = Bot(collectors=[collector], bot_accounts=[bot_account])
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        with pytest.raises(HandlerTimeoutError) as exc:
+            await bot.async_execute_bot_command(user_command)
+
+    # - Assert -
+    assert exc.value.timeout == 0.01
+
+
+async def test__command__finished_in_time(
+    incoming_message_factory: Callable[..., IncomingMessage],
+    bot_account: BotAccountWithSecret,
+) -> None:
+    # - Arrange -
+    user_command = incoming_message_factory(body="/command")
+    collector = HandlerCollector()
+    handled = False
+
+    @collector.command("/command", description="My command", timeout=1)
+    async def handler(message: IncomingMessage, bot: Bot) -> None:
+        nonlocal handled
+        handled = True
+
+    built_bot = Bot(collectors=[collector], bot_accounts=[bot_account])
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        await bot.async_execute_bot_command(user_command)
+
+    # - Assert -
+    assert handled
+
+
+async def test__system_event__bot_default_timeout_used(
+    smartapp_event: SmartAppEvent,
+    bot_account: BotAccountWithSecret,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    collector = HandlerCollector()
+
+    @collector.smartapp_event
+    async def handler(event: SmartAppEvent, bot: Bot) -> None:
+        await asyncio.sleep(1)
+
+    built_bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        default_handler_timeout=0.01,
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        await bot.async_execute_bot_command(smartapp_event)
+
+    # - Assert -
+    assert "Handler for `SmartAppEvent` timed out" in loguru_caplog.text
+    assert "HandlerTimeoutError" in loguru_caplog.text
+
+
+async def test__shutdown__not_finished_handlers_cancelled(
+    incoming_message_factory: Callable[..., IncomingMessage],
+    loguru_caplog: pytest.LogCaptureFixture,
+    bot_account: BotAccountWithSecret,
+) -> None:
+    # - Arrange -
+    user_command = incoming_message_factory(body="/command")
+    collector = HandlerCollector()
+    handler_cancelled = False
+
+    @collector.command("/command", description="My command")
+    async def handler(message: IncomingMessage, bot: Bot) -> None:
+        nonlocal handler_cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            handler_cancelled = True
+            raise
+
+    bot = Bot(
+        collectors=[collector],
+        bot_accounts=[bot_account],
+        shutdown_timeout=0.01,
+    )
+
+    # - Act -
+    task = bot.async_execute_bot_command(user_command)
+    await bot.shutdown()
+
+    # - Assert -
+    assert handler_cancelled
+    assert task.cancelled()
+    assert "Cancelling 1 not finished handlers" in loguru_caplog.text
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_message"),
+    [
+        (
+            {"default_handler_timeout": 0},
+            "`default_handler_timeout` should be positive",
+        ),
+        ({"shutdown_timeout": -1}, "`shutdown_timeout` should be positive"),
+    ],
+)
+async def test__bot__invalid_timeouts(
+    bot_account: BotAccountWithSecret,
+    kwargs: dict[str, Any],
+    error_message: str,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        Bot(collectors=[HandlerCollector()], bot_accounts=[bot_account], **kwargs)
+
+    # - Assert -
+    assert error_message in str(exc.value)
+
+
+async def test__collector__invalid_handler_timeouts() -> None:
+    # - Arrange -
+    collector = HandlerCollector()
+
+    # - Act -
+    with pytest.raises(ValueError) as command_exc:
+        collector.command("/command", description="My command", timeout=0)
+    with pytest.raises(ValueError) as default_handler_exc:
+        collector.default_message_handler(timeout=0)
+
+    # - Assert -
+    assert "`timeout` should be positive" in str(command_exc.value)
+    assert "`timeout` should be positive" in str(default_handler_exc.value)
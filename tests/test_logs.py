@@ -13,8 +13,10 @@ from pybotx import (
     BotAccountWithSecret,
     HandlerCollector,
     IncomingMessage,
+    OutgoingMessage,
     lifespan_wrapper,
 )
+from pybotx.logger import pformat_outgoing_content
 from pybotx.models.attachments import AttachmentDocument, OutgoingAttachment
 
 pytestmark = [
@@ -127,3 +129,66 @@ async def test__attachment__trimmed_in_outgoing_message(
     # - Assert -
     assert "...<trimmed>" in loguru_caplog.text
     assert endpoint.called
+
+
+async def test__attachment__trimmed_in_outgoing_content(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    loguru_caplog: pytest.LogCaptureFixture,
+) -> None:
+    # - Arrange -
+    chat_id = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={
+                "status": "ok",
+                "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+            },
+        ),
+    )
+
+    built_bot = Bot(collectors=[HandlerCollector()], bot_accounts=[bot_account])
+    file = OutgoingAttachment(
+        content=b"Very very very very very very very very very long text" * 10,
+        filename="test.txt",
+    )
+
+    # - Act -
+    async with lifespan_wrapper(built_bot) as bot:
+        async for result in bot.broadcast(
+            message_template=OutgoingMessage(
+                bot_id=bot_id,
+                chat_id=chat_id,
+                body="Hi!",
+                file=file,
+            ),
+            chat_ids=[chat_id],
+            wait_callback=False,
+        ):
+            assert result.error is None
+
+    # - Assert -
+    assert "content: {" in loguru_caplog.text
+    assert str(chat_id) in loguru_caplog.text
+    assert "...<trimmed>" in loguru_caplog.text
+
+
+@pytest.mark.parametrize(
+    ("content", "expected_log"),
+    [
+        (b"\x1f\x8b\x08", "<3 bytes>"),
+        (iter([b"{}"]), "<streamed>"),
+    ],
+)
+async def test__outgoing_content__not_json_content_not_printed(
+    content: Any,
+    expected_log: str,
+) -> None:
+    # - Act -
+    log = pformat_outgoing_content(content)
+
+    # - Assert -
+    assert log == expected_log
@@ -0,0 +1,748 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    Bot,
+    BotAccountWithSecret,
+    BubbleMarkup,
+    DeliveryModes,
+    EditMessage,
+    HandlerCollector,
+    Outbox,
+    OutboxEntry,
+    OutboxEntryStatuses,
+    OutboxMemoryStore,
+    OutboxRequestKinds,
+    OutboxSQLiteStore,
+    OutboxStoreProto,
+    OutgoingMessage,
+    PreparedMessage,
+    RateLimitReachedError,
+    ReplyMessage,
+)
+from pybotx.bot.outbox.outbox import is_retryable_error
+from pybotx.client.exceptions.http import InvalidBotXStatusCodeError
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+SYNC_ID = UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def store(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+) -> AsyncGenerator[OutboxStoreProto, None]:
+    if request.param == "memory":
+        yield OutboxMemoryStore()
+        return
+
+    sqlite_store = OutboxSQLiteStore(str(tmp_path / "outbox.db"))
+    yield sqlite_store
+    await sqlite_store.close()
+
+
+def build_outbox(store: OutboxStoreProto, **kwargs: Any) -> Outbox:
+    return Outbox(store, retry_delay=0.01, poll_interval=0.01, **kwargs)
+
+
+def mock_direct_notification(
+    respx_mock: MockRouter,
+    host: str,
+    statuses: list[HTTPStatus] | None = None,
+) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = []
+    statuses = statuses or []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        if len(requests) <= len(statuses):
+            return httpx.Response(statuses[len(requests) - 1])
+
+        return httpx.Response(
+            HTTPStatus.OK,
+            json={"status": "ok", "result": {"sync_id": str(SYNC_ID)}},
+        )
+
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct/sync").mock(
+        side_effect=handler,
+    )
+    return requests
+
+
+async def wait_entry_finished(bot: Bot, entry_id: UUID) -> OutboxEntry:
+    while True:
+        entry = await bot.get_outbox_entry(entry_id)
+        assert entry
+        if entry.status not in {
+            OutboxEntryStatuses.PENDING,
+            OutboxEntryStatuses.SENDING,
+        }:
+            return entry
+
+        await asyncio.sleep(0.01)
+
+
+async def test__outbox__all_request_kinds_sent(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    direct_notification_requests = mock_direct_notification(respx_mock, host)
+    endpoints = {
+        path: respx_mock.post(f"https://{host}/api/v3/botx/{path}").mock(
+            return_value=httpx.Response(
+                HTTPStatus.ACCEPTED,
+                json={"status": "ok", "result": "pushed"},
+            ),
+        )
+        for path in (
+            "events/edit_event",
+            "events/reply_event",
+            "events/delete_event",
+            "smartapps/notification",
+        )
+    }
+
+    bubbles = BubbleMarkup()
+    bubbles.add_button(command="/bye", label="Bye")
+
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=build_outbox(store, rate_limit=1000)
+    ) as bot:
+        entry_ids = [
+            await bot.enqueue(
+                message=OutgoingMessage(
+                    bot_id=bot_id,
+                    chat_id=CHAT_ID,
+                    body="Привет!",
+                    bubbles=bubbles,
+                ),
+            ),
+            await bot.enqueue(
+                message=EditMessage(bot_id=bot_id, sync_id=SYNC_ID, body="Hi!"),
+            ),
+            await bot.enqueue(
+                message=ReplyMessage(bot_id=bot_id, sync_id=SYNC_ID, body="Hi!"),
+            ),
+            await bot.enqueue_delete_message(bot_id=bot_id, sync_id=SYNC_ID),
+            await bot.enqueue_smartapp_notification(
+                bot_id=bot_id,
+                chat_id=CHAT_ID,
+                smartapp_counter=42,
+            ),
+        ]
+        entries = [await wait_entry_finished(bot, entry_id) for entry_id in entry_ids]
+
+    # - Assert -
+    assert [entry.kind for entry in entries] == list(OutboxRequestKinds)
+    assert {entry.status for entry in entries} == {OutboxEntryStatuses.SENT}
+    assert [entry.sync_id for entry in entries] == [SYNC_ID, None, None, None, None]
+    assert all(endpoint.called for endpoint in endpoints.values())
+
+    assert direct_notification_requests == [
+        {
+            "group_chat_id": str(CHAT_ID),
+            "notification": {
+                "status": "ok",
+                "body": "Привет!",
+                "bubble": [
+                    [
+                        {
+                            "command": "/bye",
+                            "data": {},
+                            "label": "Bye",
+                            "opts": {"silent": True, "align": "center"},
+                        },
+                    ],
+                ],
+            },
+        },
+    ]
+
+
+async def test__outbox__failed_request_retried(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(
+        respx_mock,
+        host,
+        [HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.TOO_MANY_REQUESTS],
+    )
+
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=build_outbox(store)
+    ) as bot:
+        entry_id = await bot.enqueue(
+            message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+        )
+        entry = await wait_entry_finished(bot, entry_id)
+
+    # - Assert -
+    assert entry.status == OutboxEntryStatuses.SENT
+    assert entry.attempts == 3
+    assert entry.sync_id == SYNC_ID
+    assert entry.error is None
+    assert len(requests) == 3
+
+
+@pytest.mark.parametrize(
+    ("statuses", "attempts"),
+    [
+        ([HTTPStatus.BAD_REQUEST], 1),
+        ([HTTPStatus.INTERNAL_SERVER_ERROR] * 2, 2),
+    ],
+)
+async def test__outbox__entry_failed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    loguru_caplog: pytest.LogCaptureFixture,
+    statuses: list[HTTPStatus],
+    attempts: int,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host, statuses)
+    outbox = build_outbox(OutboxMemoryStore(), max_attempts=2)
+
+    # - Act -
+    async with bot_factory(delivery_mode=DeliveryModes.SYNC, outbox=outbox) as bot:
+        entry_id = await bot.enqueue(
+            message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+        )
+        entry = await wait_entry_finished(bot, entry_id)
+
+    # - Assert -
+    assert entry.status == OutboxEntryStatuses.FAILED
+    assert entry.attempts == attempts
+    assert "InvalidBotXStatusCodeError" in str(entry.error)
+    assert len(requests) == attempts
+    assert f"Outbox entry `{entry_id}` failed" in loguru_caplog.text
+
+
+async def test__outbox__pending_entries_sent_after_restart(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    bot_factory: Any,
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+    db_path = str(tmp_path / "outbox.db")
+
+    store = OutboxSQLiteStore(db_path)
+    stopped_bot = Bot(
+        collectors=[HandlerCollector()],
+        bot_accounts=[bot_account],
+        outbox=Outbox(store),
+    )
+    entry_ids = [
+        await stopped_bot.enqueue(
+            message=PreparedMessage.from_outgoing_message(
+                OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body=body),
+            ),
+        )
+        for body in ("first", "second", "third")
+    ]
+    await stopped_bot.shutdown()
+    await store.close()
+
+    store = OutboxSQLiteStore(db_path)
+
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=build_outbox(store, workers=1)
+    ) as bot:
+        entries = [await wait_entry_finished(bot, entry_id) for entry_id in entry_ids]
+
+    await store.close()
+
+    # - Assert -
+    assert {entry.status for entry in entries} == {OutboxEntryStatuses.SENT}
+    assert [request["notification"]["body"] for request in requests] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+async def test__outbox__scheduled_entry_sent_in_time(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+    send_at = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=build_outbox(store)
+    ) as bot:
+        entry_id = await bot.enqueue(
+            message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+            send_at=send_at,
+        )
+        await asyncio.sleep(0.05)
+        requests_before_time = len(requests)
+
+        entry = await wait_entry_finished(bot, entry_id)
+        finished_at = datetime.now(timezone.utc)
+
+    # - Assert -
+    assert requests_before_time == 0
+    assert entry.status == OutboxEntryStatuses.SENT
+    assert finished_at >= send_at
+    assert len(requests) == 1
+
+
+async def test__outbox__scheduled_entries_cancelled(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    requests = mock_direct_notification(respx_mock, host)
+    send_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=build_outbox(store)
+    ) as bot:
+        cancelled_entry_ids = [
+            await bot.enqueue(
+                message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+                send_at=send_at,
+                key="reminder:1",
+            ),
+            await bot.enqueue_delete_message(
+                bot_id=bot_id,
+                sync_id=SYNC_ID,
+                send_at=send_at,
+                key="reminder:1",
+            ),
+        ]
+        kept_entry_id = await bot.enqueue_smartapp_notification(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            smartapp_counter=1,
+            send_at=send_at,
+            key="reminder:2",
+        )
+
+        cancelled_count = await bot.cancel_outbox_entries(key="reminder:1")
+        unknown_key_cancelled_count = await bot.cancel_outbox_entries(key="unknown")
+
+        cancelled_entries = [
+            await bot.get_outbox_entry(entry_id) for entry_id in cancelled_entry_ids
+        ]
+        kept_entry = await bot.get_outbox_entry(kept_entry_id)
+
+    # - Assert -
+    assert cancelled_count == 2
+    assert unknown_key_cancelled_count == 0
+    assert [entry.status for entry in cancelled_entries if entry] == [
+        OutboxEntryStatuses.CANCELLED,
+    ] * 2
+    assert kept_entry
+    assert kept_entry.status == OutboxEntryStatuses.PENDING
+    assert kept_entry.key == "reminder:2"
+    assert not requests
+
+
+async def test__outbox__sending_entry_not_cancelled(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    request_received = asyncio.Event()
+    release_response = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        request_received.set()
+        await release_response.wait()
+        return httpx.Response(
+            HTTPStatus.OK,
+            json={"status": "ok", "result": {"sync_id": str(SYNC_ID)}},
+        )
+
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct/sync").mock(
+        side_effect=handler,
+    )
+
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=build_outbox(store)
+    ) as bot:
+        entry_id = await bot.enqueue(
+            message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+            key="reminder:1",
+        )
+        await request_received.wait()
+
+        cancelled_count = await bot.cancel_outbox_entries(key="reminder:1")
+        release_response.set()
+        entry = await wait_entry_finished(bot, entry_id)
+
+    # - Assert -
+    assert cancelled_count == 0
+    assert entry.status == OutboxEntryStatuses.SENT
+
+
+async def test__outbox_store__cancelled_entry_not_updated(
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    entry = OutboxEntry(
+        id=uuid4(),
+        bot_id=uuid4(),
+        kind=OutboxRequestKinds.DELETE_MESSAGE,
+        payload={},
+        key="key",
+    )
+    await store.add_entry(entry)
+    await store.cancel_entries("key")
+
+    # - Act -
+    entry.attempts = 1
+    await store.update_entry(entry)
+
+    # - Assert -
+    stored_entry = await store.get_entry(entry.id)
+    assert stored_entry
+    assert stored_entry.status == OutboxEntryStatuses.CANCELLED
+    assert stored_entry.attempts == 0
+
+
+async def test__outbox_store__ready_entries_claimed_by_time(
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    now = time.time()
+    entries = [
+        OutboxEntry(
+            id=uuid4(),
+            bot_id=uuid4(),
+            kind=OutboxRequestKinds.DELETE_MESSAGE,
+            payload={},
+            next_attempt_at=next_attempt_at,
+        )
+        for next_attempt_at in (now - 1, now - 2, now + 60)
+    ]
+    for entry in entries:
+        await store.add_entry(entry)
+
+    # Entry with old time in schedule shouldn't be returned twice.
+    entries[0].next_attempt_at = now - 3
+    await store.update_entry(entries[0])
+
+    # - Act -
+    first_claimed_entries = await store.claim_ready_entries(now, 1, now + 60)
+    second_claimed_entries = await store.claim_ready_entries(now, 10, now + 60)
+    claimed_again_entries = await store.claim_ready_entries(now, 10, now + 60)
+
+    # - Assert -
+    assert [entry.id for entry in first_claimed_entries] == [entries[0].id]
+    assert [entry.id for entry in second_claimed_entries] == [entries[1].id]
+    assert not claimed_again_entries
+
+    stored_entry = await store.get_entry(entries[0].id)
+    assert stored_entry == first_claimed_entries[0]
+    assert stored_entry.status == OutboxEntryStatuses.SENDING
+    assert stored_entry.attempts == 1
+    assert stored_entry.next_attempt_at == now + 60
+
+
+async def test__outbox_store__expired_claim_claimed_again(
+    store: OutboxStoreProto,
+) -> None:
+    # - Arrange -
+    now = time.time()
+    entry = OutboxEntry(
+        id=uuid4(),
+        bot_id=uuid4(),
+        kind=OutboxRequestKinds.DELETE_MESSAGE,
+        payload={},
+        key="key",
+    )
+    await store.add_entry(entry)
+    await store.claim_ready_entries(now, 1, now + 1)
+
+    # - Act -
+    cancelled_count = await store.cancel_entries("key")
+    claimed_entries = await store.claim_ready_entries(now + 2, 1, now + 3)
+
+    # - Assert -
+    assert cancelled_count == 0
+    assert [claimed_entry.id for claimed_entry in claimed_entries] == [entry.id]
+    assert claimed_entries[0].attempts == 2
+
+
+async def test__outbox_sqlite_store__entry_claimed_by_one_process(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    now = time.time()
+    db_path = str(tmp_path / "outbox.db")
+    stores = [OutboxSQLiteStore(db_path) for _ in range(2)]
+    entries = [
+        OutboxEntry(
+            id=uuid4(),
+            bot_id=uuid4(),
+            kind=OutboxRequestKinds.DELETE_MESSAGE,
+            payload={},
+        )
+        for _ in range(10)
+    ]
+    for entry in entries:
+        await stores[0].add_entry(entry)
+
+    # - Act -
+    claimed_entries_lists = await asyncio.gather(
+        *(
+            store.claim_ready_entries(now, 1, now + 60)
+            for store in stores
+            for _ in range(5)
+        ),
+    )
+    for store in stores:
+        await store.close()
+
+    # - Assert -
+    claimed_entry_ids = [
+        claimed_entry.id
+        for claimed_entries in claimed_entries_lists
+        for claimed_entry in claimed_entries
+    ]
+    assert sorted(claimed_entry_ids) == sorted(entry.id for entry in entries)
+
+
+async def test__outbox__workers_limit() -> None:
+    # - Arrange -
+    outbox = Outbox(workers=1, poll_interval=0.01)
+    sent_entry_ids = []
+    release_event = asyncio.Event()
+
+    async def handler(entry: OutboxEntry) -> None:
+        sent_entry_ids.append(entry.id)
+        await release_event.wait()
+
+    outbox.start(handler)
+
+    # - Act -
+    entry_ids = [
+        await outbox.add_entry(uuid4(), OutboxRequestKinds.DELETE_MESSAGE, {})
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.05)
+    sent_before_release = list(sent_entry_ids)
+
+    release_event.set()
+    await asyncio.sleep(0.05)
+    await outbox.stop()
+
+    # - Assert -
+    assert sent_before_release == entry_ids[:1]
+    assert sent_entry_ids == entry_ids
+
+
+async def test__outbox__unknown_entry(
+    bot_factory: Any,
+    store: OutboxStoreProto,
+) -> None:
+    # - Act -
+    async with bot_factory(
+        delivery_mode=DeliveryModes.SYNC, outbox=Outbox(store)
+    ) as bot:
+        entry = await bot.get_outbox_entry(uuid4())
+
+    # - Assert -
+    assert entry is None
+
+
+async def test__outbox_memory_store__finished_entries_limited() -> None:
+    # - Arrange -
+    store = OutboxMemoryStore(finished_entries_limit=1)
+    entries = [
+        OutboxEntry(
+            id=uuid4(),
+            bot_id=uuid4(),
+            kind=OutboxRequestKinds.DELETE_MESSAGE,
+            payload={},
+            status=OutboxEntryStatuses.SENT,
+        )
+        for _ in range(2)
+    ]
+
+    # - Act -
+    for entry in entries:
+        await store.add_entry(entry)
+
+    # - Assert -
+    assert await store.get_entry(entries[0].id) is None
+    assert await store.get_entry(entries[1].id) == entries[1]
+
+
+@pytest.mark.parametrize(
+    "param_name",
+    ["workers", "max_attempts", "claim_timeout"],
+)
+async def test__outbox__invalid_params(param_name: str) -> None:
+    # - Arrange -
+    kwargs: dict[str, Any] = {param_name: 0}
+
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        Outbox(**kwargs)
+
+    # - Assert -
+    assert f"`{param_name}` should be positive" in str(exc.value)
+
+
+async def test__outbox__sent_message_callback_waited(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": {"sync_id": str(SYNC_ID)}},
+        ),
+    )
+
+    # - Act -
+    async with bot_factory(outbox=build_outbox(OutboxMemoryStore())) as bot:
+        entry_id = await bot.enqueue(
+            message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+        )
+        await asyncio.sleep(0.05)
+        entry_before_callback = await bot.get_outbox_entry(entry_id)
+
+        await bot.set_raw_botx_method_result(
+            {
+                "status": "error",
+                "sync_id": str(SYNC_ID),
+                "reason": "chat_not_found",
+                "errors": [],
+                "error_data": {},
+            },
+            verify_request=False,
+        )
+        entry = await wait_entry_finished(bot, entry_id)
+
+    # - Assert -
+    assert entry_before_callback
+    assert entry_before_callback.status == OutboxEntryStatuses.SENDING
+    assert entry.status == OutboxEntryStatuses.FAILED
+    assert "ChatNotFoundError" in str(entry.error)
+
+
+async def test__outbox__sending_entry_finished_on_shutdown(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={"status": "ok", "result": {"sync_id": str(SYNC_ID)}},
+        ),
+    )
+    store = OutboxMemoryStore()
+
+    # - Act -
+    async with bot_factory(outbox=build_outbox(store)) as bot:
+        entry_id = await bot.enqueue(
+            message=OutgoingMessage(bot_id=bot_id, chat_id=CHAT_ID, body="Hi!"),
+        )
+        await asyncio.sleep(0.05)
+
+        shutdown_task = asyncio.create_task(bot.shutdown())
+        await asyncio.sleep(0.01)
+        await bot.set_raw_botx_method_result(
+            {"status": "ok", "sync_id": str(SYNC_ID), "result": {}},
+            verify_request=False,
+        )
+        await shutdown_task
+
+    entry = await store.get_entry(entry_id)
+
+    # - Assert -
+    assert entry
+    assert entry.status == OutboxEntryStatuses.SENT
+
+
+async def test__outbox__not_configured(bot_id: UUID, bot_factory: Any) -> None:
+    # - Act -
+    async with bot_factory() as bot:
+        with pytest.raises(ValueError) as exc:
+            await bot.enqueue_delete_message(bot_id=bot_id, sync_id=SYNC_ID)
+
+    # - Assert -
+    assert "`outbox` isn't configured" in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    ("exc", "is_retryable"),
+    [
+        (httpx.ConnectError("Connection refused"), True),
+        (RateLimitReachedError("Too many requests"), True),
+        (
+            InvalidBotXStatusCodeError(
+                httpx.Response(
+                    HTTPStatus.NOT_FOUND,
+                    request=httpx.Request("POST", "https://cts.example.com"),
+                ),
+            ),
+            False,
+        ),
+        (ValueError(), False),
+    ],
+)
+async def test__outbox__retryable_errors(
+    exc: Exception,
+    is_retryable: bool,
+) -> None:
+    # - Assert -
+    assert is_retryable_error(exc) is is_retryable
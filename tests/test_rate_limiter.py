@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from pybotx.bot.rate_limiter import RateLimiter
+
+
+async def test__rate_limiter__acquisitions_spaced_out() -> None:
+    # - Arrange -
+    rate_limiter = RateLimiter(100)
+    loop = asyncio.get_running_loop()
+
+    # - Act -
+    start_time = loop.time()
+    for _ in range(4):
+        await rate_limiter.acquire()
+    elapsed_time = loop.time() - start_time
+
+    # - Assert -
+    assert elapsed_time >= 0.03
+
+
+async def test__rate_limiter__acquire_amount() -> None:
+    # - Arrange -
+    rate_limiter = RateLimiter(1000)
+    loop = asyncio.get_running_loop()
+
+    # - Act -
+    start_time = loop.time()
+    await rate_limiter.acquire(50)
+    await rate_limiter.acquire()
+    elapsed_time = loop.time() - start_time
+
+    # - Assert -
+    assert elapsed_time >= 0.05
+
+
+def test__rate_limiter__invalid_rate() -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        RateLimiter(0)
+
+    # - Assert -
+    assert "rate" in str(exc.value)
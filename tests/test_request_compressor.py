@@ -0,0 +1,324 @@
+import gzip
+import json
+import zlib
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from aiofiles.tempfile import NamedTemporaryFile
+from respx.router import MockRouter
+
+from pybotx import (
+    BotAccountWithSecret,
+    OutgoingAttachmentStream,
+    OutgoingMessage,
+    RequestCompressionEncodings,
+    RequestCompressor,
+)
+from pybotx.bot.bot_accounts_storage import BotAccountsStorage
+from pybotx.client.events_api.reply_event import (
+    BotXAPIReplyEventRequestPayload,
+    ReplyEventMethod,
+)
+from pybotx.missing import Undefined
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+SOURCE_SYNC_ID = UUID("8ba66c5b-40bf-5c77-911d-519cb4e382e9")
+
+DECOMPRESSORS = {
+    None: lambda content: content,
+    "gzip": gzip.decompress,
+    "deflate": zlib.decompress,
+}
+
+
+def mock_endpoint(
+    respx_mock: MockRouter,
+    host: str,
+    path: str,
+    response_json: dict[str, Any],
+    compression_supported: bool = True,
+) -> list[tuple[str | None, dict[str, Any]]]:
+    requests: list[tuple[str | None, dict[str, Any]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        content_encoding = request.headers.get("Content-Encoding")
+        content = DECOMPRESSORS[content_encoding](request.content)
+        requests.append((content_encoding, json.loads(content)))
+
+        if content_encoding and not compression_supported:
+            return httpx.Response(HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
+
+        return httpx.Response(HTTPStatus.ACCEPTED, json=response_json)
+
+    respx_mock.post(f"https://{host}{path}").mock(side_effect=handler)
+    return requests
+
+
+def mock_reply_event(
+    respx_mock: MockRouter,
+    host: str,
+    compression_supported: bool = True,
+) -> list[tuple[str | None, dict[str, Any]]]:
+    return mock_endpoint(
+        respx_mock,
+        host,
+        "/api/v3/botx/events/reply_event",
+        {"status": "ok", "result": "bot_reply_pushed"},
+        compression_supported,
+    )
+
+
+@pytest.mark.parametrize(
+    ("encoding", "content_encoding"),
+    [
+        (RequestCompressionEncodings.GZIP, "gzip"),
+        (RequestCompressionEncodings.DEFLATE, "deflate"),
+    ],
+)
+async def test__request_compressor__big_body_compressed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    encoding: RequestCompressionEncodings,
+    content_encoding: str,
+) -> None:
+    # - Arrange -
+    requests = mock_reply_event(respx_mock, host)
+    request_compressor = RequestCompressor(encoding, min_size=1024)
+
+    # - Act -
+    async with bot_factory(request_compressor=request_compressor) as bot:
+        await bot.reply_message(
+            bot_id=bot_id,
+            sync_id=SOURCE_SYNC_ID,
+            body="Replied",
+            metadata={"data": "1" * 1024},
+        )
+
+    # - Assert -
+    assert requests == [
+        (
+            content_encoding,
+            {
+                "source_sync_id": str(SOURCE_SYNC_ID),
+                "reply": {
+                    "status": "ok",
+                    "body": "Replied",
+                    "metadata": {"data": "1" * 1024},
+                },
+                "opts": {"raw_mentions": True},
+            },
+        ),
+    ]
+
+
+async def test__request_compressor__small_body_not_compressed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_reply_event(respx_mock, host)
+
+    # - Act -
+    async with bot_factory(request_compressor=RequestCompressor()) as bot:
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+
+    # - Assert -
+    assert [content_encoding for content_encoding, _ in requests] == [None]
+
+
+async def test__request_compressor__disabled_cts_not_compressed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_reply_event(respx_mock, host)
+    request_compressor = RequestCompressor(
+        min_size=1,
+        disabled_cts_urls=[f"https://{host}"],
+    )
+
+    # - Act -
+    async with bot_factory(request_compressor=request_compressor) as bot:
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+        request_compressor.enable(f"https://{host}/")
+        await bot.reply_message(bot_id=bot_id, sync_id=SOURCE_SYNC_ID, body="Hi!")
+
+    # - Assert -
+    assert [content_encoding for content_encoding, _ in requests] == [None, "gzip"]
+
+
+async def test__request_compressor__unsupported_by_cts_disabled(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_reply_event(respx_mock, host, compression_supported=False)
+    request_compressor = RequestCompressor(min_size=1)
+
+    # - Act -
+    async with bot_factory(request_compressor=request_compressor) as bot:
+        for _ in range(2):
+            await bot.reply_message(
+                bot_id=bot_id,
+                sync_id=SOURCE_SYNC_ID,
+                body="Hi!",
+            )
+
+    # - Assert -
+    assert [content_encoding for content_encoding, _ in requests] == [
+        "gzip",
+        None,
+        None,
+    ]
+    assert requests[0][1] == requests[1][1]
+    assert not request_compressor.is_enabled(f"https://{host}/")
+
+
+async def test__request_compressor__prepared_payload_compressed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    requests = mock_endpoint(
+        respx_mock,
+        host,
+        "/api/v4/botx/notifications/direct",
+        {
+            "status": "ok",
+            "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+        },
+    )
+
+    # - Act -
+    async with bot_factory(request_compressor=RequestCompressor(min_size=1)) as bot:
+        results = [
+            result
+            async for result in bot.broadcast(
+                message_template=OutgoingMessage(
+                    bot_id=bot_id,
+                    chat_id=CHAT_ID,
+                    body="Hi!",
+                ),
+                chat_ids=[CHAT_ID],
+                wait_callback=False,
+            )
+        ]
+
+    # - Assert -
+    assert results[0].sync_id == UUID("21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3")
+    assert requests == [
+        (
+            "gzip",
+            {
+                "group_chat_id": str(CHAT_ID),
+                "notification": {"status": "ok", "body": "Hi!"},
+            },
+        ),
+    ]
+
+
+async def test__request_compressor__streamed_body_not_compressed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    async_buffer: NamedTemporaryFile,
+) -> None:
+    # - Arrange -
+    await async_buffer.write(b"Hello, world!")
+    requests = mock_endpoint(
+        respx_mock,
+        host,
+        "/api/v4/botx/notifications/direct/sync",
+        {
+            "status": "ok",
+            "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+        },
+    )
+
+    # - Act -
+    async with bot_factory(request_compressor=RequestCompressor(min_size=1)) as bot:
+        await bot.send_message_sync(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            body="Hi!",
+            file=OutgoingAttachmentStream(async_buffer, "test.txt"),
+        )
+
+    # - Assert -
+    assert [content_encoding for content_encoding, _ in requests] == [None]
+
+
+async def test__request_compressor__method_without_cpu_offloader(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_account: BotAccountWithSecret,
+    httpx_client: httpx.AsyncClient,
+) -> None:
+    # - Arrange -
+    requests = mock_reply_event(respx_mock, host)
+    method = ReplyEventMethod(
+        bot_id,
+        httpx_client,
+        BotAccountsStorage([bot_account]),
+        request_compressor=RequestCompressor(min_size=1),
+    )
+
+    # - Act -
+    await method.execute(
+        BotXAPIReplyEventRequestPayload.from_domain(
+            sync_id=SOURCE_SYNC_ID,
+            body="Hi!",
+            metadata=Undefined,
+            bubbles=Undefined,
+            keyboard=Undefined,
+            file=Undefined,
+            silent_response=Undefined,
+            markup_auto_adjust=Undefined,
+            stealth_mode=Undefined,
+            send_push=Undefined,
+            ignore_mute=Undefined,
+        ),
+    )
+
+    # - Assert -
+    assert [content_encoding for content_encoding, _ in requests] == ["gzip"]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_message"),
+    [
+        ({"min_size": 0}, "`min_size` should be positive"),
+        ({"level": 10}, "`level` should be between 0 and 9"),
+    ],
+)
+async def test__request_compressor__invalid_params(
+    kwargs: dict[str, Any],
+    error_message: str,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        RequestCompressor(**kwargs)
+
+    # - Assert -
+    assert error_message in str(exc.value)
@@ -0,0 +1,295 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from pybotx import (
+    AsyncBytesBuffer,
+    RequestPriorities,
+    RequestScheduler,
+    request_priority,
+)
+
+BOT_A = UUID("24348246-6791-4ac0-9d86-b948cd6a0e46")
+BOT_B = UUID("8f3abcc8-ba00-4c89-88e0-b786beb8ec24")
+
+
+async def send_request(
+    scheduler: RequestScheduler,
+    bot_id: UUID,
+    sent_requests: list[str],
+    label: str,
+    priority: RequestPriorities = RequestPriorities.NORMAL,
+    release_event: asyncio.Event | None = None,
+) -> None:
+    with request_priority(priority):
+        async with scheduler.request_slot(bot_id):
+            sent_requests.append(label)
+            if release_event:
+                await release_event.wait()
+
+
+async def run_queued_requests(
+    scheduler: RequestScheduler,
+    requests: list[tuple[UUID, str, RequestPriorities]],
+) -> list[str]:
+    sent_requests: list[str] = []
+    release_event = asyncio.Event()
+
+    holder = asyncio.create_task(
+        send_request(scheduler, BOT_A, [], "holder", release_event=release_event),
+    )
+    await asyncio.sleep(0)
+
+    tasks = []
+    for bot_id, label, priority in requests:
+        tasks.append(
+            asyncio.create_task(
+                send_request(scheduler, bot_id, sent_requests, label, priority),
+            ),
+        )
+        await asyncio.sleep(0)
+
+    release_event.set()
+    await asyncio.gather(holder, *tasks)
+
+    return sent_requests
+
+
+async def test__request_scheduler__priority_classes_order() -> None:
+    # - Arrange -
+    scheduler = RequestScheduler(max_concurrency=1)
+
+    # - Act -
+    sent_requests = await run_queued_requests(
+        scheduler,
+        [
+            (BOT_A, "bulk", RequestPriorities.BULK),
+            (BOT_A, "normal", RequestPriorities.NORMAL),
+            (BOT_A, "interactive", RequestPriorities.INTERACTIVE),
+        ],
+    )
+
+    # - Assert -
+    assert sent_requests == ["interactive", "normal", "bulk"]
+
+
+@pytest.mark.parametrize(
+    ("bot_weights", "expected_order"),
+    [
+        ({}, ["a1", "b1", "a2", "a3"]),
+        ({BOT_A: 3}, ["a1", "a2", "a3", "b1"]),
+    ],
+)
+async def test__request_scheduler__fair_queuing_across_bots(
+    bot_weights: dict[UUID, float],
+    expected_order: list[str],
+) -> None:
+    # - Arrange -
+    scheduler = RequestScheduler(max_concurrency=1, bot_weights=bot_weights)
+    bulk = RequestPriorities.BULK
+
+    # - Act -
+    sent_requests = await run_queued_requests(
+        scheduler,
+        [
+            (BOT_A, "a1", bulk),
+            (BOT_A, "a2", bulk),
+            (BOT_A, "a3", bulk),
+            (BOT_B, "b1", bulk),
+        ],
+    )
+
+    # - Assert -
+    assert sent_requests == expected_order
+
+
+async def test__request_scheduler__cancelled_waiters() -> None:
+    # - Arrange -
+    scheduler = RequestScheduler(max_concurrency=1)
+    sent_requests: list[str] = []
+    release_event = asyncio.Event()
+
+    async def holder() -> None:
+        async with scheduler.request_slot(BOT_A):
+            await release_event.wait()
+            # Waiter future is cancelled, but it isn't removed from queue yet.
+            waiters["cancelled_on_release"].cancel()
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+
+    waiters = {
+        label: asyncio.create_task(
+            send_request(scheduler, BOT_A, sent_requests, label),
+        )
+        for label in (
+            "cancelled",
+            "cancelled_on_release",
+            "woken_up_and_cancelled",
+            "sent",
+        )
+    }
+    await asyncio.sleep(0)
+
+    # - Act -
+    waiters["cancelled"].cancel()
+    await asyncio.sleep(0)
+    queued_after_cancel = scheduler.get_metrics()[RequestPriorities.NORMAL].queued
+
+    release_event.set()
+    await asyncio.sleep(0)
+    # Slot is already given to waiter, but it isn't resumed yet.
+    waiters["woken_up_and_cancelled"].cancel()
+
+    results = await asyncio.gather(*waiters.values(), return_exceptions=True)
+    await holder_task
+
+    # - Assert -
+    assert queued_after_cancel == 3
+    assert sent_requests == ["sent"]
+    assert [type(result) for result in results] == [
+        asyncio.CancelledError,
+        asyncio.CancelledError,
+        asyncio.CancelledError,
+        type(None),
+    ]
+
+
+async def test__request_scheduler__metrics() -> None:
+    # - Arrange -
+    scheduler = RequestScheduler(max_concurrency=1)
+    release_event = asyncio.Event()
+
+    holder = asyncio.create_task(
+        send_request(scheduler, uuid4(), [], "holder", release_event=release_event),
+    )
+    waiter = asyncio.create_task(
+        send_request(scheduler, uuid4(), [], "bulk", RequestPriorities.BULK),
+    )
+    await asyncio.sleep(0.01)
+
+    # - Act -
+    metrics_before_release = scheduler.get_metrics()
+    release_event.set()
+    await asyncio.gather(holder, waiter)
+    metrics_after_release = scheduler.get_metrics()
+
+    # - Assert -
+    assert metrics_before_release[RequestPriorities.NORMAL].in_flight == 1
+    assert metrics_before_release[RequestPriorities.BULK].queued == 1
+
+    normal_metrics = metrics_after_release[RequestPriorities.NORMAL]
+    bulk_metrics = metrics_after_release[RequestPriorities.BULK]
+    assert (normal_metrics.in_flight, normal_metrics.completed) == (0, 1)
+    assert (bulk_metrics.queued, bulk_metrics.completed) == (0, 1)
+    assert bulk_metrics.total_wait_time >= 0.01
+    assert metrics_after_release[RequestPriorities.INTERACTIVE].completed == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_text"),
+    [
+        ({"max_concurrency": 0}, "max_concurrency"),
+        ({"bot_weights": {BOT_A: 0}}, "weights"),
+    ],
+)
+async def test__request_scheduler__invalid_params(
+    kwargs: dict[str, object],
+    error_text: str,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        RequestScheduler(**kwargs)  # type: ignore[arg-type]
+
+    # - Assert -
+    assert error_text in str(exc.value)
+
+
+@pytest.mark.mock_authorization
+async def test__bot__request_queue_metrics(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.post(f"https://{host}/api/v4/botx/notifications/direct").mock(
+        return_value=httpx.Response(
+            HTTPStatus.ACCEPTED,
+            json={
+                "status": "ok",
+                "result": {"sync_id": "21a9ec9e-f21f-4406-ac44-1a78d2ccf9e3"},
+            },
+        ),
+    )
+
+    # - Act -
+    async with bot_factory(request_scheduler=RequestScheduler()) as bot:
+        await bot.send_message(
+            bot_id=bot_id,
+            chat_id=uuid4(),
+            body="Hi!",
+            wait_callback=False,
+        )
+        with request_priority(RequestPriorities.BULK):
+            await bot.send_message(
+                bot_id=bot_id,
+                chat_id=uuid4(),
+                body="Hi!",
+                wait_callback=False,
+            )
+
+        metrics = bot.get_request_queue_metrics()
+
+    # - Assert -
+    assert {priority: metric.completed for priority, metric in metrics.items()} == {
+        RequestPriorities.INTERACTIVE: 0,
+        RequestPriorities.NORMAL: 1,
+        RequestPriorities.BULK: 1,
+    }
+
+
+@pytest.mark.mock_authorization
+async def test__bot__file_transfers_not_scheduled(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.get(f"https://{host}/api/v3/botx/files/download").mock(
+        return_value=httpx.Response(HTTPStatus.OK, content=b"Hello, world!"),
+    )
+    scheduler = RequestScheduler(max_concurrency=1)
+
+    # - Act -
+    async with bot_factory(request_scheduler=scheduler) as bot:
+        # Slot is held, but file transfer doesn't wait for it.
+        async with scheduler.request_slot(bot_id):
+            await bot.download_file(
+                bot_id=bot_id,
+                chat_id=uuid4(),
+                file_id=uuid4(),
+                async_buffer=AsyncBytesBuffer(),
+            )
+
+        metrics = bot.get_request_queue_metrics()
+
+    # - Assert -
+    assert metrics[RequestPriorities.NORMAL].completed == 1
+
+
+async def test__bot__without_request_scheduler(
+    bot_factory: Any,
+) -> None:
+    # - Act -
+    async with bot_factory() as bot:
+        pass
+
+    # - Assert -
+    assert bot.get_request_queue_metrics() == {}
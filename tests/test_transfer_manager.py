@@ -0,0 +1,266 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from aiofiles.tempfile import NamedTemporaryFile
+from respx.router import MockRouter
+
+from pybotx import (
+    AsyncBytesBuffer,
+    AttachmentTypes,
+    Document,
+    TransferManager,
+    TransferMetrics,
+)
+from pybotx.bot.transfer_manager import run_transfers
+from tests.client.files_api.test_upload_file import UPLOAD_FILE_RESPONSE
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+
+
+def build_document(file_id: str) -> Document:
+    return Document(
+        type=AttachmentTypes.DOCUMENT,
+        filename="test.txt",
+        size=13,
+        is_async_file=True,
+        _file_id=UUID(file_id),
+        _file_url="https://link.to/file",
+        _file_mimetype="text/plain",
+        _file_hash="Jd9r+OKpw5y+FSCg1xNTSUkwEo4nCW1Sn1AkotkOpH0=",
+    )
+
+
+async def test__transfer_manager__concurrency_limited_per_cts() -> None:
+    # - Arrange -
+    transfer_manager = TransferManager(max_concurrency=1)
+    events: list[str] = []
+
+    async def run_transfer(cts_url: str, name: str) -> None:
+        async with transfer_manager.transfer(cts_url):
+            events.append(f"{name} started")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} finished")
+
+    # - Act -
+    await asyncio.gather(
+        run_transfer("https://first.cts", "first"),
+        run_transfer("https://first.cts", "second"),
+        run_transfer("https://second.cts", "third"),
+    )
+
+    # - Assert -
+    assert events.index("third started") < events.index("first finished")
+    assert events.index("second started") > events.index("first finished")
+    assert transfer_manager.get_metrics() == {
+        "https://first.cts": TransferMetrics(completed=2),
+        "https://second.cts": TransferMetrics(completed=1),
+    }
+
+
+async def test__transfer_manager__bandwidth_limited() -> None:
+    # - Arrange -
+    transfer_manager = TransferManager(max_bytes_per_second=1000)
+    loop = asyncio.get_running_loop()
+    progress: list[tuple[int, int | None]] = []
+
+    async def chunks() -> Any:
+        for _ in range(3):
+            yield b"1" * 25
+
+    # - Act -
+    start_time = loop.time()
+    async with transfer_manager.transfer(
+        "https://cts",
+        total=75,
+        progress_callback=lambda *args: progress.append(args),
+    ) as transfer:
+        metrics_during_transfer = transfer_manager.get_metrics()
+        received_chunks = [chunk async for chunk in transfer.iter_chunks(chunks())]
+    elapsed_time = loop.time() - start_time
+
+    # - Assert -
+    assert elapsed_time >= 0.05
+    assert received_chunks == [b"1" * 25] * 3
+    assert progress == [(25, 75), (50, 75), (75, 75)]
+    assert metrics_during_transfer["https://cts"].active == 1
+    assert transfer_manager.get_metrics()["https://cts"] == TransferMetrics(
+        completed=1,
+        transferred_bytes=75,
+    )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error_message"),
+    [
+        ({"max_concurrency": 0}, "`max_concurrency` should be positive"),
+        ({"max_bytes_per_second": 0}, "`max_bytes_per_second` should be positive"),
+    ],
+)
+async def test__transfer_manager__invalid_params(
+    kwargs: dict[str, Any],
+    error_message: str,
+) -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        TransferManager(**kwargs)
+
+    # - Assert -
+    assert error_message in str(exc.value)
+
+
+async def test__run_transfers__parallelism_bounded() -> None:
+    # - Arrange -
+    active = 0
+    max_active = 0
+
+    async def transfer() -> None:
+        nonlocal active, max_active
+
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0)
+        active -= 1
+
+    # - Act -
+    await run_transfers([transfer] * 5, max_concurrency=2)
+
+    # - Assert -
+    assert max_active == 2
+
+
+async def test__run_transfers__other_transfers_cancelled_on_error() -> None:
+    # - Arrange -
+    finished: list[int] = []
+
+    async def failed_transfer() -> None:
+        raise httpx.ReadError("Connection lost")
+
+    async def slow_transfer() -> None:
+        await asyncio.sleep(1)
+        finished.append(1)
+
+    # - Act -
+    with pytest.raises(httpx.ReadError):
+        await run_transfers([slow_transfer, failed_transfer, slow_transfer])
+    await asyncio.sleep(0)
+
+    # - Assert -
+    assert finished == []
+
+
+async def test__run_transfers__invalid_max_concurrency() -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        await run_transfers([], max_concurrency=0)
+
+    # - Assert -
+    assert "`max_concurrency` should be positive" in str(exc.value)
+
+
+async def test__download_file__progress_reported(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    respx_mock.get(f"https://{host}/api/v3/botx/files/download").mock(
+        return_value=httpx.Response(HTTPStatus.OK, content=b"Hello, world!"),
+    )
+    progress: list[tuple[int, int | None]] = []
+    async_buffer = AsyncBytesBuffer()
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.download_file(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            file_id=UUID("c3b9def2-b2c8-4732-b61f-99b9b110fa80"),
+            async_buffer=async_buffer,
+            progress_callback=lambda *args: progress.append(args),
+        )
+        metrics = bot.get_transfer_metrics()
+
+    # - Assert -
+    assert bytes(async_buffer.getbuffer()) == b"Hello, world!"
+    assert progress == [(13, 13)]
+    assert metrics == {
+        f"https://{host}/": TransferMetrics(completed=1, transferred_bytes=13),
+    }
+
+
+async def test__upload_file__progress_reported(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    async_buffer: NamedTemporaryFile,
+) -> None:
+    # - Arrange -
+    await async_buffer.write(b"Hello, world!")
+    endpoint = respx_mock.post(f"https://{host}/api/v3/botx/files/upload").mock(
+        return_value=httpx.Response(HTTPStatus.OK, json=UPLOAD_FILE_RESPONSE),
+    )
+    progress: list[tuple[int, int | None]] = []
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.upload_file(
+            bot_id=bot_id,
+            chat_id=CHAT_ID,
+            async_buffer=async_buffer,
+            filename="test.txt",
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+    # - Assert -
+    body_size = len(endpoint.calls.last.request.content)
+    assert progress[-1] == (body_size, body_size)
+
+
+async def test__download_files__succeed(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+) -> None:
+    # - Arrange -
+    contents = {
+        "c3b9def2-b2c8-4732-b61f-99b9b110fa80": b"First",
+        "8dada2c8-67a6-4434-9dec-570d244e78ee": b"Second",
+    }
+
+    async def stream_content(content: bytes) -> Any:
+        yield content
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Streamed response has no `Content-Length`
+        return httpx.Response(
+            HTTPStatus.OK,
+            content=stream_content(contents[request.url.params["file_id"]]),
+        )
+
+    respx_mock.get(f"https://{host}/api/v3/botx/files/download").mock(
+        side_effect=handler,
+    )
+    files = [(build_document(file_id), AsyncBytesBuffer()) for file_id in contents]
+
+    # - Act -
+    async with bot_factory() as bot:
+        await bot.download_files(bot_id=bot_id, chat_id=CHAT_ID, files=files)
+
+    # - Assert -
+    assert [async_buffer.getbuffer() for _, async_buffer in files] == [
+        b"First",
+        b"Second",
+    ]
@@ -0,0 +1,284 @@
+import asyncio
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from aiofiles.tempfile import NamedTemporaryFile
+from respx.router import MockRouter
+
+from pybotx import (
+    AsyncBytesBuffer,
+    UploadDeduplicator,
+    UploadDedupMemoryStore,
+    UploadDedupSQLiteStore,
+)
+from pybotx.async_buffer import AsyncBufferReadable
+from tests.client.files_api.test_upload_file import UPLOAD_FILE_RESPONSE
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.mock_authorization,
+    pytest.mark.usefixtures("respx_mock"),
+]
+
+CHAT_ID = UUID("054af49e-5e18-4dca-ad73-4f96b6de63fa")
+OTHER_CHAT_ID = UUID("8dada2c8-67a6-4434-9dec-570d244e78ee")
+
+
+class SpyBuffer(AsyncBytesBuffer):
+    def __init__(self, initial_content: bytes) -> None:
+        super().__init__(initial_content)
+        self.reads = 0
+
+    async def read(self, bytes_to_read: int | None = None) -> bytes:
+        self.reads += 1
+        return await super().read(bytes_to_read)
+
+    async def readinto(self, buffer: bytearray | memoryview) -> int:
+        self.reads += 1
+        return await super().readinto(buffer)
+
+
+async def test__upload_deduplicator__same_content_uploaded_once() -> None:
+    # - Arrange -
+    upload_deduplicator = UploadDeduplicator(UploadDedupMemoryStore())
+    calls: list[str] = []
+
+    async def upload(upload_buffer: AsyncBufferReadable) -> str:
+        calls.append("upload")
+        return "result"
+
+    # - Act -
+    results = [
+        await upload_deduplicator.upload(
+            "scope",
+            AsyncBytesBuffer(b"Hello, world!"),
+            upload,
+        )
+        for _ in range(2)
+    ]
+    other_result = await upload_deduplicator.upload(
+        "scope",
+        AsyncBytesBuffer(b"Other"),
+        upload,
+    )
+
+    # - Assert -
+    assert results == ["result", "result"]
+    assert other_result == "result"
+    assert calls == ["upload", "upload"]
+
+
+async def test__upload_deduplicator__buffer_rewound(
+    async_buffer: NamedTemporaryFile,
+) -> None:
+    # - Arrange -
+    await async_buffer.write(b"Hello, world!")
+    upload_deduplicator = UploadDeduplicator()
+
+    async def upload(upload_buffer: AsyncBufferReadable) -> str:
+        return (await upload_buffer.read()).decode()
+
+    # - Act -
+    result = await upload_deduplicator.upload("scope", async_buffer, upload)
+
+    # - Assert -
+    assert result == "Hello, world!"
+
+
+async def test__upload_deduplicator__new_content_hashed_while_uploaded() -> None:
+    # - Arrange -
+    upload_deduplicator = UploadDeduplicator()
+    async_buffer = SpyBuffer(b"Hello, world!")
+
+    async def upload(upload_buffer: AsyncBufferReadable) -> str:
+        return (await upload_buffer.read()).decode()
+
+    # - Act -
+    result = await upload_deduplicator.upload("scope", async_buffer, upload)
+    reads_on_miss = async_buffer.reads
+    async_buffer.reads = 0
+    cached_result = await upload_deduplicator.upload("scope", async_buffer, upload)
+
+    # - Assert -
+    assert result == cached_result == "Hello, world!"
+    # Content isn't read before upload, only hash is calculated on hit
+    assert reads_on_miss == 1
+    assert async_buffer.reads == 2
+
+
+async def test__upload_deduplicator__content_read_by_parts_hashed() -> None:
+    # - Arrange -
+    upload_deduplicator = UploadDeduplicator()
+    calls: list[str] = []
+
+    async def upload(upload_buffer: AsyncBufferReadable) -> str:
+        calls.append("upload")
+        head = await upload_buffer.read(5)
+        await upload_buffer.seek(await upload_buffer.tell())
+        return (head + await upload_buffer.read()).decode()
+
+    # - Act -
+    result = await upload_deduplicator.upload(
+        "scope",
+        AsyncBytesBuffer(b"Hello, world!"),
+        upload,
+    )
+    cached_result = await upload_deduplicator.upload(
+        "scope",
+        AsyncBytesBuffer(b"Hello, world!"),
+        upload,
+    )
+
+    # - Assert -
+    assert result == cached_result == "Hello, world!"
+    assert calls == ["upload"]
+
+
+async def test__upload_deduplicator__concurrent_uploads_deduplicated() -> None:
+    # - Arrange -
+    upload_deduplicator = UploadDeduplicator()
+    calls: list[str] = []
+
+    async def upload(upload_buffer: AsyncBufferReadable) -> str:
+        calls.append("upload")
+        await asyncio.sleep(0)
+        return (await upload_buffer.read()).decode()
+
+    # - Act -
+    results = await asyncio.gather(
+        *(
+            upload_deduplicator.upload(
+                "scope",
+                AsyncBytesBuffer(content),
+                upload,
+            )
+            for content in (b"Hello", b"Hello", b"World")
+        ),
+    )
+
+    # - Assert -
+    assert results == ["Hello", "Hello", "World"]
+    assert calls == ["upload", "upload"]
+
+
+async def test__upload_deduplicator__expired_and_cleared_results_uploaded() -> None:
+    # - Arrange -
+    upload_deduplicator = UploadDeduplicator(ttl=0.01)
+    calls: list[str] = []
+
+    async def upload(upload_buffer: AsyncBufferReadable) -> str:
+        calls.append("upload")
+        return "result"
+
+    # - Act -
+    await upload_deduplicator.upload("scope", AsyncBytesBuffer(b"Hi"), upload)
+    await asyncio.sleep(0.02)
+    await upload_deduplicator.upload("scope", AsyncBytesBuffer(b"Hi"), upload)
+    await upload_deduplicator.clear()
+    await upload_deduplicator.upload("scope", AsyncBytesBuffer(b"Hi"), upload)
+
+    # - Assert -
+    assert calls == ["upload"] * 3
+
+
+async def test__upload_deduplicator__invalid_ttl() -> None:
+    # - Act -
+    with pytest.raises(ValueError) as exc:
+        UploadDeduplicator(ttl=0)
+
+    # - Assert -
+    assert "`ttl` should be positive" in str(exc.value)
+
+
+async def test__upload_dedup_sqlite_store__results_persisted(
+    tmp_path: Path,
+) -> None:
+    # - Arrange -
+    path = str(tmp_path / "upload_dedup.db")
+    store = UploadDedupSQLiteStore(path)
+    await store.set_result("key", "result", None)
+    await store.set_result("expired", "result", 100)
+    await store.close()
+
+    # - Act -
+    store = UploadDedupSQLiteStore(path)
+    result = await store.get_result("key", 200)
+    missing_result = await store.get_result("other", 200)
+    expired_result = await store.get_result("expired", 200)
+    await store.clear()
+    cleared_result = await store.get_result("key", 200)
+    await store.close()
+
+    # - Assert -
+    assert result == "result"
+    assert missing_result is None
+    assert expired_result is None
+    assert cleared_result is None
+
+
+async def test__upload_file__deduplicated(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    async_buffer: NamedTemporaryFile,
+) -> None:
+    # - Arrange -
+    await async_buffer.write(b"Hello, world!")
+    endpoint = respx_mock.post(f"https://{host}/api/v3/botx/files/upload").mock(
+        return_value=httpx.Response(HTTPStatus.OK, json=UPLOAD_FILE_RESPONSE),
+    )
+
+    # - Act -
+    async with bot_factory(upload_deduplicator=UploadDeduplicator()) as bot:
+        files = [
+            await bot.upload_file(
+                bot_id=bot_id,
+                chat_id=chat_id,
+                async_buffer=async_buffer,
+                filename="test.txt",
+            )
+            for chat_id in (CHAT_ID, CHAT_ID, OTHER_CHAT_ID)
+        ]
+
+    # - Assert -
+    assert files[0] == files[1] == files[2]
+    assert endpoint.call_count == 2
+
+
+async def test__upload_static_file__deduplicated(
+    respx_mock: MockRouter,
+    host: str,
+    bot_id: UUID,
+    bot_factory: Any,
+    async_buffer: NamedTemporaryFile,
+) -> None:
+    # - Arrange -
+    await async_buffer.write(b"Hello, world!")
+    endpoint = respx_mock.post(
+        f"https://{host}/api/v3/botx/smartapps/upload_file",
+    ).mock(
+        return_value=httpx.Response(
+            HTTPStatus.OK,
+            json={"status": "ok", "result": {"link": "https://link.to/file"}},
+        ),
+    )
+
+    # - Act -
+    async with bot_factory(upload_deduplicator=UploadDeduplicator()) as bot:
+        links = [
+            await bot.upload_static_file(
+                bot_id=bot_id,
+                async_buffer=async_buffer,
+                filename=filename,
+            )
+            for filename in ("test.png", "test.png", "other.png")
+        ]
+
+    # - Assert -
+    assert links == ["https://link.to/file"] * 3
+    assert endpoint.call_count == 2